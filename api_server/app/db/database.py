@@ -1,11 +1,20 @@
 """
 데이터베이스 연결 및 세션 관리
 """
+import sys
+from pathlib import Path
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from app.models.base import Base
 
+# 데스크톱 앱과 같은 스키마 마이그레이션 사용 (저장소 루트의 schema_migrations)
+ROOT_DIR = Path(__file__).resolve().parents[3]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+from schema_migrations import migrate  # noqa: E402
+
 engine = create_engine(
     settings.DATABASE_URL, 
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
@@ -14,7 +23,13 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def create_tables():
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블 생성 (SQLite는 데스크톱 앱과 같은 마이그레이션을 먼저 적용)"""
+    if engine.dialect.name == "sqlite":
+        raw_connection = engine.raw_connection()
+        try:
+            migrate(raw_connection.driver_connection)
+        finally:
+            raw_connection.close()
     Base.metadata.create_all(bind=engine)
 
 def get_db():
@@ -20,6 +20,9 @@ class Order(Base):
     shipping_company = Column(String)
     tracking_number = Column(String)
     memo = Column(Text)
+    product_order_id = Column(String)
+    shipping_due_date = Column(String)
+    product_option = Column(Text)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
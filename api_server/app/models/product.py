@@ -32,6 +32,7 @@ class Product(Base):
     exchange_fee = Column(Integer, default=0)
     discount_method = Column(Text)
     customer_benefit = Column(Text)
+    content_hash = Column(String)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
@@ -0,0 +1,162 @@
+"""
+동기화 처리량 벤치마크 - 로컬 대역 서버(naver_mock)를 띄우고 루트 앱의 동기화 경로를 측정
+
+사용 예:
+    python benchmark_sync.py                              (1k, 10k, 100k 상품주문)
+    python benchmark_sync.py --orders 10000 --throttle 0.05 --latency-ms 50
+    python benchmark_sync.py --orders 1000 --json > result.json
+
+측정 항목 (볼륨별):
+    orders   - NaverShoppingAPI.get_orders (24시간 구간 병렬 + 페이지 조회)
+    sync     - OrderSyncEngine 전체 동기화 (변경 목록 → query 상세 조회 → DB 저장)
+    products - ProductCatalogSync 전체 상품 동기화
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import bcrypt
+import requests
+import uvicorn
+
+from naver_mock.config import MockSettings
+from naver_mock.generator import SyntheticStore
+from naver_mock.main import create_application
+
+from database import DatabaseManager
+from naver_api import NaverShoppingAPI
+from naver_api_base import KST
+from order_sync import OrderSyncEngine
+from product_sync import ProductCatalogSync
+
+DEFAULT_VOLUMES = [1000, 10000, 100000]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class MockServer:
+    """대역 서버를 백그라운드 스레드에서 실행"""
+
+    def __init__(self, app):
+        self.port = free_port()
+        self.server = uvicorn.Server(uvicorn.Config(app, host='127.0.0.1', port=self.port, log_level='warning'))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.time() + 10
+        while not self.server.started:
+            if time.time() > deadline:
+                raise RuntimeError("대역 서버 시작 시간 초과")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
+
+    def stats(self) -> dict:
+        return requests.get(f"{self.base_url}/mock/stats").json()
+
+
+def timed(name: str, func, server: MockServer, count_of) -> dict:
+    """func 실행 시간과 그동안 대역 서버가 받은 요청/429 수 측정"""
+    before = server.stats()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    after = server.stats()
+    count = count_of(result)
+    return {
+        'name': name,
+        'success': bool(result.get('success')),
+        'count': count,
+        'elapsed': round(elapsed, 3),
+        'per_second': round(count / elapsed, 1) if elapsed > 0 else 0.0,
+        'requests': after['requests'] - before['requests'],
+        'throttled': after['throttled'] - before['throttled'],
+        'errors': after['errors'] - before['errors']
+    }
+
+
+def run_volume(order_count: int, args) -> dict:
+    """한 볼륨에 대해 대역 서버를 새로 띄우고 세 가지 동기화 경로 측정"""
+    settings = MockSettings(
+        ORDER_COUNT=order_count, DAYS=args.days, PRODUCT_COUNT=args.products, MAX_PAGE_SIZE=args.page_size,
+        LATENCY_MS=args.latency_ms, LATENCY_JITTER_MS=args.latency_ms // 3, RATE_LIMIT_RPS=args.rate_limit,
+        THROTTLE_PROBABILITY=args.throttle, ERROR_PROBABILITY=args.error
+    )
+    store = SyntheticStore(order_count, args.days, args.products, settings.SEED)
+    workdir = tempfile.mkdtemp(prefix='naver_bench_')
+
+    with MockServer(create_application(settings, store)) as server:
+        api = NaverShoppingAPI(
+            'benchmark-client', bcrypt.gensalt().decode('utf-8'),
+            token_cache_path=os.path.join(workdir, 'token.json'),
+            requests_per_second=args.client_rps, response_cache=False,
+            circuit_failure_threshold=1000, base_url=server.base_url
+        )
+        db_manager = DatabaseManager(os.path.join(workdir, 'orders.db'))
+        end = datetime.now(KST)
+        start = end - timedelta(days=args.days)
+
+        results = [
+            timed('orders', lambda: api.get_orders(start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'), limit=100),
+                  server, lambda r: ((r.get('data') or {}).get('total') or 0)),
+            timed('sync', lambda: OrderSyncEngine(api, db_manager).sync(initial_lookback_days=args.days),
+                  server, lambda r: r.get('saved') or 0),
+            timed('products', lambda: ProductCatalogSync(api, db_manager).sync(force=True),
+                  server, lambda r: (r.get('stats') or {}).get('products') or 0)
+        ]
+
+    return {'order_count': order_count, 'days': args.days, 'results': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='네이버 커머스 API 대역 서버 기반 동기화 벤치마크')
+    parser.add_argument('--orders', type=int, nargs='*', default=DEFAULT_VOLUMES, help='상품주문 수 (여러 개 지정 가능)')
+    parser.add_argument('--days', type=int, default=7, help='주문 분포 기간 (일)')
+    parser.add_argument('--products', type=int, default=500, help='상품 수')
+    parser.add_argument('--page-size', type=int, default=300, help='대역 서버 최대 페이지 크기')
+    parser.add_argument('--latency-ms', type=int, default=30, help='요청당 지연 (ms)')
+    parser.add_argument('--rate-limit', type=float, default=0, help='대역 서버 초당 요청 제한 (0이면 없음)')
+    parser.add_argument('--throttle', type=float, default=0, help='무작위 429 확률')
+    parser.add_argument('--error', type=float, default=0, help='무작위 500 확률')
+    parser.add_argument('--client-rps', type=float, default=20.0, help='클라이언트 초당 요청 수 (공유 속도 제한기)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    reports = [run_volume(order_count, args) for order_count in args.orders]
+
+    if args.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2))
+        return
+
+    print()
+    print(f"{'주문 수':>8} {'경로':<9} {'건수':>8} {'시간(초)':>9} {'건/초':>9} {'요청':>6} {'429':>5} {'500':>5} 결과")
+    for report in reports:
+        for result in report['results']:
+            print(f"{report['order_count']:>8} {result['name']:<9} {result['count']:>8} {result['elapsed']:>9.2f} "
+                  f"{result['per_second']:>9.1f} {result['requests']:>6} {result['throttled']:>5} {result['errors']:>5} "
+                  f"{'성공' if result['success'] else '실패'}")
+
+
+if __name__ == '__main__':
+    main()
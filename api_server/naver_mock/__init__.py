@@ -0,0 +1 @@
+# 네이버 커머스 API 로컬 대역 서버 패키지 (부하 테스트/벤치마크용)
@@ -0,0 +1,40 @@
+"""
+네이버 커머스 API 대역 서버 설정 (환경 변수 NAVER_MOCK_* 로 변경)
+"""
+from typing import Optional
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class MockSettings(BaseSettings):
+    """대역 서버 설정"""
+
+    # 서버 설정
+    HOST: str = "127.0.0.1"
+    PORT: int = 8100
+
+    # 합성 데이터 설정
+    ORDER_COUNT: int = Field(default=1000, description="생성할 상품주문 수")
+    DAYS: int = Field(default=7, description="주문일을 분포시킬 기간 (현재 시각 기준 과거 N일)")
+    PRODUCT_COUNT: int = Field(default=200, description="생성할 채널상품 수")
+    SEED: int = Field(default=42, description="합성 데이터 난수 시드 (같은 시드면 같은 데이터)")
+
+    # 페이지 설정
+    MAX_PAGE_SIZE: int = Field(default=300, description="주문 목록 한 페이지 최대 크기")
+    INCLUDE_TOTAL_PAGES: bool = Field(default=True, description="False면 pagination에 hasNext만 포함")
+    LAST_CHANGED_MAX: int = Field(default=300, description="last-changed-statuses 한 번에 반환할 최대 건수")
+
+    # 장애 주입 설정
+    LATENCY_MS: float = Field(default=30.0, description="응답 지연 (밀리초)")
+    LATENCY_JITTER_MS: float = Field(default=10.0, description="응답 지연 편차 (밀리초)")
+    RATE_LIMIT_RPS: float = Field(default=0.0, description="초당 허용 요청 수 (초과 시 429, 0이면 제한 없음)")
+    THROTTLE_PROBABILITY: float = Field(default=0.0, description="무작위 429 응답 확률 (0~1)")
+    ERROR_PROBABILITY: float = Field(default=0.0, description="무작위 500 응답 확률 (0~1)")
+    TOKEN_TTL: int = Field(default=10800, description="발급 토큰 유효시간 (초)")
+
+    # 녹화 응답 재생
+    FIXTURES_DIR: Optional[str] = Field(default=None, description="녹화된 응답(JSON) 디렉터리 - 일치하는 요청은 녹화 응답 반환")
+
+    class Config:
+        env_prefix = "NAVER_MOCK_"
+        case_sensitive = True
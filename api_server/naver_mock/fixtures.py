@@ -0,0 +1,175 @@
+"""
+녹화 응답(fixture) 저장/재생 및 개인정보 마스킹
+
+fixture 파일 형식 (JSON):
+    {"method": "GET", "path": "/external/v1/...", "params": {...}, "status": 200, "body": {...}}
+params는 요청 파라미터 중 일치해야 하는 항목만 기록한다 (없으면 경로만으로 일치).
+
+사용 예:
+    python -m naver_mock.fixtures scrub recorded.json fixtures/orders_page1.json
+    python -m naver_mock.fixtures record fixtures/ --days 1   (루트의 .env API 설정으로 실제 응답 녹화)
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+# 값을 가명으로 바꿀 개인정보 필드 (응답 어디에 있든 키 이름으로 처리)
+PII_FIELDS = {
+    'ordererName', 'ordererId', 'ordererNo', 'ordererTel', 'name', 'tel1', 'tel2',
+    'baseAddress', 'detailedAddress', 'zipCode', 'shippingMemo', 'personalCustomsClearanceCode',
+    'email', 'payLocationType', 'receiverName', 'receiverTel', 'address'
+}
+# 그대로 두면 안 되는 값 (송장번호 등 외부에서 조회 가능한 식별자)
+MASKED_FIELDS = {'trackingNumber', 'clientIp'}
+# 'name'은 상품명 등에도 쓰이므로 아래 상위 키 안에 있을 때만 마스킹
+NAME_PARENTS = {'shippingAddress', 'takingAddress', 'order', 'receiver'}
+
+
+def pseudonym(field: str, value) -> str:
+    """같은 값은 항상 같은 가명으로 (여러 응답에 걸친 동일 인물 관계 유지)"""
+    digest = hashlib.sha256(f"{field}:{value}".encode('utf-8')).hexdigest()
+    if field in ('ordererTel', 'tel1', 'tel2', 'receiverTel'):
+        number = int(digest[:8], 16)
+        return f"010-{number % 10000:04d}-{(number // 10000) % 10000:04d}"
+    if field == 'zipCode':
+        return f"{int(digest[:6], 16) % 90000 + 10000}"
+    return f"{field}_{digest[:10]}"
+
+
+def scrub(payload, parent: str = None):
+    """응답 데이터의 개인정보를 가명으로 바꾼 사본 반환"""
+    if isinstance(payload, list):
+        return [scrub(item, parent) for item in payload]
+    if not isinstance(payload, dict):
+        return payload
+
+    scrubbed = {}
+    for key, value in payload.items():
+        if value in (None, '') or isinstance(value, (dict, list)):
+            scrubbed[key] = scrub(value, key)
+        elif key == 'name' and parent not in NAME_PARENTS:
+            scrubbed[key] = value
+        elif key in PII_FIELDS:
+            scrubbed[key] = pseudonym(key, value)
+        elif key in MASKED_FIELDS:
+            scrubbed[key] = '0' * len(str(value))
+        else:
+            scrubbed[key] = value
+    return scrubbed
+
+
+def save_fixture(directory: str, name: str, method: str, path: str, body, params: Dict = None, status: int = 200) -> str:
+    """응답을 마스킹해 fixture 파일로 저장 - 파일 경로 반환"""
+    os.makedirs(directory, exist_ok=True)
+    file_path = os.path.join(directory, f"{name}.json")
+    fixture = {'method': method.upper(), 'path': path, 'params': params or {}, 'status': status, 'body': scrub(body)}
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(fixture, f, ensure_ascii=False, indent=2)
+    return file_path
+
+
+class FixtureLibrary:
+    """fixture 디렉터리의 녹화 응답을 요청과 매칭"""
+
+    def __init__(self, directory: str = None):
+        self.fixtures: List[Dict] = []
+        if directory:
+            self.load(directory)
+
+    def load(self, directory: str) -> int:
+        """디렉터리의 *.json fixture 로드 - 로드한 개수 반환"""
+        loaded = 0
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(directory, file_name), encoding='utf-8') as f:
+                    fixture = json.load(f)
+                fixture['method'] = fixture.get('method', 'GET').upper()
+                fixture.setdefault('params', {})
+                fixture.setdefault('status', 200)
+                self.fixtures.append(fixture)
+                loaded += 1
+            except Exception as e:
+                print(f"fixture 로드 오류 ({file_name}): {e}")
+        return loaded
+
+    def match(self, method: str, path: str, params: Dict) -> Optional[Dict]:
+        """요청과 일치하는 fixture (기록된 params가 모두 같아야 일치, 먼저 로드된 것 우선)"""
+        for fixture in self.fixtures:
+            if fixture['method'] != method.upper() or fixture['path'] != path:
+                continue
+            if all(str(params.get(key)) == str(value) for key, value in fixture['params'].items()):
+                return fixture
+        return None
+
+
+def _record(directory: str, days: int):
+    """루트 앱의 API 설정으로 실제 응답을 녹화 (주문 목록 1페이지, 변경 주문, query, 상품 목록 1페이지)"""
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    sys.path.insert(0, root)
+    from datetime import datetime, timedelta
+    from env_config import config
+    from naver_api import NaverShoppingAPI
+    from naver_api_base import KST, ORDERS_ENDPOINT, LAST_CHANGED_ENDPOINT, QUERY_ENDPOINT, PRODUCT_SEARCH_ENDPOINT
+
+    api = NaverShoppingAPI(config.get('NAVER_CLIENT_ID'), config.get('NAVER_CLIENT_SECRET'), response_cache=False)
+    end = datetime.now(KST)
+    start = end - timedelta(days=days)
+    params = api._order_window_params(start, min(end, start + timedelta(hours=24)), page_size=100)
+
+    recordings = [
+        ('orders_page1', 'GET', ORDERS_ENDPOINT, dict(params, page=1), {}),
+        ('last_changed', 'GET', LAST_CHANGED_ENDPOINT, {'lastChangedFrom': api._format_utc_time(start)}, {}),
+        ('products_page1', 'POST', PRODUCT_SEARCH_ENDPOINT, {'page': 1, 'size': 100}, {'page': 1}),
+    ]
+    saved_ids = []
+    for name, method, path, request_params, match_params in recordings:
+        response = api.make_authenticated_request(method, path, request_params)
+        if not response.get('success'):
+            print(f"녹화 실패 ({name}): {response.get('error')}")
+            continue
+        print(save_fixture(directory, name, method, path, response['data'], match_params))
+        if name == 'orders_page1':
+            contents = ((response['data'] or {}).get('data') or {}).get('contents') or []
+            saved_ids = [item.get('productOrderId') for item in contents if item.get('productOrderId')][:300]
+
+    if saved_ids:
+        response = api.query_orders_by_ids(saved_ids)
+        if response.get('success'):
+            print(save_fixture(directory, 'query', 'POST', QUERY_ENDPOINT, response['data']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='네이버 커머스 API 대역 서버 fixture 도구')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scrub_parser = commands.add_parser('scrub', help='녹화 응답 파일의 개인정보 마스킹')
+    scrub_parser.add_argument('source')
+    scrub_parser.add_argument('target')
+
+    record_parser = commands.add_parser('record', help='실제 API 응답을 마스킹해 녹화')
+    record_parser.add_argument('directory')
+    record_parser.add_argument('--days', type=int, default=1)
+
+    args = parser.parse_args()
+    if args.command == 'scrub':
+        with open(args.source, encoding='utf-8') as f:
+            data = json.load(f)
+        # fixture 형식이면 body만, 아니면 전체를 마스킹
+        if isinstance(data, dict) and 'body' in data and 'path' in data:
+            data['body'] = scrub(data['body'])
+        else:
+            data = scrub(data)
+        with open(args.target, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"마스킹 완료: {args.target}")
+    else:
+        _record(args.directory, args.days)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+"""
+합성 주문/상품 데이터 생성기
+
+상품주문마다 주문 시각과 마지막 변경 시각만 정렬된 배열로 보관하고,
+응답 항목은 요청될 때 (시드 + 번호) 난수로 매번 같은 값으로 만든다 (10만 건도 메모리 부담 없음).
+"""
+import random
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+KST = timezone(timedelta(hours=9))
+
+PRODUCT_ORDER_ID_BASE = 2024010100000000
+ORDER_ID_BASE = 2024010190000000
+CHANNEL_PRODUCT_NO_BASE = 5000000000
+ORIGIN_PRODUCT_NO_BASE = 9000000000
+
+DELIVERY_COMPANIES = ['CJGLS', 'HANJIN', 'LOTTE', 'EPOST', 'LOGEN']
+PAYMENT_MEANS = ['신용카드', '계좌이체', '네이버페이 포인트', '휴대폰']
+CATEGORIES = ['생활/건강>주방용품>조리도구', '가구/인테리어>수납가구>선반', '패션잡화>가방>백팩', '식품>건강식품>비타민']
+OPTIONS = ['', '색상: 블랙', '색상: 화이트', '사이즈: L', '사이즈: M / 색상: 네이비']
+
+# 주문 후 경과 일수에 따른 상품주문 상태 분포 (상태, 가중치)
+STATUS_BY_AGE = [
+    (1, [('PAYED', 80), ('DELIVERING', 10), ('CANCELED', 5), ('PAYMENT_WAITING', 5)]),
+    (3, [('PAYED', 30), ('DELIVERING', 45), ('DELIVERED', 15), ('CANCELED', 5), ('RETURNED', 5)]),
+    (None, [('DELIVERING', 10), ('DELIVERED', 40), ('PURCHASE_DECIDED', 35), ('CANCELED', 5),
+            ('RETURNED', 5), ('EXCHANGED', 5)]),
+]
+CLAIMS = {
+    'CANCELED': ('CANCEL', 'CANCEL_DONE'),
+    'RETURNED': ('RETURN', 'RETURN_DONE'),
+    'EXCHANGED': ('EXCHANGE', 'EXCHANGE_DONE'),
+}
+
+
+def format_time(timestamp: float) -> str:
+    """epoch 초를 네이버 응답 형식(KST, 밀리초)으로 변환"""
+    return datetime.fromtimestamp(timestamp, KST).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + '+09:00'
+
+
+def parse_time(value: str) -> Optional[float]:
+    """요청 시간 문자열(ISO, Z 또는 오프셋 포함)을 epoch 초로 변환"""
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    return dt.timestamp()
+
+
+class SyntheticStore:
+    """주문 ORDER_COUNT건과 채널상품 PRODUCT_COUNT개를 시드 기반으로 생성해 조회 기능 제공"""
+
+    def __init__(self, order_count: int = 1000, days: int = 7, product_count: int = 200, seed: int = 42,
+                 end_time: float = None):
+        self.order_count = max(0, int(order_count))
+        self.product_count = max(1, int(product_count))
+        self.seed = seed
+        self.end_time = end_time or datetime.now(KST).timestamp()
+        self.start_time = self.end_time - max(1, days) * 86400
+
+        rng = random.Random(seed)
+        span = self.end_time - self.start_time
+        # 상품주문 번호 순서 = 주문 시각 순서
+        self.order_times = sorted(self.start_time + rng.random() * span for _ in range(self.order_count))
+        # 마지막 변경 시각은 주문 시각 이후 (최근 주문일수록 결제 직후)
+        self.change_times = [min(self.end_time, order_time + rng.random() * min(3 * 86400, self.end_time - order_time))
+                             for order_time in self.order_times]
+        self.change_order = sorted(range(self.order_count), key=self.change_times.__getitem__)
+        self.sorted_change_times = [self.change_times[index] for index in self.change_order]
+        self.change_position = [0] * self.order_count  # 상품주문 번호 -> 변경 순번 (moreSequence)
+        for position, index in enumerate(self.change_order):
+            self.change_position[index] = position
+        self.dispatched = {}  # 발송 처리된 상품주문 번호 -> (택배사, 송장번호)
+
+    # 상품주문
+
+    def product_order_id(self, index: int) -> str:
+        return str(PRODUCT_ORDER_ID_BASE + index)
+
+    def index_of(self, product_order_id) -> Optional[int]:
+        """상품주문 ID를 번호로 변환 (없는 ID면 None)"""
+        try:
+            index = int(product_order_id) - PRODUCT_ORDER_ID_BASE
+        except (TypeError, ValueError):
+            return None
+        return index if 0 <= index < self.order_count else None
+
+    def orders_between(self, from_time: float, to_time: float) -> range:
+        """주문 시각이 [from_time, to_time) 구간인 상품주문 번호 범위"""
+        return range(bisect_left(self.order_times, from_time), bisect_left(self.order_times, to_time))
+
+    def changes_between(self, from_time: float, to_time: float = None, from_sequence: int = None) -> List[int]:
+        """마지막 변경 시각이 [from_time, to_time] 구간인 상품주문 번호 (변경 시각 순, from_sequence 순번부터)"""
+        start = bisect_left(self.sorted_change_times, from_time)
+        if from_sequence is not None:
+            start = max(start, from_sequence)
+        end = bisect_right(self.sorted_change_times, to_time) if to_time is not None else self.order_count
+        return self.change_order[start:end]
+
+    def _status(self, index: int, rng: random.Random) -> str:
+        age_days = (self.end_time - self.order_times[index]) / 86400
+        for max_age, weights in STATUS_BY_AGE:
+            if max_age is None or age_days <= max_age:
+                statuses, counts = zip(*weights)
+                return rng.choices(statuses, counts)[0]
+        return 'PAYED'
+
+    def product_order(self, index: int) -> Dict:
+        """query 응답 항목 ({'order', 'productOrder', 'delivery'})"""
+        rng = random.Random(self.seed * 1000003 + index)
+        order_time = self.order_times[index]
+        status = self._status(index, rng)
+        if index in self.dispatched:
+            status = 'DELIVERING'
+        product_index = rng.randrange(self.product_count)
+        quantity = rng.choice([1, 1, 1, 2, 3])
+        unit_price = rng.randrange(50, 800) * 100
+        discount = rng.choice([0, 0, 500, 1000])
+        claim_type, claim_status = CLAIMS.get(status, (None, None))
+
+        item = {
+            'order': {
+                'orderId': str(ORDER_ID_BASE + index),
+                'orderDate': format_time(order_time),
+                'paymentDate': format_time(order_time + 60),
+                'ordererId': f'buyer{rng.randrange(100000):05d}',
+                'ordererName': f'구매자{rng.randrange(10000):04d}',
+                'ordererTel': f'010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}',
+                'paymentMeans': rng.choice(PAYMENT_MEANS)
+            },
+            'productOrder': {
+                'productOrderId': self.product_order_id(index),
+                'productOrderStatus': status,
+                'claimType': claim_type,
+                'claimStatus': claim_status,
+                'productId': str(CHANNEL_PRODUCT_NO_BASE + product_index),
+                'productName': f'테스트 상품 {product_index:04d}',
+                'productOption': rng.choice(OPTIONS),
+                'sellerProductCode': f'SKU-{product_index:05d}',
+                'quantity': quantity,
+                'unitPrice': unit_price,
+                'productDiscountAmount': discount,
+                'totalPaymentAmount': unit_price * quantity - discount,
+                'shippingDueDate': format_time(order_time + 2 * 86400),
+                'shippingMemo': rng.choice(['', '문 앞에 놓아주세요', '경비실에 맡겨주세요']),
+                'shippingAddress': {
+                    'name': f'수령인{rng.randrange(10000):04d}',
+                    'tel1': f'010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}',
+                    'baseAddress': f'서울특별시 테스트구 샘플로 {rng.randrange(1, 300)}',
+                    'detailedAddress': f'{rng.randrange(1, 30)}층 {rng.randrange(1, 20)}호',
+                    'zipCode': f'{rng.randrange(10000, 99999)}'
+                }
+            }
+        }
+        if status in ('DELIVERING', 'DELIVERED', 'PURCHASE_DECIDED'):
+            company, tracking_number = self.dispatched.get(
+                index, (rng.choice(DELIVERY_COMPANIES), str(rng.randrange(10 ** 11, 10 ** 12))))
+            item['delivery'] = {
+                'deliveryCompany': company,
+                'trackingNumber': tracking_number,
+                'sendDate': format_time(min(self.end_time, order_time + 86400))
+            }
+        return item
+
+    def list_item(self, index: int) -> Dict:
+        """주문 목록(product-orders) 응답 항목"""
+        return {'productOrderId': self.product_order_id(index), 'content': self.product_order(index)}
+
+    def change_item(self, index: int) -> Dict:
+        """last-changed-statuses 응답 항목"""
+        item = self.product_order(index)
+        product_order = item['productOrder']
+        return {
+            'orderId': item['order']['orderId'],
+            'productOrderId': product_order['productOrderId'],
+            'lastChangedType': 'PAY_WAITING' if product_order['productOrderStatus'] == 'PAYMENT_WAITING' else 'PAYED',
+            'paymentDate': item['order']['paymentDate'],
+            'lastChangedDate': format_time(self.change_times[index]),
+            'productOrderStatus': product_order['productOrderStatus'],
+            'claimType': product_order['claimType'],
+            'claimStatus': product_order['claimStatus'],
+            'receiverAddressChanged': False
+        }
+
+    def dispatch(self, product_order_id, delivery_company: str, tracking_number: str) -> Optional[str]:
+        """발송 처리 - 실패 사유 (성공이면 None)"""
+        index = self.index_of(product_order_id)
+        if index is None:
+            return '존재하지 않는 상품주문입니다.'
+        if index in self.dispatched:
+            return '이미 발송 처리된 상품주문입니다.'
+        if self.product_order(index)['productOrder']['productOrderStatus'] != 'PAYED':
+            return '발송 처리할 수 없는 상태입니다.'
+        self.dispatched[index] = (delivery_company, tracking_number)
+        return None
+
+    # 상품
+
+    def search_products(self, page: int, size: int) -> Dict:
+        """products/search 응답"""
+        start = (page - 1) * size
+        indexes = range(start, min(start + size, self.product_count))
+        return {
+            'contents': [self._search_item(index) for index in indexes],
+            'page': page,
+            'size': size,
+            'totalElements': self.product_count,
+            'totalPages': max(1, -(-self.product_count // size)),
+            'sort': {'sorted': False, 'fields': []},
+            'first': page == 1,
+            'last': start + size >= self.product_count
+        }
+
+    def product_index(self, product_no, base: int) -> Optional[int]:
+        """채널상품/원상품 번호를 번호로 변환 (없는 번호면 None)"""
+        try:
+            index = int(product_no) - base
+        except (TypeError, ValueError):
+            return None
+        return index if 0 <= index < self.product_count else None
+
+    def _channel_product(self, index: int) -> Dict:
+        rng = random.Random(self.seed * 7919 + index)
+        category = rng.choice(CATEGORIES)
+        sale_price = rng.randrange(50, 800) * 100
+        registered = self.start_time - rng.randrange(30, 365) * 86400
+        return {
+            'originProductNo': ORIGIN_PRODUCT_NO_BASE + index,
+            'channelProductNo': CHANNEL_PRODUCT_NO_BASE + index,
+            'channelServiceType': 'STOREFARM',
+            'categoryId': str(50000000 + CATEGORIES.index(category)),
+            'name': f'테스트 상품 {index:04d}',
+            'sellerManagementCode': f'SKU-{index:05d}',
+            'statusType': rng.choices(['SALE', 'OUTOFSTOCK', 'SUSPENSION', 'CLOSE'], [85, 8, 4, 3])[0],
+            'channelProductDisplayStatusType': 'ON',
+            'salePrice': sale_price,
+            'discountedPrice': sale_price - rng.choice([0, 0, 1000, 2000]),
+            'stockQuantity': rng.randrange(0, 500),
+            'deliveryAttributeType': 'NORMAL',
+            'deliveryFee': rng.choice([0, 3000]),
+            'returnFee': 3000,
+            'exchangeFee': 6000,
+            'brandName': '위드어스',
+            'manufacturerName': '위드어스',
+            'modelName': f'MODEL-{index:04d}',
+            'wholeCategoryName': category,
+            'wholeCategoryId': '50000000>50000001>50000002',
+            'representativeImage': {'url': f'https://example.invalid/images/{index}.jpg'},
+            'regDate': format_time(registered),
+            'modifiedDate': format_time(registered + rng.randrange(0, 30) * 86400)
+        }
+
+    def _search_item(self, index: int) -> Dict:
+        return {'originProductNo': ORIGIN_PRODUCT_NO_BASE + index, 'channelProducts': [self._channel_product(index)]}
+
+    def product_detail(self, index: int) -> Dict:
+        """channel-products / origin-products 상세 응답"""
+        channel_product = self._channel_product(index)
+        return {
+            'originProduct': {
+                'statusType': channel_product['statusType'],
+                'name': channel_product['name'],
+                'salePrice': channel_product['salePrice'],
+                'stockQuantity': channel_product['stockQuantity'],
+                'deliveryInfo': {
+                    'deliveryType': 'DELIVERY',
+                    'deliveryFee': {'deliveryFeeType': 'PAID' if channel_product['deliveryFee'] else 'FREE',
+                                    'baseFee': channel_product['deliveryFee']},
+                    'claimDeliveryInfo': {'returnDeliveryFee': channel_product['returnFee'],
+                                          'exchangeDeliveryFee': channel_product['exchangeFee']}
+                },
+                'customerBenefit': {
+                    'immediateDiscountPolicy': {
+                        'discountMethod': {'value': channel_product['salePrice'] - channel_product['discountedPrice'],
+                                           'unitType': 'WON'}
+                    }
+                } if channel_product['discountedPrice'] < channel_product['salePrice'] else {}
+            },
+            'smartstoreChannelProduct': {
+                'channelProductName': channel_product['name'],
+                'channelProductDisplayStatusType': 'ON'
+            }
+        }
@@ -0,0 +1,267 @@
+"""
+네이버 커머스 API 대역 서버 - NaverShoppingAPI가 사용하는 엔드포인트를 합성 데이터/녹화 응답으로 제공
+
+지연(LATENCY_MS), 초당 요청 제한(RATE_LIMIT_RPS), 무작위 429/500 응답을 주입할 수 있어
+실제 API 없이 동기화 처리량과 재시도/서킷 브레이커 동작을 측정할 수 있다.
+"""
+import asyncio
+import random
+import secrets
+import threading
+import time
+from datetime import datetime
+from typing import Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from naver_mock.config import MockSettings
+from naver_mock.fixtures import FixtureLibrary
+from naver_mock.generator import (SyntheticStore, parse_time, CHANNEL_PRODUCT_NO_BASE, ORIGIN_PRODUCT_NO_BASE)
+
+ORDERS_PATH = '/external/v1/pay-order/seller/product-orders'
+MAX_WINDOW_SECONDS = 24 * 3600  # 주문 목록 조회 최대 기간
+QUERY_MAX_IDS = 300
+DISPATCH_MAX = 30
+PRODUCT_SEARCH_MAX_SIZE = 500
+
+
+def error_response(status_code: int, code: str, message: str, invalid_inputs: list = None) -> JSONResponse:
+    """네이버 오류 응답 형식"""
+    body = {'code': code, 'message': message, 'timestamp': datetime.now().isoformat()}
+    if invalid_inputs:
+        body['invalidInputs'] = invalid_inputs
+    return JSONResponse(status_code=status_code, content=body)
+
+
+def bad_request(name: str, message: str) -> JSONResponse:
+    return error_response(400, 'BadRequest', '요청 값이 올바르지 않습니다.',
+                          [{'name': name, 'type': 'InvalidValue', 'message': message}])
+
+
+class RequestBudget:
+    """초당 요청 제한 (토큰 버킷) - 초과 요청은 429"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        if self.rate <= 0:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+def create_application(settings: MockSettings = None, store: SyntheticStore = None) -> FastAPI:
+    """대역 서버 애플리케이션 생성 (벤치마크에서 설정/데이터를 직접 지정할 수 있음)"""
+    settings = settings or MockSettings()
+    store = store or SyntheticStore(settings.ORDER_COUNT, settings.DAYS, settings.PRODUCT_COUNT, settings.SEED)
+    fixtures = FixtureLibrary(settings.FIXTURES_DIR)
+    budget = RequestBudget(settings.RATE_LIMIT_RPS)
+    tokens: Dict[str, float] = {}  # 발급한 토큰 -> 만료 시각
+    stats = {'requests': 0, 'throttled': 0, 'errors': 0, 'fixture_hits': 0, 'by_path': {}}
+
+    app = FastAPI(
+        title="Naver Commerce API Mock",
+        description="네이버 커머스 API 로컬 대역 서버 (벤치마크용)",
+        docs_url="/docs",
+    )
+    app.state.settings = settings
+    app.state.store = store
+    app.state.stats = stats
+
+    @app.middleware("http")
+    async def inject_conditions(request: Request, call_next):
+        """지연, 요청 제한, 무작위 오류 주입 및 인증 확인"""
+        path = request.url.path
+        if not path.startswith('/external/'):
+            return await call_next(request)
+
+        stats['requests'] += 1
+        stats['by_path'][path] = stats['by_path'].get(path, 0) + 1
+
+        latency = settings.LATENCY_MS + random.uniform(-1, 1) * settings.LATENCY_JITTER_MS
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+        if not budget.try_acquire() or random.random() < settings.THROTTLE_PROBABILITY:
+            stats['throttled'] += 1
+            response = error_response(429, 'GW.RATE_LIMIT', '요청이 많아 일시적으로 사용이 제한되었습니다.')
+            response.headers['Retry-After'] = '1'
+            return response
+        if random.random() < settings.ERROR_PROBABILITY:
+            stats['errors'] += 1
+            return error_response(500, 'GW.INTERNAL_ERROR', '일시적인 오류가 발생했습니다.')
+
+        if not path.endswith('/oauth2/token'):
+            authorization = request.headers.get('Authorization', '')
+            token = authorization[7:] if authorization.startswith('Bearer ') else ''
+            if tokens.get(token, 0) < time.time():
+                return error_response(401, 'GW.AUTHN', '인증에 실패했습니다.')
+
+            # 녹화 응답이 있으면 합성 데이터 대신 반환
+            if fixtures.fixtures:
+                params = dict(request.query_params)
+                if request.method == 'POST':
+                    try:
+                        params.update(await request.json())
+                    except Exception:
+                        pass
+                fixture = fixtures.match(request.method, path, params)
+                if fixture is not None:
+                    stats['fixture_hits'] += 1
+                    return JSONResponse(status_code=fixture['status'], content=fixture['body'])
+
+        return await call_next(request)
+
+    @app.post("/external/v1/oauth2/token")
+    async def issue_token(request: Request):
+        """토큰 발급 (서명은 검증하지 않음)"""
+        form = await request.form()
+        if not form.get('client_id') or not form.get('client_secret_sign'):
+            return bad_request('client_id', 'client_id와 client_secret_sign은 필수입니다.')
+        token = secrets.token_urlsafe(24)
+        tokens[token] = time.time() + settings.TOKEN_TTL
+        return {'access_token': token, 'expires_in': settings.TOKEN_TTL, 'token_type': 'Bearer'}
+
+    @app.get(ORDERS_PATH)
+    async def list_product_orders(request: Request):
+        """조건형 상품주문 목록 조회 (최대 24시간 구간, 페이지 단위)"""
+        params = request.query_params
+        try:
+            from_time = parse_time(params.get('from'))
+            to_time = parse_time(params.get('to')) or time.time()
+        except ValueError:
+            return bad_request('from', '시간 형식이 올바르지 않습니다.')
+        if from_time is None:
+            return bad_request('from', 'from은 필수입니다.')
+        if to_time - from_time > MAX_WINDOW_SECONDS + 1:
+            return bad_request('to', '조회 기간은 최대 24시간입니다.')
+
+        page = max(1, int(params.get('page') or 1))
+        size = max(1, min(int(params.get('size') or params.get('pageSize') or 100), settings.MAX_PAGE_SIZE))
+        statuses = [status for status in (params.get('orderStatusType') or params.get('productOrderStatuses') or '').split(',') if status]
+
+        indexes = store.orders_between(from_time, to_time)
+        if statuses:
+            items = [store.list_item(index) for index in indexes]
+            items = [item for item in items if item['content']['productOrder']['productOrderStatus'] in statuses]
+            total = len(items)
+            contents = items[(page - 1) * size:page * size]
+        else:
+            total = len(indexes)
+            contents = [store.list_item(index) for index in indexes[(page - 1) * size:page * size]]
+
+        pagination = {'page': page, 'size': size, 'hasNext': page * size < total}
+        if settings.INCLUDE_TOTAL_PAGES:
+            pagination['totalPages'] = max(1, -(-total // size))
+            pagination['totalElements'] = total
+        return {'timestamp': datetime.now().isoformat(), 'data': {'contents': contents, 'pagination': pagination}}
+
+    @app.get(f"{ORDERS_PATH}/last-changed-statuses")
+    async def last_changed_statuses(request: Request):
+        """변경 상품주문 내역 조회 (moreSequence로 이어서 조회)"""
+        params = request.query_params
+        try:
+            from_time = parse_time(params.get('lastChangedFrom'))
+            to_time = parse_time(params.get('lastChangedTo'))
+        except ValueError:
+            return bad_request('lastChangedFrom', '시간 형식이 올바르지 않습니다.')
+        if from_time is None:
+            return bad_request('lastChangedFrom', 'lastChangedFrom은 필수입니다.')
+        if to_time is not None and to_time - from_time > MAX_WINDOW_SECONDS + 1:
+            return bad_request('lastChangedTo', '조회 기간은 최대 24시간입니다.')
+
+        limit = max(1, min(int(params.get('limitCount') or settings.LAST_CHANGED_MAX), settings.LAST_CHANGED_MAX))
+        more_sequence = params.get('moreSequence')
+        indexes = store.changes_between(from_time, to_time, int(more_sequence) if more_sequence else None)
+
+        page, rest = indexes[:limit], indexes[limit:]
+        data = {'lastChangeStatuses': [store.change_item(index) for index in page], 'count': len(page)}
+        if rest:
+            next_index = rest[0]
+            data['more'] = {'moreFrom': store.change_item(next_index)['lastChangedDate'],
+                            'moreSequence': str(store.change_position[next_index])}
+        return {'timestamp': datetime.now().isoformat(), 'data': data}
+
+    @app.post(f"{ORDERS_PATH}/query")
+    async def query_product_orders(request: Request):
+        """상품주문 상세 내역 조회 (최대 300개)"""
+        body = await request.json()
+        product_order_ids = body.get('productOrderIds') or []
+        if not product_order_ids or len(product_order_ids) > QUERY_MAX_IDS:
+            return bad_request('productOrderIds', f'productOrderIds는 1~{QUERY_MAX_IDS}개여야 합니다.')
+        indexes = [store.index_of(product_order_id) for product_order_id in product_order_ids]
+        return {'timestamp': datetime.now().isoformat(),
+                'data': [store.product_order(index) for index in indexes if index is not None]}
+
+    @app.post(f"{ORDERS_PATH}/dispatch")
+    async def dispatch_product_orders(request: Request):
+        """발송 처리 (최대 30건, 건별 성공/실패)"""
+        body = await request.json()
+        dispatches = body.get('dispatchProductOrders') or []
+        if not dispatches or len(dispatches) > DISPATCH_MAX:
+            return bad_request('dispatchProductOrders', f'발송 처리는 1~{DISPATCH_MAX}건이어야 합니다.')
+
+        success_ids, fail_infos = [], []
+        for dispatch in dispatches:
+            product_order_id = str(dispatch.get('productOrderId'))
+            error = store.dispatch(product_order_id, dispatch.get('deliveryCompanyCode'), dispatch.get('trackingNumber'))
+            if error:
+                fail_infos.append({'productOrderId': product_order_id, 'code': 'DISPATCH_FAIL', 'message': error})
+            else:
+                success_ids.append(product_order_id)
+        return {'timestamp': datetime.now().isoformat(),
+                'data': {'successProductOrderIds': success_ids, 'failProductOrderInfos': fail_infos}}
+
+    @app.post("/external/v1/products/search")
+    async def search_products(request: Request):
+        """상품 목록 조회"""
+        body = await request.json()
+        page = max(1, int(body.get('page') or 1))
+        size = max(1, min(int(body.get('size') or 50), PRODUCT_SEARCH_MAX_SIZE))
+        result = store.search_products(page, size)
+        statuses = body.get('productStatusTypes')
+        if statuses:
+            for item in result['contents']:
+                item['channelProducts'] = [product for product in item['channelProducts']
+                                           if product['statusType'] in statuses]
+            result['contents'] = [item for item in result['contents'] if item['channelProducts']]
+        return result
+
+    @app.get("/external/v2/products/channel-products/{channel_product_no}")
+    async def get_channel_product(channel_product_no: str):
+        index = store.product_index(channel_product_no, CHANNEL_PRODUCT_NO_BASE)
+        if index is None:
+            return error_response(404, 'NotFound', '상품이 존재하지 않습니다.')
+        return store.product_detail(index)
+
+    @app.get("/external/v2/products/origin-products/{origin_product_no}")
+    async def get_origin_product(origin_product_no: str):
+        index = store.product_index(origin_product_no, ORIGIN_PRODUCT_NO_BASE)
+        if index is None:
+            return error_response(404, 'NotFound', '상품이 존재하지 않습니다.')
+        detail = store.product_detail(index)
+        return {'originProduct': detail['originProduct']}
+
+    @app.get("/mock/stats")
+    async def mock_stats():
+        """요청/주입 통계 (벤치마크에서 조회)"""
+        return dict(stats, order_count=store.order_count, product_count=store.product_count,
+                    dispatched=len(store.dispatched))
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy", "orders": store.order_count, "products": store.product_count}
+
+    return app
+
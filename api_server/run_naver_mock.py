@@ -0,0 +1,24 @@
+"""
+네이버 커머스 API 대역 서버 실행 스크립트
+
+설정은 NAVER_MOCK_ 환경변수로 지정 (예: NAVER_MOCK_ORDER_COUNT=10000 NAVER_MOCK_THROTTLE_PROBABILITY=0.05)
+루트 앱에서 사용하려면 .env에 NAVER_API_BASE_URL=http://127.0.0.1:8100 설정
+"""
+import uvicorn
+from naver_mock.config import MockSettings
+
+if __name__ == "__main__":
+    settings = MockSettings()
+    print(f"Naver Commerce API mock - 주문 {settings.ORDER_COUNT}건 / {settings.DAYS}일, 상품 {settings.PRODUCT_COUNT}개")
+    print(f"지연 {settings.LATENCY_MS}ms, 초당 제한 {settings.RATE_LIMIT_RPS or '없음'}, "
+          f"429 확률 {settings.THROTTLE_PROBABILITY}, 500 확률 {settings.ERROR_PROBABILITY}")
+    print(f"Server will be available at: http://{settings.HOST}:{settings.PORT}")
+    print("Press Ctrl+C to stop the server")
+
+    uvicorn.run(
+        "naver_mock.main:create_application",
+        factory=True,
+        host=settings.HOST,
+        port=settings.PORT,
+        log_level="warning"
+    )
@@ -0,0 +1,143 @@
+"""
+API 요청 추적 모듈 - 상세 로그는 필요할 때만 생성
+"""
+import time
+import random
+import threading
+from typing import Callable, Dict, Optional
+
+# 추적 수준: off(추적 안 함) < basic(요청당 한 줄) < detail(요청/응답 전체 출력)
+TRACE_LEVELS = {'off': 0, 'basic': 1, 'detail': 2}
+
+
+class APIResult(dict):
+    """API 요청 결과 dict - request_details, response_details, terminal_log 등은 처음 접근할 때 생성
+
+    기본 키(success, status_code, message, data, error, elapsed)만 미리 채우고,
+    상세 키는 lazy={키: factory(result)}로 등록해 두었다가 조회 시 한 번만 만든다.
+    """
+
+    def __init__(self, *args, lazy: Dict[str, Callable] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy = dict(lazy or {})
+
+    def __missing__(self, key):
+        factory = self._lazy.pop(key, None)
+        if factory is None:
+            raise KeyError(key)
+        value = factory(self)
+        self[key] = value
+        return value
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._lazy
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key) or key in self._lazy:
+            return self[key]
+        return default
+
+    def items(self):
+        """전체 항목 (json.dumps 등 전체 내용을 보는 경우 상세 키까지 생성)"""
+        self.materialize()
+        return super().items()
+
+    def materialize(self) -> 'APIResult':
+        """등록된 상세 키를 모두 생성"""
+        for key in list(self._lazy):
+            self[key]
+        return self
+
+    def copy(self) -> dict:
+        """상세 키까지 모두 포함한 일반 dict 복사본"""
+        return dict(self.materialize())
+
+    def lean(self) -> dict:
+        """아직 생성하지 않은 상세 키를 제외한 일반 dict (캐시 저장용)"""
+        return {key: dict.__getitem__(self, key) for key in dict.keys(self)}
+
+
+class RequestSpan:
+    """요청 1건의 추적 정보"""
+
+    __slots__ = ('method', 'endpoint', 'started', 'detailed', 'status_code', 'elapsed', 'cached', 'result')
+
+    def __init__(self, method: str, endpoint: str, detailed: bool):
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.started = time.time()
+        self.detailed = detailed
+        self.status_code = None
+        self.elapsed = None
+        self.cached = False
+        self.result = None  # 요청 결과 (sink에서 result['terminal_log'] 등으로 상세 정보 조회 가능)
+
+    def to_dict(self) -> Dict:
+        return {
+            'method': self.method,
+            'endpoint': self.endpoint,
+            'status_code': self.status_code,
+            'elapsed': self.elapsed,
+            'cached': self.cached
+        }
+
+
+class RequestTracer:
+    """요청 추적기 - 수준(off/basic/detail)과 샘플링 비율에 따라 span 생성
+
+    off 수준이거나 샘플링에서 제외된 요청은 span을 만들지 않는다 (추가 비용 없음).
+    sink를 지정하면 완료된 span을 전달한다.
+    """
+
+    def __init__(self, level: str = 'basic', sample_rate: float = 1.0, sink: Callable[[RequestSpan], None] = None):
+        self.level = TRACE_LEVELS.get(str(level).lower(), TRACE_LEVELS['basic'])
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self.sink = sink
+        self._lock = threading.Lock()
+        self._traced = 0
+        self._errors = 0
+
+    def set_level(self, level: str):
+        """추적 수준 변경"""
+        self.level = TRACE_LEVELS.get(str(level).lower(), self.level)
+
+    def start_span(self, method: str, endpoint: str) -> Optional[RequestSpan]:
+        """요청 시작 - 추적 대상이 아니면 None"""
+        if not self.level:
+            return None
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+        return RequestSpan(method, endpoint, self.level >= TRACE_LEVELS['detail'])
+
+    def finish_span(self, span: Optional[RequestSpan], result: Dict) -> Dict:
+        """요청 완료 - span 기록 후 결과를 그대로 반환"""
+        if span is None:
+            return result
+
+        span.status_code = result.get('status_code')
+        span.elapsed = round(time.time() - span.started, 3)
+        span.cached = bool(result.get('from_cache'))
+        span.result = result
+        with self._lock:
+            self._traced += 1
+            if not result.get('success'):
+                self._errors += 1
+
+        print(f"API {span.method} {span.endpoint} → {span.status_code}{' (캐시)' if span.cached else ''} ({span.elapsed:.3f}초)")
+
+        if self.sink:
+            try:
+                self.sink(span)
+            except Exception as e:
+                print(f"추적 sink 오류: {e}")
+        return result
+
+    def get_stats(self) -> Dict:
+        """추적 통계"""
+        with self._lock:
+            return {
+                'level': next(name for name, value in TRACE_LEVELS.items() if value == self.level),
+                'sample_rate': self.sample_rate,
+                'traced': self._traced,
+                'errors': self._errors
+            }
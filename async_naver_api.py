@@ -0,0 +1,249 @@
+"""
+네이버 커머스 API 비동기 클라이언트 (httpx + asyncio)
+"""
+import time
+import asyncio
+import httpx
+from typing import List, Dict, Optional
+
+from naver_api_base import NaverAPIBase, ORDERS_ENDPOINT, QUERY_ENDPOINT
+from order_partition import OrderPartition
+
+
+class AsyncNaverShoppingAPI(NaverAPIBase):
+    """네이버 쇼핑 API 비동기 클라이언트
+
+    NaverShoppingAPI와 같은 메서드를 제공하며 모든 API 메서드는 await 해서 사용한다.
+    구간/페이지 조회는 스레드 대신 하나의 이벤트 루프에서 병렬 실행되고,
+    요청 속도 제한기와 토큰 관리자는 동기 클라이언트와 공유한다.
+
+    사용 예:
+        async with AsyncNaverShoppingAPI(client_id, client_secret) as api:
+            result = await api.get_orders('2024-01-01', '2024-01-31')
+    """
+
+    def __init__(self, client_id: str, client_secret: str, pool_size: int = 20, token_cache_path: str = None,
+                 page_fanout: int = 8, window_workers: int = 16, requests_per_second: float = 4.0,
+                 timeout: float = 30.0, response_cache=None, tracer=None, circuit_failure_threshold: int = 5,
+                 circuit_recovery_timeout: float = 30.0, offline_orders=None, base_url: str = None):
+        super().__init__(client_id, client_secret, token_cache_path=token_cache_path, page_fanout=page_fanout,
+                         window_workers=window_workers, requests_per_second=requests_per_second,
+                         response_cache=response_cache, tracer=tracer,
+                         circuit_failure_threshold=circuit_failure_threshold,
+                         circuit_recovery_timeout=circuit_recovery_timeout, offline_orders=offline_orders,
+                         base_url=base_url)
+
+        # 하나의 이벤트 루프에서 공유하는 keep-alive 연결 풀
+        self.pool_size = max(1, int(pool_size))
+        self.timeout = timeout
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+            timeout=timeout
+        )
+        self._request_count = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """클라이언트 종료 (풀의 모든 연결 반환)"""
+        try:
+            await self.client.aclose()
+        except Exception as e:
+            print(f"세션 종료 오류: {e}")
+
+    def get_connection_stats(self) -> Dict:
+        """요청 통계 조회"""
+        return {
+            'pool_size': self.pool_size,
+            'requests': self._request_count
+        }
+
+    async def _send_request(self, method: str, url: str, headers: Dict, data: Dict = None) -> httpx.Response:
+        """공유 연결 풀로 HTTP 요청 전송"""
+        self._request_count += 1
+
+        method = method.upper()
+        if method == 'GET':
+            return await self.client.get(url, headers=headers, params=data or None)
+        if method == 'POST':
+            return await self.client.post(url, headers=headers, json=data)
+        if method == 'PUT':
+            return await self.client.put(url, headers=headers, json=data)
+        raise ValueError(f'Unsupported method: {method}')
+
+    async def _send_with_rate_limit(self, method: str, url: str, headers: Dict, data: Dict = None, log_details: bool = False) -> httpx.Response:
+        """공유 속도 제한기를 거쳐 요청 전송 - 요청 제한 응답 시 속도를 낮추고 재시도"""
+        for attempt in range(self.max_throttle_retries + 1):
+            await self.rate_limiter.acquire_async()
+            response = await self._send_request(method, url, headers, data)
+            if not self._record_rate_limit_result(response, attempt, log_details):
+                return response
+        return response
+
+    def _issue_access_token(self) -> Optional[tuple]:
+        """액세스 토큰 발급 - 토큰 관리자가 작업 스레드에서 호출하므로 동기 요청 사용"""
+        try:
+            url, headers, data = self._build_token_request()
+            response = httpx.post(url, headers=headers, data=data, timeout=self.timeout)
+            return self._parse_token_response(response)
+        except Exception as e:
+            print(f"토큰 발급 오류: {e}")
+            return None
+
+    async def _get_token(self) -> Optional[str]:
+        """유효한 토큰 반환 - 갱신이 필요할 때만 작업 스레드에서 대기 (이벤트 루프 블로킹 방지)"""
+        token_manager = self.token_manager
+        if token_manager.token and token_manager.expires_in > token_manager.refresh_margin:
+            return token_manager.token
+        return await asyncio.to_thread(token_manager.get_token)
+
+    async def get_access_token(self) -> bool:
+        """네이버 쇼핑 API 액세스 토큰 강제 재발급"""
+        return await asyncio.to_thread(self.token_manager.get_token, True) is not None
+
+    async def make_authenticated_request(self, method: str, endpoint: str, data: Dict = None, log_details: bool = None) -> Dict:
+        """인증된 API 요청 - 상태/데이터/소요 시간 반환 (상세 정보는 조회할 때 생성)"""
+        span, log_details = self._start_trace(method, endpoint, log_details)
+        return self.tracer.finish_span(span, await self._execute_request(method, endpoint, data, log_details))
+
+    async def _execute_request(self, method: str, endpoint: str, data: Dict, log_details: bool) -> Dict:
+        """캐시 확인, 토큰 발급, 서킷 브레이커 확인, 요청 전송 (401 응답 시 토큰 재발급 후 재시도)"""
+        start_time = time.time()
+
+        cached = self._get_cached_response(method, endpoint, data, log_details)
+        if cached is not None:
+            return cached
+
+        access_token = await self._get_token()
+        if not access_token:
+            return self._token_unavailable_result(method, endpoint, data)
+        if method.upper() not in ('GET', 'POST', 'PUT'):
+            return self._unsupported_method_result(method)
+        if not self.circuit_breaker.allow_request():
+            # API 장애로 차단 중이면 요청을 보내지 않고 바로 실패 (재시도 대기로 스레드가 쌓이지 않도록)
+            return self._circuit_open_result(method, endpoint, data)
+
+        url, headers, request_context = self._prepare_request(method, endpoint, data, access_token, log_details)
+
+        try:
+            response = await self._send_with_rate_limit(method, url, headers, data, log_details)
+
+            if response.status_code == 401:
+                # 토큰 만료 시 재발급 (동시에 401을 받은 요청들은 한 번의 갱신 결과를 공유)
+                self.token_manager.invalidate(access_token)
+                access_token = await self._get_token()
+                if access_token:
+                    headers['Authorization'] = f'Bearer {access_token}'
+                    response = await self._send_with_rate_limit(method, url, headers, data, log_details)
+                    result = self._build_response_result(response, request_context, start_time, log_details, token_refreshed=True)
+                    return self._update_cache(method, endpoint, data, result)
+
+            result = self._build_response_result(response, request_context, start_time, log_details)
+            return self._update_cache(method, endpoint, data, result)
+
+        except Exception as e:
+            return self._network_error_result(e, request_context, start_time, log_details)
+
+    async def get_changed_orders_with_chunking(self, start_time: str, end_time: str, last_changed_type: str = 'PAYED') -> Dict:
+        """24시간 단위로 나누어 변경된 주문 조회"""
+        time_windows = self._changed_orders_windows(start_time, end_time)
+
+        async def fetch_window(window):
+            window_start, window_end = window
+            return await self.get_last_changed_orders(
+                last_changed_from=self._format_api_time(window_start),
+                last_changed_to=self._format_api_time(window_end),
+                last_changed_type=last_changed_type
+            )
+
+        return self._build_changed_orders_result(time_windows, await self._map_windows(fetch_window, time_windows))
+
+    async def get_orders(self, start_date: str = None, end_date: str = None, order_status: str = None, limit: int = 50) -> Dict:
+        """주문 목록 조회 - 24시간 단위 구간과 페이지를 이벤트 루프에서 병렬 조회"""
+        start_dt, end_dt = self._order_date_range(start_date, end_date)
+        page_size = min(limit, 100)
+
+        time_windows = self._split_time_windows(start_dt, end_dt)
+        started = time.time()
+
+        async def fetch_window(window):
+            window_start, window_end = window
+            return await self._fetch_orders_window(window_start, window_end, order_status, page_size)
+
+        return self._build_orders_result(time_windows, await self._map_windows(fetch_window, time_windows), started)
+
+    async def get_order_partition(self, start_date: str = None, end_date: str = None, max_age: float = None) -> OrderPartition:
+        """기간 내 전체 상품주문을 상태 조건 없이 한 번 조회하여 상태별로 분류"""
+        partition = self._local_partition(start_date, end_date, max_age)
+        if partition is not None:
+            return partition
+        return self._partition_from_result(start_date, end_date, await self.get_orders(start_date, end_date, limit=100))
+
+    async def get_orders_by_status(self, start_date: str = None, end_date: str = None, statuses=None, max_age: float = None) -> Dict:
+        """지정한 상태(상품주문 상태 또는 클레임 상태)의 주문 조회 - get_orders와 같은 응답 형식 (data['data']는 ProductOrder 목록)"""
+        return (await self.get_order_partition(start_date, end_date, max_age)).to_response(statuses)
+
+    async def iter_orders(self, start_date: str = None, end_date: str = None, statuses=None, limit: int = 100, on_progress=None):
+        """주문 목록을 구간/페이지 순서대로 조회하며 상품주문(ProductOrder)을 하나씩 반환 (async generator)"""
+        stream, plan = self._open_order_stream(start_date, end_date, statuses, limit, on_progress)
+        request = next(plan, None)
+        while request is not None:
+            results = await self._fetch_order_pages_concurrently(*request)
+            try:
+                request = plan.send(results)
+            except StopIteration:
+                request = None
+            for order in self._take_stream_orders(stream):
+                yield order
+
+    async def _map_windows(self, fetch_func, time_windows: List[tuple]) -> List:
+        """구간별 조회 코루틴을 최대 window_workers 개씩 동시에 실행 - 결과는 구간 순서 유지"""
+        semaphore = asyncio.Semaphore(self.window_workers)
+
+        async def run(window):
+            async with semaphore:
+                return await fetch_func(window)
+
+        return list(await asyncio.gather(*(run(window) for window in time_windows)))
+
+    async def _fetch_orders_window(self, window_start, window_end, order_status=None, page_size: int = 100) -> tuple:
+        """한 조회 구간(최대 24시간)의 모든 페이지 조회 - (주문 목록, 구간 통계) 반환 (페이지 계획은 _window_page_plan)"""
+        plan = self._window_page_plan(window_start, window_end, order_status, page_size)
+        request = next(plan)
+        while True:
+            results = await self._fetch_order_pages_concurrently(*request)
+            try:
+                request = plan.send(results)
+            except StopIteration as done:
+                return done.value
+
+    async def _fetch_order_pages_concurrently(self, base_params: Dict, pages: List[int]) -> Dict[int, Dict]:
+        """여러 페이지를 최대 page_fanout 개씩 동시에 조회 - {페이지: 결과} 반환"""
+        if not pages:
+            return {}
+        semaphore = asyncio.Semaphore(self.page_fanout)
+
+        async def fetch_page(page):
+            async with semaphore:
+                return await self._fetch_orders_page(dict(base_params, page=page))
+
+        results = await asyncio.gather(*(fetch_page(page) for page in pages))
+        return dict(zip(pages, results))
+
+    async def _fetch_orders_page(self, params: Dict) -> Dict:
+        """주문 목록 한 페이지 조회 (요청 제한 재시도는 make_authenticated_request에서 처리)"""
+        response = await self.make_authenticated_request('GET', ORDERS_ENDPOINT, params, log_details=False)
+        return self._parse_orders_page(response, params)
+
+    async def get_order_detail(self, product_order_id: str) -> Dict:
+        """주문 상세 정보 조회"""
+        data = {
+            'productOrderIds': [product_order_id]
+        }
+
+        response = await self.make_authenticated_request('POST', QUERY_ENDPOINT, data)
+        return self._first_order_detail(response)
@@ -8,12 +8,15 @@ import json
 from database import DatabaseManager
 from naver_api import NaverShoppingAPI
 from notification_manager import NotificationManager
+from order_hydration import OrderHydrator
+from product_order import ProductOrder
 
 class BackgroundMonitor:
     def __init__(self, db_manager: DatabaseManager, naver_api: NaverShoppingAPI, 
                  notification_manager: NotificationManager, check_interval: int = 300):
         self.db_manager = db_manager
         self.naver_api = naver_api
+        self.hydrator = OrderHydrator(naver_api) if naver_api else None
         self.notification_manager = notification_manager
         self.check_interval = check_interval
         self.monitoring = False
@@ -42,6 +45,12 @@ class BackgroundMonitor:
         """모니터링 루프"""
         while self.monitoring:
             try:
+                # API 차단 중(서킷 브레이커)에는 요청하지 않고 복구 확인 시점까지 대기
+                breaker = getattr(self.naver_api, 'circuit_breaker', None)
+                if breaker is not None and breaker.is_open:
+                    time.sleep(max(1.0, min(breaker.retry_in(), self.check_interval)))
+                    continue
+                
                 self._check_new_orders()
                 self._check_status_changes()
                 self._check_urgent_inquiries()
@@ -59,37 +68,30 @@ class BackgroundMonitor:
             return
         
         try:
-            # 최근 1시간 내 주문 조회
+            # 최근 1시간이 포함된 날짜의 결제 완료(PAYED) 상품주문 조회 (ProductOrder 목록)
             end_time = datetime.now()
             start_time = end_time - timedelta(hours=1)
             
-            new_orders = self.naver_api.get_orders(
+            response = self.naver_api.get_orders_by_status(
                 start_time.strftime('%Y-%m-%d'),
                 end_time.strftime('%Y-%m-%d'),
-                status='ORDERED'
+                statuses=['PAYED']
             )
+            records = (response.get('data') or {}).get('data') or []
             
-            # 데이터베이스에 없는 신규 주문 찾기
-            for order in new_orders:
-                existing_orders = self.db_manager.get_orders_by_status('신규주문')
-                order_exists = any(o['order_id'] == order.get('orderId') for o in existing_orders)
-                
-                if not order_exists:
-                    # 신규 주문 데이터베이스에 추가
-                    order_data = {
-                        'order_id': order.get('orderId'),
-                        'order_date': order.get('orderDate'),
-                        'customer_name': order.get('customerName'),
-                        'customer_phone': order.get('customerPhone'),
-                        'product_name': order.get('productName'),
-                        'quantity': order.get('quantity', 1),
-                        'price': order.get('price', 0),
-                        'status': '신규주문',
-                        'memo': ''
-                    }
-                    
-                    if self.db_manager.add_order(order_data):
-                        # 신규 주문 알림
+            # 데이터베이스에 없는 신규 상품주문 찾기 (조회한 상품주문 ID만 한 번에 확인)
+            existing = self.db_manager.get_product_orders_by_ids(
+                record.product_order_id for record in records if record.product_order_id)
+            new_records = {}
+            for record in records:
+                if record.product_order_id and record.order_id and record.product_order_id not in existing:
+                    new_records[record.product_order_id] = record
+            
+            if new_records:
+                # 신규 주문을 한 트랜잭션으로 저장한 뒤 알림
+                result = self.db_manager.upsert_product_orders(new_records.values())
+                if not result['failed']:
+                    for order_data in (record.to_db_dict() for record in new_records.values()):
                         self.notification_manager.send_new_order_notification(order_data)
                         print(f"신규 주문 알림: {order_data['order_id']}")
         
@@ -102,29 +104,27 @@ class BackgroundMonitor:
             return
         
         try:
-            # 모든 주문의 최신 상태 조회
-            all_orders = self.db_manager.get_all_orders()
+            # 저장된 상품주문의 최신 상태를 배치로 한 번에 조회 (주문마다 요청하지 않음)
+            records = self.db_manager.get_product_orders()
+            latest_orders = self.hydrator.hydrate(record.product_order_id for record in records)
             
-            for order in all_orders:
-                # 네이버 API에서 최신 주문 정보 조회
-                latest_order = self.naver_api.get_order_detail(order['order_id'])
+            changed_records = []
+            for record in records:
+                latest = ProductOrder.from_api(latest_orders.get(record.product_order_id))
                 
-                if latest_order:
-                    new_status = self.naver_api._map_naver_status_to_local(
-                        latest_order.get('status')
+                if latest and latest.order_id and (latest.status, latest.claim_status) != (record.status, record.claim_status):
+                    # 상태 변경 알림
+                    self.notification_manager.send_status_change_notification(
+                        record.order_id,
+                        record.claim_status or record.status,
+                        latest.claim_status or latest.status
                     )
-                    
-                    if new_status != order['status']:
-                        # 상태 변경 알림
-                        self.notification_manager.send_status_change_notification(
-                            order['order_id'],
-                            order['status'],
-                            new_status
-                        )
-                        
-                        # 데이터베이스 상태 업데이트
-                        self.db_manager.update_order_status(order['order_id'], new_status)
-                        print(f"주문 상태 변경: {order['order_id']} - {order['status']} → {new_status}")
+                    changed_records.append(latest)
+                    print(f"주문 상태 변경: {record.product_order_id} - {record.status} → {latest.status}")
+            
+            if changed_records:
+                # 변경된 상품주문을 한 번에 저장
+                self.db_manager.upsert_product_orders(changed_records)
         
         except Exception as e:
             print(f"상태 변경 체크 오류: {e}")
@@ -135,24 +135,24 @@ class BackgroundMonitor:
             # 긴급 문의 키워드
             urgent_keywords = ['긴급', 'ASAP', '빠른', '즉시', '당장', '급함', '급구']
             
-            # 최근 주문의 메모 확인
-            recent_orders = self.db_manager.get_all_orders()
+            # 최근 주문의 배송 메모 확인
+            recent_orders = self.db_manager.get_product_orders()
             
             for order in recent_orders:
-                memo = order.get('memo', '')
+                memo = order.shipping_memo
                 if memo:
                     for keyword in urgent_keywords:
                         if keyword in memo:
                             # 긴급 문의 알림
                             inquiry_data = {
-                                'customer_name': order['customer_name'],
-                                'customer_phone': order['customer_phone'],
+                                'customer_name': order.orderer_name,
+                                'customer_phone': order.orderer_tel,
                                 'content': memo,
-                                'order_id': order['order_id']
+                                'order_id': order.order_id
                             }
                             
                             self.notification_manager.send_urgent_inquiry_notification(inquiry_data)
-                            print(f"긴급 문의 알림: {order['order_id']}")
+                            print(f"긴급 문의 알림: {order.order_id}")
                             break
         
         except Exception as e:
@@ -183,19 +183,21 @@ class BackgroundMonitor:
     def get_order_statistics(self) -> Dict:
         """주문 통계 정보 반환"""
         try:
-            counts = self.db_manager.get_order_counts()
+            counts = self.db_manager.get_product_order_counts()
             
             # 시간대별 통계
             now = datetime.now()
             today_orders = []
             yesterday_orders = []
             
-            all_orders = self.db_manager.get_all_orders()
+            all_orders = self.db_manager.get_product_orders()
             for order in all_orders:
-                order_date = datetime.strptime(order['order_date'], '%Y-%m-%d')
-                if order_date.date() == now.date():
+                if not order.order_date:
+                    continue
+                order_date = order.order_date.date()
+                if order_date == now.date():
                     today_orders.append(order)
-                elif order_date.date() == (now - timedelta(days=1)).date():
+                elif order_date == (now - timedelta(days=1)).date():
                     yesterday_orders.append(order)
             
             return {
@@ -203,9 +205,9 @@ class BackgroundMonitor:
                 'status_counts': counts,
                 'today_orders': len(today_orders),
                 'yesterday_orders': len(yesterday_orders),
-                'new_orders_today': len([o for o in today_orders if o['status'] == '신규주문']),
-                'shipped_today': len([o for o in today_orders if o['status'] == '배송중']),
-                'delivered_today': len([o for o in today_orders if o['status'] == '배송완료'])
+                'new_orders_today': len([o for o in today_orders if o.status == 'PAYED']),
+                'shipped_today': len([o for o in today_orders if o.status == 'DELIVERING']),
+                'delivered_today': len([o for o in today_orders if o.status == 'DELIVERED'])
             }
         
         except Exception as e:
@@ -0,0 +1,108 @@
+"""
+DB 조회 실행 계획 점검 - 대용량 임시 DB에서 HOT_QUERIES가 전체 테이블 스캔을 하지 않는지 확인
+
+사용 예:
+    python check_query_plans.py                 (주문/상품주문 각 500,000건)
+    python check_query_plans.py --orders 100000 --verbose
+
+전체 테이블 스캔이 있는 조회가 있으면 종료 코드 1을 반환한다.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from database import DatabaseManager, HOT_QUERIES, UNFILTERED_QUERIES, is_full_scan
+from order_documents import encode_document
+
+ORDER_STATUSES = ['PAYED', 'DELIVERING', 'DELIVERED', 'PURCHASE_DECIDED', 'CANCELED', 'RETURNED', 'EXCHANGED']
+PRODUCT_STATUSES = ['SALE', 'OUTOFSTOCK', 'SUSPENSION', 'CLOSE']
+
+
+def populate(db_manager: DatabaseManager, order_count: int, product_count: int, shipment_count: int):
+    """임의 데이터로 테이블 채우기 (한 트랜잭션)"""
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    with db_manager.connection() as conn:
+        conn.executemany(
+            'INSERT INTO orders (order_id, order_date, status, product_order_id, shipping_due_date, price) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            ((f'O{i}', (start + timedelta(seconds=i * 60)).isoformat(), rng.choice(ORDER_STATUSES), f'P{i}',
+              (start + timedelta(seconds=i * 60, days=3)).isoformat(), rng.randint(1000, 100000))
+             for i in range(order_count)))
+        conn.executemany(
+            'INSERT INTO order_headers (order_id, order_date, orderer_name) VALUES (?, ?, ?)',
+            ((f'O{i}', (start + timedelta(seconds=i * 60)).isoformat(), f'주문자 {i}')
+             for i in range(0, order_count, 2)))
+        # 주문 하나에 상품주문 두 건
+        conn.executemany(
+            'INSERT INTO product_orders (product_order_id, order_id, order_date, status, claim_status, total_amount, '
+            'shipping_due_date, last_changed_date) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            ((f'P{i}', f'O{i - i % 2}', (start + timedelta(seconds=(i - i % 2) * 60)).isoformat(), status,
+              status if status in ('CANCELED', 'RETURNED', 'EXCHANGED') and rng.random() < 0.5 else None,
+              rng.randint(1000, 100000), (start + timedelta(seconds=i * 60, days=3)).isoformat(),
+              (start + timedelta(seconds=i * 60 + 30)).isoformat())
+             for i, status in ((i, rng.choice(ORDER_STATUSES)) for i in range(order_count))))
+        conn.executemany(
+            'INSERT INTO order_documents (product_order_id, order_id, last_changed_date, codec, raw_size, payload) '
+            "VALUES (?, ?, ?, 'zlib', ?, ?)",
+            ((f'P{i}', f'O{i - i % 2}', (start + timedelta(seconds=i * 60 + 30)).isoformat(), raw_size, blob)
+             for i, (blob, raw_size, _) in ((i, encode_document({'productOrder': {'productOrderId': f'P{i}'}}))
+                                             for i in range(order_count))))
+        conn.executemany(
+            'INSERT INTO products (channel_product_no, product_name, status_type, modified_date, updated_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            ((str(i), f'상품 {i}', rng.choice(PRODUCT_STATUSES), (start + timedelta(hours=i)).isoformat(),
+              (start + timedelta(minutes=i)).isoformat())
+             for i in range(product_count)))
+        conn.executemany(
+            "INSERT INTO shipping_outbox (product_order_id, delivery_company, tracking_number, status, next_attempt_at) "
+            "VALUES (?, 'CJGLS', ?, ?, ?)",
+            ((f'P{i}', f'{600000000000 + i}', 'sent' if i % 10 else 'pending', float(i)) for i in range(shipment_count)))
+        conn.execute('ANALYZE')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='HOT_QUERIES 실행 계획 점검')
+    parser.add_argument('--orders', type=int, default=500000)
+    parser.add_argument('--products', type=int, default=50000)
+    parser.add_argument('--shipments', type=int, default=20000)
+    parser.add_argument('--verbose', action='store_true', help='모든 조회의 실행 계획 출력')
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix='query_plans_'), 'orders.db')
+    db_manager = DatabaseManager(db_path)
+    started = time.time()
+    populate(db_manager, args.orders, args.products, args.shipments)
+    print(f"테스트 DB 생성: 주문/상품주문 각 {args.orders:,}건, 상품 {args.products:,}개, 발송 대기열 {args.shipments:,}건 "
+          f"({time.time() - started:.1f}초)")
+
+    plans = db_manager.explain()
+    failures = []
+    with db_manager.connection() as conn:
+        for name, plan in plans.items():
+            sql, params = HOT_QUERIES[name]
+            query_started = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            elapsed = (time.perf_counter() - query_started) * 1000
+            # 전체 목록 조회(UNFILTERED_QUERIES)만 테이블 전체 스캔을 허용
+            full_scan = is_full_scan(plan) and name not in UNFILTERED_QUERIES
+            if full_scan:
+                failures.append(name)
+            result = 'FAIL' if full_scan else ('full' if name in UNFILTERED_QUERIES else 'ok')
+            print(f"{result:>4}  {name:<36} {elapsed:9.1f}ms  {' / '.join(plan)}"
+                  if args.verbose or full_scan else f"{result:>4}  {name:<36} {elapsed:9.1f}ms")
+
+    db_manager.close()
+    if failures:
+        print(f"전체 테이블 스캔 조회 {len(failures)}개: {', '.join(failures)}")
+        return 1
+    print(f"조회 {len(plans)}개 모두 인덱스 사용")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
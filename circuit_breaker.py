@@ -0,0 +1,199 @@
+"""
+네이버 커머스 API 서킷 브레이커 모듈
+"""
+import time
+import threading
+from typing import Callable, Dict, List
+
+CLOSED = 'closed'        # 정상 - 모든 요청 허용
+OPEN = 'open'            # 차단 - 요청 없이 바로 실패 (캐시/DB 데이터 사용)
+HALF_OPEN = 'half_open'  # 복구 확인 - 시험 요청만 허용
+
+STATE_LABELS = {
+    CLOSED: '정상',
+    OPEN: '차단 (캐시 모드)',
+    HALF_OPEN: '복구 확인 중'
+}
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold회 이상이면 recovery_timeout초 동안 요청을 차단
+
+    차단 시간이 지나면 half_open_max_calls개의 시험 요청만 보내고,
+    시험 요청이 성공하면 정상으로, 실패하면 다시 차단한다 (차단 시간은 최대 max_recovery_timeout까지 2배씩 증가).
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1,
+                 max_recovery_timeout: float = 300.0):
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0            # 연속 실패 횟수
+        self._opened_at = 0.0
+        self._open_timeout = 0.0      # 현재 차단 시간
+        self._probes = 0              # 진행 중인 시험 요청 수
+        self._opened_count = 0
+        self._rejected = 0
+        self._listeners: List[Callable[[str], None]] = []
+        self.configure(failure_threshold, recovery_timeout, half_open_max_calls, max_recovery_timeout)
+
+    def configure(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1,
+                  max_recovery_timeout: float = 300.0):
+        """임계값 설정 변경 (공유 인스턴스를 재사용할 때 호출)"""
+        with self._lock:
+            self.failure_threshold = max(1, int(failure_threshold))
+            self.recovery_timeout = max(1.0, float(recovery_timeout))
+            self.half_open_max_calls = max(1, int(half_open_max_calls))
+            self.max_recovery_timeout = max(self.recovery_timeout, float(max_recovery_timeout))
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """상태 변경 콜백 등록 - callback(새 상태), 상태를 바꾼 스레드에서 호출된다"""
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], None]):
+        """상태 변경 콜백 해제"""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (차단 시간이 지났으면 half_open)"""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self._open_timeout:
+                return HALF_OPEN
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """요청을 차단하는 중인지 여부 (시험 요청 대기 포함)"""
+        return self.state == OPEN
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부 - 허용된 요청은 끝난 뒤 record_success/record_failure를 호출해야 한다"""
+        with self._lock:
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self._open_timeout:
+                    self._rejected += 1
+                    return False
+                changed = self._transition(HALF_OPEN)
+            else:
+                changed = None
+
+            if self._state == HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    self._rejected += 1
+                    allowed = False
+                else:
+                    self._probes += 1
+                    allowed = True
+            else:
+                allowed = True
+        self._notify(changed)
+        return allowed
+
+    def record_success(self):
+        """요청 성공 (서버가 정상 응답) - 시험 요청이면 정상 상태로 복귀"""
+        with self._lock:
+            self._failures = 0
+            changed = None
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                self._open_timeout = 0.0
+                changed = self._transition(CLOSED)
+        self._notify(changed)
+
+    def record_failure(self):
+        """요청 실패 (네트워크 오류, 5xx, 재시도 후에도 요청 제한) - 임계값을 넘거나 시험 요청이 실패하면 차단"""
+        with self._lock:
+            self._failures += 1
+            changed = None
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                changed = self._open(min(self.max_recovery_timeout, max(self.recovery_timeout, self._open_timeout * 2)))
+            elif self._state == CLOSED and self._failures >= self.failure_threshold:
+                changed = self._open(self.recovery_timeout)
+        self._notify(changed)
+
+    def reset(self):
+        """정상 상태로 강제 복귀 (API 재초기화 시)"""
+        with self._lock:
+            self._failures = 0
+            self._probes = 0
+            self._open_timeout = 0.0
+            changed = self._transition(CLOSED)
+        self._notify(changed)
+
+    def retry_in(self) -> float:
+        """다음 시험 요청까지 남은 시간 (초)"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._open_timeout - (time.monotonic() - self._opened_at))
+
+    def get_stats(self) -> Dict:
+        """현재 서킷 브레이커 상태 조회"""
+        state = self.state
+        with self._lock:
+            return {
+                'state': state,
+                'label': STATE_LABELS[state],
+                'failures': self._failures,
+                'failure_threshold': self.failure_threshold,
+                'opened_count': self._opened_count,
+                'rejected': self._rejected,
+                'retry_in': round(max(0.0, self._open_timeout - (time.monotonic() - self._opened_at)), 1)
+                if self._state == OPEN else 0.0
+            }
+
+    def _open(self, timeout: float):
+        """차단 상태로 전환 (lock 보유 상태에서 호출)"""
+        self._opened_at = time.monotonic()
+        self._open_timeout = timeout
+        self._opened_count += 1
+        self._transition(OPEN)
+        print(f"API 서킷 브레이커 차단 - 연속 실패 {self._failures}회, {timeout:.0f}초 후 복구 확인")
+        return OPEN
+
+    def _transition(self, state: str):
+        """상태 변경 (lock 보유 상태에서 호출) - 바뀌었으면 새 상태, 아니면 None 반환"""
+        if self._state == state:
+            return None
+        self._state = state
+        if state == CLOSED:
+            print("API 서킷 브레이커 복구 - 정상 요청 재개")
+        return state
+
+    def _notify(self, state):
+        """lock 밖에서 상태 변경 콜백 호출"""
+        if state is None:
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(state)
+            except Exception as e:
+                print(f"서킷 브레이커 상태 알림 오류: {e}")
+
+
+# 프로세스 전체에서 공유하는 서킷 브레이커 (모든 탭, 백그라운드 모니터, 재초기화된 API 클라이언트 공통)
+_shared_breaker = None
+_shared_breaker_lock = threading.Lock()
+
+
+def get_shared_circuit_breaker(failure_threshold: int = None, recovery_timeout: float = None) -> CircuitBreaker:
+    """공유 서킷 브레이커 반환 (싱글톤 패턴)
+
+    임계값은 처음 생성할 때만 적용된다 - 나중에 만든 클라이언트가 다른 클라이언트의 설정을 덮어쓰지 않도록
+    (설정 변경은 configure를 명시적으로 호출).
+    """
+    global _shared_breaker
+    with _shared_breaker_lock:
+        if _shared_breaker is None:
+            settings = {}
+            if failure_threshold is not None:
+                settings['failure_threshold'] = failure_threshold
+            if recovery_timeout is not None:
+                settings['recovery_timeout'] = recovery_timeout
+            _shared_breaker = CircuitBreaker(**settings)
+        return _shared_breaker
@@ -1,256 +1,492 @@
 import sqlite3
 import json
+import hashlib
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional
+
+from order_documents import OrderDocument, available_codec, compress_document, serialize_document
+from product_order import ProductOrder
+from schema_migrations import migrate, SCHEMA_VERSION
+
+SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+# 자주 실행하는 조회의 SQL - DatabaseManager 메서드와 HOT_QUERIES(check_query_plans.py)가 같은 문자열을 사용
+# {placeholders}: IN 목록의 '?, ?, ...', {date_condition}: 주문일 조건 또는 빈 문자열
+ORDERS_BY_STATUS_SQL = 'SELECT * FROM orders WHERE status = ? ORDER BY order_date DESC'
+ALL_ORDERS_SQL = 'SELECT * FROM orders ORDER BY order_date DESC'
+ORDERS_BY_DATE_RANGE_SQL = 'SELECT * FROM orders WHERE order_date >= ? AND order_date <= ? ORDER BY order_date DESC'
+ORDER_COUNTS_SQL = 'SELECT status, COUNT(*) as count FROM orders {date_condition} GROUP BY status'
+COUNT_EXISTING_SQL = 'SELECT COUNT(*) FROM {table} WHERE {key_column} IN ({placeholders})'
+SETTING_SQL = 'SELECT value FROM settings WHERE key = ?'
+
+PRODUCT_SELECT_COLUMNS = (
+    'channel_product_no, origin_product_no, product_name, status_type, sale_price, discounted_price, '
+    'stock_quantity, category_id, category_name, brand_name, manufacturer_name, model_name, '
+    'seller_management_code, reg_date, modified_date, representative_image_url, whole_category_name, '
+    'whole_category_id, delivery_fee, return_fee, exchange_fee, discount_method, customer_benefit, '
+    'created_at, updated_at'
+)
+ALL_PRODUCTS_SQL = f'SELECT {PRODUCT_SELECT_COLUMNS} FROM products ORDER BY updated_at DESC'
+PRODUCTS_BY_STATUS_SQL = f'SELECT {PRODUCT_SELECT_COLUMNS} FROM products WHERE status_type = ? ORDER BY updated_at DESC'
+PRODUCT_BY_ID_SQL = f'SELECT {PRODUCT_SELECT_COLUMNS} FROM products WHERE channel_product_no = ?'
+PRODUCT_MODIFIED_DATES_SQL = 'SELECT channel_product_no, modified_date FROM products'
+PRODUCT_HASHES_SQL = 'SELECT channel_product_no, content_hash FROM products WHERE channel_product_no IN ({placeholders})'
+
+PRODUCT_ORDER_SELECT_SQL = (
+    'SELECT p.*, h.orderer_name, h.orderer_tel, h.payment_means '
+    'FROM product_orders p LEFT JOIN order_headers h ON h.order_id = p.order_id'
+)
+PRODUCT_ORDERS_BY_ID_SQL = PRODUCT_ORDER_SELECT_SQL + ' WHERE p.product_order_id IN ({placeholders})'
+# 상태 조건 - 상품주문 상태 인덱스와 클레임 상태 인덱스를 각각 검색해서 합침
+# (status IN (...) OR claim_status IN (...)로 쓰면 주문일 인덱스 전체를 순회함)
+PRODUCT_ORDER_STATUS_ROWIDS_SQL = (
+    'SELECT rowid FROM product_orders WHERE status IN ({placeholders}){date_condition} '
+    'UNION SELECT rowid FROM product_orders WHERE claim_status IN ({placeholders}){date_condition}'
+)
+# 상품주문 상태별 건수 (get_product_order_counts)
+PRODUCT_ORDER_STATUS_COUNTS_SQL = 'SELECT status, COUNT(*) FROM product_orders {date_condition} GROUP BY status'
+PRODUCT_ORDER_CLAIM_COUNTS_SQL = (
+    "SELECT claim_status, COUNT(*) FROM product_orders "
+    "WHERE claim_status IS NOT NULL AND claim_status != '' {date_condition} GROUP BY claim_status")
+PRODUCT_ORDER_CLAIM_OVERLAP_SQL = (
+    "SELECT claim_status, COUNT(*) FROM product_orders "
+    "WHERE claim_status IS NOT NULL AND claim_status != '' AND claim_status = status {date_condition} "
+    "GROUP BY claim_status")
+
+ORDER_DOCUMENTS_SQL = 'SELECT product_order_id, order_id, last_changed_date, codec, raw_size, payload FROM order_documents'
+ORDER_DOCUMENTS_BY_ID_SQL = ORDER_DOCUMENTS_SQL + ' WHERE product_order_id IN ({placeholders}){date_condition}'
+ORDER_DOCUMENTS_CHANGED_SINCE_SQL = ORDER_DOCUMENTS_SQL + ' WHERE last_changed_date >= ?'
+ORDER_DOCUMENT_VERSIONS_SQL = (
+    'SELECT product_order_id, content_hash, last_changed_date FROM order_documents '
+    'WHERE product_order_id IN ({placeholders})'
+)
+
+DUE_SHIPMENTS_SQL = "SELECT * FROM shipping_outbox WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY next_attempt_at, id"
+NEXT_SHIPMENT_DUE_SQL = "SELECT MIN(next_attempt_at) FROM shipping_outbox WHERE status = 'pending'"
+SHIPPING_OUTBOX_COUNTS_SQL = 'SELECT status, COUNT(*) FROM shipping_outbox GROUP BY status'
+
+
+def placeholders(count: int) -> str:
+    """IN 목록 자리표시자 ('?, ?, ...')"""
+    return ', '.join('?' * count)
+
+
+def product_orders_sql(status_count: int = 0, start_date: bool = False, end_date: bool = False) -> str:
+    """get_product_orders 조회문 (상태 개수, 주문일 시작/끝 조건 여부에 따라 생성, 주문일 최신순)"""
+    date_condition = (' AND order_date >= ?' if start_date else '') + (' AND order_date <= ?' if end_date else '')
+    if status_count:
+        where = 'WHERE p.rowid IN ({})'.format(PRODUCT_ORDER_STATUS_ROWIDS_SQL.format(
+            placeholders=placeholders(status_count), date_condition=date_condition))
+    elif date_condition:
+        where = 'WHERE ' + date_condition[len(' AND '):].replace('order_date', 'p.order_date')
+    else:
+        where = ''
+    return f'{PRODUCT_ORDER_SELECT_SQL} {where} ORDER BY p.order_date DESC'
+
+
+def product_orders_params(statuses: List[str] = None, start_date: str = None, end_date: str = None) -> list:
+    """product_orders_sql 조회문의 파라미터"""
+    dates = [date for date in (start_date, end_date) if date]
+    if statuses:
+        return list(statuses) + dates + list(statuses) + dates
+    return dates
+
+
+# 탭/대시보드/동기화가 자주 실행하는 조회 - 이름: (SQL, 예시 파라미터)
+# 인덱스를 바꾸면 check_query_plans.py로 테이블 전체를 읽는 조회가 없는지 확인한다.
+HOT_QUERIES = {
+    'orders_by_status': (ORDERS_BY_STATUS_SQL, ('PAYED',)),
+    'all_orders': (ALL_ORDERS_SQL, ()),
+    'order_counts': (ORDER_COUNTS_SQL.format(date_condition=''), ()),
+    'order_counts_since': (ORDER_COUNTS_SQL.format(date_condition='WHERE order_date >= ?'), ('2024-01-01',)),
+    'orders_by_date_range': (ORDERS_BY_DATE_RANGE_SQL, ('2024-01-01', '2024-01-07')),
+    'order_exists': (COUNT_EXISTING_SQL.format(table='orders', key_column='order_id', placeholders=placeholders(2)),
+                     ('O1', 'O2')),
+    # 상태별 탭 (get_product_orders - 상품주문 상태 또는 클레임 상태)
+    'all_product_orders': (product_orders_sql(), ()),
+    'product_orders_by_status': (product_orders_sql(2), product_orders_params(['RETURNED', 'EXCHANGED'])),
+    'product_orders_by_status_and_date': (product_orders_sql(1, True, True),
+                                          product_orders_params(['PAYED'], '2024-01-01', '2024-01-07')),
+    'product_orders_by_date_range': (product_orders_sql(0, True, True),
+                                     product_orders_params(None, '2024-01-01', '2024-01-07')),
+    'product_orders_by_id': (PRODUCT_ORDERS_BY_ID_SQL.format(placeholders=placeholders(2)), ('P1', 'P2')),
+    'product_order_counts_since': (PRODUCT_ORDER_STATUS_COUNTS_SQL.format(date_condition='WHERE order_date >= ?'),
+                                   ('2024-01-01',)),
+    'product_order_claim_counts_since': (PRODUCT_ORDER_CLAIM_COUNTS_SQL.format(date_condition='AND order_date >= ?'),
+                                         ('2024-01-01',)),
+    'product_order_claim_overlap_since': (PRODUCT_ORDER_CLAIM_OVERLAP_SQL.format(date_condition='AND order_date >= ?'),
+                                          ('2024-01-01',)),
+    'product_order_exists': (COUNT_EXISTING_SQL.format(table='product_orders', key_column='product_order_id',
+                                                       placeholders=placeholders(2)), ('P1', 'P2')),
+    'order_documents_by_id': (ORDER_DOCUMENTS_BY_ID_SQL.format(placeholders=placeholders(2), date_condition=''),
+                              ('P1', 'P2')),
+    'order_documents_changed_since': (ORDER_DOCUMENTS_CHANGED_SINCE_SQL, ('2024-03-01',)),
+    'order_document_versions': (ORDER_DOCUMENT_VERSIONS_SQL.format(placeholders=placeholders(2)), ('P1', 'P2')),
+    'setting': (SETTING_SQL, ('order_sync_cursor',)),
+    'all_products': (ALL_PRODUCTS_SQL, ()),
+    'products_by_status': (PRODUCTS_BY_STATUS_SQL, ('SALE',)),
+    'product_by_id': (PRODUCT_BY_ID_SQL, ('1',)),
+    'product_modified_dates': (PRODUCT_MODIFIED_DATES_SQL, ()),
+    'product_hashes': (PRODUCT_HASHES_SQL.format(placeholders=placeholders(2)), ('1', '2')),
+    'due_shipments': (DUE_SHIPMENTS_SQL, (0,)),
+    'next_shipment_due': (NEXT_SHIPMENT_DUE_SQL, ()),
+    'shipping_outbox_counts': (SHIPPING_OUTBOX_COUNTS_SQL, ()),
+}
+
+# 전체 목록 조회라 테이블 전체를 읽는 것이 정상인 조회
+UNFILTERED_QUERIES = frozenset({'all_orders', 'all_product_orders', 'all_products'})
+
+
+def explain(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> List[str]:
+    """EXPLAIN QUERY PLAN 결과 (실행 계획 detail 목록)"""
+    return [row[-1] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()]
+
+
+def is_full_scan(plan: List[str]) -> bool:
+    """테이블 전체를 읽는 단계가 있는지
+
+    인덱스 없는 스캔('SCAN orders', 구버전 'SCAN TABLE orders')과
+    커버링이 아닌 인덱스 순회('SCAN orders USING INDEX ...' - 순서만 인덱스로 맞추고 모든 행을 읽음)를 포함한다.
+    커버링 인덱스 순회, 서브쿼리 결과('SCAN (subquery-1)')와 상수 행 스캔은 제외한다.
+    """
+    for detail in plan:
+        if not detail.startswith('SCAN ') or detail.startswith(('SCAN (', 'SCAN CONSTANT ROW')):
+            continue
+        if ' USING COVERING INDEX ' not in detail:
+            return True
+    return False
+
+
+JOURNAL_MODES = ('WAL', 'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'OFF')
+
+
+class ConnectionManager:
+    """스레드별 SQLite 연결 재사용
+
+    스레드마다 연결을 하나 열어 두고 계속 사용한다 (호출마다 connect/close 하지 않음).
+    WAL 모드에서는 UI 스레드의 조회와 동기화/모니터 스레드의 쓰기가 서로 막지 않고,
+    쓰기끼리 겹치면 busy_timeout 동안 기다린 뒤 실패한다.
+    종료된 스레드의 연결은 새 연결을 열 때 정리하고, close()에서 남은 연결을 모두 닫는다.
+    """
+
+    def __init__(self, db_path: str, journal_mode: str = 'WAL', synchronous: str = 'NORMAL',
+                 busy_timeout_ms: int = 5000, cache_size_kb: int = 16384, mmap_size_mb: int = 64):
+        self.db_path = db_path
+        self.journal_mode = journal_mode.upper() if journal_mode.upper() in JOURNAL_MODES else 'WAL'
+        self.synchronous = synchronous.upper() if synchronous.upper() in SYNCHRONOUS_MODES else 'NORMAL'
+        self.busy_timeout_ms = max(0, int(busy_timeout_ms))
+        self.cache_size_kb = max(0, int(cache_size_kb))
+        self.mmap_size_mb = max(0, int(mmap_size_mb))
+        self._lock = threading.Lock()
+        self._connections: Dict[int, tuple] = {}  # 스레드 ident -> (스레드, 연결, 트랜잭션 깊이 목록)
+        self._opened = 0
+
+    def _open(self) -> sqlite3.Connection:
+        """새 연결을 열고 PRAGMA 적용"""
+        # 다른 스레드(종료 처리)에서 close 할 수 있도록 check_same_thread=False - 사용은 소유 스레드에서만
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False)
+        conn.execute(f'PRAGMA busy_timeout = {self.busy_timeout_ms}')
+        if self.db_path != ':memory:':
+            conn.execute(f'PRAGMA journal_mode = {self.journal_mode}')
+        conn.execute(f'PRAGMA synchronous = {self.synchronous}')
+        if self.cache_size_kb:
+            conn.execute(f'PRAGMA cache_size = -{self.cache_size_kb}')  # 음수는 KiB 단위
+        conn.execute(f'PRAGMA mmap_size = {self.mmap_size_mb * 1024 * 1024}')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        return conn
+
+    def _entry(self) -> tuple:
+        """현재 스레드의 (스레드, 연결, 깊이) - 없으면 새로 연다"""
+        ident = threading.get_ident()
+        current = threading.current_thread()
+        with self._lock:
+            entry = self._connections.get(ident)
+            if entry is not None and entry[0] is current:
+                return entry
+            stale = [key for key, (thread, _, _) in self._connections.items() if not thread.is_alive() or key == ident]
+            stale_connections = [self._connections.pop(key)[1] for key in stale]
+        for conn in stale_connections:
+            try:
+                conn.close()
+            except Exception as e:
+                print(f"DB 연결 정리 오류: {e}")
+
+        entry = (current, self._open(), [0])
+        with self._lock:
+            self._connections[ident] = entry
+            self._opened += 1
+        return entry
+
+    @contextmanager
+    def connection(self):
+        """현재 스레드의 연결 - 블록이 정상 종료되면 commit, 예외가 나면 rollback (중첩 시 가장 바깥에서 처리)"""
+        _, conn, depth = self._entry()
+        depth[0] += 1
+        try:
+            yield conn
+        except Exception:
+            if depth[0] == 1 and conn.in_transaction:
+                conn.rollback()
+            raise
+        else:
+            if depth[0] == 1 and conn.in_transaction:
+                conn.commit()
+        finally:
+            depth[0] -= 1
+
+    def close(self):
+        """모든 연결 종료 (WAL 체크포인트 후) - 이후 호출은 새 연결을 연다"""
+        with self._lock:
+            entries = list(self._connections.values())
+            self._connections.clear()
+        for index, (_, conn, _) in enumerate(entries):
+            try:
+                if index == len(entries) - 1:
+                    conn.execute('PRAGMA optimize')
+                    if self.journal_mode == 'WAL':
+                        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                conn.close()
+            except Exception as e:
+                print(f"DB 연결 종료 오류: {e}")
+
+    def get_stats(self) -> Dict:
+        """연결 통계"""
+        with self._lock:
+            return {
+                'open_connections': len(self._connections),
+                'opened_total': self._opened,
+                'journal_mode': self.journal_mode,
+                'synchronous': self.synchronous,
+                'busy_timeout_ms': self.busy_timeout_ms
+            }
+
 
 class DatabaseManager:
-    def __init__(self, db_path: str = "orders.db"):
+    def __init__(self, db_path: str = "orders.db", journal_mode: str = 'WAL', synchronous: str = 'NORMAL',
+                 busy_timeout_ms: int = 5000, cache_size_kb: int = 16384, mmap_size_mb: int = 64,
+                 document_codec: str = 'zlib'):
         self.db_path = db_path
+        self.document_codec = available_codec(document_codec)  # 상품주문 원본 응답 압축 코덱
+        self.connections = ConnectionManager(db_path, journal_mode=journal_mode, synchronous=synchronous,
+                                             busy_timeout_ms=busy_timeout_ms, cache_size_kb=cache_size_kb,
+                                             mmap_size_mb=mmap_size_mb)
+        self.query_plans: Dict[str, List[str]] = {}  # explain() 결과
         self.init_database()
+
+    def connection(self):
+        """현재 스레드의 재사용 연결 (with 블록 단위로 commit/rollback)"""
+        return self.connections.connection()
+
+    def close(self):
+        """애플리케이션 종료 시 DB 연결 정리"""
+        self.connections.close()
+
+    def get_connection_stats(self) -> Dict:
+        """DB 연결 통계"""
+        return self.connections.get_stats()
+
+    def explain(self, names: List[str] = None) -> Dict[str, List[str]]:
+        """HOT_QUERIES의 실행 계획을 조회해 query_plans에 기록 - {이름: 실행 계획}"""
+        plans = {}
+        with self.connection() as conn:
+            for name in names or HOT_QUERIES:
+                sql, params = HOT_QUERIES[name]
+                plans[name] = explain(conn, sql, params)
+        self.query_plans.update(plans)
+        return plans
     
     def init_database(self):
-        """데이터베이스 초기화 및 테이블 생성"""
+        """데이터베이스 초기화 (스키마 마이그레이션 적용 - 최신이면 바로 반환)"""
         try:
-            print(f"데이터베이스 초기화 시작 - 경로: {self.db_path}")
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            print("데이터베이스 연결 성공")
-            
-            # 주문 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS orders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                order_id TEXT UNIQUE NOT NULL,
-                order_date TEXT NOT NULL,
-                customer_name TEXT,
-                customer_phone TEXT,
-                product_name TEXT,
-                quantity INTEGER,
-                price INTEGER,
-                status TEXT DEFAULT '신규주문',
-                shipping_company TEXT,
-                tracking_number TEXT,
-                memo TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-            # 설정 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-            # 상품 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS products (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                channel_product_no TEXT UNIQUE NOT NULL,
-                origin_product_no TEXT,
-                product_name TEXT NOT NULL,
-                status_type TEXT,
-                sale_price INTEGER DEFAULT 0,
-                discounted_price INTEGER DEFAULT 0,
-                stock_quantity INTEGER DEFAULT 0,
-                category_id TEXT,
-                category_name TEXT,
-                brand_name TEXT,
-                manufacturer_name TEXT,
-                model_name TEXT,
-                seller_management_code TEXT,
-                reg_date TEXT,
-                modified_date TEXT,
-                representative_image_url TEXT,
-                whole_category_name TEXT,
-                whole_category_id TEXT,
-                delivery_fee INTEGER DEFAULT 0,
-                return_fee INTEGER DEFAULT 0,
-                exchange_fee INTEGER DEFAULT 0,
-                discount_method TEXT,
-                customer_benefit TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-            # 알림 로그 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS notification_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    order_id TEXT,
-                    notification_type TEXT,
-                    message TEXT,
-                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # 기존 테이블에 누락된 컬럼들 추가
-            self._add_missing_columns(cursor)
-            
-            conn.commit()
-            conn.close()
-            print("데이터베이스 초기화 완료")
+            with self.connection() as conn:
+                applied = migrate(conn)
+            if applied:
+                print(f"데이터베이스 초기화 완료 - 경로: {self.db_path}, 스키마 버전 {SCHEMA_VERSION}")
         except Exception as e:
             print(f"데이터베이스 초기화 오류: {e}")
             raise
     
-    def _add_missing_columns(self, cursor):
-        """기존 테이블에 누락된 컬럼들 추가"""
-        try:
-            # products 테이블에 누락된 컬럼들 추가
-            missing_product_columns = [
-                ('discount_method', 'TEXT'),
-                ('customer_benefit', 'TEXT')
-            ]
-            
-            for column_name, column_type in missing_product_columns:
-                try:
-                    cursor.execute(f'ALTER TABLE products ADD COLUMN {column_name} {column_type}')
-                    print(f"상품 컬럼 추가 성공: {column_name}")
-                except sqlite3.OperationalError as e:
-                    if "duplicate column name" in str(e):
-                        print(f"컬럼 이미 존재: {column_name}")
-                    else:
-                        print(f"컬럼 추가 실패: {column_name} - {e}")
-            
-            # orders 테이블에 누락된 컬럼들 추가
-            missing_order_columns = [
-                ('product_order_id', 'TEXT'),
-                ('shipping_due_date', 'TEXT'),
-                ('product_option', 'TEXT')
-            ]
-            
-            for column_name, column_type in missing_order_columns:
-                try:
-                    cursor.execute(f'ALTER TABLE orders ADD COLUMN {column_name} {column_type}')
-                    print(f"주문 컬럼 추가 성공: {column_name}")
-                except sqlite3.OperationalError as e:
-                    if "duplicate column name" in str(e):
-                        print(f"컬럼 이미 존재: {column_name}")
-                    else:
-                        print(f"컬럼 추가 실패: {column_name} - {e}")
-                        
-        except Exception as e:
-            print(f"컬럼 추가 중 오류: {e}")
-    
+    ORDER_COLUMNS = (
+        'order_id', 'order_date', 'customer_name', 'customer_phone',
+        'product_name', 'quantity', 'price', 'status', 'shipping_company',
+        'tracking_number', 'memo', 'product_order_id', 'shipping_due_date',
+        'product_option'
+    )
+    ORDER_UPSERT_BATCH_SIZE = 500
+
+    def _order_params(self, order_data: Dict) -> tuple:
+        """orders 테이블 저장 파라미터 (ORDER_COLUMNS 순서 + updated_at)"""
+        return (
+            order_data.get('order_id'),
+            order_data.get('order_date'),
+            order_data.get('customer_name'),
+            order_data.get('customer_phone'),
+            order_data.get('product_name'),
+            order_data.get('quantity', 1),
+            order_data.get('price', 0),
+            order_data.get('status', '신규주문'),
+            order_data.get('shipping_company'),
+            order_data.get('tracking_number'),
+            order_data.get('memo'),
+            order_data.get('product_order_id'),
+            order_data.get('shipping_due_date'),
+            order_data.get('product_option'),
+            datetime.now().isoformat()
+        )
+
+    def _order_upsert_sql(self) -> str:
+        """주문 INSERT ... ON CONFLICT 문 - 값이 모두 같으면 갱신하지 않음 (created_at은 유지)"""
+        columns = self.ORDER_COLUMNS
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns[1:])
+        changed = ' OR '.join(f"orders.{column} IS NOT excluded.{column}" for column in columns[1:])
+        return f'''
+            INSERT INTO orders ({', '.join(columns)}, updated_at)
+            VALUES ({', '.join('?' * (len(columns) + 1))})
+            ON CONFLICT(order_id) DO UPDATE SET {updates}, updated_at = excluded.updated_at
+            WHERE {changed}
+        '''
+
+    def _count_existing(self, conn: sqlite3.Connection, table: str, key_column: str, keys: List[str]) -> int:
+        """이미 저장된 키 개수 (SQLite 변수 개수 제한(999) 이내로 나눠서 조회)"""
+        existing = 0
+        for start in range(0, len(keys), 900):
+            chunk = keys[start:start + 900]
+            existing += conn.execute(
+                COUNT_EXISTING_SQL.format(table=table, key_column=key_column, placeholders=placeholders(len(chunk))), chunk
+            ).fetchone()[0]
+        return existing
+
+    def upsert_orders(self, orders: Iterable, batch_size: int = None) -> Dict[str, int]:
+        """주문 목록을 배치 단위 트랜잭션으로 저장 (주문 ID 기준 추가/갱신)
+
+        orders: 주문 dict(add_order 형식) 또는 ProductOrder 레코드
+        반환: {'inserted', 'updated', 'unchanged', 'failed'} 건수
+        같은 주문 ID가 여러 번 있으면 마지막 값을 사용한다.
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+        rows = {}
+        for order in orders:
+            order_data = order.to_db_dict() if isinstance(order, ProductOrder) else order
+            if not order_data.get('order_id') or not order_data.get('order_date'):
+                counts['failed'] += 1
+                continue
+            rows.pop(order_data['order_id'], None)
+            rows[order_data['order_id']] = self._order_params(order_data)
+        if not rows:
+            return counts
+
+        params = list(rows.values())
+        batch_size = max(1, int(batch_size or self.ORDER_UPSERT_BATCH_SIZE))
+        sql = self._order_upsert_sql()
+        for offset in range(0, len(params), batch_size):
+            batch = params[offset:offset + batch_size]
+            try:
+                with self.connection() as conn:
+                    existing = self._count_existing(conn, 'orders', 'order_id', [row[0] for row in batch])
+                    written = conn.executemany(sql, batch).rowcount  # 추가 + 실제로 갱신된 건수
+                inserted = len(batch) - existing
+                counts['inserted'] += inserted
+                counts['updated'] += written - inserted
+                counts['unchanged'] += existing - (written - inserted)
+            except Exception as e:
+                print(f"주문 일괄 저장 오류: {e}")
+                counts['failed'] += len(batch)
+        return counts
+
     def add_order(self, order_data: Dict) -> bool:
-        """새 주문 추가"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO orders 
-                (order_id, order_date, customer_name, customer_phone, 
-                 product_name, quantity, price, status, shipping_company, 
-                 tracking_number, memo, product_order_id, shipping_due_date, 
-                 product_option, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                order_data.get('order_id'),
-                order_data.get('order_date'),
-                order_data.get('customer_name'),
-                order_data.get('customer_phone'),
-                order_data.get('product_name'),
-                order_data.get('quantity', 1),
-                order_data.get('price', 0),
-                order_data.get('status', '신규주문'),
-                order_data.get('shipping_company'),
-                order_data.get('tracking_number'),
-                order_data.get('memo'),
-                order_data.get('product_order_id'),
-                order_data.get('shipping_due_date'),
-                order_data.get('product_option'),
-                datetime.now().isoformat()
-            ))
-            
-            conn.commit()
-            conn.close()
-            return True
-        except Exception as e:
-            print(f"주문 추가 오류: {e}")
-            return False
+        """새 주문 추가 (이미 있으면 갱신)"""
+        result = self.upsert_orders([order_data])
+        if result['failed']:
+            print(f"주문 추가 오류: {order_data.get('order_id')}")
+        return result['failed'] == 0
     
     def get_orders_by_status(self, status: str) -> List[Dict]:
-        """상태별 주문 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """상태별 주문 조회 (이전 orders 테이블 - api_server 호환용, 화면은 get_product_orders 사용)"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT * FROM orders WHERE status = ? ORDER BY order_date DESC
-        ''', (status,))
+            cursor.execute(ORDERS_BY_STATUS_SQL, (status,))
         
-        columns = [description[0] for description in cursor.description]
-        orders = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            columns = [description[0] for description in cursor.description]
+            orders = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
-        conn.close()
         return orders
     
     def get_all_orders(self) -> List[Dict]:
-        """모든 주문 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """모든 주문 조회 (이전 orders 테이블 - api_server 호환용, 화면은 get_product_orders 사용)"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT * FROM orders ORDER BY order_date DESC
-        ''')
+            cursor.execute(ALL_ORDERS_SQL)
         
-        columns = [description[0] for description in cursor.description]
-        orders = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            columns = [description[0] for description in cursor.description]
+            orders = [dict(zip(columns, row)) for row in cursor.fetchall()]
         
-        conn.close()
         return orders
     
     def update_order_status(self, order_id: str, status: str) -> bool:
-        """주문 상태 업데이트"""
+        """주문 상태 업데이트 - order_id는 주문 ID 또는 상품주문 ID
+
+        상품주문(product_orders)과 이전 orders 테이블을 한 트랜잭션으로 함께 갱신한다.
+        """
+        return self._update_order_fields(order_id, {'status': status}, {'status': status})
+
+    def update_tracking_number(self, order_id: str, tracking_number: str, delivery_company: str = None) -> bool:
+        """송장 번호 업데이트 - order_id는 주문 ID 또는 상품주문 ID"""
+        product_order_fields = {'tracking_number': tracking_number}
+        order_fields = {'tracking_number': tracking_number}
+        if delivery_company:
+            product_order_fields['delivery_company'] = delivery_company
+            order_fields['shipping_company'] = delivery_company
+        return self._update_order_fields(order_id, product_order_fields, order_fields)
+
+    def _update_order_fields(self, order_id: str, product_order_fields: Dict, order_fields: Dict) -> bool:
+        """product_orders(주문 ID 또는 상품주문 ID 일치)와 orders 행의 컬럼 갱신"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE orders SET status = ?, updated_at = ? WHERE order_id = ?
-            ''', (status, datetime.now().isoformat(), order_id))
-            
-            conn.commit()
-            conn.close()
+            now = datetime.now().isoformat()
+            with self.connection() as conn:
+                assignments = ', '.join(f"{column} = ?" for column in product_order_fields)
+                conn.execute(
+                    f"UPDATE product_orders SET {assignments}, updated_at = ? WHERE order_id = ? OR product_order_id = ?",
+                    (*product_order_fields.values(), now, order_id, order_id))
+                assignments = ', '.join(f"{column} = ?" for column in order_fields)
+                conn.execute(
+                    f"UPDATE orders SET {assignments}, updated_at = ? WHERE order_id = ? OR product_order_id = ?",
+                    (*order_fields.values(), now, order_id, order_id))
             return True
         except Exception as e:
-            print(f"주문 상태 업데이트 오류: {e}")
+            print(f"주문 업데이트 오류: {e}")
             return False
     
-    def get_order_counts(self) -> Dict[str, int]:
-        """주문 상태별 건수 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def get_order_counts(self, since: str = None) -> Dict[str, int]:
+        """주문 상태별 건수 조회 (since 지정 시 해당 주문일시 이후만)"""
+        with self.connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT status, COUNT(*) as count FROM orders GROUP BY status
-        ''')
+            if since:
+                cursor.execute(ORDER_COUNTS_SQL.format(date_condition='WHERE order_date >= ?'), (since,))
+            else:
+                cursor.execute(ORDER_COUNTS_SQL.format(date_condition=''))
         
-        counts = {}
-        for row in cursor.fetchall():
-            counts[row[0]] = row[1]
+            counts = {}
+            for row in cursor.fetchall():
+                counts[row[0]] = row[1]
         
-        conn.close()
         return counts
     
     def save_setting(self, key: str, value: str) -> bool:
         """설정 저장"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO settings (key, value, updated_at)
-                VALUES (?, ?, ?)
-            ''', (key, value, datetime.now().isoformat()))
+                cursor.execute('''
+                    INSERT OR REPLACE INTO settings (key, value, updated_at)
+                    VALUES (?, ?, ?)
+                ''', (key, value, datetime.now().isoformat()))
             
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"설정 저장 오류: {e}")
@@ -258,159 +494,140 @@ class DatabaseManager:
     
     def get_setting(self, key: str) -> Optional[str]:
         """설정 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        result = cursor.fetchone()
+            cursor.execute(SETTING_SQL, (key,))
+            result = cursor.fetchone()
         
-        conn.close()
         return result[0] if result else None
     
     def save_product(self, product_data: Dict) -> bool:
-        """상품 정보 저장 (기존 상품이 있으면 업데이트)"""
+        """상품 정보 저장 (기존 상품이 있으면 업데이트, 내용이 같으면 쓰지 않음)"""
+        result = self.upsert_products([product_data])
+        if result['failed']:
+            print(f"상품 저장 오류 - 채널상품 ID: {product_data.get('channel_product_no')}")
+        return result['failed'] == 0
+
+    PRODUCT_COLUMNS = (
+        'channel_product_no', 'origin_product_no', 'product_name', 'status_type',
+        'sale_price', 'discounted_price', 'stock_quantity', 'category_id', 'category_name',
+        'brand_name', 'manufacturer_name', 'model_name', 'seller_management_code',
+        'reg_date', 'modified_date', 'representative_image_url', 'whole_category_name',
+        'whole_category_id', 'delivery_fee', 'return_fee', 'exchange_fee',
+        'discount_method', 'customer_benefit'
+    )
+
+    # 값이 없을 때 저장할 기본값 (테이블 DEFAULT와 같음)
+    PRODUCT_DEFAULTS = {
+        'sale_price': 0, 'discounted_price': 0, 'stock_quantity': 0,
+        'delivery_fee': 0, 'return_fee': 0, 'exchange_fee': 0
+    }
+    PRODUCT_UPSERT_BATCH_SIZE = 500
+
+    def _product_values(self, product: Dict) -> tuple:
+        """products 테이블 저장 값 (PRODUCT_COLUMNS 순서)"""
+        return tuple(product.get(column, self.PRODUCT_DEFAULTS.get(column)) for column in self.PRODUCT_COLUMNS)
+
+    def product_content_hash(self, product: Dict) -> str:
+        """상품 행의 내용 해시 (PRODUCT_COLUMNS 값 기준, 저장된 해시와 같으면 변경 없음)"""
+        values = ['' if value is None else str(value) for value in self._product_values(product)]
+        return hashlib.sha1('\x1f'.join(values).encode('utf-8')).hexdigest()
+
+    def upsert_products(self, products: Iterable[Dict], batch_size: int = None) -> Dict[str, int]:
+        """상품 목록을 배치 단위 트랜잭션으로 저장 (채널상품 ID 기준 추가/갱신)
+
+        저장된 content_hash와 같은 상품은 쓰지 않으므로 updated_at(목록 정렬 기준)도 바뀌지 않는다.
+        반환: {'inserted', 'updated', 'unchanged', 'failed'} 건수
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+        rows = {}
+        for product in products:
+            channel_product_no = product.get('channel_product_no')
+            if not channel_product_no or not product.get('product_name'):
+                counts['failed'] += 1
+                continue
+            rows.pop(str(channel_product_no), None)
+            rows[str(channel_product_no)] = product
+        if not rows:
+            return counts
+
+        columns = self.PRODUCT_COLUMNS
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns[1:])
+        sql = f'''
+            INSERT INTO products ({', '.join(columns)}, content_hash)
+            VALUES ({', '.join('?' * (len(columns) + 1))})
+            ON CONFLICT(channel_product_no) DO UPDATE SET {updates}, content_hash = excluded.content_hash,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE products.content_hash IS NOT excluded.content_hash
+        '''
+        items = list(rows.items())
+        batch_size = max(1, int(batch_size or self.PRODUCT_UPSERT_BATCH_SIZE))
+        for offset in range(0, len(items), batch_size):
+            batch = items[offset:offset + batch_size]
+            try:
+                with self.connection() as conn:
+                    stored = {}
+                    # SQLite 변수 개수 제한(999) 이내로 나눠서 저장된 해시 조회
+                    for start in range(0, len(batch), 900):
+                        keys = [key for key, _ in batch[start:start + 900]]
+                        stored.update(conn.execute(
+                            PRODUCT_HASHES_SQL.format(placeholders=placeholders(len(keys))), keys
+                        ).fetchall())
+
+                    params = []
+                    inserted = updated = 0
+                    for key, product in batch:
+                        content_hash = self.product_content_hash(product)
+                        if key not in stored:
+                            inserted += 1
+                        elif stored[key] != content_hash:
+                            updated += 1
+                        else:
+                            continue
+                        params.append(self._product_values(product) + (content_hash,))
+                    if params:
+                        conn.executemany(sql, params)
+                counts['inserted'] += inserted
+                counts['updated'] += updated
+                counts['unchanged'] += len(batch) - inserted - updated
+            except Exception as e:
+                print(f"상품 일괄 저장 오류: {e}")
+                counts['failed'] += len(batch)
+        return counts
+
+    def save_products(self, products: List[Dict]) -> int:
+        """상품 목록 저장 (upsert_products) - 저장(추가/갱신/변경 없음) 건수 반환"""
+        result = self.upsert_products(products)
+        return result['inserted'] + result['updated'] + result['unchanged']
+
+    def get_product_modified_dates(self) -> Dict[str, str]:
+        """저장된 상품의 {채널상품 ID: 수정일} (변경 여부 확인용)"""
         try:
-            print(f"DB 저장 시작 - 상품 데이터: {product_data}")
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # 기존 상품 확인
-            channel_product_no = product_data.get('channel_product_no')
-            print(f"기존 상품 확인 - 채널상품 ID: {channel_product_no}")
-            cursor.execute('SELECT id FROM products WHERE channel_product_no = ?', 
-                          (channel_product_no,))
-            existing = cursor.fetchone()
-            print(f"기존 상품 확인 결과: {existing}")
-            
-            if existing:
-                # 업데이트
-                print(f"기존 상품 업데이트 - ID: {existing[0]}")
-                cursor.execute('''
-                    UPDATE products SET
-                        origin_product_no = ?,
-                        product_name = ?,
-                        status_type = ?,
-                        sale_price = ?,
-                        discounted_price = ?,
-                        stock_quantity = ?,
-                        category_id = ?,
-                        category_name = ?,
-                        brand_name = ?,
-                        manufacturer_name = ?,
-                        model_name = ?,
-                        seller_management_code = ?,
-                        reg_date = ?,
-                        modified_date = ?,
-                        representative_image_url = ?,
-                        whole_category_name = ?,
-                        whole_category_id = ?,
-                        delivery_fee = ?,
-                        return_fee = ?,
-                        exchange_fee = ?,
-                        discount_method = ?,
-                        customer_benefit = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE channel_product_no = ?
-                ''', (
-                    product_data.get('origin_product_no'),
-                    product_data.get('product_name'),
-                    product_data.get('status_type'),
-                    product_data.get('sale_price', 0),
-                    product_data.get('discounted_price', 0),
-                    product_data.get('stock_quantity', 0),
-                    product_data.get('category_id'),
-                    product_data.get('category_name'),
-                    product_data.get('brand_name'),
-                    product_data.get('manufacturer_name'),
-                    product_data.get('model_name'),
-                    product_data.get('seller_management_code'),
-                    product_data.get('reg_date'),
-                    product_data.get('modified_date'),
-                    product_data.get('representative_image_url'),
-                    product_data.get('whole_category_name'),
-                    product_data.get('whole_category_id'),
-                    product_data.get('delivery_fee', 0),
-                    product_data.get('return_fee', 0),
-                    product_data.get('exchange_fee', 0),
-                    product_data.get('discount_method'),
-                    product_data.get('customer_benefit'),
-                    product_data.get('channel_product_no')
-                ))
-            else:
-                # 새로 삽입
-                print(f"새 상품 삽입 - 채널상품 ID: {channel_product_no}")
-                cursor.execute('''
-                    INSERT INTO products (
-                        channel_product_no, origin_product_no, product_name, status_type,
-                        sale_price, discounted_price, stock_quantity, category_id, category_name,
-                        brand_name, manufacturer_name, model_name, seller_management_code,
-                        reg_date, modified_date, representative_image_url, whole_category_name,
-                        whole_category_id, delivery_fee, return_fee, exchange_fee,
-                        discount_method, customer_benefit
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    product_data.get('channel_product_no'),
-                    product_data.get('origin_product_no'),
-                    product_data.get('product_name'),
-                    product_data.get('status_type'),
-                    product_data.get('sale_price', 0),
-                    product_data.get('discounted_price', 0),
-                    product_data.get('stock_quantity', 0),
-                    product_data.get('category_id'),
-                    product_data.get('category_name'),
-                    product_data.get('brand_name'),
-                    product_data.get('manufacturer_name'),
-                    product_data.get('model_name'),
-                    product_data.get('seller_management_code'),
-                    product_data.get('reg_date'),
-                    product_data.get('modified_date'),
-                    product_data.get('representative_image_url'),
-                    product_data.get('whole_category_name'),
-                    product_data.get('whole_category_id'),
-                    product_data.get('delivery_fee', 0),
-                    product_data.get('return_fee', 0),
-                    product_data.get('exchange_fee', 0),
-                    product_data.get('discount_method'),
-                    product_data.get('customer_benefit')
-                ))
-            
-            conn.commit()
-            conn.close()
-            print(f"상품 저장 완료 - 채널상품 ID: {channel_product_no}")
-            return True
-            
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(PRODUCT_MODIFIED_DATES_SQL)
+                modified_dates = {str(row[0]): row[1] for row in cursor.fetchall()}
+            return modified_dates
         except Exception as e:
-            print(f"상품 저장 오류: {e}")
-            print(f"오류 타입: {type(e)}")
-            import traceback
-            print(f"상세 오류 정보: {traceback.format_exc()}")
-            return False
-    
+            print(f"상품 수정일 조회 오류: {e}")
+            return {}
+
     def get_all_products(self) -> List[Dict]:
         """모든 상품 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT channel_product_no, origin_product_no, product_name, status_type,
-                       sale_price, discounted_price, stock_quantity, category_id, category_name,
-                       brand_name, manufacturer_name, model_name, seller_management_code,
-                       reg_date, modified_date, representative_image_url, whole_category_name,
-                       whole_category_id, delivery_fee, return_fee, exchange_fee,
-                       discount_method, customer_benefit, created_at, updated_at
-                FROM products
-                ORDER BY updated_at DESC
-            ''')
+                cursor.execute(ALL_PRODUCTS_SQL)
             
-            columns = [description[0] for description in cursor.description]
-            products = []
+                columns = [description[0] for description in cursor.description]
+                products = []
             
-            for row in cursor.fetchall():
-                product = dict(zip(columns, row))
-                products.append(product)
+                for row in cursor.fetchall():
+                    product = dict(zip(columns, row))
+                    products.append(product)
             
-            conn.close()
             return products
             
         except Exception as e:
@@ -420,29 +637,18 @@ class DatabaseManager:
     def get_products_by_status(self, status: str) -> List[Dict]:
         """상태별 상품 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT channel_product_no, origin_product_no, product_name, status_type,
-                       sale_price, discounted_price, stock_quantity, category_id, category_name,
-                       brand_name, manufacturer_name, model_name, seller_management_code,
-                       reg_date, modified_date, representative_image_url, whole_category_name,
-                       whole_category_id, delivery_fee, return_fee, exchange_fee,
-                       discount_method, customer_benefit, created_at, updated_at
-                FROM products
-                WHERE status_type = ?
-                ORDER BY updated_at DESC
-            ''', (status,))
+                cursor.execute(PRODUCTS_BY_STATUS_SQL, (status,))
             
-            columns = [description[0] for description in cursor.description]
-            products = []
+                columns = [description[0] for description in cursor.description]
+                products = []
             
-            for row in cursor.fetchall():
-                product = dict(zip(columns, row))
-                products.append(product)
+                for row in cursor.fetchall():
+                    product = dict(zip(columns, row))
+                    products.append(product)
             
-            conn.close()
             return products
             
         except Exception as e:
@@ -453,23 +659,13 @@ class DatabaseManager:
         """채널상품 ID로 상품 조회"""
         try:
             print(f"DB 조회 시작 - 채널상품 ID: {channel_product_no}")
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT channel_product_no, origin_product_no, product_name, status_type,
-                       sale_price, discounted_price, stock_quantity, category_id, category_name,
-                       brand_name, manufacturer_name, model_name, seller_management_code,
-                       reg_date, modified_date, representative_image_url, whole_category_name,
-                       whole_category_id, delivery_fee, return_fee, exchange_fee,
-                       discount_method, customer_benefit, created_at, updated_at
-                FROM products
-                WHERE channel_product_no = ?
-            ''', (channel_product_no,))
+                cursor.execute(PRODUCT_BY_ID_SQL, (channel_product_no,))
             
-            row = cursor.fetchone()
-            print(f"DB 조회 결과 - row: {row}")
-            conn.close()
+                row = cursor.fetchone()
+                print(f"DB 조회 결과 - row: {row}")
             
             if row:
                 columns = [description[0] for description in cursor.description]
@@ -488,14 +684,12 @@ class DatabaseManager:
     def delete_product(self, channel_product_no: str) -> bool:
         """상품 삭제"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('DELETE FROM products WHERE channel_product_no = ?', 
-                          (channel_product_no,))
+                cursor.execute('DELETE FROM products WHERE channel_product_no = ?', 
+                              (channel_product_no,))
             
-            conn.commit()
-            conn.close()
             return True
             
         except Exception as e:
@@ -509,25 +703,436 @@ class DatabaseManager:
     def get_orders_by_date_range(self, start_date: str, end_date: str) -> List[Dict]:
         """날짜 범위로 주문 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT * FROM orders 
-                WHERE order_date >= ? AND order_date <= ?
-                ORDER BY order_date DESC
-            ''', (start_date, end_date))
+                cursor.execute(ORDERS_BY_DATE_RANGE_SQL, (start_date, end_date))
             
-            columns = [description[0] for description in cursor.description]
-            orders = [dict(zip(columns, row)) for row in cursor.fetchall()]
+                columns = [description[0] for description in cursor.description]
+                orders = [dict(zip(columns, row)) for row in cursor.fetchall()]
             
-            conn.close()
             return orders
             
         except Exception as e:
             print(f"날짜 범위 주문 조회 오류: {e}")
             return []
     
+    # 주문/상품주문 (order_headers, product_orders)
+
+    ORDER_HEADER_COLUMNS = ('order_id', 'order_date', 'orderer_name', 'orderer_tel', 'payment_means')
+    PRODUCT_ORDER_COLUMNS = (
+        'product_order_id', 'order_id', 'order_date', 'status', 'claim_type', 'claim_status',
+        'product_name', 'product_option', 'seller_product_code', 'quantity', 'unit_price',
+        'discount_amount', 'total_amount', 'base_address', 'detailed_address', 'shipping_due_date',
+        'shipping_memo', 'delivery_company', 'tracking_number', 'last_changed_date'
+    )
+    def _upsert_sql(self, table: str, columns: tuple, keep_existing: tuple = ()) -> str:
+        """INSERT ... ON CONFLICT(첫 컬럼) 문 - 값이 모두 같으면 갱신하지 않음 (created_at은 유지)
+
+        keep_existing 컬럼은 새 값이 NULL이면 기존 값을 유지한다.
+        """
+        key, values = columns[0], columns[1:]
+        updates = ', '.join(f"{column} = COALESCE(excluded.{column}, {table}.{column})" if column in keep_existing
+                            else f"{column} = excluded.{column}" for column in values)
+        changed = ' OR '.join(f"(excluded.{column} IS NOT NULL AND {table}.{column} IS NOT excluded.{column})"
+                              if column in keep_existing else f"{table}.{column} IS NOT excluded.{column}"
+                              for column in values)
+        return f'''
+            INSERT INTO {table} ({', '.join(columns)})
+            VALUES ({', '.join('?' * len(columns))})
+            ON CONFLICT({key}) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP
+            WHERE {changed}
+        '''
+
+    def _product_order_params(self, record: ProductOrder, last_changed_date: str = None) -> tuple:
+        """product_orders 테이블 저장 값 (PRODUCT_ORDER_COLUMNS 순서)"""
+        return (
+            record.product_order_id,
+            record.order_id,
+            record.order_date.isoformat() if record.order_date else None,
+            record.status,
+            record.claim_type,
+            record.claim_status,
+            record.product_name,
+            record.product_option,
+            record.seller_product_code,
+            record.quantity,
+            record.unit_price,
+            record.discount_amount,
+            record.total_amount,
+            record.base_address,
+            record.detailed_address,
+            record.shipping_due_date.isoformat() if record.shipping_due_date else None,
+            record.shipping_memo,
+            record.delivery_company,
+            record.tracking_number,
+            last_changed_date
+        )
+
+    def upsert_product_orders(self, product_orders: Iterable[ProductOrder], last_changed: Dict[str, str] = None,
+                              batch_size: int = None) -> Dict[str, int]:
+        """ProductOrder 레코드를 주문(order_headers)/상품주문(product_orders) 테이블에 배치 단위 트랜잭션으로 저장
+
+        last_changed: {상품주문 ID: 마지막 변경 일시} (변경 주문 조회 결과, 없으면 기존 값 유지)
+        반환: 상품주문 기준 {'inserted', 'updated', 'unchanged', 'failed'} 건수
+        """
+        last_changed = last_changed or {}
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+        records = {}
+        for record in product_orders:
+            if not record.product_order_id or not record.order_id:
+                counts['failed'] += 1
+                continue
+            records.pop(record.product_order_id, None)
+            records[record.product_order_id] = record
+        if not records:
+            return counts
+
+        header_sql = self._upsert_sql('order_headers', self.ORDER_HEADER_COLUMNS)
+        product_order_sql = self._upsert_sql('product_orders', self.PRODUCT_ORDER_COLUMNS,
+                                             keep_existing=('last_changed_date',))
+        items = list(records.values())
+        batch_size = max(1, int(batch_size or self.ORDER_UPSERT_BATCH_SIZE))
+        for offset in range(0, len(items), batch_size):
+            batch = items[offset:offset + batch_size]
+            headers = {record.order_id: (
+                record.order_id, record.order_date.isoformat() if record.order_date else None,
+                record.orderer_name, record.orderer_tel, record.payment_means
+            ) for record in batch}
+            try:
+                with self.connection() as conn:
+                    existing = self._count_existing(conn, 'product_orders', 'product_order_id',
+                                                    [record.product_order_id for record in batch])
+                    conn.executemany(header_sql, list(headers.values()))
+                    written = conn.executemany(product_order_sql, [
+                        self._product_order_params(record, last_changed.get(record.product_order_id))
+                        for record in batch
+                    ]).rowcount
+                inserted = len(batch) - existing
+                counts['inserted'] += inserted
+                counts['updated'] += written - inserted
+                counts['unchanged'] += existing - (written - inserted)
+            except Exception as e:
+                print(f"상품주문 일괄 저장 오류: {e}")
+                counts['failed'] += len(batch)
+        return counts
+
+    def save_product_orders(self, product_orders: List[ProductOrder]) -> int:
+        """ProductOrder 레코드 목록 저장 - 저장(추가/갱신/변경 없음) 건수 반환"""
+        result = self.upsert_product_orders(product_orders)
+        return result['inserted'] + result['updated'] + result['unchanged']
+
+    def get_product_orders(self, statuses: List[str] = None, start_date: str = None, end_date: str = None) -> List[ProductOrder]:
+        """저장된 상품주문을 ProductOrder 레코드로 조회 (상태/주문일 범위 조건은 선택, 주문일 최신순)
+
+        상태 조건은 상품주문 상태나 클레임 상태가 statuses에 포함되는 주문 (ProductOrder.matches와 같음)
+        """
+        try:
+            sql = product_orders_sql(len(statuses or ()), bool(start_date), bool(end_date))
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, product_orders_params(statuses, start_date, end_date))
+                columns = [description[0] for description in cursor.description]
+                return [ProductOrder.from_product_orders_row(dict(zip(columns, row))) for row in cursor.fetchall()]
+
+        except Exception as e:
+            print(f"상품주문 조회 오류: {e}")
+            return []
+
+    def get_product_orders_by_ids(self, product_order_ids: Iterable[str]) -> Dict[str, ProductOrder]:
+        """상품주문 ID로 조회 - {상품주문 ID: ProductOrder} (없는 ID는 제외)"""
+        ids = list(dict.fromkeys(str(product_order_id) for product_order_id in product_order_ids))
+        records = {}
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(ids), 900):
+                    chunk = ids[start:start + 900]
+                    cursor.execute(PRODUCT_ORDERS_BY_ID_SQL.format(placeholders=placeholders(len(chunk))), chunk)
+                    columns = [description[0] for description in cursor.description]
+                    for row in cursor.fetchall():
+                        record = ProductOrder.from_product_orders_row(dict(zip(columns, row)))
+                        records[record.product_order_id] = record
+        except Exception as e:
+            print(f"상품주문 조회 오류: {e}")
+        return records
+
+    def get_product_order_counts(self, statuses: List[str] = None, since: str = None) -> Dict[str, int]:
+        """상품주문 상태별 건수 (since 지정 시 해당 주문일시 이후만) - OrderPartition.counts와 같은 형식
+
+        상품주문 상태나 클레임 상태가 해당하는 상품주문 수로 세며 (상품주문 상태가 없으면 UNKNOWN),
+        두 상태가 같은 상품주문은 한 번만 센다 (상태별 건수 + 클레임 상태별 건수 - 두 상태가 같은 건수).
+        statuses를 지정하면 해당 상태만 (없는 상태는 0)
+        """
+        params = (since,) if since else ()
+        try:
+            with self.connection() as conn:
+                status_counts = conn.execute(PRODUCT_ORDER_STATUS_COUNTS_SQL.format(
+                    date_condition="WHERE order_date >= ?" if since else ""), params).fetchall()
+                claim_counts = conn.execute(PRODUCT_ORDER_CLAIM_COUNTS_SQL.format(
+                    date_condition="AND order_date >= ?" if since else ""), params).fetchall()
+                overlap_counts = conn.execute(PRODUCT_ORDER_CLAIM_OVERLAP_SQL.format(
+                    date_condition="AND order_date >= ?" if since else ""), params).fetchall()
+        except Exception as e:
+            print(f"상품주문 건수 조회 오류: {e}")
+            return {status: 0 for status in statuses} if statuses else {}
+
+        counts = {}
+        for rows, sign in ((status_counts, 1), (claim_counts, 1), (overlap_counts, -1)):
+            for status, count in rows:
+                status = status or 'UNKNOWN'
+                counts[status] = counts.get(status, 0) + sign * count
+        if statuses is None:
+            return counts
+        return {status: counts.get(status, 0) for status in statuses}
+
+    # 상품주문 원본 응답 (order_documents)
+
+    def put_order_documents(self, documents: Dict[str, Dict], last_changed: Dict[str, str] = None,
+                            batch_size: int = None) -> Dict[str, int]:
+        """상품주문 원본 응답을 압축해서 배치 단위 트랜잭션으로 저장
+
+        documents: {상품주문 ID: query 응답 항목}
+        last_changed: {상품주문 ID: 마지막 변경 일시} (없으면 기존 값 유지)
+        반환: {'inserted', 'updated', 'unchanged', 'failed', 'raw_bytes', 'stored_bytes'} (바이트는 새로 쓴 문서 기준)
+        """
+        last_changed = last_changed or {}
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+        items = [(str(product_order_id), payload) for product_order_id, payload in documents.items()
+                 if product_order_id and isinstance(payload, dict)]
+        counts['failed'] = len(documents) - len(items)
+        if not items:
+            return counts
+
+        sql = '''
+            INSERT INTO order_documents (product_order_id, order_id, last_changed_date, codec, raw_size,
+                                         content_hash, payload, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(product_order_id) DO UPDATE SET
+                order_id = excluded.order_id,
+                last_changed_date = COALESCE(excluded.last_changed_date, order_documents.last_changed_date),
+                codec = excluded.codec, raw_size = excluded.raw_size, content_hash = excluded.content_hash,
+                payload = excluded.payload, updated_at = CURRENT_TIMESTAMP
+        '''
+        batch_size = max(1, int(batch_size or self.ORDER_UPSERT_BATCH_SIZE))
+        for offset in range(0, len(items), batch_size):
+            batch = items[offset:offset + batch_size]
+            try:
+                serialized = [(product_order_id, payload) + serialize_document(payload)
+                              for product_order_id, payload in batch]
+                with self.connection() as conn:
+                    stored = self._stored_document_versions(conn, [item[0] for item in serialized])
+
+                # 내용과 변경 일시가 같은 문서는 압축하지 않고 건너뜀
+                rows = []
+                for product_order_id, payload, raw, content_hash in serialized:
+                    changed_date = last_changed.get(product_order_id)
+                    if product_order_id in stored and stored[product_order_id][0] == content_hash and \
+                            (changed_date is None or stored[product_order_id][1] == changed_date):
+                        counts['unchanged'] += 1
+                        continue
+                    order_id = (payload.get('order') or (payload.get('content') or {}).get('order') or {}).get('orderId')
+                    blob = compress_document(raw, self.document_codec)
+                    rows.append((product_order_id, str(order_id) if order_id else None, changed_date,
+                                 self.document_codec, len(raw), content_hash, sqlite3.Binary(blob)))
+                    counts['raw_bytes'] += len(raw)
+                    counts['stored_bytes'] += len(blob)
+                if rows:
+                    with self.connection() as conn:
+                        conn.executemany(sql, rows)
+                inserted = sum(1 for row in rows if row[0] not in stored)
+                counts['inserted'] += inserted
+                counts['updated'] += len(rows) - inserted
+            except Exception as e:
+                print(f"상품주문 원본 저장 오류: {e}")
+                counts['failed'] += len(batch)
+        return counts
+
+    def _stored_document_versions(self, conn: sqlite3.Connection, product_order_ids: List[str]) -> Dict[str, tuple]:
+        """저장된 원본의 {상품주문 ID: (내용 해시, 마지막 변경 일시)}"""
+        stored = {}
+        for start in range(0, len(product_order_ids), 900):
+            chunk = product_order_ids[start:start + 900]
+            for row in conn.execute(ORDER_DOCUMENT_VERSIONS_SQL.format(placeholders=placeholders(len(chunk))), chunk):
+                stored[row[0]] = (row[1], row[2])
+        return stored
+
+    def get_order_documents(self, product_order_ids: Iterable[str] = None,
+                            changed_since: str = None) -> Dict[str, OrderDocument]:
+        """저장된 원본 응답 조회 - {상품주문 ID: OrderDocument} (압축은 payload 접근 시 해제)
+
+        product_order_ids를 지정하면 해당 상품주문만 (없는 ID는 제외),
+        changed_since를 지정하면 마지막 변경 일시가 그 이후인 문서만 조회한다.
+        """
+        documents = {}
+        try:
+            with self.connection() as conn:
+                if product_order_ids is None:
+                    chunks = [(ORDER_DOCUMENTS_CHANGED_SINCE_SQL, (changed_since,))] if changed_since \
+                        else [(ORDER_DOCUMENTS_SQL, ())]
+                else:
+                    ids = list(dict.fromkeys(str(product_order_id) for product_order_id in product_order_ids))
+                    chunks = []
+                    for start in range(0, len(ids), 900):
+                        chunk = ids[start:start + 900]
+                        sql = ORDER_DOCUMENTS_BY_ID_SQL.format(
+                            placeholders=placeholders(len(chunk)),
+                            date_condition=' AND last_changed_date >= ?' if changed_since else '')
+                        chunks.append((sql, chunk + [changed_since] if changed_since else chunk))
+                for sql, params in chunks:
+                    for row in conn.execute(sql, params):
+                        documents[row[0]] = OrderDocument(*row)
+        except Exception as e:
+            print(f"상품주문 원본 조회 오류: {e}")
+        return documents
+
+    def get_order_document_stats(self) -> Dict:
+        """원본 응답 보관 통계 (문서 수, 원본/압축 크기, 압축률)"""
+        try:
+            with self.connection() as conn:
+                documents, raw_bytes, stored_bytes = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(LENGTH(payload)), 0) FROM order_documents"
+                ).fetchone()
+        except Exception as e:
+            print(f"상품주문 원본 통계 조회 오류: {e}")
+            return {}
+        return {
+            'documents': documents,
+            'raw_bytes': raw_bytes,
+            'stored_bytes': stored_bytes,
+            'ratio': round(raw_bytes / stored_bytes, 2) if stored_bytes else 0,
+            'codec': self.document_codec
+        }
+
+    # 발송 처리 대기열 (shipping_outbox)
+
+    def enqueue_shipments(self, shipments: List[Dict]) -> int:
+        """발송 처리 대기열에 추가 - 추가/갱신 건수 반환
+
+        shipments: [{'product_order_id', 'delivery_company', 'tracking_number'}, ...]
+        이미 발송 완료(sent)되었거나 발송 중(sending)인 상품주문은 다시 넣지 않는다
+        (발송 중인 건을 대기로 되돌리면 전송 결과가 반영되기 전에 한 번 더 보낼 수 있음).
+        """
+        if not shipments:
+            return 0
+        try:
+            with self.connection() as conn:
+                cursor = conn.executemany('''
+                    INSERT INTO shipping_outbox (product_order_id, delivery_company, tracking_number)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(product_order_id) DO UPDATE SET
+                        delivery_company = excluded.delivery_company,
+                        tracking_number = excluded.tracking_number,
+                        status = 'pending',
+                        attempts = 0,
+                        last_error = NULL,
+                        next_attempt_at = 0,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE shipping_outbox.status NOT IN ('sent', 'sending')
+                ''', [(s['product_order_id'], s['delivery_company'], s['tracking_number']) for s in shipments])
+                queued = cursor.rowcount
+            return queued
+        except Exception as e:
+            print(f"발송 대기열 추가 오류: {e}")
+            return 0
+
+    def claim_due_shipments(self, now: float, limit: int = None) -> List[Dict]:
+        """발송 시각이 된 대기 건을 발송 중(sending)으로 바꾸고 반환"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row  # 공유 연결의 row_factory는 바꾸지 않음
+                rows = cursor.execute(f"{DUE_SHIPMENTS_SQL} {'LIMIT ' + str(int(limit)) if limit else ''}",
+                                      (now,)).fetchall()
+                conn.executemany("UPDATE shipping_outbox SET status = 'sending', updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                                 [(row['id'],) for row in rows])
+            return [dict(row) for row in rows]
+        except Exception as e:
+            print(f"발송 대기열 조회 오류: {e}")
+            return []
+
+    def reset_inflight_shipments(self) -> int:
+        """이전 실행에서 발송 중(sending)으로 남은 건을 대기(pending)로 되돌림 - 되돌린 건수 반환"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.execute("UPDATE shipping_outbox SET status = 'pending', updated_at = CURRENT_TIMESTAMP WHERE status = 'sending'")
+            return cursor.rowcount
+        except Exception as e:
+            print(f"발송 대기열 복구 오류: {e}")
+            return 0
+
+    def complete_shipments(self, product_order_ids: List[str]) -> bool:
+        """발송 완료 처리"""
+        try:
+            with self.connection() as conn:
+                conn.executemany('''
+                    UPDATE shipping_outbox SET status = 'sent', attempts = attempts + 1, last_error = NULL,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE product_order_id = ?
+                ''', [(product_order_id,) for product_order_id in product_order_ids])
+            return True
+        except Exception as e:
+            print(f"발송 완료 처리 오류: {e}")
+            return False
+
+    def fail_shipments(self, failures: List[tuple]) -> bool:
+        """발송 실패 처리 - failures: [(상품주문 ID, 오류 메시지, 다음 시도 시각 또는 None), ...]
+
+        다음 시도 시각이 None이면 더 이상 재시도하지 않는다(failed).
+        """
+        try:
+            with self.connection() as conn:
+                conn.executemany('''
+                    UPDATE shipping_outbox SET
+                        status = CASE WHEN ? IS NULL THEN 'failed' ELSE 'pending' END,
+                        next_attempt_at = COALESCE(?, next_attempt_at),
+                        attempts = attempts + 1, last_error = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE product_order_id = ?
+                ''', [(next_attempt_at, next_attempt_at, error, product_order_id)
+                      for product_order_id, error, next_attempt_at in failures])
+            return True
+        except Exception as e:
+            print(f"발송 실패 처리 오류: {e}")
+            return False
+
+    def defer_shipments(self, product_order_ids: List[str], error: str, next_attempt_at: float) -> bool:
+        """보내지 못한 발송 건을 시도 횟수를 늘리지 않고 대기로 되돌림 (서킷 브레이커 차단/요청 제한)"""
+        try:
+            with self.connection() as conn:
+                conn.executemany('''
+                    UPDATE shipping_outbox SET status = 'pending', next_attempt_at = ?, last_error = ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE product_order_id = ?
+                ''', [(next_attempt_at, error, product_order_id) for product_order_id in product_order_ids])
+            return True
+        except Exception as e:
+            print(f"발송 보류 처리 오류: {e}")
+            return False
+
+    def get_shipping_outbox_counts(self) -> Dict[str, int]:
+        """발송 대기열 상태별 건수"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(SHIPPING_OUTBOX_COUNTS_SQL)
+                counts = {status: count for status, count in cursor.fetchall()}
+            return counts
+        except Exception as e:
+            print(f"발송 대기열 건수 조회 오류: {e}")
+            return {}
+
+    def get_next_shipment_due(self) -> Optional[float]:
+        """대기 건 중 가장 빠른 다음 시도 시각 (대기 건이 없으면 None)"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(NEXT_SHIPMENT_DUE_SQL)
+                row = cursor.fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"발송 대기열 조회 오류: {e}")
+            return None
+
     def get_products(self) -> List[Dict]:
         """모든 상품 조회 (get_all_products의 별칭)"""
         return self.get_all_products()
\ No newline at end of file
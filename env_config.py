@@ -72,6 +72,13 @@ class EnvConfig:
         except (ValueError, TypeError):
             return default
     
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        """실수 환경 변수 값 가져오기 - 캐시 우선 사용"""
+        try:
+            return float(self.get(key, str(default)))
+        except (ValueError, TypeError):
+            return default
+    
     def set(self, key: str, value: str):
         """환경 변수 설정 - 캐시도 함께 업데이트"""
         os.environ[key] = value
@@ -86,14 +93,34 @@ class EnvConfig:
         env_vars = {
             'NAVER_CLIENT_ID': self.get('NAVER_CLIENT_ID'),
             'NAVER_CLIENT_SECRET': self.get('NAVER_CLIENT_SECRET'),
+            'NAVER_API_BASE_URL': self.get('NAVER_API_BASE_URL', ''),
             'DATABASE_PATH': self.get('DATABASE_PATH', 'orders.db'),
+            'DB_JOURNAL_MODE': self.get('DB_JOURNAL_MODE', 'WAL'),
+            'DB_SYNCHRONOUS': self.get('DB_SYNCHRONOUS', 'NORMAL'),
+            'DB_BUSY_TIMEOUT_MS': str(self.get_int('DB_BUSY_TIMEOUT_MS', 5000)),
+            'DB_CACHE_SIZE_KB': str(self.get_int('DB_CACHE_SIZE_KB', 16384)),
+            'DB_MMAP_SIZE_MB': str(self.get_int('DB_MMAP_SIZE_MB', 64)),
+            'DB_DOCUMENT_CODEC': self.get('DB_DOCUMENT_CODEC', 'zlib'),
             'DISCORD_WEBHOOK_URL': self.get('DISCORD_WEBHOOK_URL'),
             'DISCORD_ENABLED': str(self.get_bool('DISCORD_ENABLED')).lower(),
             'DESKTOP_NOTIFICATIONS': str(self.get_bool('DESKTOP_NOTIFICATIONS', True)).lower(),
             'CHECK_INTERVAL': str(self.get_int('CHECK_INTERVAL', 300)),
+            'API_POOL_SIZE': str(self.get_int('API_POOL_SIZE', 10)),
+            'API_PAGE_FANOUT': str(self.get_int('API_PAGE_FANOUT', 4)),
+            'API_WINDOW_WORKERS': str(self.get_int('API_WINDOW_WORKERS', 4)),
+            'API_REQUESTS_PER_SECOND': str(self.get_float('API_REQUESTS_PER_SECOND', 4.0)),
+            'API_TRACE_LEVEL': self.get('API_TRACE_LEVEL', 'basic'),
+            'API_TRACE_SAMPLE_RATE': str(self.get_float('API_TRACE_SAMPLE_RATE', 1.0)),
+            'API_CIRCUIT_FAILURE_THRESHOLD': str(self.get_int('API_CIRCUIT_FAILURE_THRESHOLD', 5)),
+            'API_CIRCUIT_RECOVERY_TIMEOUT': str(self.get_float('API_CIRCUIT_RECOVERY_TIMEOUT', 30.0)),
+            'API_REQUEST_TIMEOUT': str(self.get_float('API_REQUEST_TIMEOUT', 30.0)),
             'AUTO_REFRESH': str(self.get_bool('AUTO_REFRESH', True)).lower(),
             'REFRESH_INTERVAL': str(self.get_int('REFRESH_INTERVAL', 60)),
             'PRODUCT_STATUS_TYPES': self.get('PRODUCT_STATUS_TYPES', 'SALE,WAIT,OUTOFSTOCK,SUSPENSION,CLOSE,PROHIBITION'),
+            'PRODUCT_SYNC_ENRICH': str(self.get_bool('PRODUCT_SYNC_ENRICH', False)).lower(),
+            'PRODUCT_DETAIL_SOURCE': self.get('PRODUCT_DETAIL_SOURCE', 'channel'),
+            'SHIPPING_DISPATCH_MAX_ATTEMPTS': str(self.get_int('SHIPPING_DISPATCH_MAX_ATTEMPTS', 3)),
+            'SHIPPING_DISPATCH_RETRY_DELAY': str(self.get_float('SHIPPING_DISPATCH_RETRY_DELAY', 2.0)),
             'ORDER_COLUMNS': self.get('ORDER_COLUMNS', '주문ID,상품주문ID,주문자,상품명,옵션정보,판매자상품코드,수량,단가,할인금액,금액,결제방법,배송지주소,배송예정일,주문일시,상태'),
             'ALLOWED_IPS': self.get('ALLOWED_IPS', '121.190.40.153,175.125.204.97'),
             'QUICK_PERIOD_SETTING': str(self.get_int('QUICK_PERIOD_SETTING', 7)),
@@ -113,8 +140,24 @@ class EnvConfig:
             f.write("# 네이버 API 설정\n")
             f.write(f"NAVER_CLIENT_ID={env_vars['NAVER_CLIENT_ID']}\n")
             f.write(f"NAVER_CLIENT_SECRET={env_vars['NAVER_CLIENT_SECRET']}\n")
+            f.write(f"NAVER_API_BASE_URL={env_vars['NAVER_API_BASE_URL']}\n")
+            f.write(f"API_POOL_SIZE={env_vars['API_POOL_SIZE']}\n")
+            f.write(f"API_PAGE_FANOUT={env_vars['API_PAGE_FANOUT']}\n")
+            f.write(f"API_WINDOW_WORKERS={env_vars['API_WINDOW_WORKERS']}\n")
+            f.write(f"API_REQUESTS_PER_SECOND={env_vars['API_REQUESTS_PER_SECOND']}\n")
+            f.write(f"API_TRACE_LEVEL={env_vars['API_TRACE_LEVEL']}\n")
+            f.write(f"API_TRACE_SAMPLE_RATE={env_vars['API_TRACE_SAMPLE_RATE']}\n")
+            f.write(f"API_CIRCUIT_FAILURE_THRESHOLD={env_vars['API_CIRCUIT_FAILURE_THRESHOLD']}\n")
+            f.write(f"API_CIRCUIT_RECOVERY_TIMEOUT={env_vars['API_CIRCUIT_RECOVERY_TIMEOUT']}\n")
+            f.write(f"API_REQUEST_TIMEOUT={env_vars['API_REQUEST_TIMEOUT']}\n")
             f.write("\n# 데이터베이스 설정\n")
             f.write(f"DATABASE_PATH={env_vars['DATABASE_PATH']}\n")
+            f.write(f"DB_JOURNAL_MODE={env_vars['DB_JOURNAL_MODE']}\n")
+            f.write(f"DB_SYNCHRONOUS={env_vars['DB_SYNCHRONOUS']}\n")
+            f.write(f"DB_BUSY_TIMEOUT_MS={env_vars['DB_BUSY_TIMEOUT_MS']}\n")
+            f.write(f"DB_CACHE_SIZE_KB={env_vars['DB_CACHE_SIZE_KB']}\n")
+            f.write(f"DB_MMAP_SIZE_MB={env_vars['DB_MMAP_SIZE_MB']}\n")
+            f.write(f"DB_DOCUMENT_CODEC={env_vars['DB_DOCUMENT_CODEC']}\n")
             f.write("\n# 디스코드 알림 설정\n")
             f.write(f"DISCORD_WEBHOOK_URL={env_vars['DISCORD_WEBHOOK_URL']}\n")
             f.write(f"DISCORD_ENABLED={env_vars['DISCORD_ENABLED']}\n")
@@ -126,6 +169,11 @@ class EnvConfig:
             f.write(f"REFRESH_INTERVAL={env_vars['REFRESH_INTERVAL']}\n")
             f.write("\n# 상품상태 조회 설정\n")
             f.write(f"PRODUCT_STATUS_TYPES={env_vars['PRODUCT_STATUS_TYPES']}\n")
+            f.write(f"PRODUCT_SYNC_ENRICH={env_vars['PRODUCT_SYNC_ENRICH']}\n")
+            f.write(f"PRODUCT_DETAIL_SOURCE={env_vars['PRODUCT_DETAIL_SOURCE']}\n")
+            f.write("\n# 발송 처리 설정\n")
+            f.write(f"SHIPPING_DISPATCH_MAX_ATTEMPTS={env_vars['SHIPPING_DISPATCH_MAX_ATTEMPTS']}\n")
+            f.write(f"SHIPPING_DISPATCH_RETRY_DELAY={env_vars['SHIPPING_DISPATCH_RETRY_DELAY']}\n")
             f.write("\n# 주문 컬럼 설정\n")
             f.write(f"ORDER_COLUMNS={env_vars['ORDER_COLUMNS']}\n")
             f.write("\n# IP 관리 설정\n")
@@ -87,6 +87,11 @@ print("💾 쇼핑몰 주문관리시스템 v1.0.0 - 로그 시스템 임시 비
 
 from database import DatabaseManager
 from naver_api import NaverShoppingAPI
+from order_sync import OrderSyncEngine
+from product_sync import ProductCatalogSync
+from shipping_dispatch import ShippingDispatcher
+from response_cache import ResponseCache
+from api_tracing import RequestTracer
 from notification_manager import NotificationManager
 from env_config import config
 from ui_utils import enable_context_menu
@@ -121,11 +126,22 @@ class WithUsOrderManager:
         
         # 데이터베이스 매니저 초기화
         print("데이터베이스 매니저 초기화 시작")
-        self.db_manager = DatabaseManager()
+        self.db_manager = DatabaseManager(
+            journal_mode=config.get('DB_JOURNAL_MODE', 'WAL'),
+            synchronous=config.get('DB_SYNCHRONOUS', 'NORMAL'),
+            busy_timeout_ms=config.get_int('DB_BUSY_TIMEOUT_MS', 5000),
+            cache_size_kb=config.get_int('DB_CACHE_SIZE_KB', 16384),
+            mmap_size_mb=config.get_int('DB_MMAP_SIZE_MB', 64),
+            document_codec=config.get('DB_DOCUMENT_CODEC', 'zlib')
+        )
         print("데이터베이스 매니저 초기화 완료")
         
         # API 및 알림 매니저 초기화
         self.naver_api = None
+        self.order_sync = None
+        self.product_sync = None
+        self.shipping_dispatcher = None
+        self.response_cache = None
         self.notification_manager = None
         self.all_orders = []
         self.initialize_api()
@@ -239,9 +255,31 @@ class WithUsOrderManager:
         # 상태바
         self.status_var = tk.StringVar()
         self.status_var.set("준비됨")
-        status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN)
-        status_bar.pack(side="bottom", fill="x")
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(side="bottom", fill="x")
+        # API 서킷 브레이커 상태 (차단 중에는 저장된 데이터로 표시)
+        self.api_state_var = tk.StringVar()
+        self.api_state_var.set("API: 정상")
+        self.api_state_label = ttk.Label(status_frame, textvariable=self.api_state_var, relief=tk.SUNKEN)
+        self.api_state_label.pack(side="right")
+        status_bar = ttk.Label(status_frame, textvariable=self.status_var, relief=tk.SUNKEN)
+        status_bar.pack(side="left", fill="x", expand=True)
     
+    def on_api_circuit_changed(self, state):
+        """서킷 브레이커 상태 변경 시 상태바 갱신 (요청 스레드에서 호출될 수 있음)"""
+        def update():
+            stats = self.naver_api.get_circuit_stats() if self.naver_api else {'state': state, 'label': '정상'}
+            text = f"API: {stats['label']}"
+            if stats['state'] == 'open':
+                text += f" - {stats['retry_in']:.0f}초 후 재시도, 저장된 데이터 표시 중"
+                # 차단 시간이 지나면 복구 확인 상태로 다시 표시
+                self.root.after(int(stats['retry_in'] * 1000) + 500, update)
+            self.api_state_var.set(text)
+        try:
+            self.root.after(0, update)
+        except Exception as e:
+            print(f"API 상태 표시 오류: {e}")
+
     def on_tab_changed(self, event):
         """탭 변경 이벤트 핸들러 - 성능 최적화"""
         try:
@@ -298,16 +336,67 @@ class WithUsOrderManager:
             client_secret = config.get('NAVER_CLIENT_SECRET')
             
             if client_id and client_secret:
-                self.naver_api = NaverShoppingAPI(client_id, client_secret)
-                print("API 초기화 완료")
+                # 재초기화 시 기존 세션의 연결 풀 정리
+                if self.naver_api:
+                    self.naver_api.close()
+                pool_size = config.get_int('API_POOL_SIZE', 10)
+                # 토큰 캐시는 orders.db와 같은 폴더에 암호화하여 저장
+                data_dir = os.path.dirname(os.path.abspath(self.db_manager.db_path))
+                token_cache_path = os.path.join(data_dir, 'naver_token.cache')
+                # 조회 응답 캐시는 재초기화/재시작 후에도 유지 (SQLite 파일)
+                if self.response_cache is None:
+                    self.response_cache = ResponseCache(db_path=os.path.join(data_dir, 'naver_api_cache.db'))
+                self.naver_api = NaverShoppingAPI(client_id, client_secret, pool_size=pool_size,
+                                                  token_cache_path=token_cache_path,
+                                                  page_fanout=config.get_int('API_PAGE_FANOUT', 4),
+                                                  window_workers=config.get_int('API_WINDOW_WORKERS', 4),
+                                                  requests_per_second=config.get_float('API_REQUESTS_PER_SECOND', 4.0),
+                                                  response_cache=self.response_cache,
+                                                  tracer=RequestTracer(level=config.get('API_TRACE_LEVEL', 'basic'),
+                                                                       sample_rate=config.get_float('API_TRACE_SAMPLE_RATE', 1.0)),
+                                                  circuit_failure_threshold=config.get_int('API_CIRCUIT_FAILURE_THRESHOLD', 5),
+                                                  circuit_recovery_timeout=config.get_float('API_CIRCUIT_RECOVERY_TIMEOUT', 30.0),
+                                                  offline_orders=self.db_manager.get_product_orders,
+                                                  base_url=config.get('NAVER_API_BASE_URL') or None,
+                                                  timeout=config.get_float('API_REQUEST_TIMEOUT', 30.0))
+                # 설정 화면에서 바꾼 값은 공유 속도 제한기/서킷 브레이커에 명시적으로 반영
+                # (요청 제한으로 낮아진 현재 속도와 차단 상태는 유지)
+                self.naver_api.rate_limiter.configure(config.get_float('API_REQUESTS_PER_SECOND', 4.0))
+                self.naver_api.circuit_breaker.configure(config.get_int('API_CIRCUIT_FAILURE_THRESHOLD', 5),
+                                                         config.get_float('API_CIRCUIT_RECOVERY_TIMEOUT', 30.0))
+                # 서킷 브레이커 상태를 상태바에 표시 (공유 인스턴스라 재초기화해도 한 번만 등록됨)
+                self.naver_api.circuit_breaker.add_listener(self.on_api_circuit_changed)
+                self.on_api_circuit_changed(self.naver_api.circuit_breaker.state)
+                # 시작/첫 대시보드 새로고침이 토큰 발급을 기다리지 않도록 백그라운드에서 미리 발급
+                self.naver_api.token_manager.prefetch()
+                # 변경분만 조회하는 증분 동기화 (커서는 settings 테이블에 저장)
+                self.order_sync = OrderSyncEngine(self.naver_api, self.db_manager,
+                                                  initial_lookback_days=config.get_int('DASHBOARD_PERIOD_DAYS', 1))
+                # 전체 상품 페이지 순회 동기화 (수정일이 같은 상품은 건너뜀)
+                self.product_sync = ProductCatalogSync(self.naver_api, self.db_manager,
+                                                       detail_source=config.get('PRODUCT_DETAIL_SOURCE', 'channel'))
+                # 발송 처리 대기열 - 이전 실행에서 보내지 못한 건은 백그라운드에서 이어서 발송
+                self.shipping_dispatcher = ShippingDispatcher(self.naver_api, self.db_manager,
+                                                              max_attempts=config.get_int('SHIPPING_DISPATCH_MAX_ATTEMPTS', 3),
+                                                              retry_delay=config.get_float('SHIPPING_DISPATCH_RETRY_DELAY', 2.0))
+                outbox_counts = self.db_manager.get_shipping_outbox_counts()
+                if outbox_counts.get('pending') or outbox_counts.get('sending'):
+                    threading.Thread(target=self.shipping_dispatcher.run, daemon=True).start()
+                print(f"API 초기화 완료 (연결 풀 크기: {pool_size})")
                 return True
             else:
                 print("API 설정이 없습니다. 설정 탭에서 API 정보를 입력해주세요.")
                 self.naver_api = None
+                self.order_sync = None
+                self.product_sync = None
+                self.shipping_dispatcher = None
                 return False
         except Exception as e:
             print(f"API 초기화 오류: {e}")
             self.naver_api = None
+            self.order_sync = None
+            self.product_sync = None
+            self.shipping_dispatcher = None
             return False
     
     def initialize_notifications(self):
@@ -385,7 +474,7 @@ class WithUsOrderManager:
         refresh_thread.start()
     
     def remove_duplicate_orders(self, orders):
-        """중복된 주문 제거 (orderId 기준)"""
+        """중복된 주문 제거 (상품주문ID 기준, 없으면 orderId - 한 주문의 여러 상품주문은 모두 유지)"""
         if not isinstance(orders, list):
             return []
         
@@ -394,7 +483,8 @@ class WithUsOrderManager:
         
         for order in orders:
             if isinstance(order, dict):
-                order_id = order.get('orderId')
+                product_order = (order.get('content') or {}).get('productOrder') or {}
+                order_id = order.get('productOrderId') or product_order.get('productOrderId') or order.get('orderId')
                 if order_id and order_id not in seen_order_ids:
                     seen_order_ids.add(order_id)
                     unique_orders.append(order)
@@ -412,6 +502,16 @@ class WithUsOrderManager:
             print("애플리케이션 종료")
         except Exception as e:
             print(f"애플리케이션 실행 오류: {e}")
+        finally:
+            if self.naver_api:
+                stats = self.naver_api.get_connection_stats()
+                print(f"API 연결 통계: {stats}")
+                print(f"API 응답 캐시 통계: {self.naver_api.get_cache_stats()}")
+                print(f"API 동시 요청 병합 통계: {self.naver_api.get_coalescing_stats()}")
+                print(f"API 요청 추적 통계: {self.naver_api.get_trace_stats()}")
+                self.naver_api.close()
+            print(f"DB 연결 통계: {self.db_manager.get_connection_stats()}")
+            self.db_manager.close()
 
 
 def main():
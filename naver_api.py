@@ -1,473 +1,189 @@
 import requests
-import json
-import hashlib
-import hmac
+from requests.adapters import HTTPAdapter
 import time
-import base64
-import bcrypt
-import pybase64
-from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-import configparser
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-class NaverShoppingAPI:
-    def __init__(self, client_id: str, client_secret: str):
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.base_url = "https://api.commerce.naver.com"
-        self.access_token = None
-        
+from naver_api_base import NaverAPIBase, ORDERS_ENDPOINT, QUERY_ENDPOINT
+from order_partition import OrderPartition
+from product_order import parse_product_orders
+from single_flight import SingleFlight, coalesce
+
+class NaverShoppingAPI(NaverAPIBase):
+    """네이버 쇼핑 API 동기 클라이언트 (requests 세션 + 스레드 병렬 조회)
+
+    엔드포인트와 요청/응답 처리는 AsyncNaverShoppingAPI와 NaverAPIBase에서 공유한다.
+    """
+    def __init__(self, client_id: str, client_secret: str, pool_size: int = 10, token_cache_path: str = None,
+                 page_fanout: int = 4, window_workers: int = 4, requests_per_second: float = 4.0, response_cache=None,
+                 coalesce_requests: bool = True, tracer=None, circuit_failure_threshold: int = 5,
+                 circuit_recovery_timeout: float = 30.0, offline_orders=None, base_url: str = None,
+                 timeout: float = 30.0):
+        super().__init__(client_id, client_secret, token_cache_path=token_cache_path, page_fanout=page_fanout,
+                         window_workers=window_workers, requests_per_second=requests_per_second,
+                         response_cache=response_cache, tracer=tracer,
+                         circuit_failure_threshold=circuit_failure_threshold,
+                         circuit_recovery_timeout=circuit_recovery_timeout, offline_orders=offline_orders,
+                         base_url=base_url)
+        
+        # 모든 탭과 백그라운드 모니터가 공유하는 keep-alive 세션 (TCP/TLS 연결 재사용)
+        self.pool_size = max(1, int(pool_size))
+        self.session = self._create_session(self.pool_size)
+        self.timeout = timeout  # 연결/응답 대기 제한 (초) - 응답 없는 서버에 작업 스레드가 묶이지 않도록
+        self._stats_lock = threading.Lock()
+        self._request_count = 0
+        
+        # 탭/대시보드/백그라운드 모니터가 동시에 같은 조회를 호출하면 한 번만 실행하고 결과 공유 (@coalesce 메서드)
+        self.single_flight = SingleFlight() if coalesce_requests else None
+    
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """연결 풀이 설정된 HTTP 세션 생성"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _send_request(self, method: str, url: str, headers: Dict, data: Dict = None, form: bool = False) -> requests.Response:
+        """공유 세션으로 HTTP 요청 전송"""
+        with self._stats_lock:
+            self._request_count += 1
+        
+        method = method.upper()
+        if form:
+            return self.session.request(method, url, headers=headers, data=data, timeout=self.timeout)
+        if method == 'GET':
+            # 파라미터가 있는 경우 URL에 직접 추가
+            if data:
+                param_string = '&'.join([f"{k}={v}" for k, v in data.items()])
+                url = f"{url}?{param_string}"
+            return self.session.get(url, headers=headers, timeout=self.timeout)
+        if method == 'POST':
+            return self.session.post(url, headers=headers, json=data, timeout=self.timeout)
+        if method == 'PUT':
+            return self.session.put(url, headers=headers, json=data, timeout=self.timeout)
+        raise ValueError(f'Unsupported method: {method}')
+    
+    def _send_with_rate_limit(self, method: str, url: str, headers: Dict, data: Dict = None, log_details: bool = False) -> requests.Response:
+        """공유 속도 제한기를 거쳐 요청 전송 - 요청 제한 응답 시 속도를 낮추고 재시도"""
+        for attempt in range(self.max_throttle_retries + 1):
+            self.rate_limiter.acquire()
+            response = self._send_request(method, url, headers, data)
+            if not self._record_rate_limit_result(response, attempt, log_details):
+                return response
+        return response
+    
+    def get_connection_stats(self) -> Dict:
+        """연결 재사용 통계 조회"""
+        opened = 0
+        pool_requests = 0
+        for adapter in set(self.session.adapters.values()):
+            pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+            if pools is None:
+                continue
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                opened += getattr(pool, 'num_connections', 0)
+                pool_requests += getattr(pool, 'num_requests', 0)
+        
+        reused = max(0, pool_requests - opened)
+        return {
+            'pool_size': self.pool_size,
+            'requests': self._request_count,
+            'connections_opened': opened,
+            'connections_reused': reused,
+            'reuse_ratio': round(reused / pool_requests, 3) if pool_requests else 0.0
+        }
+    
+    def get_coalescing_stats(self) -> Dict:
+        """동시 요청 병합 통계 조회"""
+        return self.single_flight.get_stats() if self.single_flight else {}
+    
+    def close(self):
+        """세션 종료 (풀의 모든 연결 반환)"""
+        try:
+            self.session.close()
+        except Exception as e:
+            print(f"세션 종료 오류: {e}")
+    
     def get_access_token(self) -> bool:
-        """네이버 쇼핑 API 액세스 토큰 발급"""
+        """네이버 쇼핑 API 액세스 토큰 강제 재발급"""
+        return self.token_manager.get_token(force=True) is not None
+    
+    def _issue_access_token(self) -> Optional[tuple]:
+        """네이버 쇼핑 API 액세스 토큰 발급 - (토큰, 유효시간(초)) 반환"""
         try:
-            url = f"{self.base_url}/external/v1/oauth2/token"
-            
-            # 현재 시간의 타임스탬프 생성 (밀리초 단위)
-            timestamp = int(time.time() * 1000)
-            
-            # 클라이언트 ID와 타임스탬프를 결합하여 비밀번호 생성
-            password = self.client_id + "_" + str(timestamp)
-            
-            # bcrypt 해싱
-            hashed = bcrypt.hashpw(password.encode('utf-8'), self.client_secret.encode('utf-8'))
-            
-            # base64 인코딩
-            client_secret_sign = pybase64.standard_b64encode(hashed).decode('utf-8')
-            
-            headers = {
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'Accept': 'application/json'
-            }
-            
-            data = {
-                'client_id': str(self.client_id),
-                'timestamp': timestamp,
-                'client_secret_sign': str(client_secret_sign),
-                'grant_type': 'client_credentials',
-                'type': 'SELF'
-            }
-            
-            response = requests.post(url, headers=headers, data=data)
-            
-            if response.status_code == 200:
-                token_data = response.json()
-                self.access_token = token_data.get('access_token')
-                return True
-            else:
-                error_detail = response.text
-                print(f"토큰 발급 실패: {response.status_code} - {error_detail}")
-                
-                # 오류 상세 정보 파싱
-                try:
-                    error_data = response.json()
-                    if 'invalidInputs' in error_data:
-                        for invalid_input in error_data['invalidInputs']:
-                            print(f"오류 상세: {invalid_input.get('message', '알 수 없는 오류')}")
-                except:
-                    pass
-                
-                return False
-                
+            url, headers, data = self._build_token_request()
+            response = self._send_request('POST', url, headers, data, form=True)
+            return self._parse_token_response(response)
         except Exception as e:
             print(f"토큰 발급 오류: {e}")
-            return False
+            return None
     
-    def _generate_terminal_log(self, request_info: Dict, response_info: Dict, response_data: any) -> str:
-        """터미널 로그 형식으로 요청/응답 정보 생성"""
-        log_lines = []
-        
-        # 요청 정보
-        log_lines.append("=== API 요청 상세 정보 ===")
-        log_lines.append(f"메서드: {request_info['method']}")
-        log_lines.append(f"URL: {request_info['url']}")
-        log_lines.append(f"엔드포인트: {request_info['endpoint']}")
-        if request_info.get('data'):
-            log_lines.append(f"요청 데이터: {json.dumps(request_info['data'], indent=2, ensure_ascii=False) if isinstance(request_info['data'], dict) else str(request_info['data'])}")
-        log_lines.append("========================")
-        
-        if request_info['method'].upper() == 'GET' and request_info.get('data'):
-            log_lines.append(f"GET 요청 URL: {request_info['url']}?{request_info.get('params', '')}")
-            log_lines.append(f"GET 요청 파라미터: {request_info['data']}")
-        
-        # 응답 정보 (응답 헤더 제거)
-        log_lines.append("")
-        log_lines.append("=== API 응답 상세 정보 ===")
-        log_lines.append(f"응답 시간: {response_info['response_time']}")
-        log_lines.append(f"상태 코드: {response_info['status_code']}")
-        log_lines.append("=========================")
-        
-        # 응답 데이터 (timestamp, traceId 제거)
-        if isinstance(response_data, dict):
-            # timestamp, traceId 제거하고 data만 표시
-            filtered_data = {k: v for k, v in response_data.items() if k not in ['timestamp', 'traceId']}
-            log_lines.append(f"{json.dumps(filtered_data, indent=2, ensure_ascii=False)}")
-        else:
-            log_lines.append(f"{json.dumps(response_data, indent=2, ensure_ascii=False)}")
-        
-        return "\n".join(log_lines)
+    def make_authenticated_request(self, method: str, endpoint: str, data: Dict = None, log_details: bool = None) -> Dict:
+        """인증된 API 요청 - 상태/데이터/소요 시간 반환 (상세 정보는 조회할 때 생성)
+
+        log_details가 None이면 요청 추적 수준에 따라 상세 로그 출력 여부를 정한다.
+        """
+        span, log_details = self._start_trace(method, endpoint, log_details)
+        return self.tracer.finish_span(span, self._execute_request(method, endpoint, data, log_details))
     
-    def make_authenticated_request(self, method: str, endpoint: str, data: Dict = None, log_details: bool = True) -> Dict:
-        """인증된 API 요청 - 상세 응답 정보 반환"""
+    def _execute_request(self, method: str, endpoint: str, data: Dict, log_details: bool) -> Dict:
+        """캐시 확인, 토큰 발급, 서킷 브레이커 확인, 요청 전송 (401 응답 시 토큰 재발급 후 재시도)"""
         start_time = time.time()
         
-        if not self.access_token:
-            if not self.get_access_token():
-                return {
-                    'success': False,
-                    'status_code': 401,
-                    'message': '토큰 발급 실패',
-                    'data': None,
-                    'error': 'Access token not available',
-                    'request_details': {
-                        'method': method,
-                        'endpoint': endpoint,
-                        'data': data,
-                        'timestamp': datetime.now().isoformat()
-                    },
-                    'terminal_log': f"토큰 발급 실패 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                }
+        cached = self._get_cached_response(method, endpoint, data, log_details)
+        if cached is not None:
+            return cached
         
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            'Authorization': f'Bearer {self.access_token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json;charset=UTF-8',
-            'X-Naver-Client-Id': self.client_id,
-            'X-Naver-Client-Secret': self.client_secret
-        }
-        
-        # 요청 정보 상세 로깅
-        request_info = {
-            'timestamp': datetime.now().isoformat(),
-            'method': method,
-            'url': url,
-            'endpoint': endpoint,
-            'headers': {k: v[:20] + '...' if k == 'Authorization' and len(str(v)) > 20 else v for k, v in headers.items()},
-            'data': data,
-            'data_size': len(str(data)) if data else 0
-        }
+        access_token = self.token_manager.get_token()
+        if not access_token:
+            return self._token_unavailable_result(method, endpoint, data)
+        if method.upper() not in ('GET', 'POST', 'PUT'):
+            return self._unsupported_method_result(method)
+        if not self.circuit_breaker.allow_request():
+            # API 장애로 차단 중이면 요청을 보내지 않고 바로 실패 (재시도 대기로 스레드가 쌓이지 않도록)
+            return self._circuit_open_result(method, endpoint, data)
         
-        if log_details:
-            print(f"\n=== API 요청 상세 정보 ===")
-            print(f"타임스탬프: {request_info['timestamp']}")
-            print(f"메서드: {method}")
-            print(f"URL: {url}")
-            print(f"엔드포인트: {endpoint}")
-            if data:
-                print(f"요청 데이터 크기: {request_info['data_size']} bytes")
-                print(f"요청 데이터: {json.dumps(data, indent=2, ensure_ascii=False) if isinstance(data, dict) else str(data)}")
-            print(f"========================")
+        url, headers, request_context = self._prepare_request(method, endpoint, data, access_token, log_details)
         
         try:
-            if method.upper() == 'GET':
-                # 파라미터가 있는 경우 URL에 직접 추가
-                if data:
-                    param_string = '&'.join([f"{k}={v}" for k, v in data.items()])
-                    url = f"{url}?{param_string}"
-                print(f"GET 요청 URL: {url}")
-                print(f"GET 요청 파라미터: {data}")
-                response = requests.get(url, headers=headers)
-            elif method.upper() == 'POST':
-                response = requests.post(url, headers=headers, json=data)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, headers=headers, json=data)
-            else:
-                return {
-                    'success': False,
-                    'status_code': 400,
-                    'message': '지원하지 않는 HTTP 메서드',
-                    'data': None,
-                    'error': f'Unsupported method: {method}'
-                }
+            response = self._send_with_rate_limit(method, url, headers, data, log_details)
             
-            # 요청 완료 시간 측정
-            end_time = time.time()
-            response_time = end_time - start_time
+            if response.status_code == 401:
+                # 토큰 만료 시 재발급 (동시에 401을 받은 스레드들은 한 번의 갱신 결과를 공유)
+                self.token_manager.invalidate(access_token)
+                access_token = self.token_manager.get_token()
+                if access_token:
+                    headers['Authorization'] = f'Bearer {access_token}'
+                    response = self._send_with_rate_limit(method, url, headers, data, log_details)
+                    result = self._build_response_result(response, request_context, start_time, log_details, token_refreshed=True)
+                    return self._update_cache(method, endpoint, data, result)
             
-            # 응답 정보 상세 로깅
-            response_info = {
-                'timestamp': datetime.now().isoformat(),
-                'status_code': response.status_code,
-                'response_time': f"{response_time:.3f}s",
-                'headers': dict(response.headers),
-                'content_length': len(response.text) if hasattr(response, 'text') else 0
-            }
-            
-            if log_details:
-                print(f"\n=== API 응답 상세 정보 ===")
-                print(f"응답 시간: {response_info['response_time']}")
-                print(f"상태 코드: {response.status_code}")
-                print(f"응답 크기: {response_info['content_length']} bytes")
-                print(f"응답 바디:")
-                try:
-                    response_data = response.json()
-                    print(json.dumps(response_data, ensure_ascii=False, indent=2))
-                except:
-                    print(response.text)
-                print(f"=========================")
-            
-            # 응답 상태 코드에 따른 처리
-            if response.status_code == 200:
-                try:
-                    response_data = response.json()
-                    # 터미널 로그 생성
-                    terminal_log = self._generate_terminal_log(request_info, response_info, response_data)
-                    
-                    result = {
-                        'success': True,
-                        'status_code': response.status_code,
-                        'message': '요청 성공',
-                        'data': response_data,
-                        'error': None,
-                        'request_details': request_info,
-                        'response_details': response_info,
-                        'terminal_log': terminal_log
-                    }
-                    
-                    # 별도 로그 출력 제거 (터미널 로그에 포함됨)
-                    
-                    return result
-                except Exception as json_error:
-                    terminal_log = self._generate_terminal_log(request_info, response_info, response.text)
-                    result = {
-                        'success': True,
-                        'status_code': response.status_code,
-                        'message': '요청 성공 (JSON 파싱 실패)',
-                        'data': response.text,
-                        'error': f'JSON 파싱 오류: {str(json_error)}',
-                        'request_details': request_info,
-                        'response_details': response_info,
-                        'terminal_log': terminal_log
-                    }
-                    
-                    if log_details:
-                        print(f"JSON 파싱 실패: {str(json_error)}")
-                        print(f"원본 응답 텍스트: {response.text[:200]}...")
-                    
-                    return result
-            elif response.status_code == 401:
-                # 토큰 만료 시 재발급
-                if self.get_access_token():
-                    headers['Authorization'] = f'Bearer {self.access_token}'
-                    if method.upper() == 'GET':
-                        # 파라미터가 있는 경우 URL에 직접 추가
-                        if data:
-                            param_string = '&'.join([f"{k}={v}" for k, v in data.items()])
-                            url = f"{url}?{param_string}"
-                        response = requests.get(url, headers=headers)
-                    elif method.upper() == 'POST':
-                        response = requests.post(url, headers=headers, json=data)
-                    elif method.upper() == 'PUT':
-                        response = requests.put(url, headers=headers, json=data)
-                    
-                    if response.status_code == 200:
-                        try:
-                            response_data = response.json()
-                            # 재시도 응답 정보 업데이트
-                            retry_response_info = response_info.copy()
-                            retry_response_info.update({
-                                'status_code': response.status_code,
-                                'content_length': len(response.text) if hasattr(response, 'text') else 0
-                            })
-                            terminal_log = self._generate_terminal_log(request_info, retry_response_info, response_data)
-                            return {
-                                'success': True,
-                                'status_code': response.status_code,
-                                'message': '요청 성공 (토큰 재발급 후)',
-                                'data': response_data,
-                                'error': None,
-                                'terminal_log': terminal_log
-                            }
-                        except:
-                            return {
-                                'success': True,
-                                'status_code': response.status_code,
-                                'message': '요청 성공 (토큰 재발급 후, JSON 파싱 실패)',
-                                'data': response.text,
-                                'error': None
-                            }
-                
-                # 토큰 재발급 실패
-                result = {
-                    'success': False,
-                    'status_code': 401,
-                    'message': '인증 실패 (토큰 재발급 실패)',
-                    'data': None,
-                    'error': response.text,
-                    'request_details': request_info,
-                    'response_details': response_info
-                }
-                
-                if log_details:
-                    print(f"토큰 재발급 실패: {response.text}")
-                
-                return result
-            else:
-                # 기타 오류
-                try:
-                    error_data = response.json()
-                    error_message = error_data.get('message', '알 수 없는 오류')
-                    if 'invalidInputs' in error_data:
-                        invalid_inputs = error_data['invalidInputs']
-                        error_details = []
-                        for invalid_input in invalid_inputs:
-                            field = invalid_input.get('field', '')
-                            message = invalid_input.get('message', '')
-                            error_details.append(f"{field}: {message}")
-                        error_message += f" - {', '.join(error_details)}"
-                    
-                    if log_details:
-                        print(f"API 오류 응답: {json.dumps(error_data, indent=2, ensure_ascii=False)}")
-                        
-                except Exception as parse_error:
-                    error_message = response.text
-                    if log_details:
-                        print(f"오류 응답 파싱 실패: {str(parse_error)}")
-                        print(f"원본 오류 응답: {response.text}")
-                
-                result = {
-                    'success': False,
-                    'status_code': response.status_code,
-                    'message': f'요청 실패 ({response.status_code})',
-                    'data': None,
-                    'error': error_message,
-                    'request_details': request_info,
-                    'response_details': response_info
-                }
-                
-                if log_details:
-                    print(f"HTTP {response.status_code} 오류: {error_message}")
-                
-                return result
+            result = self._build_response_result(response, request_context, start_time, log_details)
+            return self._update_cache(method, endpoint, data, result)
             
         except Exception as e:
-            end_time = time.time()
-            response_time = end_time - start_time
-            
-            result = {
-                'success': False,
-                'status_code': 0,
-                'message': '네트워크 오류',
-                'data': None,
-                'error': str(e),
-                'request_details': request_info,
-                'response_details': {
-                    'timestamp': datetime.now().isoformat(),
-                    'response_time': f"{response_time:.3f}s",
-                    'error_type': type(e).__name__
-                }
-            }
-            
-            if log_details:
-                print(f"\n=== API 요청 예외 발생 ===")
-                print(f"예외 타입: {type(e).__name__}")
-                print(f"예외 메시지: {str(e)}")
-                print(f"요청 시간: {response_time:.3f}s")
-                print(f"======================")
-            
-            return result
-    
-    
-    def get_order_detail(self, order_id: str) -> Optional[Dict]:
-        """주문 상세 조회"""
-        response = self.make_authenticated_request('GET', f'/external/v1/pay-order/seller/product-orders/{order_id}')
-        return response
-    
-    def get_last_changed_orders(self, last_changed_from: str, last_changed_to: str = None, last_changed_type: str = None) -> Dict:
-        """변경된 주문 목록 조회 (last-changed-statuses)"""
-        params = {
-            'lastChangedFrom': last_changed_from
-        }
-        
-        if last_changed_to:
-            params['lastChangedTo'] = last_changed_to
-        
-        if last_changed_type:
-            params['lastChangedType'] = last_changed_type
-            
-        response = self.make_authenticated_request('GET', '/external/v1/pay-order/seller/product-orders/last-changed-statuses', params)
-        return response
-    
-    def query_orders_by_ids(self, product_order_ids: list) -> Dict:
-        """주문 ID 목록으로 상세 주문 정보 조회 (query)"""
-        data = {
-            'productOrderIds': product_order_ids
-        }
-        response = self.make_authenticated_request('POST', '/external/v1/pay-order/seller/product-orders/query', data)
-        return response
+            return self._network_error_result(e, request_context, start_time, log_details)
     
+    @coalesce
     def get_changed_orders_with_chunking(self, start_time: str, end_time: str, last_changed_type: str = 'PAYED') -> Dict:
         """24시간 단위로 나누어 변경된 주문 조회"""
-        from datetime import datetime, timezone, timedelta
-        import time
-        
-        # 한국 시간대 설정 (UTC+9)
-        kst = timezone(timedelta(hours=9))
-        
-        # 시간 문자열을 datetime 객체로 변환
-        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00')).astimezone(kst)
-        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00')).astimezone(kst)
-        
-        all_orders = []
-        total_chunks = 0
-        
-        print(f"24시간 단위 청크 조회 시작:")
-        print(f"  → 시작 시간: {start_dt.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+09:00")
-        print(f"  → 종료 시간: {end_dt.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+09:00")
-        
-        # 24시간 단위로 쪼개서 조회
-        current_start = start_dt
-        while current_start < end_dt:
-            # 24시간 후 또는 종료일 중 더 이른 시간
-            current_end = min(current_start + timedelta(hours=24), end_dt)
-            
-            total_chunks += 1
-            print(f"청크 {total_chunks}: {current_start.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+09:00 ~ {current_end.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+09:00")
-            
-            # ISO 형식으로 변환
-            chunk_start = current_start.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-            chunk_end = current_end.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-            
-            # 해당 청크의 변경된 주문 조회
-            print(f"  → 청크 {total_chunks} API 요청:")
-            print(f"    - URL: {self.base_url}/external/v1/pay-order/seller/product-orders/last-changed-statuses")
-            print(f"    - lastChangedFrom: {chunk_start}")
-            print(f"    - lastChangedTo: {chunk_end}")
-            print(f"    - lastChangedType: {last_changed_type}")
-            
-            response = self.get_last_changed_orders(
-                last_changed_from=chunk_start,
-                last_changed_to=chunk_end,
+        # 24시간 단위 구간을 병렬로 조회 (공유 요청 예산 내에서, 결과는 시간순으로 병합)
+        time_windows = self._changed_orders_windows(start_time, end_time)
+        
+        def fetch_window(window):
+            window_start, window_end = window
+            return self.get_last_changed_orders(
+                last_changed_from=self._format_api_time(window_start),
+                last_changed_to=self._format_api_time(window_end),
                 last_changed_type=last_changed_type
             )
-            
-            if response and response.get('success'):
-                data = response.get('data', {})
-                if 'lastChangeStatuses' in data:
-                    chunk_orders = data['lastChangeStatuses']
-                    all_orders.extend(chunk_orders)
-                    print(f"  → {len(chunk_orders)}건 조회 성공")
-                else:
-                    print(f"  → 0건 조회")
-            else:
-                print(f"  → 조회 실패: {response.get('error', '알 수 없는 오류') if response else '응답 없음'}")
-            
-            # 0.5초 딜레이 (참조 코드와 동일)
-            time.sleep(0.5)
-            
-            # 다음 청크로 이동
-            current_start = current_end
         
-        print(f"전체 청크 조회 완료: {total_chunks}개 청크, 총 {len(all_orders)}건")
-        
-        return {
-            'success': True,
-            'data': {
-                'count': len(all_orders),
-                'lastChangeStatuses': all_orders,
-                'chunks_processed': total_chunks
-            }
-        }
+        return self._build_changed_orders_result(time_windows, self._map_windows(fetch_window, time_windows))
     
     def update_order_status(self, order_id: str, status: str) -> bool:
         """주문 상태 업데이트"""
@@ -475,298 +191,100 @@ class NaverShoppingAPI:
             'status': status
         }
         
-        response = self.make_authenticated_request('PUT', f'/external/v1/pay-order/seller/product-orders/{order_id}/status', data)
+        response = self.make_authenticated_request('PUT', f'{ORDERS_ENDPOINT}/{order_id}/status', data)
         return response is not None
     
-    def get_products(self, limit: int = 100, product_status_types: list = None) -> Dict:
-        """상품 목록 조회 - 상세 응답 정보 반환"""
-        if product_status_types is None:
-            product_status_types = ["SALE", "WAIT", "OUTOFSTOCK", "SUSPENSION", "CLOSE", "PROHIBITION"]
-        
-        data = {
-            "productStatusTypes": product_status_types,
-            "page": 1,
-            "size": min(limit, 50),  # 최대 50개로 제한
-            "orderType": "NO",
-            "periodType": "PROD_REG_DAY",
-            "fromDate": "",
-            "toDate": ""
-        }
-        return self.make_authenticated_request('POST', '/external/v1/products/search', data)
-    
-    def get_channel_product(self, channel_product_id: str) -> Dict:
-        """채널상품 상세 조회 - 상세 응답 정보 반환"""
-        return self.make_authenticated_request('GET', f'/external/v2/products/channel-products/{channel_product_id}')
-    
+    @coalesce
     def get_orders(self, start_date: str = None, end_date: str = None, order_status: str = None, limit: int = 50) -> Dict:
         """주문 목록 조회 - 24시간 단위로 쪼개서 조회"""
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
+        start_dt, end_dt = self._order_date_range(start_date, end_date)
+        page_size = min(limit, 100)
         
-        # 한국 시간(KST) 기준으로 계산 (UTC+9)
-        from datetime import timezone, timedelta
-        kst = timezone(timedelta(hours=9))
-        now_kst = datetime.now(kst)
-        current_time = now_kst.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+        # 24시간 단위 구간을 병렬로 조회 (공유 요청 예산 내에서, 결과는 시간순으로 병합)
+        time_windows = self._split_time_windows(start_dt, end_dt)
+        started = time.time()
         
-        # 시작일과 종료일을 현재 시간 기준으로 계산 (KST 기준)
-        if start_date == end_date:
-            # 같은 날인 경우, 현재 시간에서 N일 전까지
-            days_diff = (now_kst.date() - datetime.strptime(start_date, '%Y-%m-%d').date()).days
-            start_dt = now_kst - timedelta(days=days_diff)
-            end_dt = now_kst
-        else:
-            # 다른 날인 경우, 시작일 현재시간에서 종료일 현재시간까지
-            start_base = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=kst)
-            end_base = datetime.strptime(end_date, '%Y-%m-%d').replace(tzinfo=kst)
-            
-            # 현재 시간을 기준으로 시작/종료 시간 설정
-            start_dt = start_base.replace(hour=now_kst.hour, minute=now_kst.minute, second=now_kst.second)
-            end_dt = end_base.replace(hour=now_kst.hour, minute=now_kst.minute, second=now_kst.second)
-            
-            # 종료일이 현재 시간보다 미래인 경우 현재 시간으로 제한
-            if end_dt > now_kst:
-                end_dt = now_kst
+        def fetch_window(window):
+            window_start, window_end = window
+            return self._fetch_orders_window(window_start, window_end, order_status, page_size)
         
-        all_orders = []
-        chunk_count = 0
-        
-        # 24시간 단위로 쪼개서 조회
-        current_start = start_dt
-        while current_start < end_dt:
-            # 24시간 후 또는 종료일 중 더 이른 시간
-            current_end = min(current_start + timedelta(hours=24), end_dt)
-            
-            chunk_count += 1
-            print(f"청크 {chunk_count}: {current_start.strftime('%m-%d %H:%M')} ~ {current_end.strftime('%m-%d %H:%M')}")
-            
-            params = {
-                'from': current_start.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z',
-                'to': current_end.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z',
-                'page': 1,
-                'size': min(limit, 100)
-            }
-            
-            if order_status:
-                # 여러 상태가 전달된 경우 처리
-                if isinstance(order_status, list):
-                    # 리스트인 경우 콤마로 연결하여 다중 상태 조회 시도
-                    params['orderStatusType'] = ','.join(order_status)
-                    print(f"다중 상태 조회 시도: {params['orderStatusType']}")
-                else:
-                    params['orderStatusType'] = order_status
-            
-            # 재시도 로직 (최대 3회)
-            max_retries = 3
-            retry_count = 0
-            success = False
-            
-            while retry_count < max_retries and not success:
-                try:
-                    response = self.make_authenticated_request('GET', '/external/v1/pay-order/seller/product-orders', params, log_details=False)
-                    
-                    if response and response.get('success'):
-                        # make_authenticated_request가 반환하는 응답 구조: {'success': True, 'data': {...}}
-                        # 여기서 data는 네이버 API의 전체 응답이고, 실제 주문 데이터는 data['data']['contents']에 있음
-                        api_response = response.get('data', {})
-                        data = api_response.get('data', {})
-                        
-                        if 'contents' in data:
-                            orders = data['contents']
-                            all_orders.extend(orders)
-                            print(f"  → {len(orders)}건 조회")
-                        else:
-                            print(f"  → 0건 조회")
-                        success = True
-                    else:
-                        error_msg = response.get('error', '알 수 없는 오류') if response else '응답 없음'
-                        
-                        # 요청 제한 오류인 경우 재시도
-                        if '요청이 많아' in error_msg or '일시적으로' in error_msg:
-                            retry_count += 1
-                            if retry_count < max_retries:
-                                wait_time = retry_count * 2  # 2초, 4초, 6초 대기
-                                print(f"  → 요청 제한 오류, {wait_time}초 후 재시도 ({retry_count}/{max_retries})")
-                                time.sleep(wait_time)
-                                continue
-                        
-                        print(f"  → 조회 실패: {error_msg}")
-                        success = True  # 재시도하지 않고 다음 청크로
-                        
-                except Exception as e:
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        wait_time = retry_count * 2
-                        print(f"  → 조회 오류, {wait_time}초 후 재시도 ({retry_count}/{max_retries}): {e}")
-                        time.sleep(wait_time)
-                    else:
-                        print(f"  → 조회 오류 (최대 재시도 초과): {e}")
-                        success = True  # 재시도하지 않고 다음 청크로
-            
-            # 다음 청크로 이동
-            current_start = current_end
-            
-            # API 호출 제한을 고려한 대기 (요청 제한 오류 방지)
-            import time
-            time.sleep(1.0)  # 1초 대기로 증가
-        
-        print(f"전체 조회 완료: {chunk_count}개 청크, 총 {len(all_orders)}건")
-        
-        # 결과를 원래 형식으로 반환
-        return {
-            'success': True,
-            'data': {
-                'data': all_orders,
-                'total': len(all_orders)
-            },
-            'chunks_processed': chunk_count
-        }
+        return self._build_orders_result(time_windows, self._map_windows(fetch_window, time_windows), started)
     
-    def get_store_info(self) -> Dict:
-        """스토어 정보 조회 - 상세 응답 정보 반환"""
-        return self.make_authenticated_request('GET', '/external/v1/seller/account')
+    @coalesce
+    def get_order_partition(self, start_date: str = None, end_date: str = None, max_age: float = None) -> OrderPartition:
+        """기간 내 전체 상품주문을 상태 조건 없이 한 번 조회하여 상태별로 분류
+        
+        max_age 초(기본 partition_max_age) 이내에 같은 기간을 조회했으면 API 요청 없이 재사용하고,
+        서킷 브레이커 차단 중이면 로컬 DB에 저장된 주문으로 분류한 결과(degraded)를 반환한다.
+        """
+        partition = self._local_partition(start_date, end_date, max_age)
+        if partition is not None:
+            return partition
+        return self._partition_from_result(start_date, end_date, self.get_orders(start_date, end_date, limit=100))
     
-    def get_seller_channels(self) -> Dict:
-        """판매자 채널 정보 조회 - 상세 응답 정보 반환"""
-        return self.make_authenticated_request('GET', '/external/v1/seller/channels')
+    def get_orders_by_status(self, start_date: str = None, end_date: str = None, statuses=None, max_age: float = None) -> Dict:
+        """지정한 상태(상품주문 상태 또는 클레임 상태)의 주문 조회 - get_orders와 같은 응답 형식 (data['data']는 ProductOrder 목록)"""
+        return self.get_order_partition(start_date, end_date, max_age).to_response(statuses)
     
-    def get_order_statistics(self, start_date: str = None, end_date: str = None) -> Dict:
-        """주문 통계 조회 (최대 24시간 범위)"""
-        if not start_date:
-            start_date = (datetime.now() - timedelta(hours=24)).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-        
-        params = {
-            'from': start_date,
-            'to': end_date
-        }
-        
-        response = self.make_authenticated_request('GET', '/external/v1/statistics/orders', params)
-        return response or {}
+    def iter_orders(self, start_date: str = None, end_date: str = None, statuses=None, limit: int = 100, on_progress=None):
+        """주문 목록을 구간/페이지 순서대로 조회하며 상품주문(ProductOrder)을 하나씩 반환 (generator)
+        
+        첫 페이지를 받는 즉시 주문을 내보내므로 화면에 점진적으로 표시할 수 있고,
+        한 번에 최대 page_fanout 페이지만 메모리에 보관한다.
+        statuses가 있으면 상품주문 상태나 클레임 상태가 해당하는 주문만 반환하며 (조회는 상태 조건 없이 한 번),
+        on_progress(event)에는 'window', 'page', 'done' 진행 이벤트가 전달된다.
+        """
+        stream, plan = self._open_order_stream(start_date, end_date, statuses, limit, on_progress)
+        request = next(plan, None)
+        while request is not None:
+            try:
+                request = plan.send(self._fetch_order_pages_concurrently(*request))
+            except StopIteration:
+                request = None
+            yield from self._take_stream_orders(stream)
     
-    def sync_orders_to_database(self, db_manager, start_date: str = None, end_date: str = None) -> int:
-        """네이버 API에서 주문 데이터를 가져와 데이터베이스에 동기화"""
-        orders = self.get_orders(start_date, end_date)
-        synced_count = 0
+    def _map_windows(self, fetch_func, time_windows: List[tuple]) -> List:
+        """구간별 조회 함수를 window_workers 개수의 스레드로 실행 - 결과는 구간 순서 유지"""
+        if self.window_workers <= 1 or len(time_windows) <= 1:
+            return [fetch_func(window) for window in time_windows]
         
-        for order in orders:
-            order_data = {
-                'order_id': order.get('orderId'),
-                'order_date': order.get('orderDate'),
-                'customer_name': order.get('customerName'),
-                'customer_phone': order.get('customerPhone'),
-                'product_name': order.get('productName'),
-                'quantity': order.get('quantity', 1),
-                'price': order.get('price', 0),
-                'status': self._map_naver_status_to_local(order.get('status')),
-                'shipping_company': order.get('shippingCompany'),
-                'tracking_number': order.get('trackingNumber'),
-                'memo': order.get('memo', '')
-            }
-            
-            if db_manager.add_order(order_data):
-                synced_count += 1
-        
-        return synced_count
-    
-    def _map_naver_status_to_local(self, naver_status: str) -> str:
-        """네이버 API 상태를 로컬 상태로 매핑"""
-        status_mapping = {
-            'ORDERED': '신규주문',
-            'PAYED': '신규주문',
-            'READY': '발송대기',
-            'SHIPPED': '배송중',
-            'DELIVERED': '배송완료',
-            'CONFIRMED': '구매확정',
-            'CANCELLED': '취소주문',
-            'RETURNED': '반품주문',
-            'EXCHANGED': '교환주문'
-        }
-        return status_mapping.get(naver_status, '신규주문')
-    
-    # 주문관리 핵심 API 메서드들
-    
-    def get_product_detail(self, product_id: str) -> Dict:
-        """상품 상세 조회"""
-        return self.make_authenticated_request('GET', f'/external/v1/products/{product_id}')
-    
-    def get_origin_product(self, origin_product_id: str) -> Dict:
-        """원상품 상세 조회"""
-        return self.make_authenticated_request('GET', f'/external/v2/products/origin-products/{origin_product_id}')
-    
-    def get_order_product_ids(self, order_id: str) -> Dict:
-        """주문 상품 ID 목록 조회"""
-        return self.make_authenticated_request('GET', f'/external/v1/pay-order/seller/orders/{order_id}/product-order-ids')
-    
-    def update_shipping_info(self, product_order_id: str, delivery_company: str, tracking_number: str) -> Dict:
-        """배송 정보 업데이트"""
-        data = {
-            'deliveryCompany': delivery_company,
-            'trackingNumber': tracking_number
-        }
-        return self.make_authenticated_request('PUT', f'/external/v1/pay-order/seller/product-orders/{product_order_id}/shipping', data)
-    
-    def change_order_status(self, product_order_id: str, status: str, reason: str = None) -> Dict:
-        """주문 상태 변경"""
-        data = {
-            'status': status
-        }
-        if reason:
-            data['reason'] = reason
-        return self.make_authenticated_request('PUT', f'/external/v1/pay-order/seller/product-orders/{product_order_id}/status', data)
-    
-    def get_delivery_companies(self) -> Dict:
-        """배송업체 목록 조회"""
-        return self.make_authenticated_request('GET', '/external/v1/pay-order/seller/delivery-companies')
+        with ThreadPoolExecutor(max_workers=min(self.window_workers, len(time_windows))) as executor:
+            return list(executor.map(fetch_func, time_windows))
     
-    def bulk_update_shipping(self, shipping_updates: list) -> Dict:
-        """배송 정보 일괄 업데이트"""
-        data = {
-            'shippingUpdates': shipping_updates
-        }
-        return self.make_authenticated_request('POST', '/external/v1/pay-order/seller/product-orders/bulk-shipping', data)
+    def _fetch_orders_window(self, window_start, window_end, order_status=None, page_size: int = 100) -> tuple:
+        """한 조회 구간(최대 24시간)의 모든 페이지 조회 - (주문 목록, 구간 통계) 반환 (페이지 계획은 _window_page_plan)"""
+        plan = self._window_page_plan(window_start, window_end, order_status, page_size)
+        request = next(plan)
+        while True:
+            try:
+                request = plan.send(self._fetch_order_pages_concurrently(*request))
+            except StopIteration as done:
+                return done.value
     
-    def get_order_claims(self, start_date: str = None, end_date: str = None) -> Dict:
-        """클레임(취소/반품/교환) 조회"""
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-        
-        params = {
-            'from': start_date,
-            'to': end_date
-        }
-        return self.make_authenticated_request('GET', '/external/v1/pay-order/seller/claims', params)
+    def _fetch_order_pages_concurrently(self, base_params: Dict, pages: List[int]) -> Dict[int, Dict]:
+        """여러 페이지를 page_fanout 개수만큼 병렬 조회 - {페이지: 결과} 반환"""
+        if not pages:
+            return {}
+        if self.page_fanout <= 1 or len(pages) == 1:
+            return {page: self._fetch_orders_page(dict(base_params, page=page)) for page in pages}
+        
+        with ThreadPoolExecutor(max_workers=min(self.page_fanout, len(pages))) as executor:
+            futures = {page: executor.submit(self._fetch_orders_page, dict(base_params, page=page)) for page in pages}
+            return {page: future.result() for page, future in futures.items()}
     
-    def process_claim(self, claim_id: str, action: str, reason: str = None) -> Dict:
-        """클레임 처리 (승인/거부)"""
-        data = {
-            'action': action  # 'APPROVE', 'REJECT'
-        }
-        if reason:
-            data['reason'] = reason
-        return self.make_authenticated_request('POST', f'/external/v1/pay-order/seller/claims/{claim_id}/process', data)
+    def _fetch_orders_page(self, params: Dict) -> Dict:
+        """주문 목록 한 페이지 조회 (요청 제한 재시도는 make_authenticated_request에서 처리)"""
+        response = self.make_authenticated_request('GET', ORDERS_ENDPOINT, params, log_details=False)
+        return self._parse_orders_page(response, params)
     
-    def get_order_statistics_detailed(self, start_date: str = None, end_date: str = None) -> Dict:
-        """상세 주문 통계 조회"""
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
+    def sync_orders_to_database(self, db_manager, start_date: str = None, end_date: str = None) -> int:
+        """네이버 API에서 주문 데이터를 가져와 데이터베이스에 동기화 (한 번에 일괄 저장)"""
+        result = self.get_orders(start_date, end_date)
+        # get_orders 응답은 {'data': {'data': [주문 목록 항목, ...]}} 구조
+        records = parse_product_orders(((result or {}).get('data') or {}).get('data') or [])
         
-        params = {
-            'startDate': start_date,
-            'endDate': end_date
-        }
-        return self.make_authenticated_request('GET', '/external/v1/statistics/orders/detailed', params)
-    
-    def search_orders(self, search_params: Dict) -> Dict:
-        """주문 검색 (고급 검색)"""
-        return self.make_authenticated_request('POST', '/external/v1/pay-order/seller/product-orders/search', search_params)
+        saved = db_manager.upsert_orders(records)
+        return saved['inserted'] + saved['updated'] + saved['unchanged']
     
     def get_order_detail(self, product_order_id: str) -> Dict:
         """주문 상세 정보 조회"""
@@ -774,20 +292,5 @@ class NaverShoppingAPI:
             'productOrderIds': [product_order_id]
         }
         
-        response = self.make_authenticated_request('POST', '/external/v1/pay-order/seller/product-orders/query', data, log_details=True)
-        
-        if response and isinstance(response, dict) and 'data' in response:
-            data_list = response['data']
-            if isinstance(data_list, list) and len(data_list) > 0:
-                return data_list[0]
-        
-        return {}
-    
-    def get_multiple_order_details(self, product_order_ids: list) -> Dict:
-        """여러 주문 상세 정보 일괄 조회"""
-        data = {
-            'productOrderIds': product_order_ids
-        }
-        
-        response = self.make_authenticated_request('POST', '/external/v1/pay-order/seller/product-orders/query', data)
-        return response or {}
+        response = self.make_authenticated_request('POST', QUERY_ENDPOINT, data)
+        return self._first_order_detail(response)
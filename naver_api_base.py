@@ -0,0 +1,1195 @@
+"""
+네이버 커머스 API 공통 모듈 - 동기/비동기 클라이언트가 공유하는 엔드포인트와 요청/응답 처리
+"""
+import json
+import time
+import bcrypt
+import pybase64
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional
+
+from token_manager import TokenManager
+from rate_limiter import get_shared_rate_limiter, parse_retry_after
+from circuit_breaker import get_shared_circuit_breaker
+from response_cache import ResponseCache
+from api_tracing import APIResult, RequestTracer
+from order_partition import OrderPartition
+from product_order import ProductOrder
+
+# 한국 시간대 (UTC+9)
+KST = timezone(timedelta(hours=9))
+
+DEFAULT_BASE_URL = 'https://api.commerce.naver.com'
+
+ORDERS_ENDPOINT = '/external/v1/pay-order/seller/product-orders'
+LAST_CHANGED_ENDPOINT = '/external/v1/pay-order/seller/product-orders/last-changed-statuses'
+QUERY_ENDPOINT = '/external/v1/pay-order/seller/product-orders/query'
+DISPATCH_ENDPOINT = '/external/v1/pay-order/seller/product-orders/dispatch'
+DISPATCH_BATCH_SIZE = 30  # 발송 처리 한 번에 보낼 수 있는 최대 상품주문 수
+PRODUCT_SEARCH_ENDPOINT = '/external/v1/products/search'
+PRODUCT_SEARCH_MAX_SIZE = 500  # 상품 목록 조회 한 페이지 최대 크기
+
+# 읽기 위주 엔드포인트별 응답 캐시 유효시간 (초, 엔드포인트 접두사 기준) - GET 요청만 캐시
+CACHE_TTLS = {
+    '/external/v1/pay-order/seller/delivery-companies': 24 * 3600,
+    '/external/v1/seller/account': 3600,
+    '/external/v1/seller/channels': 3600,
+    '/external/v2/products/channel-products/': 300,
+    '/external/v2/products/origin-products/': 300,
+    '/external/v1/products/': 300
+}
+
+# 쓰기 요청 성공 후 무효화할 캐시 (쓰기 엔드포인트 접두사 -> 조회 엔드포인트 접두사 목록)
+# 발송/클레임 처리는 주문 조회 결과만 바꾸므로 택배사 목록 같은 기준 정보는 무효화하지 않음
+CACHE_INVALIDATIONS = {
+    '/external/v1/pay-order/': [ORDERS_ENDPOINT, '/external/v1/pay-order/seller/orders/',
+                                '/external/v1/pay-order/seller/claims'],
+    '/external/v1/products/': ['/external/v1/products/', '/external/v2/products/'],
+    '/external/v2/products/': ['/external/v1/products/', '/external/v2/products/']
+}
+
+# 데이터를 변경하지 않는 POST 조회 엔드포인트 (캐시 무효화 제외)
+READ_ONLY_POSTS = (QUERY_ENDPOINT, f'{ORDERS_ENDPOINT}/search', PRODUCT_SEARCH_ENDPOINT)
+
+
+class NaverAPIBase:
+    """네이버 쇼핑 API 공통 기반 클래스
+
+    엔드포인트 정의, 요청 준비, 응답 결과 생성, 조회 구간/페이지 계산을 담당한다.
+    하위 클래스는 전송 계층(_send_request, _send_with_rate_limit, make_authenticated_request)만 구현한다.
+    엔드포인트 메서드는 make_authenticated_request 결과를 그대로 반환하므로
+    비동기 클라이언트에서는 같은 메서드가 await 가능한 코루틴을 반환한다.
+    """
+
+    def __init__(self, client_id: str, client_secret: str, token_cache_path: str = None,
+                 page_fanout: int = 4, window_workers: int = 4, requests_per_second: float = 4.0,
+                 response_cache: ResponseCache = None, tracer: RequestTracer = None,
+                 circuit_failure_threshold: int = 5, circuit_recovery_timeout: float = 30.0, offline_orders=None,
+                 base_url: str = None):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        # 대역 서버(api_server/naver_mock)로 벤치마크할 때 base_url 변경
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip('/')
+        self.page_fanout = max(1, int(page_fanout))  # 조회 구간 내 페이지 병렬 조회 수
+        self.window_workers = max(1, int(window_workers))  # 24시간 구간 병렬 조회 수
+
+        # 모든 API 호출이 공유하는 적응형 초당 요청 예산 (프로세스 전체 공통, 설정은 처음 생성할 때만 적용)
+        self.rate_limiter = get_shared_rate_limiter(requests_per_second)
+        self.max_throttle_retries = 3  # 요청 제한 응답 시 재시도 횟수
+
+        # API 장애/심한 요청 제한 시 요청을 차단하는 서킷 브레이커 (프로세스 전체 공통, 설정은 처음 생성할 때만 적용)
+        self.circuit_breaker = get_shared_circuit_breaker(circuit_failure_threshold, circuit_recovery_timeout)
+        # 차단 중 주문 조회에 사용할 로컬 저장소 - offline_orders(start_date=, end_date=) -> [ProductOrder, ...]
+        self.offline_orders = offline_orders
+
+        # 토큰 만료 추적 / 단일 갱신 / 암호화 디스크 캐시
+        self.token_manager = TokenManager(client_id, client_secret, self._issue_access_token,
+                                          cache_path=token_cache_path)
+
+        # 읽기 위주 엔드포인트 응답 캐시 (None이면 메모리 캐시 생성, False면 사용 안 함)
+        self.response_cache = ResponseCache() if response_cache is None else (response_cache or None)
+
+        # 요청 추적 (수준/샘플링에 따라 요청당 한 줄 또는 상세 로그 출력)
+        self.tracer = tracer or RequestTracer()
+
+        # 상태 조건 없이 한 번 조회한 기간별 주문 분류 결과 (여러 탭이 짧은 시간 동안 공유)
+        self.partition_max_age = 60.0
+        self._partitions = {}
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """현재 액세스 토큰"""
+        return self.token_manager.token
+
+    def _issue_access_token(self) -> Optional[tuple]:
+        """액세스 토큰 발급 - 하위 클래스에서 구현"""
+        raise NotImplementedError
+
+    def get_rate_limit_stats(self) -> Dict:
+        """현재 요청 속도 및 대기열 상태 조회"""
+        return self.rate_limiter.get_stats()
+
+    def get_circuit_stats(self) -> Dict:
+        """서킷 브레이커 상태 조회"""
+        return self.circuit_breaker.get_stats()
+
+    def get_trace_stats(self) -> Dict:
+        """요청 추적 통계 조회"""
+        return self.tracer.get_stats()
+
+    def _start_trace(self, method: str, endpoint: str, log_details: Optional[bool]) -> tuple:
+        """요청 추적 시작 - (span, 상세 로그 여부) 반환
+
+        log_details를 지정하지 않으면 추적 수준이 detail이고 샘플링된 요청만 상세 로그를 출력한다.
+        """
+        span = self.tracer.start_span(method, endpoint)
+        if log_details is None:
+            log_details = span is not None and span.detailed
+        return span, log_details
+
+    # 응답 캐시
+
+    def _cache_key(self, method: str, endpoint: str, data: Dict = None) -> str:
+        """캐시 키 (계정 + 메서드 + 엔드포인트 + 파라미터)"""
+        params = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str) if data else ''
+        return f"{self.client_id}|{method.upper()} {endpoint}|{params}"
+
+    def _cache_ttl(self, method: str, endpoint: str) -> Optional[float]:
+        """엔드포인트의 캐시 유효시간 (캐시 대상이 아니면 None)"""
+        if not self.response_cache or method.upper() != 'GET':
+            return None
+        for prefix, ttl in CACHE_TTLS.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return None
+
+    def _get_cached_response(self, method: str, endpoint: str, data: Dict, log_details: bool) -> Optional[Dict]:
+        """캐시된 응답 조회"""
+        if self._cache_ttl(method, endpoint) is None:
+            return None
+        cached = self.response_cache.get(self._cache_key(method, endpoint, data))
+        if cached is None:
+            return None
+        if log_details:
+            print(f"캐시된 응답 사용: {method.upper()} {endpoint}")
+        return dict(cached, from_cache=True)
+
+    def _update_cache(self, method: str, endpoint: str, data: Dict, result: Dict) -> Dict:
+        """성공한 조회 응답은 캐시에 저장하고, 성공한 쓰기 요청은 관련 캐시 무효화"""
+        if not result.get('success'):
+            return result
+
+        if method.upper() != 'GET' and endpoint.startswith('/external/v1/pay-order/') and not endpoint.startswith(READ_ONLY_POSTS):
+            # 주문 상태/배송 변경 후에는 상태별 분류 결과를 다시 조회
+            self._partitions.clear()
+        if not self.response_cache:
+            return result
+
+        ttl = self._cache_ttl(method, endpoint)
+        if ttl is not None:
+            # 지연 생성되는 상세 정보(응답 객체 참조 포함)는 캐시하지 않음
+            cached = result.lean() if isinstance(result, APIResult) else result
+            self.response_cache.set(self._cache_key(method, endpoint, data), cached, ttl)
+        elif method.upper() != 'GET' and not endpoint.startswith(READ_ONLY_POSTS):
+            for write_prefix, cached_prefixes in CACHE_INVALIDATIONS.items():
+                if endpoint.startswith(write_prefix):
+                    for cached_prefix in cached_prefixes:
+                        self.invalidate_cache(cached_prefix)
+        return result
+
+    def invalidate_cache(self, endpoint_prefix: str = None) -> int:
+        """응답 캐시 무효화 - endpoint_prefix로 시작하는 조회 캐시 삭제 (None이면 전체)"""
+        if not self.response_cache:
+            return 0
+        if endpoint_prefix is None:
+            return self.response_cache.invalidate(f"{self.client_id}|")
+        return self.response_cache.invalidate(f"{self.client_id}|GET {endpoint_prefix}")
+
+    def get_cache_stats(self) -> Dict:
+        """응답 캐시 적중/실패 통계"""
+        return self.response_cache.get_stats() if self.response_cache else {}
+
+    # 토큰 발급 요청/응답 처리
+
+    def _build_token_request(self) -> tuple:
+        """토큰 발급 요청 생성 - (URL, 헤더, 폼 데이터) 반환"""
+        url = f"{self.base_url}/external/v1/oauth2/token"
+
+        # 현재 시간의 타임스탬프 생성 (밀리초 단위)
+        timestamp = int(time.time() * 1000)
+
+        # 클라이언트 ID와 타임스탬프를 결합하여 비밀번호 생성
+        password = self.client_id + "_" + str(timestamp)
+
+        # bcrypt 해싱
+        hashed = bcrypt.hashpw(password.encode('utf-8'), self.client_secret.encode('utf-8'))
+
+        # base64 인코딩
+        client_secret_sign = pybase64.standard_b64encode(hashed).decode('utf-8')
+
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Accept': 'application/json'
+        }
+
+        data = {
+            'client_id': str(self.client_id),
+            'timestamp': timestamp,
+            'client_secret_sign': str(client_secret_sign),
+            'grant_type': 'client_credentials',
+            'type': 'SELF'
+        }
+        return url, headers, data
+
+    def _parse_token_response(self, response) -> Optional[tuple]:
+        """토큰 발급 응답 처리 - (토큰, 유효시간(초)) 또는 None 반환"""
+        if response.status_code == 200:
+            token_data = response.json()
+            # expires_in 누락 시 네이버 기본 유효시간(3시간) 적용
+            return token_data.get('access_token'), int(token_data.get('expires_in') or 10800)
+
+        error_detail = response.text
+        print(f"토큰 발급 실패: {response.status_code} - {error_detail}")
+
+        # 오류 상세 정보 파싱
+        try:
+            error_data = response.json()
+            if 'invalidInputs' in error_data:
+                for invalid_input in error_data['invalidInputs']:
+                    print(f"오류 상세: {invalid_input.get('message', '알 수 없는 오류')}")
+        except:
+            pass
+
+        return None
+
+    # 요청 제한 처리
+
+    def _is_throttled(self, response) -> bool:
+        """요청 제한(429 또는 네이버 요청 제한 오류) 응답 여부"""
+        if response.status_code == 429:
+            return True
+        if response.status_code >= 400:
+            text = response.text or ''
+            return '요청이 많아' in text or '일시적으로' in text or 'RATE_LIMIT' in text
+        return False
+
+    def _record_circuit_result(self, response):
+        """최종 응답을 서킷 브레이커에 반영 - 5xx와 재시도 후에도 요청 제한인 응답만 실패로 본다"""
+        if response.status_code >= 500 or self._is_throttled(response):
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _record_rate_limit_result(self, response, attempt: int, log_details: bool = False) -> bool:
+        """응답 결과를 속도 제한기에 반영 - 요청 제한 응답이면 True (재시도 필요)"""
+        if not self._is_throttled(response):
+            if response.status_code < 400:
+                self.rate_limiter.on_success()
+            return False
+
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        self.rate_limiter.on_throttle(retry_after)
+        if log_details or attempt == self.max_throttle_retries:
+            stats = self.rate_limiter.get_stats()
+            print(f"요청 제한 응답 ({response.status_code}) - 속도 {stats['rate']}/초로 조정, 재시도 {attempt + 1}/{self.max_throttle_retries}")
+        return True
+
+    # 인증 요청 준비 및 결과 생성
+
+    def _prepare_request(self, method: str, endpoint: str, data: Dict, access_token: str, log_details: bool) -> tuple:
+        """인증 헤더 생성 - (URL, 헤더, 요청 컨텍스트) 반환
+
+        요청 상세 정보(request_details)는 log_details이거나 결과에서 조회할 때만 요청 컨텍스트로부터 만든다.
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json;charset=UTF-8',
+            'X-Naver-Client-Id': self.client_id,
+            'X-Naver-Client-Secret': self.client_secret
+        }
+        request_context = (method, url, endpoint, headers, data, time.time())
+
+        if log_details:
+            request_info = self._build_request_info(request_context)
+            print(f"\n=== API 요청 상세 정보 ===")
+            print(f"타임스탬프: {request_info['timestamp']}")
+            print(f"메서드: {method}")
+            print(f"URL: {url}")
+            print(f"엔드포인트: {endpoint}")
+            if data:
+                print(f"요청 데이터 크기: {request_info['data_size']} bytes")
+                print(f"요청 데이터: {json.dumps(data, indent=2, ensure_ascii=False) if isinstance(data, dict) else str(data)}")
+            print(f"========================")
+
+            if method.upper() == 'GET':
+                print(f"GET 요청 URL: {url}")
+                print(f"GET 요청 파라미터: {data}")
+
+        return url, headers, request_context
+
+    def _build_request_info(self, request_context: tuple) -> Dict:
+        """요청 컨텍스트로 요청 상세 정보 생성"""
+        method, url, endpoint, headers, data, requested_at = request_context
+        return {
+            'timestamp': datetime.fromtimestamp(requested_at).isoformat(),
+            'method': method,
+            'url': url,
+            'endpoint': endpoint,
+            'headers': {k: v[:20] + '...' if k == 'Authorization' and len(str(v)) > 20 else v for k, v in headers.items()},
+            'data': data,
+            'data_size': len(str(data)) if data else 0
+        }
+
+    def _build_response_info(self, response, response_time: float, responded_at: float) -> Dict:
+        """HTTP 응답 상세 정보 생성"""
+        return {
+            'timestamp': datetime.fromtimestamp(responded_at).isoformat(),
+            'status_code': response.status_code,
+            'response_time': f"{response_time:.3f}s",
+            'headers': dict(response.headers),
+            'content_length': len(response.text) if hasattr(response, 'text') else 0
+        }
+
+    def _token_unavailable_result(self, method: str, endpoint: str, data: Dict) -> Dict:
+        """토큰 발급 실패 결과"""
+        return {
+            'success': False,
+            'status_code': 401,
+            'message': '토큰 발급 실패',
+            'data': None,
+            'error': 'Access token not available',
+            'request_details': {
+                'method': method,
+                'endpoint': endpoint,
+                'data': data,
+                'timestamp': datetime.now().isoformat()
+            },
+            'terminal_log': f"토큰 발급 실패 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        }
+
+    def _circuit_open_result(self, method: str, endpoint: str, data: Dict) -> Dict:
+        """서킷 브레이커 차단 중 결과 (요청을 보내지 않음)"""
+        retry_in = self.circuit_breaker.retry_in()
+        return {
+            'success': False,
+            'status_code': 503,
+            'message': 'API 요청 차단 중 (서킷 브레이커)',
+            'data': None,
+            'error': f'Circuit open - {retry_in:.0f}초 후 복구 확인',
+            'circuit_open': True,
+            'elapsed': 0.0,
+            'request_details': {
+                'method': method,
+                'endpoint': endpoint,
+                'data': data,
+                'timestamp': datetime.now().isoformat()
+            }
+        }
+
+    def _unsupported_method_result(self, method: str) -> Dict:
+        """지원하지 않는 HTTP 메서드 결과"""
+        return {
+            'success': False,
+            'status_code': 400,
+            'message': '지원하지 않는 HTTP 메서드',
+            'data': None,
+            'error': f'Unsupported method: {method}'
+        }
+
+    def _build_response_result(self, response, request_context: tuple, start_time: float, log_details: bool,
+                               token_refreshed: bool = False) -> APIResult:
+        """HTTP 응답을 공통 결과 형식으로 변환
+
+        기본 결과는 상태, 데이터, 소요 시간(elapsed)만 담고
+        request_details / response_details / terminal_log는 처음 조회할 때 생성한다 (log_details면 즉시 생성).
+        응답 상태는 서킷 브레이커에도 반영된다.
+        """
+        self._record_circuit_result(response)
+
+        # 요청 완료 시간 측정
+        responded_at = time.time()
+        response_time = responded_at - start_time
+
+        # 응답 바디는 한 번만 파싱
+        try:
+            response_data = response.json()
+            json_error = None
+        except Exception as e:
+            response_data = None
+            json_error = e
+
+        lazy = {
+            'request_details': lambda result: self._build_request_info(request_context),
+            'response_details': lambda result: self._build_response_info(response, response_time, responded_at)
+        }
+
+        if log_details:
+            response_info = self._build_response_info(response, response_time, responded_at)
+            lazy['response_details'] = lambda result: response_info
+            print(f"\n=== API 응답 상세 정보 ===")
+            print(f"응답 시간: {response_info['response_time']}")
+            print(f"상태 코드: {response.status_code}")
+            print(f"응답 크기: {response_info['content_length']} bytes")
+            print(f"응답 바디:")
+            if json_error is None:
+                print(json.dumps(response_data, ensure_ascii=False, indent=2))
+            else:
+                print(response.text)
+            print(f"=========================")
+
+        # 응답 상태 코드에 따른 처리
+        if response.status_code == 200:
+            success_message = '요청 성공 (토큰 재발급 후)' if token_refreshed else '요청 성공'
+            body = response_data if json_error is None else response.text
+            # 터미널 로그는 조회할 때 생성
+            lazy['terminal_log'] = lambda result: self._generate_terminal_log(
+                result['request_details'], result['response_details'], body)
+
+            if json_error is None:
+                result = {
+                    'success': True,
+                    'status_code': response.status_code,
+                    'message': success_message,
+                    'data': response_data,
+                    'error': None
+                }
+            else:
+                result = {
+                    'success': True,
+                    'status_code': response.status_code,
+                    'message': f'{success_message} (JSON 파싱 실패)',
+                    'data': response.text,
+                    'error': f'JSON 파싱 오류: {str(json_error)}'
+                }
+
+                if log_details:
+                    print(f"JSON 파싱 실패: {str(json_error)}")
+                    print(f"원본 응답 텍스트: {response.text[:200]}...")
+        elif response.status_code == 401:
+            # 토큰 재발급 실패 (또는 재발급한 토큰으로도 인증 실패)
+            result = {
+                'success': False,
+                'status_code': 401,
+                'message': '인증 실패 (토큰 재발급 실패)',
+                'data': None,
+                'error': response.text
+            }
+
+            if log_details:
+                print(f"토큰 재발급 실패: {response.text}")
+        else:
+            # 기타 오류
+            if isinstance(response_data, dict):
+                error_message = response_data.get('message', '알 수 없는 오류')
+                if 'invalidInputs' in response_data:
+                    error_details = []
+                    for invalid_input in response_data['invalidInputs']:
+                        field = invalid_input.get('field', '')
+                        message = invalid_input.get('message', '')
+                        error_details.append(f"{field}: {message}")
+                    error_message += f" - {', '.join(error_details)}"
+
+                if log_details:
+                    print(f"API 오류 응답: {json.dumps(response_data, indent=2, ensure_ascii=False)}")
+            else:
+                error_message = response.text
+                if log_details:
+                    print(f"오류 응답 파싱 실패: {str(json_error) if json_error else '객체가 아닌 응답'}")
+                    print(f"원본 오류 응답: {response.text}")
+
+            result = {
+                'success': False,
+                'status_code': response.status_code,
+                'message': f'요청 실패 ({response.status_code})',
+                'data': None,
+                'error': error_message,
+                'throttled': self._is_throttled(response)
+            }
+
+            if log_details:
+                print(f"HTTP {response.status_code} 오류: {error_message}")
+
+        result['elapsed'] = round(response_time, 3)
+        result = APIResult(result, lazy=lazy)
+        if log_details:
+            result.materialize()
+        return result
+
+    def _network_error_result(self, error: Exception, request_context: tuple, start_time: float, log_details: bool) -> Dict:
+        """요청 중 예외 발생 결과 (서킷 브레이커에 실패로 반영)"""
+        self.circuit_breaker.record_failure()
+        response_time = time.time() - start_time
+
+        result = {
+            'success': False,
+            'status_code': 0,
+            'message': '네트워크 오류',
+            'data': None,
+            'error': str(error),
+            'elapsed': round(response_time, 3),
+            'request_details': self._build_request_info(request_context),
+            'response_details': {
+                'timestamp': datetime.now().isoformat(),
+                'response_time': f"{response_time:.3f}s",
+                'error_type': type(error).__name__
+            }
+        }
+
+        if log_details:
+            print(f"\n=== API 요청 예외 발생 ===")
+            print(f"예외 타입: {type(error).__name__}")
+            print(f"예외 메시지: {str(error)}")
+            print(f"요청 시간: {response_time:.3f}s")
+            print(f"======================")
+
+        return result
+
+    def _generate_terminal_log(self, request_info: Dict, response_info: Dict, response_data: any) -> str:
+        """터미널 로그 형식으로 요청/응답 정보 생성"""
+        log_lines = []
+
+        # 요청 정보
+        log_lines.append("=== API 요청 상세 정보 ===")
+        log_lines.append(f"메서드: {request_info['method']}")
+        log_lines.append(f"URL: {request_info['url']}")
+        log_lines.append(f"엔드포인트: {request_info['endpoint']}")
+        if request_info.get('data'):
+            log_lines.append(f"요청 데이터: {json.dumps(request_info['data'], indent=2, ensure_ascii=False) if isinstance(request_info['data'], dict) else str(request_info['data'])}")
+        log_lines.append("========================")
+
+        if request_info['method'].upper() == 'GET' and request_info.get('data'):
+            log_lines.append(f"GET 요청 URL: {request_info['url']}?{request_info.get('params', '')}")
+            log_lines.append(f"GET 요청 파라미터: {request_info['data']}")
+
+        # 응답 정보 (응답 헤더 제거)
+        log_lines.append("")
+        log_lines.append("=== API 응답 상세 정보 ===")
+        log_lines.append(f"응답 시간: {response_info['response_time']}")
+        log_lines.append(f"상태 코드: {response_info['status_code']}")
+        log_lines.append("=========================")
+
+        # 응답 데이터 (timestamp, traceId 제거)
+        if isinstance(response_data, dict):
+            # timestamp, traceId 제거하고 data만 표시
+            filtered_data = {k: v for k, v in response_data.items() if k not in ['timestamp', 'traceId']}
+            log_lines.append(f"{json.dumps(filtered_data, indent=2, ensure_ascii=False)}")
+        else:
+            log_lines.append(f"{json.dumps(response_data, indent=2, ensure_ascii=False)}")
+
+        return "\n".join(log_lines)
+
+    # 조회 구간 / 페이지 계산
+
+    def _format_api_time(self, dt: datetime) -> str:
+        """API 요청용 시간 문자열 (밀리초 포함)"""
+        return dt.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+    def _format_utc_time(self, dt: datetime) -> str:
+        """시간대 정보가 있는 시각을 UTC 기준 API 시간 문자열로 변환 (URL 인코딩 불필요)"""
+        return self._format_api_time(dt.astimezone(timezone.utc))
+
+    def _order_date_range(self, start_date: str = None, end_date: str = None) -> tuple:
+        """주문 조회 기간(YYYY-MM-DD)을 KST 기준 (시작 시각, 종료 시각)으로 변환"""
+        if not start_date:
+            start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        # 한국 시간(KST) 기준으로 계산 (UTC+9)
+        now_kst = datetime.now(KST)
+
+        # 시작일과 종료일을 현재 시간 기준으로 계산 (KST 기준)
+        if start_date == end_date:
+            # 같은 날인 경우, 현재 시간에서 N일 전까지
+            days_diff = (now_kst.date() - datetime.strptime(start_date, '%Y-%m-%d').date()).days
+            start_dt = now_kst - timedelta(days=days_diff)
+            end_dt = now_kst
+        else:
+            # 다른 날인 경우, 시작일 현재시간에서 종료일 현재시간까지
+            start_base = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=KST)
+            end_base = datetime.strptime(end_date, '%Y-%m-%d').replace(tzinfo=KST)
+
+            # 현재 시간을 기준으로 시작/종료 시간 설정
+            start_dt = start_base.replace(hour=now_kst.hour, minute=now_kst.minute, second=now_kst.second)
+            end_dt = end_base.replace(hour=now_kst.hour, minute=now_kst.minute, second=now_kst.second)
+
+            # 종료일이 현재 시간보다 미래인 경우 현재 시간으로 제한
+            if end_dt > now_kst:
+                end_dt = now_kst
+
+        return start_dt, end_dt
+
+    def _split_time_windows(self, start_dt: datetime, end_dt: datetime, hours: int = 24) -> List[tuple]:
+        """조회 기간을 최대 24시간 단위 구간 목록으로 분할"""
+        time_windows = []
+        current_start = start_dt
+        while current_start < end_dt:
+            # 24시간 후 또는 종료일 중 더 이른 시간
+            current_end = min(current_start + timedelta(hours=hours), end_dt)
+            time_windows.append((current_start, current_end))
+            current_start = current_end
+        return time_windows
+
+    def _order_window_params(self, window_start: datetime, window_end: datetime, order_status=None, page_size: int = 100) -> Dict:
+        """한 조회 구간의 주문 목록 요청 파라미터 (page 제외)"""
+        base_params = {
+            'from': self._format_api_time(window_start),
+            'to': self._format_api_time(window_end),
+            'size': page_size
+        }
+
+        if order_status:
+            # 여러 상태가 전달된 경우 처리
+            if isinstance(order_status, list):
+                # 리스트인 경우 콤마로 연결하여 다중 상태 조회 시도
+                base_params['orderStatusType'] = ','.join(order_status)
+            else:
+                base_params['orderStatusType'] = order_status
+        return base_params
+
+    def _get_total_pages(self, pagination: Dict, page_size: int) -> Optional[int]:
+        """페이지네이션 메타데이터에서 전체 페이지 수 계산 (알 수 없으면 None)"""
+        if not isinstance(pagination, dict):
+            return None
+        if pagination.get('totalPages'):
+            return int(pagination['totalPages'])
+        total_elements = pagination.get('totalElements', pagination.get('totalCount'))
+        if total_elements is not None and page_size:
+            return max(1, -(-int(total_elements) // page_size))
+        return None
+
+    def _remaining_pages(self, first_page: Dict, page_size: int) -> List[int]:
+        """첫 페이지 메타데이터로 전체 페이지 수를 알 수 있을 때 나머지 페이지 번호 목록"""
+        if not first_page['success']:
+            return []
+        total_pages = self._get_total_pages(first_page['pagination'], page_size)
+        if total_pages and total_pages > 1:
+            return list(range(2, total_pages + 1))
+        return []
+
+    def _collect_pages(self, results: Dict[int, Dict], page_contents: Dict[int, List], failed_pages: List[int]):
+        """전체 페이지 수 기반으로 조회한 페이지 결과 병합"""
+        for page, result in results.items():
+            page_contents[page] = result['contents']
+            if not result['success']:
+                failed_pages.append(page)
+
+    def _collect_page_batch(self, batch: List[int], results: Dict[int, Dict], page_contents: Dict[int, List],
+                            failed_pages: List[int]) -> bool:
+        """hasNext 기반 앞서 조회한 페이지 묶음 병합 - 마지막 페이지에 도달하면 True"""
+        for page in batch:
+            result = results[page]
+            if not result['success']:
+                failed_pages.append(page)
+                return True
+            page_contents[page] = result['contents']
+            if not result['contents'] or not result['pagination'].get('hasNext'):
+                return True
+        return False
+
+    def _summarize_window(self, base_params: Dict, page_contents: Dict[int, List], requests_made: int,
+                          failed_pages: List[int], started: float) -> tuple:
+        """구간 페이지들을 순서대로 병합 - (주문 목록, 구간 통계) 반환"""
+        window_orders = []
+        for page in sorted(page_contents):
+            window_orders.extend(page_contents[page])
+
+        window_stats = {
+            'from': base_params['from'],
+            'to': base_params['to'],
+            'pages': len([page for page, contents in page_contents.items() if contents]) or 1,
+            'requests': requests_made,
+            'orders': len(window_orders),
+            'failed_pages': failed_pages,
+            'elapsed': round(time.time() - started, 3)
+        }
+        return window_orders, window_stats
+
+    # 주문 목록 페이지 조회 계획 - 동기/비동기 클라이언트가 공유
+    # 계획(generator)이 조회할 (base_params, 페이지 목록)을 yield하면 클라이언트는
+    # _fetch_order_pages_concurrently로 조회해 {페이지: 결과}를 send로 돌려준다.
+
+    def _window_page_plan(self, window_start: datetime, window_end: datetime, order_status=None, page_size: int = 100):
+        """한 조회 구간(최대 24시간)의 모든 페이지 조회 계획 - 끝나면 (주문 목록, 구간 통계) 반환"""
+        started = time.time()
+        base_params = self._order_window_params(window_start, window_end, order_status, page_size)
+
+        first_page = (yield base_params, [1])[1]
+        page_contents = {1: first_page['contents']}
+        requests_made = 1
+        failed_pages = [] if first_page['success'] else [1]
+
+        remaining_pages = self._remaining_pages(first_page, page_size)
+        if remaining_pages:
+            # 전체 페이지 수를 알고 있으면 나머지 페이지를 한 번에 병렬 조회
+            results = yield base_params, remaining_pages
+            requests_made += len(results)
+            self._collect_pages(results, page_contents, failed_pages)
+        elif first_page['success'] and first_page['pagination'].get('hasNext'):
+            # hasNext만 제공되는 경우 fan-out 크기만큼 앞서 조회하며 마지막 페이지까지 진행
+            next_page = 2
+            while True:
+                batch = list(range(next_page, next_page + self.page_fanout))
+                results = yield base_params, batch
+                requests_made += len(results)
+                if self._collect_page_batch(batch, results, page_contents, failed_pages):
+                    break
+                next_page += self.page_fanout
+
+        return self._summarize_window(base_params, page_contents, requests_made, failed_pages, started)
+
+    def _parse_orders_page(self, response: Dict, params: Dict) -> Dict:
+        """주문 목록 한 페이지 응답 정리 - {'success', 'contents', 'pagination', 'error'} 반환"""
+        if response and response.get('success'):
+            # make_authenticated_request가 반환하는 응답 구조: {'success': True, 'data': {...}}
+            # 여기서 data는 네이버 API의 전체 응답이고, 실제 주문 데이터는 data['data']['contents']에 있음
+            api_response = response.get('data') or {}
+            data = (api_response.get('data') or {}) if isinstance(api_response, dict) else {}
+            return {
+                'success': True,
+                'contents': data.get('contents') or [],
+                'pagination': data.get('pagination') or {},
+                'error': None
+            }
+
+        error_msg = str(response.get('error', '알 수 없는 오류') if response else '응답 없음')
+        print(f"  → 조회 실패 (page {params.get('page')}): {error_msg}")
+        return {'success': False, 'contents': [], 'pagination': {}, 'error': error_msg}
+
+    def _build_orders_result(self, time_windows: List[tuple], window_results: List[tuple], started: float) -> Dict:
+        """구간별 조회 결과를 시간순으로 병합하여 get_orders 결과 생성"""
+        all_orders = []
+        windows = []
+        for index, (window_orders, window_stats) in enumerate(window_results, 1):
+            all_orders.extend(window_orders)
+            windows.append(window_stats)
+            window_start, window_end = time_windows[index - 1]
+            print(f"청크 {index}: {window_start.strftime('%m-%d %H:%M')} ~ {window_end.strftime('%m-%d %H:%M')} → "
+                  f"{len(window_orders)}건 ({window_stats['pages']}페이지, {window_stats['elapsed']:.2f}초)")
+
+        chunk_count = len(time_windows)
+        print(f"전체 조회 완료: {chunk_count}개 청크, {sum(w['pages'] for w in windows)}페이지, 총 {len(all_orders)}건 ({time.time() - started:.2f}초)")
+
+        # 결과를 원래 형식으로 반환
+        return {
+            'success': True,
+            'data': {
+                'data': all_orders,
+                'total': len(all_orders)
+            },
+            'chunks_processed': chunk_count,
+            'windows': windows
+        }
+
+    # 상태별 주문 분류 (get_order_partition)
+
+    def _cached_partition(self, start_date: str, end_date: str, max_age: float = None) -> Optional[OrderPartition]:
+        """max_age 초 이내에 조회한 같은 기간의 분류 결과"""
+        partition = self._partitions.get((start_date, end_date))
+        max_age = self.partition_max_age if max_age is None else max_age
+        if partition is not None and partition.complete and partition.age <= max_age:
+            return partition
+        return None
+
+    def _orders_result_complete(self, result: Dict) -> bool:
+        """get_orders 결과가 모든 구간/페이지를 조회한 완전한 결과인지 여부"""
+        windows = result.get('windows') or []
+        return bool(result.get('success')) and not any(window.get('failed_pages') for window in windows)
+
+    def _build_partition(self, start_date: str, end_date: str, result: Dict) -> OrderPartition:
+        """상태 조건 없는 get_orders 결과를 상태별로 분류하여 저장"""
+        data = result.get('data') or {}
+        complete = self._orders_result_complete(result)
+        partition = OrderPartition(data.get('data') or [], start_date, end_date, complete=complete)
+        self._partitions[(start_date, end_date)] = partition
+
+        counts = ', '.join(f"{status} {count}" for status, count in sorted(partition.counts().items()))
+        print(f"주문 상태별 분류: {start_date} ~ {end_date} 총 {len(partition.items)}건 ({counts or '없음'})"
+              f"{'' if complete else ' - 일부 페이지 조회 실패'}")
+        return partition
+
+    def _degraded_partition(self, start_date: str, end_date: str, result: Dict = None) -> Optional[OrderPartition]:
+        """서킷 브레이커 차단 중이면 로컬 DB에 저장된 주문으로 분류 결과 생성
+
+        result(API 조회 결과)가 완전하거나 차단 중이 아니거나 로컬 저장소가 없으면 None.
+        """
+        if not self.offline_orders or (result is not None and self._orders_result_complete(result)) \
+                or not self.circuit_breaker.is_open:
+            return None
+        try:
+            start_dt, end_dt = self._order_date_range(start_date, end_date)
+            # 저장된 주문일은 시각까지 포함하므로 종료일 다음 날 0시까지 조회
+            orders = self.offline_orders(start_date=start_dt.strftime('%Y-%m-%d'),
+                                         end_date=(end_dt + timedelta(days=1)).strftime('%Y-%m-%d'))
+        except Exception as e:
+            print(f"캐시 모드 주문 조회 오류: {e}")
+            return None
+
+        print(f"API 차단 중 - 저장된 주문 {len(orders)}건으로 응답 ({start_date} ~ {end_date})")
+        return OrderPartition(orders, start_date, end_date, complete=False, degraded=True)
+
+    def _local_partition(self, start_date: str, end_date: str, max_age: float = None) -> Optional[OrderPartition]:
+        """API 조회 없이 응답할 수 있는 분류 결과 (max_age 이내 캐시, 서킷 브레이커 차단 중이면 로컬 DB)"""
+        return self._cached_partition(start_date, end_date, max_age) or self._degraded_partition(start_date, end_date)
+
+    def _partition_from_result(self, start_date: str, end_date: str, result: Dict) -> OrderPartition:
+        """get_orders 결과로 분류 결과 생성 (조회 중 차단되어 불완전하면 로컬 DB 결과로 대체)"""
+        return self._degraded_partition(start_date, end_date, result) or self._build_partition(start_date, end_date, result)
+
+    def invalidate_order_partitions(self):
+        """상태별 주문 분류 결과 삭제 (다음 조회 시 API에서 다시 조회)"""
+        self._partitions.clear()
+
+    # 주문 스트리밍 조회 (iter_orders)
+
+    def _start_order_stream(self, time_windows: List[tuple], statuses=None, on_progress=None) -> Dict:
+        """iter_orders 진행 상태 생성"""
+        if isinstance(statuses, str):
+            statuses = [statuses]
+        return {
+            'windows': len(time_windows),
+            'window': 0,
+            'pages': 0,
+            'orders': 0,
+            'failed_pages': [],
+            'status_filter': set(statuses) if statuses else None,
+            'on_progress': on_progress,
+            'ready': [],
+            'started': time.time()
+        }
+
+    def _emit_order_progress(self, stream: Dict, event_type: str, **fields):
+        """진행 이벤트 전달 - {'type', 'window', 'windows', 'pages', 'orders', 'elapsed', ...}"""
+        if not stream['on_progress']:
+            return
+        event = {
+            'type': event_type,
+            'window': stream['window'],
+            'windows': stream['windows'],
+            'pages': stream['pages'],
+            'orders': stream['orders'],
+            'elapsed': round(time.time() - stream['started'], 3)
+        }
+        event.update(fields)
+        try:
+            stream['on_progress'](event)
+        except Exception as e:
+            print(f"주문 조회 진행 이벤트 처리 오류: {e}")
+
+    def _stream_window_started(self, stream: Dict, window_start: datetime, window_end: datetime):
+        """조회 구간 시작 이벤트"""
+        stream['window'] += 1
+        self._emit_order_progress(stream, 'window', window_from=self._format_api_time(window_start),
+                                  window_to=self._format_api_time(window_end))
+
+    def _stream_page_orders(self, stream: Dict, page: int, page_result: Dict) -> List[ProductOrder]:
+        """조회한 페이지를 ProductOrder로 변환/상태 필터링하여 반환하고 page 이벤트 전달"""
+        orders = []
+        if page_result['success']:
+            status_filter = stream['status_filter']
+            for item in page_result['contents']:
+                order = ProductOrder.from_api(item)
+                if order is not None and order.matches(status_filter):
+                    orders.append(order)
+        else:
+            stream['failed_pages'].append((stream['window'], page))
+
+        stream['pages'] += 1
+        stream['orders'] += len(orders)
+        self._emit_order_progress(stream, 'page', page=page, page_orders=len(orders), success=page_result['success'])
+        return orders
+
+    def _finish_order_stream(self, stream: Dict):
+        """전체 조회 완료 이벤트"""
+        elapsed = time.time() - stream['started']
+        print(f"주문 스트리밍 조회 완료: {stream['windows']}개 구간, {stream['pages']}페이지, 총 {stream['orders']}건 ({elapsed:.2f}초)")
+        self._emit_order_progress(stream, 'done', failed_pages=list(stream['failed_pages']))
+
+    def _next_page_batch(self, remaining_pages: List[int], next_page: int) -> tuple:
+        """다음에 병렬 조회할 페이지 묶음 - (페이지 목록, 남은 페이지 목록, 다음 시작 페이지)
+
+        전체 페이지 수를 알면 남은 페이지에서, 모르면(hasNext 기반) next_page부터 page_fanout 개를 앞서 조회한다.
+        """
+        if remaining_pages:
+            return remaining_pages[:self.page_fanout], remaining_pages[self.page_fanout:], next_page
+        batch = list(range(next_page, next_page + self.page_fanout))
+        return batch, [], next_page + self.page_fanout
+
+    def _open_order_stream(self, start_date: str = None, end_date: str = None, statuses=None, limit: int = 100,
+                           on_progress=None) -> tuple:
+        """iter_orders 진행 상태와 페이지 조회 계획 생성 - (stream, 계획) 반환
+
+        계획은 _window_page_plan과 같은 방식으로 페이지를 요청하며, 받은 페이지의 주문은
+        조회 순서대로 stream에 쌓인다 (_take_stream_orders로 꺼냄).
+        """
+        start_dt, end_dt = self._order_date_range(start_date, end_date)
+        time_windows = self._split_time_windows(start_dt, end_dt)
+        stream = self._start_order_stream(time_windows, statuses, on_progress)
+        return stream, self._order_stream_plan(stream, time_windows, min(limit, 100))
+
+    def _order_stream_plan(self, stream: Dict, time_windows: List[tuple], page_size: int):
+        """iter_orders 페이지 조회 계획 - 구간/페이지 순서대로 요청하고 끝나면 done 이벤트 전달"""
+        for window_start, window_end in time_windows:
+            self._stream_window_started(stream, window_start, window_end)
+            # 상태 조건 없이 조회하고 로컬에서 필터링 (여러 상태를 한 번의 조회로 처리)
+            base_params = self._order_window_params(window_start, window_end, None, page_size)
+
+            first_page = (yield base_params, [1])[1]
+            stream['ready'].extend(self._stream_page_orders(stream, 1, first_page))
+
+            remaining_pages = self._remaining_pages(first_page, page_size)
+            has_next = not remaining_pages and first_page['success'] and first_page['pagination'].get('hasNext')
+            next_page = 2
+            while remaining_pages or has_next:
+                batch, remaining_pages, next_page = self._next_page_batch(remaining_pages, next_page)
+                results = yield base_params, batch
+                for page in batch:
+                    result = results[page]
+                    stream['ready'].extend(self._stream_page_orders(stream, page, result))
+                    if has_next and (not result['success'] or not result['contents'] or not result['pagination'].get('hasNext')):
+                        has_next = False
+                        break
+
+        self._finish_order_stream(stream)
+
+    def _take_stream_orders(self, stream: Dict) -> List[ProductOrder]:
+        """지금까지 받은 페이지의 주문을 꺼냄 (조회 순서 유지)"""
+        orders, stream['ready'] = stream['ready'], []
+        return orders
+
+    def _changed_orders_windows(self, start_time: str, end_time: str) -> List[tuple]:
+        """변경 주문 조회 기간(ISO 문자열)을 KST 기준 24시간 구간 목록으로 분할"""
+        # 시간 문자열을 datetime 객체로 변환
+        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00')).astimezone(KST)
+        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00')).astimezone(KST)
+
+        print(f"24시간 단위 청크 조회 시작:")
+        print(f"  → 시작 시간: {start_dt.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+09:00")
+        print(f"  → 종료 시간: {end_dt.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+09:00")
+
+        return self._split_time_windows(start_dt, end_dt)
+
+    def _build_changed_orders_result(self, time_windows: List[tuple], responses: List[Dict]) -> Dict:
+        """구간별 변경 주문 조회 결과를 시간순으로 병합"""
+        all_orders = []
+        for index, response in enumerate(responses, 1):
+            window_start, window_end = time_windows[index - 1]
+            print(f"청크 {index}: {window_start.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+09:00 ~ {window_end.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}+09:00")
+
+            if response and response.get('success'):
+                data = response.get('data') or {}
+                # 네이버 응답은 {'data': {'lastChangeStatuses': [...]}} 구조
+                if isinstance(data, dict) and isinstance(data.get('data'), dict):
+                    data = data['data']
+                if isinstance(data, dict) and 'lastChangeStatuses' in data:
+                    chunk_orders = data['lastChangeStatuses']
+                    all_orders.extend(chunk_orders)
+                    print(f"  → {len(chunk_orders)}건 조회 성공")
+                else:
+                    print(f"  → 0건 조회")
+            else:
+                print(f"  → 조회 실패: {response.get('error', '알 수 없는 오류') if response else '응답 없음'}")
+
+        total_chunks = len(time_windows)
+        print(f"전체 청크 조회 완료: {total_chunks}개 청크, 총 {len(all_orders)}건")
+
+        return {
+            'success': True,
+            'data': {
+                'count': len(all_orders),
+                'lastChangeStatuses': all_orders,
+                'chunks_processed': total_chunks
+            }
+        }
+
+    def _first_order_detail(self, response: Dict) -> Dict:
+        """주문 상세 조회(query) 응답에서 첫 번째 주문 추출"""
+        if response and isinstance(response, dict) and 'data' in response:
+            data_list = response['data']
+            if isinstance(data_list, list) and len(data_list) > 0:
+                return data_list[0]
+
+        return {}
+
+    def _map_naver_status_to_local(self, naver_status: str) -> str:
+        """네이버 API 상태를 로컬 상태로 매핑"""
+        status_mapping = {
+            'ORDERED': '신규주문',
+            'PAYED': '신규주문',
+            'READY': '발송대기',
+            'SHIPPED': '배송중',
+            'DELIVERED': '배송완료',
+            'CONFIRMED': '구매확정',
+            'CANCELLED': '취소주문',
+            'RETURNED': '반품주문',
+            'EXCHANGED': '교환주문'
+        }
+        return status_mapping.get(naver_status, '신규주문')
+
+    # 엔드포인트 메서드 (동기 클라이언트는 결과 dict, 비동기 클라이언트는 코루틴 반환)
+
+    def get_last_changed_orders(self, last_changed_from: str, last_changed_to: str = None, last_changed_type: str = None,
+                                more_sequence: str = None, limit_count: int = None):
+        """변경된 주문 목록 조회 (last-changed-statuses)
+
+        응답의 more(moreFrom, moreSequence)가 있으면 lastChangedFrom=moreFrom, more_sequence=moreSequence로 이어서 조회한다.
+        """
+        params = {
+            'lastChangedFrom': last_changed_from
+        }
+
+        if last_changed_to:
+            params['lastChangedTo'] = last_changed_to
+
+        if last_changed_type:
+            params['lastChangedType'] = last_changed_type
+
+        if more_sequence:
+            params['moreSequence'] = more_sequence
+
+        if limit_count:
+            params['limitCount'] = limit_count
+
+        return self.make_authenticated_request('GET', LAST_CHANGED_ENDPOINT, params)
+
+    def query_orders_by_ids(self, product_order_ids: list):
+        """주문 ID 목록으로 상세 주문 정보 조회 (query)"""
+        data = {
+            'productOrderIds': product_order_ids
+        }
+        return self.make_authenticated_request('POST', QUERY_ENDPOINT, data)
+
+    def get_products(self, limit: int = 50, product_status_types: list = None, page: int = 1):
+        """상품 목록 조회 (page 페이지, 페이지당 최대 PRODUCT_SEARCH_MAX_SIZE개) - 상세 응답 정보 반환
+
+        전체 상품은 ProductCatalogSync로 모든 페이지를 조회한다.
+        """
+        if product_status_types is None:
+            product_status_types = ["SALE", "WAIT", "OUTOFSTOCK", "SUSPENSION", "CLOSE", "PROHIBITION"]
+
+        data = {
+            "productStatusTypes": product_status_types,
+            "page": max(1, page),
+            "size": max(1, min(limit, PRODUCT_SEARCH_MAX_SIZE)),
+            "orderType": "NO",
+            "periodType": "PROD_REG_DAY",
+            "fromDate": "",
+            "toDate": ""
+        }
+        return self.make_authenticated_request('POST', PRODUCT_SEARCH_ENDPOINT, data)
+
+    def get_channel_product(self, channel_product_id: str):
+        """채널상품 상세 조회 - 상세 응답 정보 반환"""
+        return self.make_authenticated_request('GET', f'/external/v2/products/channel-products/{channel_product_id}')
+
+    def get_store_info(self):
+        """스토어 정보 조회 - 상세 응답 정보 반환"""
+        return self.make_authenticated_request('GET', '/external/v1/seller/account')
+
+    def get_seller_channels(self):
+        """판매자 채널 정보 조회 - 상세 응답 정보 반환"""
+        return self.make_authenticated_request('GET', '/external/v1/seller/channels')
+
+    def get_order_statistics(self, start_date: str = None, end_date: str = None):
+        """주문 통계 조회 (최대 24시간 범위)"""
+        if not start_date:
+            start_date = self._format_api_time(datetime.now() - timedelta(hours=24))
+        if not end_date:
+            end_date = self._format_api_time(datetime.now())
+
+        params = {
+            'from': start_date,
+            'to': end_date
+        }
+        return self.make_authenticated_request('GET', '/external/v1/statistics/orders', params)
+
+    # 주문관리 핵심 API 메서드들
+
+    def get_product_detail(self, product_id: str):
+        """상품 상세 조회"""
+        return self.make_authenticated_request('GET', f'/external/v1/products/{product_id}')
+
+    def get_origin_product(self, origin_product_id: str):
+        """원상품 상세 조회"""
+        return self.make_authenticated_request('GET', f'/external/v2/products/origin-products/{origin_product_id}')
+
+    def get_order_product_ids(self, order_id: str):
+        """주문 상품 ID 목록 조회"""
+        return self.make_authenticated_request('GET', f'/external/v1/pay-order/seller/orders/{order_id}/product-order-ids')
+
+    def update_shipping_info(self, product_order_id: str, delivery_company: str, tracking_number: str):
+        """배송 정보 업데이트"""
+        data = {
+            'deliveryCompany': delivery_company,
+            'trackingNumber': tracking_number
+        }
+        return self.make_authenticated_request('PUT', f'{ORDERS_ENDPOINT}/{product_order_id}/shipping', data)
+
+    def change_order_status(self, product_order_id: str, status: str, reason: str = None):
+        """주문 상태 변경"""
+        data = {
+            'status': status
+        }
+        if reason:
+            data['reason'] = reason
+        return self.make_authenticated_request('PUT', f'{ORDERS_ENDPOINT}/{product_order_id}/status', data)
+
+    def get_delivery_companies(self):
+        """배송업체 목록 조회"""
+        return self.make_authenticated_request('GET', '/external/v1/pay-order/seller/delivery-companies')
+
+    def dispatch_product_orders(self, dispatches: list):
+        """상품주문 발송 처리 (최대 DISPATCH_BATCH_SIZE건)
+
+        dispatches: [{'productOrderId', 'deliveryCompanyCode', 'trackingNumber'}, ...]
+        응답 data['data']에 successProductOrderIds / failProductOrderInfos가 들어 있다.
+        """
+        dispatch_date = self._format_utc_time(datetime.now(KST))
+        data = {
+            'dispatchProductOrders': [
+                {
+                    'productOrderId': dispatch['productOrderId'],
+                    'deliveryMethod': dispatch.get('deliveryMethod', 'DELIVERY'),
+                    'deliveryCompanyCode': dispatch['deliveryCompanyCode'],
+                    'trackingNumber': dispatch['trackingNumber'],
+                    'dispatchDate': dispatch.get('dispatchDate', dispatch_date)
+                }
+                for dispatch in dispatches
+            ]
+        }
+        return self.make_authenticated_request('POST', DISPATCH_ENDPOINT, data)
+
+    def bulk_update_shipping(self, shipping_updates: list):
+        """배송 정보 일괄 업데이트"""
+        data = {
+            'shippingUpdates': shipping_updates
+        }
+        return self.make_authenticated_request('POST', f'{ORDERS_ENDPOINT}/bulk-shipping', data)
+
+    def get_order_claims(self, start_date: str = None, end_date: str = None):
+        """클레임(취소/반품/교환) 조회"""
+        if not start_date:
+            start_date = self._format_api_time(datetime.now() - timedelta(days=7))
+        if not end_date:
+            end_date = self._format_api_time(datetime.now())
+
+        params = {
+            'from': start_date,
+            'to': end_date
+        }
+        return self.make_authenticated_request('GET', '/external/v1/pay-order/seller/claims', params)
+
+    def process_claim(self, claim_id: str, action: str, reason: str = None):
+        """클레임 처리 (승인/거부)"""
+        data = {
+            'action': action  # 'APPROVE', 'REJECT'
+        }
+        if reason:
+            data['reason'] = reason
+        return self.make_authenticated_request('POST', f'/external/v1/pay-order/seller/claims/{claim_id}/process', data)
+
+    def get_order_statistics_detailed(self, start_date: str = None, end_date: str = None):
+        """상세 주문 통계 조회"""
+        if not start_date:
+            start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        params = {
+            'startDate': start_date,
+            'endDate': end_date
+        }
+        return self.make_authenticated_request('GET', '/external/v1/statistics/orders/detailed', params)
+
+    def search_orders(self, search_params: Dict):
+        """주문 검색 (고급 검색)"""
+        return self.make_authenticated_request('POST', f'{ORDERS_ENDPOINT}/search', search_params)
+
+    def get_multiple_order_details(self, product_order_ids: list):
+        """여러 주문 상세 정보 일괄 조회"""
+        data = {
+            'productOrderIds': product_order_ids
+        }
+        return self.make_authenticated_request('POST', QUERY_ENDPOINT, data)
@@ -0,0 +1,134 @@
+"""
+상품주문 원본 응답(JSON) 압축 보관 모듈 - order_documents 테이블 저장 형식
+
+네이버 query 응답 항목을 그대로 압축해 두고, 읽을 때는 필요한 문서만 처음 접근할 때 풀어서 사용한다.
+zstd는 zstandard 패키지가 있을 때만 사용하며, 저장된 문서는 행마다 기록된 코덱으로 풀기 때문에
+코덱 설정을 바꿔도 기존 문서를 그대로 읽을 수 있다.
+"""
+import hashlib
+import json
+import zlib
+from typing import Dict, Optional, Tuple
+
+from product_order import ProductOrder
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 - 없으면 zlib 사용
+    zstandard = None
+
+CODECS = ('zlib', 'zstd')
+DEFAULT_CODEC = 'zlib'
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 9
+
+# 미리 정의한 압축 사전 - 상품주문 1건의 JSON은 1KB 안팎이라 문서마다 따로 압축하면 거의 줄지 않으므로
+# 공통 키/값을 사전으로 두고 압축한다. 저장된 문서를 풀 때도 같은 사전이 필요하므로 이 값은 수정하지 않는다
+# (바꿔야 하면 새 코덱 이름을 추가하고 기존 코덱은 그대로 둔다).
+DOCUMENT_TEMPLATE = {
+    'delivery': {'deliveryCompany': 'CJGLS', 'deliveryMethod': 'DELIVERY', 'deliveryStatus': 'DELIVERY_COMPLETION',
+                 'sendDate': '2024-01-01T00:00:00.000+09:00', 'trackingNumber': ''},
+    'order': {'orderDate': '2024-01-01T00:00:00.000+09:00', 'orderId': '', 'ordererId': '', 'ordererName': '',
+              'ordererTel': '010-', 'payLocationType': 'MOBILE', 'paymentDate': '2024-01-01T00:00:00.000+09:00',
+              'paymentMeans': '신용카드'},
+    'productOrder': {'claimStatus': None, 'claimType': None, 'deliveryFeeAmount': 0, 'expectedDeliveryMethod': 'DELIVERY',
+                     'productDiscountAmount': 0, 'productId': '', 'productName': '', 'productOption': '',
+                     'productOrderId': '', 'productOrderStatus': 'PAYED', 'quantity': 1, 'sellerProductCode': '',
+                     'shippingAddress': {'baseAddress': '서울특별시 ', 'detailedAddress': '', 'name': '',
+                                         'tel1': '010-', 'zipCode': ''},
+                     'shippingDueDate': '2024-01-01T23:59:59.000+09:00', 'shippingMemo': '배송 전에 미리 연락바랍니다.',
+                     'totalPaymentAmount': 0, 'unitPrice': 0}
+}
+
+
+def _serialize(payload: Dict) -> bytes:
+    """키를 정렬한 JSON (내용이 같으면 항상 같은 바이트)"""
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+DOCUMENT_DICTIONARY = _serialize(DOCUMENT_TEMPLATE)
+_zstd_dictionary = zstandard.ZstdCompressionDict(DOCUMENT_DICTIONARY, dict_type=zstandard.DICT_TYPE_RAWCONTENT) \
+    if zstandard is not None else None
+
+
+def available_codec(codec: str = None) -> str:
+    """사용할 수 있는 코덱 이름 (zstd를 요청했지만 zstandard가 없으면 zlib)"""
+    codec = (codec or DEFAULT_CODEC).lower()
+    if codec not in CODECS:
+        print(f"알 수 없는 문서 압축 코덱: {codec} - {DEFAULT_CODEC} 사용")
+        return DEFAULT_CODEC
+    if codec == 'zstd' and zstandard is None:
+        return 'zlib'
+    return codec
+
+
+def serialize_document(payload: Dict) -> Tuple[bytes, str]:
+    """문서 직렬화 - (JSON 바이트, 내용 해시) 반환 (해시가 같으면 압축/저장하지 않음)"""
+    raw = _serialize(payload)
+    return raw, hashlib.sha1(raw).hexdigest()
+
+
+def compress_document(raw: bytes, codec: str = DEFAULT_CODEC) -> bytes:
+    """직렬화한 문서를 압축 사전과 함께 압축"""
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=_zstd_dictionary).compress(raw)
+    compressor = zlib.compressobj(ZLIB_LEVEL, zdict=DOCUMENT_DICTIONARY)
+    return compressor.compress(raw) + compressor.flush()
+
+
+def encode_document(payload: Dict, codec: str = DEFAULT_CODEC) -> Tuple[bytes, int, str]:
+    """문서를 압축 - (압축 데이터, 원본 크기, 내용 해시) 반환"""
+    raw, content_hash = serialize_document(payload)
+    return compress_document(raw, codec), len(raw), content_hash
+
+
+def decode_document(blob: bytes, codec: str) -> Dict:
+    """압축된 문서를 dict로 복원"""
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd로 저장된 문서를 읽으려면 zstandard 패키지가 필요합니다")
+        raw = zstandard.ZstdDecompressor(dict_data=_zstd_dictionary).decompress(blob)
+    else:
+        decompressor = zlib.decompressobj(zdict=DOCUMENT_DICTIONARY)
+        raw = decompressor.decompress(blob) + decompressor.flush()
+    return json.loads(raw)
+
+
+class OrderDocument:
+    """order_documents 테이블 행 1건 - payload/record는 처음 접근할 때 한 번만 풀어서 보관"""
+
+    __slots__ = ('product_order_id', 'order_id', 'last_changed_date', 'codec', 'raw_size', '_blob',
+                 '_payload', '_record')
+
+    def __init__(self, product_order_id: str, order_id: str, last_changed_date: Optional[str], codec: str,
+                 raw_size: int, blob: bytes):
+        self.product_order_id = product_order_id
+        self.order_id = order_id
+        self.last_changed_date = last_changed_date
+        self.codec = codec
+        self.raw_size = raw_size
+        self._blob = blob
+        self._payload = None
+        self._record = None
+
+    @property
+    def stored_size(self) -> int:
+        """압축된 크기 (바이트)"""
+        return len(self._blob)
+
+    @property
+    def payload(self) -> Dict:
+        """원본 응답 항목 ({'order', 'productOrder', 'delivery', ...})"""
+        if self._payload is None:
+            self._payload = decode_document(self._blob, self.codec)
+        return self._payload
+
+    @property
+    def record(self) -> Optional[ProductOrder]:
+        """원본 응답을 변환한 ProductOrder 레코드"""
+        if self._record is None:
+            self._record = ProductOrder.from_api(self.payload)
+        return self._record
+
+    def __repr__(self) -> str:
+        return f"OrderDocument({self.product_order_id!r}, last_changed_date={self.last_changed_date!r})"
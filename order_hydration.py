@@ -0,0 +1,96 @@
+"""
+상품주문 상세 일괄 조회 모듈 (query 엔드포인트 배치 + 병렬 실행)
+"""
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+QUERY_BATCH_SIZE = 300  # query 엔드포인트의 productOrderIds 최대 개수
+
+
+class OrderHydrator:
+    """상품주문 ID 목록을 배치로 나눠 병렬 상세 조회 - {productOrderId: 상세} 반환
+
+    여러 호출자가 add()로 ID를 모아 두었다가 flush()로 한 번에 조회하거나,
+    hydrate()로 바로 조회할 수 있다. 요청 속도는 API 클라이언트의 공유 속도 제한기가 제어한다.
+    """
+
+    def __init__(self, naver_api, batch_size: int = QUERY_BATCH_SIZE, max_workers: int = None):
+        self.naver_api = naver_api
+        self.batch_size = max(1, min(int(batch_size), QUERY_BATCH_SIZE))
+        self.max_workers = max(1, int(max_workers or getattr(naver_api, 'window_workers', 4)))
+        self._pending = {}  # 순서를 유지하는 대기 중인 ID (dict를 순서 있는 집합으로 사용)
+        self._pending_lock = threading.Lock()
+        self.last_stats = {}
+
+    def add(self, product_order_ids: Iterable[str]):
+        """다음 flush()에서 조회할 상품주문 ID 추가 (중복 무시)"""
+        with self._pending_lock:
+            for product_order_id in product_order_ids:
+                if product_order_id:
+                    self._pending[str(product_order_id)] = None
+
+    def flush(self) -> Dict[str, Dict]:
+        """모아 둔 ID를 모두 조회"""
+        with self._pending_lock:
+            product_order_ids = list(self._pending)
+            self._pending.clear()
+        return self.hydrate(product_order_ids)
+
+    def hydrate(self, product_order_ids: Iterable[str]) -> Dict[str, Dict]:
+        """상품주문 상세 조회 - {productOrderId: query 응답 항목} 반환 (조회 실패한 ID는 제외)"""
+        started = time.time()
+        unique_ids = list(dict.fromkeys(str(i) for i in product_order_ids if i))
+        batches = [unique_ids[offset:offset + self.batch_size] for offset in range(0, len(unique_ids), self.batch_size)]
+
+        if len(batches) <= 1 or self.max_workers <= 1:
+            batch_results = [self._query_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                batch_results = list(executor.map(self._query_batch, batches))
+
+        details = {}
+        failed_batches = 0
+        for items in batch_results:
+            if items is None:
+                failed_batches += 1
+                continue
+            for item in items:
+                product_order_id = self._product_order_id(item)
+                if product_order_id:
+                    details[product_order_id] = item
+
+        self.last_stats = {
+            'requested': len(unique_ids),
+            'batches': len(batches),
+            'hydrated': len(details),
+            'failed_batches': failed_batches,
+            'elapsed': round(time.time() - started, 3)
+        }
+        if unique_ids:
+            print(f"주문 상세 일괄 조회: {len(unique_ids)}건 → {len(details)}건 ({len(batches)}회 요청, {self.last_stats['elapsed']:.2f}초)")
+        return details
+
+    def _query_batch(self, batch: List[str]):
+        """한 배치 조회 - 항목 목록 또는 실패 시 None 반환"""
+        try:
+            response = self.naver_api.query_orders_by_ids(batch)
+        except Exception as e:
+            print(f"  → 주문 상세 조회 오류 ({len(batch)}건): {e}")
+            return None
+
+        if not response or not response.get('success'):
+            print(f"  → 주문 상세 조회 실패 ({len(batch)}건): {response.get('error', '알 수 없는 오류') if response else '응답 없음'}")
+            return None
+
+        # 네이버 응답은 {'data': [{'order': {...}, 'productOrder': {...}, ...}]} 구조
+        api_response = response.get('data') or {}
+        items = api_response.get('data') if isinstance(api_response, dict) else api_response
+        return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+    def _product_order_id(self, item: Dict) -> str:
+        """query 응답 항목의 상품주문 ID"""
+        product_order = item.get('productOrder') or {}
+        product_order_id = product_order.get('productOrderId') or item.get('productOrderId')
+        return str(product_order_id) if product_order_id else ''
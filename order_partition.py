@@ -0,0 +1,80 @@
+"""
+주문 상태별 분류 모듈 - 기간 내 전체 상품주문을 한 번 조회하여 상태별로 나누어 제공
+"""
+import time
+from typing import Dict, Iterable, List, Optional
+
+from product_order import ProductOrder, parse_product_orders
+
+
+class OrderPartition:
+    """기간 내 상품주문을 상품주문 상태 / 클레임 상태별로 분류한 결과
+
+    상태 조건 없이 한 번 조회한 주문 목록을 ProductOrder 레코드로 변환해 로컬에서 분류하므로
+    어떤 상태 조합이든 추가 API 요청 없이 select()/counts()로 꺼낼 수 있다.
+    complete가 False이면 일부 페이지 조회가 실패한 불완전한 결과이고,
+    degraded가 True이면 API 대신 로컬 DB에 저장된 주문으로 만든 결과이다 (서킷 브레이커 차단 중).
+    """
+
+    def __init__(self, items: Iterable[Dict], start_date: str = None, end_date: str = None, complete: bool = True,
+                 degraded: bool = False):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.complete = complete
+        self.degraded = degraded
+        self.fetched_at = time.time()
+        self.items = []
+        self.by_status = {}
+        self.by_claim_status = {}
+
+        seen = set()
+        for record in parse_product_orders(items):
+            if record.product_order_id:
+                if record.product_order_id in seen:
+                    continue
+                seen.add(record.product_order_id)
+
+            index = len(self.items)
+            self.items.append(record)
+            self.by_status.setdefault(record.status or 'UNKNOWN', []).append(index)
+            if record.claim_status:
+                self.by_claim_status.setdefault(record.claim_status, []).append(index)
+
+    @property
+    def age(self) -> float:
+        """조회 후 경과 시간 (초)"""
+        return time.time() - self.fetched_at
+
+    def select(self, statuses=None) -> List[ProductOrder]:
+        """상품주문 상태 또는 클레임 상태가 statuses에 해당하는 항목 (조회 순서 유지, None이면 전체)"""
+        if not statuses:
+            return list(self.items)
+        if isinstance(statuses, str):
+            statuses = [statuses]
+
+        indexes = set()
+        for status in statuses:
+            indexes.update(self.by_status.get(status, ()))
+            indexes.update(self.by_claim_status.get(status, ()))
+        return [self.items[index] for index in sorted(indexes)]
+
+    def counts(self, statuses: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """상태별 건수 - 상품주문 상태나 클레임 상태가 해당하는 상품주문 수 (statuses를 지정하면 해당 상태만, 없는 상태는 0)"""
+        if statuses is None:
+            statuses = list(self.by_status) + [status for status in self.by_claim_status if status not in self.by_status]
+        return {status: len(set(self.by_status.get(status, ())) | set(self.by_claim_status.get(status, ())))
+                for status in statuses}
+
+    def to_response(self, statuses=None) -> Dict:
+        """get_orders와 같은 형식의 응답 ({'success', 'data': {'data': [ProductOrder, ...], 'total'}, 'complete', 'degraded'})"""
+        orders = self.select(statuses)
+        return {
+            'success': bool(self.complete or self.items or self.degraded),
+            'data': {
+                'data': orders,
+                'total': len(orders)
+            },
+            'complete': self.complete,
+            'degraded': self.degraded,
+            'from_partition': True
+        }
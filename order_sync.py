@@ -0,0 +1,246 @@
+"""
+변경 주문 기반 증분 동기화 모듈 (last-changed-statuses + query)
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from naver_api_base import KST
+from order_hydration import OrderHydrator
+from product_order import parse_product_orders
+
+CURSOR_SETTING_KEY = 'order_sync_last_changed_from'  # settings 테이블에 저장하는 마지막 동기화 시각 (UTC ISO)
+COVERED_FROM_SETTING_KEY = 'order_sync_covered_from'  # 누락 없이 동기화된 주문일 범위의 시작 시각 (UTC ISO)
+LAST_CHANGED_LIMIT = 300  # last-changed-statuses 한 번에 받을 최대 건수
+
+
+class OrderSyncEngine:
+    """변경분만 가져와 DB에 반영하는 증분 주문 동기화
+
+    1. settings 테이블의 커서(lastChangedFrom)부터 현재까지 24시간 구간으로 변경 목록 조회
+    2. moreSequence 가 있으면 같은 구간을 이어서 조회
+    3. 변경된 상품주문 ID를 query 로 묶어서 병렬 상세 조회 (OrderHydrator)
+       - 저장된 원본(order_documents)의 마지막 변경 일시가 같은 상품주문은 조회하지 않음
+    4. 원본과 상품주문을 DB에 저장한 뒤 커서 전진
+
+    커서와 함께 누락 없이 동기화된 범위의 시작 시각(covered_from)을 저장한다.
+    변경 목록은 커서 이후만 조회하므로, 그보다 이전 주문일을 요청하면(since) 그 구간은
+    주문 목록 조회로 먼저 채운 뒤 범위 시작을 앞당긴다.
+    """
+
+    def __init__(self, naver_api, db_manager, initial_lookback_days: int = 1, overlap_seconds: int = 60):
+        self.naver_api = naver_api
+        self.db_manager = db_manager
+        self.initial_lookback_days = initial_lookback_days  # 커서가 없을 때 처음 조회할 기간
+        self.overlap_seconds = overlap_seconds  # 커서 경계에서 늦게 반영된 변경을 놓치지 않기 위한 겹침
+        self.hydrator = OrderHydrator(naver_api)  # 변경된 상품주문 배치 상세 조회
+        self._sync_lock = threading.Lock()  # 대시보드/백그라운드 모니터 동시 실행 방지
+
+    def _get_time_setting(self, key: str) -> Optional[datetime]:
+        try:
+            value = self.db_manager.get_setting(key)
+            if value:
+                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except Exception as e:
+            print(f"동기화 시각 조회 오류 ({key}): {e}")
+        return None
+
+    def get_cursor(self) -> Optional[datetime]:
+        """저장된 동기화 커서 조회"""
+        return self._get_time_setting(CURSOR_SETTING_KEY)
+
+    def save_cursor(self, cursor: datetime) -> bool:
+        """동기화 커서 저장"""
+        return self.db_manager.save_setting(CURSOR_SETTING_KEY, cursor.astimezone(timezone.utc).isoformat())
+
+    def get_covered_from(self) -> Optional[datetime]:
+        """누락 없이 동기화된 범위의 시작 시각 (이 시각 이후 주문은 모두 DB에 있음, 모르면 None)"""
+        return self._get_time_setting(COVERED_FROM_SETTING_KEY)
+
+    def save_covered_from(self, covered_from: datetime) -> bool:
+        """동기화된 범위의 시작 시각 저장"""
+        return self.db_manager.save_setting(COVERED_FROM_SETTING_KEY,
+                                            covered_from.astimezone(timezone.utc).isoformat())
+
+    def reset_cursor(self) -> bool:
+        """커서 초기화 - 다음 동기화는 initial_lookback_days 기간 전체를 다시 조회"""
+        self.db_manager.save_setting(COVERED_FROM_SETTING_KEY, '')
+        return self.db_manager.save_setting(CURSOR_SETTING_KEY, '')
+
+    def sync(self, initial_lookback_days: int = None, since: datetime = None) -> Dict:
+        """마지막 커서 이후 변경된 주문을 조회하여 DB에 반영
+
+        since(주문일 시작 시각)가 동기화된 범위보다 이전이면 빠진 구간을 주문 목록으로 먼저 채운다.
+        """
+        with self._sync_lock:
+            result = self._sync(initial_lookback_days or self.initial_lookback_days, since)
+            if since and result['success']:
+                backfill = self._backfill(since)
+                result['backfill'] = backfill
+                result['requests'] += backfill['requests']
+                result['success'] = backfill['success']
+            return result
+
+    def _sync(self, initial_lookback_days: int, since: datetime = None) -> Dict:
+        now = datetime.now(KST)
+        cursor = self.get_cursor()
+        first_sync = cursor is None
+        if cursor:
+            start_dt = min(cursor, now) - timedelta(seconds=self.overlap_seconds)
+        else:
+            start_dt = now - timedelta(days=initial_lookback_days)
+            if since:
+                start_dt = min(start_dt, since)
+
+        time_windows = self.naver_api._split_time_windows(start_dt.astimezone(KST), now)
+        print(f"증분 동기화 시작: {start_dt.astimezone(KST).strftime('%m-%d %H:%M:%S')} ~ {now.strftime('%m-%d %H:%M:%S')} ({len(time_windows)}개 구간)")
+
+        window_results = self.naver_api._map_windows(self._fetch_changes, time_windows)
+
+        # 시간순으로 연속 성공한 구간까지만 커서를 전진 (실패 구간은 다음 동기화에서 다시 조회)
+        changes = []
+        new_cursor = None
+        requests_made = 0
+        failed = False
+        for (window_start, window_end), (window_changes, success, window_requests) in zip(time_windows, window_results):
+            requests_made += window_requests
+            changes.extend(window_changes)
+            if not success:
+                failed = True
+            elif not failed:
+                new_cursor = window_end
+
+        # 같은 상품주문이 여러 번 변경된 경우 한 번만 상세 조회 (상태는 시간순 마지막 변경 기준)
+        latest_status = {}
+        last_changed = {}
+        for change in changes:
+            product_order_id = change.get('productOrderId')
+            if product_order_id:
+                latest_status[product_order_id] = change.get('productOrderStatus')
+                last_changed[str(product_order_id)] = change.get('lastChangedDate')
+        product_order_ids = list(latest_status)
+        status_counts = {}
+        for status in latest_status.values():
+            if status:
+                status_counts[status] = status_counts.get(status, 0) + 1
+
+        # 저장된 원본의 마지막 변경 일시가 같으면 (커서 겹침 구간 등) 다시 상세 조회하지 않음
+        cached = {product_order_id: document
+                  for product_order_id, document in self.db_manager.get_order_documents(product_order_ids).items()
+                  if document.last_changed_date and document.last_changed_date == last_changed.get(product_order_id)}
+        stale_ids = [product_order_id for product_order_id in product_order_ids if str(product_order_id) not in cached]
+        hydrated = {}
+        hydrated_all = True
+        if stale_ids:
+            hydrated = self.hydrator.hydrate(stale_ids)
+            requests_made += self.hydrator.last_stats.get('batches', 0)
+            # 상세 조회에 실패한 주문이 있으면 커서를 전진하지 않음
+            hydrated_all = self.hydrator.last_stats.get('failed_batches', 0) == 0
+        details = list(hydrated.values())
+
+        product_orders = [record for record in parse_product_orders(details) if record.order_id]
+        upserted = self.db_manager.upsert_product_orders(product_orders, last_changed)
+        # 원본은 상품주문 저장에 성공했을 때만 변경 일시와 함께 저장 (실패 시 다음 동기화에서 다시 상세 조회)
+        self.db_manager.put_order_documents(hydrated, None if upserted['failed'] else last_changed)
+        # 저장에 실패한 주문이 있으면 커서를 전진하지 않음 (변경 목록은 커서 이후만 다시 조회하므로)
+        saved_all = not upserted['failed']
+        upserted['unchanged'] += len(cached)
+        saved = upserted['inserted'] + upserted['updated'] + upserted['unchanged']
+
+        if not hydrated_all or not saved_all:
+            new_cursor = None
+        if new_cursor:
+            self.save_cursor(new_cursor)
+            # 첫 동기화는 조회 시작 시각부터 누락 없이 반영됨 (이후 주문은 모두 변경 목록에 포함)
+            if first_sync:
+                self.save_covered_from(start_dt)
+        cursor = new_cursor or cursor
+
+        print(f"증분 동기화 완료: 변경 {len(product_order_ids)}건, 상세 {len(details)}건 (저장된 원본 사용 {len(cached)}건), 저장 {saved}건 "
+              f"(추가 {upserted['inserted']}, 갱신 {upserted['updated']}, 변경 없음 {upserted['unchanged']}"
+              f"{', 실패 ' + str(upserted['failed']) if upserted['failed'] else ''}) (요청 {requests_made}회)")
+
+        return {
+            'success': not failed and hydrated_all and saved_all,
+            'changed': len(product_order_ids),
+            'hydrated': len(details),
+            'cached': len(cached),
+            'saved': saved,
+            'inserted': upserted['inserted'],
+            'updated': upserted['updated'],
+            'unchanged': upserted['unchanged'],
+            'status_counts': status_counts,
+            'windows': len(time_windows),
+            'requests': requests_made,
+            'cursor': cursor.isoformat() if cursor else None
+        }
+
+    def _backfill(self, since: datetime) -> Dict:
+        """동기화된 범위 이전(since ~ covered_from)의 주문을 주문 목록 조회로 채움
+
+        범위 시작을 모르면(이전 버전에서 만든 커서) since부터 현재까지 한 번 조회한다.
+        모든 구간 조회와 저장에 성공했을 때만 범위 시작을 since로 앞당긴다.
+        """
+        covered_from = self.get_covered_from()
+        if covered_from and since >= covered_from:
+            return {'success': True, 'windows': 0, 'requests': 0, 'saved': 0}
+
+        gap_end = covered_from or datetime.now(KST)
+        time_windows = self.naver_api._split_time_windows(since.astimezone(KST), gap_end.astimezone(KST))
+        print(f"동기화 범위 이전 구간 조회: {since.astimezone(KST).strftime('%m-%d %H:%M:%S')} ~ "
+              f"{gap_end.astimezone(KST).strftime('%m-%d %H:%M:%S')} ({len(time_windows)}개 구간)")
+
+        def fetch_window(window):
+            return self.naver_api._fetch_orders_window(window[0], window[1])
+
+        items = []
+        requests_made = 0
+        complete = True
+        for window_orders, window_stats in self.naver_api._map_windows(fetch_window, time_windows):
+            items.extend(window_orders)
+            requests_made += window_stats['requests']
+            if window_stats['failed_pages']:
+                complete = False
+
+        records = [record for record in parse_product_orders(items) if record.order_id]
+        upserted = self.db_manager.upsert_product_orders(records)
+        saved = upserted['inserted'] + upserted['updated'] + upserted['unchanged']
+        success = complete and not upserted['failed']
+        if success:
+            self.save_covered_from(since)
+        else:
+            print("  → 이전 구간 일부 조회/저장 실패 - 다음 동기화에서 다시 조회")
+
+        return {'success': success, 'windows': len(time_windows), 'requests': requests_made, 'saved': saved}
+
+    def _fetch_changes(self, window: tuple) -> tuple:
+        """한 구간의 변경 목록을 moreSequence 끝까지 조회 - (변경 목록, 성공 여부, 요청 수) 반환"""
+        window_start, window_end = window
+        last_changed_from = self.naver_api._format_utc_time(window_start)
+        last_changed_to = self.naver_api._format_utc_time(window_end)
+        more_sequence = None
+        changes = []
+        requests_made = 0
+
+        while True:
+            response = self.naver_api.get_last_changed_orders(
+                last_changed_from=last_changed_from,
+                last_changed_to=last_changed_to,
+                more_sequence=more_sequence,
+                limit_count=LAST_CHANGED_LIMIT
+            )
+            requests_made += 1
+
+            if not response or not response.get('success'):
+                print(f"  → 변경 주문 조회 실패: {response.get('error', '알 수 없는 오류') if response else '응답 없음'}")
+                return changes, False, requests_made
+
+            api_response = response.get('data') or {}
+            data = (api_response.get('data') or {}) if isinstance(api_response, dict) else {}
+            changes.extend(data.get('lastChangeStatuses') or [])
+
+            more = data.get('more') or {}
+            if not more.get('moreSequence'):
+                return changes, True, requests_made
+            last_changed_from = more.get('moreFrom') or last_changed_from
+            more_sequence = more['moreSequence']
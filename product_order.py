@@ -0,0 +1,213 @@
+"""
+상품주문 레코드 및 네이버 주문 응답 파서 - 모든 탭과 DB 계층이 공유
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+
+def parse_datetime(value) -> Optional[datetime]:
+    """ISO 형식 시각 문자열(Z 또는 +09:00 포함)을 datetime으로 변환 (실패 시 None)"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def to_int(value, default: int = 0) -> int:
+    """숫자/숫자 문자열을 int로 변환 (실패 시 default)"""
+    try:
+        return int(value) if value is not None and value != '' else default
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return default
+
+
+def format_datetime(value: Optional[datetime], fmt: str = '%Y-%m-%d %H:%M') -> str:
+    """datetime을 화면 표시용 문자열로 변환 (없으면 빈 문자열)"""
+    return value.strftime(fmt) if value else ''
+
+
+class ProductOrder:
+    """상품주문 1건 - 네이버 응답의 중첩 dict 대신 필요한 필드만 보관하는 경량 레코드
+
+    일시는 datetime, 수량/금액은 int로 한 번만 변환해 두며,
+    상태별 분류 결과를 여러 탭이 같은 레코드로 공유한다.
+    """
+
+    __slots__ = (
+        'product_order_id', 'order_id', 'order_date', 'status', 'claim_status', 'claim_type',
+        'orderer_name', 'orderer_tel', 'product_name', 'product_option', 'seller_product_code',
+        'quantity', 'unit_price', 'discount_amount', 'total_amount', 'payment_means',
+        'base_address', 'detailed_address', 'shipping_due_date', 'shipping_memo',
+        'delivery_company', 'tracking_number'
+    )
+
+    def __init__(self, product_order_id: str = '', order_id: str = '', order_date: datetime = None, status: str = '',
+                 claim_status: str = '', claim_type: str = '', orderer_name: str = '', orderer_tel: str = '',
+                 product_name: str = '', product_option: str = '', seller_product_code: str = '',
+                 quantity: int = 1, unit_price: int = 0, discount_amount: int = 0, total_amount: int = 0,
+                 payment_means: str = '', base_address: str = '', detailed_address: str = '',
+                 shipping_due_date: datetime = None, shipping_memo: str = '', delivery_company: str = '',
+                 tracking_number: str = ''):
+        self.product_order_id = product_order_id
+        self.order_id = order_id
+        self.order_date = order_date
+        self.status = status
+        self.claim_status = claim_status
+        self.claim_type = claim_type
+        self.orderer_name = orderer_name
+        self.orderer_tel = orderer_tel
+        self.product_name = product_name
+        self.product_option = product_option
+        self.seller_product_code = seller_product_code
+        self.quantity = quantity
+        self.unit_price = unit_price
+        self.discount_amount = discount_amount
+        self.total_amount = total_amount
+        self.payment_means = payment_means
+        self.base_address = base_address
+        self.detailed_address = detailed_address
+        self.shipping_due_date = shipping_due_date
+        self.shipping_memo = shipping_memo
+        self.delivery_company = delivery_company
+        self.tracking_number = tracking_number
+
+    @classmethod
+    def from_api(cls, item: Dict) -> Optional['ProductOrder']:
+        """네이버 주문 응답 항목을 레코드로 변환 (주문 정보가 없으면 None)
+
+        주문 목록 항목({'productOrderId', 'content': {'order', 'productOrder', 'delivery'}})과
+        query 응답 항목({'order', 'productOrder', 'delivery'})을 모두 처리한다.
+        """
+        if not isinstance(item, dict):
+            return None
+        content = item.get('content') if isinstance(item.get('content'), dict) else item
+        order = content.get('order')
+        if not isinstance(order, dict):
+            return None
+        product_order = content.get('productOrder') or {}
+        delivery = content.get('delivery') or {}
+        shipping_address = product_order.get('shippingAddress') or {}
+
+        return cls(
+            product_order_id=str(product_order.get('productOrderId') or item.get('productOrderId') or ''),
+            order_id=str(order.get('orderId') or ''),
+            order_date=parse_datetime(order.get('orderDate')),
+            status=product_order.get('productOrderStatus') or '',
+            claim_status=product_order.get('claimStatus') or '',
+            claim_type=product_order.get('claimType') or '',
+            orderer_name=order.get('ordererName') or '',
+            orderer_tel=order.get('ordererTel') or '',
+            product_name=product_order.get('productName') or '',
+            product_option=product_order.get('productOption') or '',
+            seller_product_code=product_order.get('sellerProductCode') or '',
+            quantity=to_int(product_order.get('quantity'), 1),
+            unit_price=to_int(product_order.get('unitPrice')),
+            discount_amount=to_int(product_order.get('productDiscountAmount')),
+            total_amount=to_int(product_order.get('totalPaymentAmount')),
+            payment_means=order.get('paymentMeans') or '',
+            base_address=shipping_address.get('baseAddress') or '',
+            detailed_address=shipping_address.get('detailedAddress') or '',
+            shipping_due_date=parse_datetime(product_order.get('shippingDueDate')),
+            shipping_memo=product_order.get('shippingMemo') or '',
+            delivery_company=delivery.get('deliveryCompany') or '',
+            tracking_number=delivery.get('trackingNumber') or ''
+        )
+
+    @classmethod
+    def from_db_row(cls, row: Dict) -> 'ProductOrder':
+        """orders 테이블 행을 레코드로 변환"""
+        return cls(
+            product_order_id=row.get('product_order_id') or '',
+            order_id=row.get('order_id') or '',
+            order_date=parse_datetime(row.get('order_date')),
+            status=row.get('status') or '',
+            orderer_name=row.get('customer_name') or '',
+            orderer_tel=row.get('customer_phone') or '',
+            product_name=row.get('product_name') or '',
+            product_option=row.get('product_option') or '',
+            quantity=to_int(row.get('quantity'), 1),
+            total_amount=to_int(row.get('price')),
+            base_address=row.get('shipping_address') or '',
+            shipping_due_date=parse_datetime(row.get('shipping_due_date')),
+            shipping_memo=row.get('memo') or '',
+            delivery_company=row.get('shipping_company') or '',
+            tracking_number=row.get('tracking_number') or ''
+        )
+
+    @classmethod
+    def from_product_orders_row(cls, row: Dict) -> 'ProductOrder':
+        """product_orders 테이블 행(order_headers 조인 포함)을 레코드로 변환 - 컬럼 이름은 필드 이름과 같음"""
+        return cls(
+            product_order_id=row.get('product_order_id') or '',
+            order_id=row.get('order_id') or '',
+            order_date=parse_datetime(row.get('order_date')),
+            status=row.get('status') or '',
+            claim_status=row.get('claim_status') or '',
+            claim_type=row.get('claim_type') or '',
+            orderer_name=row.get('orderer_name') or '',
+            orderer_tel=row.get('orderer_tel') or '',
+            product_name=row.get('product_name') or '',
+            product_option=row.get('product_option') or '',
+            seller_product_code=row.get('seller_product_code') or '',
+            quantity=to_int(row.get('quantity'), 1),
+            unit_price=to_int(row.get('unit_price')),
+            discount_amount=to_int(row.get('discount_amount')),
+            total_amount=to_int(row.get('total_amount')),
+            payment_means=row.get('payment_means') or '',
+            base_address=row.get('base_address') or '',
+            detailed_address=row.get('detailed_address') or '',
+            shipping_due_date=parse_datetime(row.get('shipping_due_date')),
+            shipping_memo=row.get('shipping_memo') or '',
+            delivery_company=row.get('delivery_company') or '',
+            tracking_number=row.get('tracking_number') or ''
+        )
+
+    @property
+    def shipping_address(self) -> str:
+        """배송지 주소 (기본 주소 + 상세 주소)"""
+        return f"{self.base_address} {self.detailed_address}".strip()
+
+    def matches(self, statuses) -> bool:
+        """상품주문 상태나 클레임 상태가 statuses에 포함되면 True (statuses가 비어 있으면 항상 True)"""
+        if not statuses:
+            return True
+        return self.status in statuses or (bool(self.claim_status) and self.claim_status in statuses)
+
+    def to_db_dict(self) -> Dict:
+        """orders 테이블 저장 형식 (DatabaseManager.add_order 입력)"""
+        return {
+            'order_id': self.order_id,
+            'order_date': self.order_date.isoformat() if self.order_date else '',
+            'customer_name': self.orderer_name,
+            'customer_phone': self.orderer_tel,
+            'product_name': self.product_name,
+            'quantity': self.quantity,
+            'price': self.total_amount,
+            'status': self.status or '신규주문',
+            'shipping_company': self.delivery_company,
+            'tracking_number': self.tracking_number,
+            'memo': self.shipping_memo,
+            'product_order_id': self.product_order_id,
+            'shipping_due_date': self.shipping_due_date.isoformat() if self.shipping_due_date else '',
+            'product_option': self.product_option
+        }
+
+    def __repr__(self) -> str:
+        return f"ProductOrder({self.product_order_id!r}, order_id={self.order_id!r}, status={self.status!r})"
+
+
+def parse_product_orders(items: Iterable[Dict]) -> List[ProductOrder]:
+    """네이버 주문 응답 항목 목록을 레코드 목록으로 변환 (변환할 수 없는 항목은 제외)"""
+    records = []
+    for item in items or ():
+        record = item if isinstance(item, ProductOrder) else ProductOrder.from_api(item)
+        if record is not None:
+            records.append(record)
+    return records
@@ -0,0 +1,215 @@
+"""
+상품 카탈로그 전체 동기화 모듈 (products/search 페이지 순회 + 채널상품/원상품 상세 병렬 조회)
+"""
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from naver_api_base import PRODUCT_SEARCH_MAX_SIZE
+
+DETAIL_SOURCES = ('channel', 'origin')  # 상세 조회 엔드포인트 (channel-products / origin-products)
+
+
+def product_rows(search_item: Dict) -> List[Dict]:
+    """products/search 응답 항목을 products 테이블 형식 목록으로 변환 (채널상품마다 1행)"""
+    origin_product_no = search_item.get('originProductNo')
+    rows = []
+    for channel_product in search_item.get('channelProducts') or []:
+        if not isinstance(channel_product, dict) or not channel_product.get('channelProductNo'):
+            continue
+        whole_category_name = channel_product.get('wholeCategoryName') or ''
+        rows.append({
+            'origin_product_no': str(origin_product_no) if origin_product_no else None,
+            'channel_product_no': str(channel_product.get('channelProductNo')),
+            'product_name': channel_product.get('name'),
+            'status_type': channel_product.get('statusType'),
+            'sale_price': channel_product.get('salePrice', 0),
+            'discounted_price': channel_product.get('discountedPrice', 0),
+            'stock_quantity': channel_product.get('stockQuantity', 0),
+            'category_id': channel_product.get('categoryId'),
+            'category_name': whole_category_name.split('>')[-1] if whole_category_name else '',
+            'brand_name': channel_product.get('brandName'),
+            'manufacturer_name': channel_product.get('manufacturerName'),
+            'model_name': channel_product.get('modelName'),
+            'seller_management_code': channel_product.get('sellerManagementCode'),
+            'reg_date': channel_product.get('regDate'),
+            'modified_date': channel_product.get('modifiedDate'),
+            'representative_image_url': (channel_product.get('representativeImage') or {}).get('url'),
+            'whole_category_name': channel_product.get('wholeCategoryName'),
+            'whole_category_id': channel_product.get('wholeCategoryId'),
+            'delivery_fee': channel_product.get('deliveryFee', 0),
+            'return_fee': channel_product.get('returnFee', 0),
+            'exchange_fee': channel_product.get('exchangeFee', 0),
+            'discount_method': '',
+            'customer_benefit': ''
+        })
+    return rows
+
+
+def detail_fields(detail: Dict) -> Dict:
+    """채널상품/원상품 상세 응답에서 목록 조회에 없는 배송비/혜택 정보 추출"""
+    origin_product = (detail or {}).get('originProduct') or {}
+    delivery_info = origin_product.get('deliveryInfo') or {}
+    delivery_fee = delivery_info.get('deliveryFee') or {}
+    claim_info = delivery_info.get('claimDeliveryInfo') or {}
+    customer_benefit = origin_product.get('customerBenefit') or {}
+    discount_policy = customer_benefit.get('immediateDiscountPolicy') or {}
+
+    fields = {}
+    if 'baseFee' in delivery_fee:
+        fields['delivery_fee'] = delivery_fee.get('baseFee') or 0
+    if 'returnDeliveryFee' in claim_info:
+        fields['return_fee'] = claim_info.get('returnDeliveryFee') or 0
+    if 'exchangeDeliveryFee' in claim_info:
+        fields['exchange_fee'] = claim_info.get('exchangeDeliveryFee') or 0
+    if discount_policy.get('discountMethod'):
+        fields['discount_method'] = json.dumps(discount_policy['discountMethod'], ensure_ascii=False)
+    if customer_benefit:
+        fields['customer_benefit'] = json.dumps(customer_benefit, ensure_ascii=False)
+    return fields
+
+
+class ProductCatalogSync:
+    """스토어 전체 상품을 DB에 동기화
+
+    1. products/search를 최대 페이지 크기로 첫 페이지 조회 후 나머지 페이지를 병렬 조회
+    2. DB에 저장된 modifiedDate와 같은 상품은 변경 없음으로 건너뜀 (force=True면 모두 비교)
+    3. enrich=True면 변경된 상품의 채널상품(또는 원상품) 상세를 병렬 조회해 배송비/혜택 정보 보강
+    4. 변경된 상품을 upsert_products로 저장 (내용 해시가 같은 상품은 쓰지 않음)
+    요청 속도는 API 클라이언트의 공유 속도 제한기가 제어한다.
+    """
+
+    def __init__(self, naver_api, db_manager, page_size: int = PRODUCT_SEARCH_MAX_SIZE, max_workers: int = None,
+                 detail_source: str = 'channel'):
+        self.naver_api = naver_api
+        self.db_manager = db_manager
+        self.page_size = max(1, min(int(page_size), PRODUCT_SEARCH_MAX_SIZE))
+        self.max_workers = max(1, int(max_workers or getattr(naver_api, 'window_workers', 4)))
+        self.detail_source = detail_source if detail_source in DETAIL_SOURCES else 'channel'
+        self._sync_lock = threading.Lock()  # 상품 탭/홈 탭 동시 실행 방지
+        self.last_stats = {}
+
+    def sync(self, product_status_types: list = None, enrich: bool = False, force: bool = False) -> Dict:
+        """전체 상품 조회 후 변경된 상품만 DB에 저장
+
+        반환: {'success', 'products': [search 응답 항목, ...], 'stats': {'pages', 'products', 'saved', 'skipped', ...}}
+        """
+        with self._sync_lock:
+            return self._sync(product_status_types, enrich, force)
+
+    def _sync(self, product_status_types: Optional[list], enrich: bool, force: bool) -> Dict:
+        started = time.time()
+        items, pages, failed_pages = self._fetch_all_pages(product_status_types)
+
+        rows = [row for item in items for row in product_rows(item)]
+        known = {} if force else self.db_manager.get_product_modified_dates()
+        changed = [row for row in rows
+                   if force or not row['modified_date'] or known.get(row['channel_product_no']) != row['modified_date']]
+        skipped = len(rows) - len(changed)
+
+        enriched = self._enrich(changed) if enrich and changed else 0
+        upserted = self.db_manager.upsert_products(changed) if changed else {}
+        saved = upserted.get('inserted', 0) + upserted.get('updated', 0)
+        unchanged = upserted.get('unchanged', 0)  # 수정일은 다르지만 저장할 내용은 같은 상품
+
+        self.last_stats = {
+            'pages': pages,
+            'failed_pages': failed_pages,
+            'products': len(rows),
+            'changed': len(changed),
+            'skipped': skipped,
+            'enriched': enriched,
+            'saved': saved,
+            'unchanged': unchanged,
+            'failed': upserted.get('failed', 0),
+            'elapsed': round(time.time() - started, 3)
+        }
+        print(f"상품 동기화 완료: {pages}페이지, 상품 {len(rows)}개, 저장 {saved}개, 변경 없음 {skipped + unchanged}개"
+              f"{f', 상세 보강 {enriched}개' if enrich else ''}"
+              f"{f', 실패 페이지 {failed_pages}' if failed_pages else ''} ({self.last_stats['elapsed']:.2f}초)")
+
+        return {
+            'success': not failed_pages and not upserted.get('failed'),
+            'products': items,
+            'stats': dict(self.last_stats)
+        }
+
+    def _fetch_all_pages(self, product_status_types: Optional[list]) -> tuple:
+        """products/search 전체 페이지 조회 - (항목 목록, 조회한 페이지 수, 실패한 페이지 목록)"""
+        first = self._fetch_page(1, product_status_types)
+        if first is None:
+            return [], 1, [1]
+
+        contents, total_pages = first
+        items = list(contents)
+        remaining = list(range(2, total_pages + 1))
+        failed_pages = []
+
+        if remaining:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(remaining))) as executor:
+                results = list(executor.map(lambda page: self._fetch_page(page, product_status_types), remaining))
+            # 페이지 순서대로 병합
+            for page, result in zip(remaining, results):
+                if result is None:
+                    failed_pages.append(page)
+                else:
+                    items.extend(result[0])
+
+        return items, total_pages, failed_pages
+
+    def _fetch_page(self, page: int, product_status_types: Optional[list]):
+        """한 페이지 조회 - (항목 목록, 전체 페이지 수) 또는 실패 시 None"""
+        try:
+            response = self.naver_api.get_products(limit=self.page_size, product_status_types=product_status_types, page=page)
+        except Exception as e:
+            print(f"  → 상품 목록 {page}페이지 조회 오류: {e}")
+            return None
+
+        if not response or not response.get('success'):
+            print(f"  → 상품 목록 {page}페이지 조회 실패: {response.get('error', '알 수 없는 오류') if response else '응답 없음'}")
+            return None
+
+        data = response.get('data') or {}
+        contents = [item for item in data.get('contents') or [] if isinstance(item, dict)]
+        total_pages = data.get('totalPages')
+        if not total_pages:
+            total_elements = data.get('totalElements') or len(contents)
+            total_pages = (total_elements + self.page_size - 1) // self.page_size
+        return contents, max(1, int(total_pages))
+
+    def _enrich(self, rows: List[Dict]) -> int:
+        """변경된 상품의 상세를 병렬 조회해 행에 반영 - 보강한 행 수 반환
+
+        원상품 기준이면 같은 원상품의 채널상품은 한 번만 조회한다.
+        """
+        if self.detail_source == 'origin':
+            keys = list(dict.fromkeys(row['origin_product_no'] for row in rows if row['origin_product_no']))
+            fetch = self.naver_api.get_origin_product
+            key_of = lambda row: row['origin_product_no']
+        else:
+            keys = [row['channel_product_no'] for row in rows]
+            fetch = self.naver_api.get_channel_product
+            key_of = lambda row: row['channel_product_no']
+
+        def fetch_detail(key):
+            try:
+                response = fetch(key)
+            except Exception as e:
+                print(f"  → 상품 상세 조회 오류 ({key}): {e}")
+                return None
+            if not response or not response.get('success'):
+                return None
+            return detail_fields(response.get('data'))
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(keys)))) as executor:
+            details = dict(zip(keys, executor.map(fetch_detail, keys)))
+
+        enriched = 0
+        for row in rows:
+            fields = details.get(key_of(row))
+            if fields:
+                row.update(fields)
+                enriched += 1
+        return enriched
@@ -0,0 +1,165 @@
+"""
+네이버 커머스 API 호출 속도 제한 모듈
+"""
+import time
+import asyncio
+import threading
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """적응형 토큰 버킷 (AIMD) - 여러 스레드가 하나의 요청 예산을 공유
+
+    성공 시 초당 요청 수를 조금씩 늘리고(additive increase),
+    429/요청 제한 응답을 받으면 절반으로 줄인다(multiplicative decrease).
+    """
+
+    def __init__(self, rate: float = 4.0, burst: int = None, min_rate: float = 0.5, max_rate: float = None,
+                 increase_step: float = 0.5, decrease_factor: float = 0.5):
+        self._lock = threading.Lock()
+        self._tokens = 0.0
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0  # Retry-After 로 지정된 재개 시각
+        self._last_decrease = 0.0
+        self._waiting = 0
+        self._acquired = 0
+        self._throttled = 0
+        self.configure(rate, burst, min_rate, max_rate, increase_step, decrease_factor)
+        self._tokens = self.capacity
+
+    def configure(self, rate: float = 4.0, burst: int = None, min_rate: float = 0.5, max_rate: float = None,
+                  increase_step: float = 0.5, decrease_factor: float = 0.5):
+        """속도 설정 변경 (설정 화면 등에서 명시적으로 호출)
+
+        이미 사용 중인 제한기는 요청 제한 응답으로 낮춘 현재 속도를 유지하고, 새 rate가 더 낮을 때만 낮춘다.
+        """
+        with self._lock:
+            current = getattr(self, 'rate', None)
+            self.min_rate = max(0.1, float(min_rate))
+            self.max_rate = max(self.min_rate, float(max_rate or rate * 2))
+            rate = float(rate) if current is None else min(current, float(rate))
+            self.rate = min(self.max_rate, max(self.min_rate, rate))  # 현재 초당 허용 요청 수
+            self.capacity = float(burst or max(1, int(rate)))
+            self.increase_step = increase_step
+            self.decrease_factor = decrease_factor
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 보충"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _reserve(self) -> Optional[float]:
+        """토큰 1개 획득 시도 - 성공하면 None, 부족하면 필요한 대기 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._acquired += 1
+                return None
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """요청 1회분의 토큰 획득 (부족하면 대기) - 대기한 시간(초) 반환"""
+        waited = 0.0
+        with self._lock:
+            self._waiting += 1
+        try:
+            while True:
+                wait_time = self._reserve()
+                if wait_time is None:
+                    return waited
+                time.sleep(wait_time)
+                waited += wait_time
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    async def acquire_async(self) -> float:
+        """acquire의 asyncio 버전 - 스레드를 막지 않고 이벤트 루프에서 대기"""
+        waited = 0.0
+        with self._lock:
+            self._waiting += 1
+        try:
+            while True:
+                wait_time = self._reserve()
+                if wait_time is None:
+                    return waited
+                await asyncio.sleep(wait_time)
+                waited += wait_time
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def on_success(self):
+        """성공 응답 - 요청 속도를 선형으로 증가 (초당 약 increase_step 만큼)"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase_step / self.rate)
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """요청 제한 응답 - 요청 속도를 배수로 감소하고 Retry-After 동안 모든 요청 중지"""
+        with self._lock:
+            now = time.monotonic()
+            self._throttled += 1
+            # 같은 혼잡 구간에서 동시에 받은 429로 여러 번 감소하지 않도록 1초 간격 제한
+            if now - self._last_decrease >= 1.0:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self._last_decrease = now
+                self._tokens = 0.0
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self._blocked_until = max(self._blocked_until, now + pause)
+
+    @property
+    def queue_depth(self) -> int:
+        """토큰을 기다리고 있는 요청 수"""
+        return self._waiting
+
+    def get_stats(self) -> Dict:
+        """현재 속도 제한 상태 조회"""
+        with self._lock:
+            return {
+                'rate': round(self.rate, 2),
+                'min_rate': self.min_rate,
+                'max_rate': self.max_rate,
+                'queue_depth': self._waiting,
+                'acquired': self._acquired,
+                'throttled': self._throttled,
+                'blocked_for': round(max(0.0, self._blocked_until - time.monotonic()), 2)
+            }
+
+
+# 프로세스 전체에서 공유하는 속도 제한기 (모든 탭, 백그라운드 모니터, 재초기화된 API 클라이언트 공통)
+_shared_limiter = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(rate: float = None) -> RateLimiter:
+    """공유 속도 제한기 반환 (싱글톤 패턴)
+
+    rate는 처음 생성할 때만 적용된다 - 나중에 만든 클라이언트가 적응된 속도를 초기화하거나
+    다른 클라이언트의 설정을 덮어쓰지 않도록 (설정 변경은 configure를 명시적으로 호출).
+    """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(rate) if rate else RateLimiter()
+        return _shared_limiter
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초 단위로 변환"""
+    if value is None or value == '':
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        retry_at = parsedate_to_datetime(str(value))
+        return max(0.0, retry_at.timestamp() - time.time())
+    except Exception:
+        return None
@@ -0,0 +1,154 @@
+"""
+네이버 커머스 API 응답 캐시 모듈 (TTL + LRU, 선택적 SQLite 저장)
+"""
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """스레드 안전한 TTL/LRU 응답 캐시
+
+    메모리에 최대 max_entries 개를 보관하고 오래 사용하지 않은 항목부터 제거한다.
+    db_path를 지정하면 SQLite 파일에도 저장하여 재시작 후에도 캐시를 유지한다.
+    """
+
+    def __init__(self, max_entries: int = 512, db_path: str = None):
+        self.max_entries = max(1, int(max_entries))
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (만료 시각, 값)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        if self.db_path:
+            self._init_db()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시 조회 - 없거나 만료되었으면 None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry:
+                del self._entries[key]
+
+        # 메모리에 없으면 디스크 캐시 확인
+        value = self._load_from_db(key, now) if self.db_path else None
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._put_memory(key, value[0], value[1])
+            return value[1]
+
+    def set(self, key: str, value: Dict, ttl: float):
+        """캐시 저장 (ttl 초 동안 유효)"""
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._put_memory(key, expires_at, value)
+        if self.db_path:
+            self._save_to_db(key, value, expires_at)
+
+    def invalidate(self, prefix: str = None) -> int:
+        """prefix로 시작하는 캐시 항목 삭제 (None이면 전체) - 삭제한 메모리 항목 수 반환"""
+        with self._lock:
+            keys = [key for key in self._entries if prefix is None or key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += 1
+        if self.db_path:
+            self._delete_from_db(prefix)
+        return len(keys)
+
+    def get_stats(self) -> Dict:
+        """캐시 적중/실패 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 3) if lookups else 0.0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'persistent': bool(self.db_path)
+            }
+
+    def _put_memory(self, key: str, expires_at: float, value: Dict):
+        """메모리 캐시에 저장 (잠금 상태에서 호출) - 용량 초과 시 LRU 제거"""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _init_db(self):
+        """디스크 캐시 테이블 생성 및 만료 항목 정리"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            ''')
+            cursor.execute('DELETE FROM response_cache WHERE expires_at <= ?', (time.time(),))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"응답 캐시 초기화 오류: {e}")
+            self.db_path = None
+
+    def _load_from_db(self, key: str, now: float) -> Optional[tuple]:
+        """디스크 캐시 조회 - (만료 시각, 값) 또는 None"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('SELECT value, expires_at FROM response_cache WHERE key = ? AND expires_at > ?', (key, now))
+            row = cursor.fetchone()
+            conn.close()
+            if row:
+                return row[1], json.loads(row[0])
+        except Exception as e:
+            print(f"응답 캐시 조회 오류: {e}")
+        return None
+
+    def _save_to_db(self, key: str, value: Dict, expires_at: float):
+        """디스크 캐시 저장"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO response_cache (key, value, expires_at)
+                VALUES (?, ?, ?)
+            ''', (key, json.dumps(value, ensure_ascii=False, default=str), expires_at))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"응답 캐시 저장 오류: {e}")
+
+    def _delete_from_db(self, prefix: str = None):
+        """디스크 캐시 삭제"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            if prefix is None:
+                cursor.execute('DELETE FROM response_cache')
+            else:
+                cursor.execute('DELETE FROM response_cache WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"응답 캐시 삭제 오류: {e}")
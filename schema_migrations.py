@@ -0,0 +1,256 @@
+"""
+SQLite 스키마 마이그레이션 모듈 (PRAGMA user_version 기준)
+
+데스크톱 앱(DatabaseManager)과 api_server(create_tables)가 같은 마이그레이션을 사용한다.
+새 스키마 변경은 MIGRATIONS 끝에 다음 번호로 추가한다 (이미 배포된 마이그레이션은 수정하지 않음).
+"""
+import sqlite3
+from typing import Callable, List, Tuple, Union
+
+
+def add_columns(table: str, columns: List[Tuple[str, str]]) -> Callable[[sqlite3.Connection], None]:
+    """없는 컬럼만 추가하는 마이그레이션 단계 (이전 버전에서 이미 추가된 DB 호환)"""
+    def step(conn: sqlite3.Connection):
+        existing = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+        for column_name, column_type in columns:
+            if column_name not in existing:
+                conn.execute(f'ALTER TABLE {table} ADD COLUMN {column_name} {column_type}')
+    return step
+
+
+# (버전, 설명, [SQL 문 또는 step(conn)])
+MIGRATIONS: List[Tuple[int, str, List[Union[str, Callable]]]] = [
+    (1, '기본 테이블', [
+        '''
+        CREATE TABLE IF NOT EXISTS orders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            order_id TEXT UNIQUE NOT NULL,
+            order_date TEXT NOT NULL,
+            customer_name TEXT,
+            customer_phone TEXT,
+            product_name TEXT,
+            quantity INTEGER,
+            price INTEGER,
+            status TEXT DEFAULT '신규주문',
+            shipping_company TEXT,
+            tracking_number TEXT,
+            memo TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS products (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel_product_no TEXT UNIQUE NOT NULL,
+            origin_product_no TEXT,
+            product_name TEXT NOT NULL,
+            status_type TEXT,
+            sale_price INTEGER DEFAULT 0,
+            discounted_price INTEGER DEFAULT 0,
+            stock_quantity INTEGER DEFAULT 0,
+            category_id TEXT,
+            category_name TEXT,
+            brand_name TEXT,
+            manufacturer_name TEXT,
+            model_name TEXT,
+            seller_management_code TEXT,
+            reg_date TEXT,
+            modified_date TEXT,
+            representative_image_url TEXT,
+            whole_category_name TEXT,
+            whole_category_id TEXT,
+            delivery_fee INTEGER DEFAULT 0,
+            return_fee INTEGER DEFAULT 0,
+            exchange_fee INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS notification_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            order_id TEXT,
+            notification_type TEXT,
+            message TEXT,
+            sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        '''
+    ]),
+    (2, '상품 혜택/주문 상품주문 컬럼', [
+        add_columns('products', [('discount_method', 'TEXT'), ('customer_benefit', 'TEXT')]),
+        add_columns('orders', [('product_order_id', 'TEXT'), ('shipping_due_date', 'TEXT'), ('product_option', 'TEXT')])
+    ]),
+    (3, '발송 처리 대기열', [
+        # 처리 도중 종료되어도 남은 건부터 이어서 발송
+        '''
+        CREATE TABLE IF NOT EXISTS shipping_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            product_order_id TEXT UNIQUE NOT NULL,
+            delivery_company TEXT NOT NULL,
+            tracking_number TEXT NOT NULL,
+            status TEXT DEFAULT 'pending',
+            attempts INTEGER DEFAULT 0,
+            last_error TEXT,
+            next_attempt_at REAL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        '''
+    ]),
+    (4, '상품 내용 해시', [
+        add_columns('products', [('content_hash', 'TEXT')])
+    ]),
+    (5, '조회 경로별 보조 인덱스', [
+        # 상태별 주문 (status = ? ORDER BY order_date), 상태별 건수 (GROUP BY status)
+        'CREATE INDEX IF NOT EXISTS idx_orders_status_order_date ON orders (status, order_date)',
+        # 기간별 주문/기간 내 상태별 건수 (order_date 범위, status까지 인덱스에서 읽음)
+        'CREATE INDEX IF NOT EXISTS idx_orders_order_date_status ON orders (order_date, status)',
+        'CREATE INDEX IF NOT EXISTS idx_orders_product_order_id ON orders (product_order_id)',
+        'CREATE INDEX IF NOT EXISTS idx_orders_shipping_due_date ON orders (shipping_due_date)',
+        # 상태별 상품 (status_type = ? ORDER BY updated_at), 전체 상품 (ORDER BY updated_at)
+        'CREATE INDEX IF NOT EXISTS idx_products_status_updated_at ON products (status_type, updated_at)',
+        'CREATE INDEX IF NOT EXISTS idx_products_updated_at ON products (updated_at)',
+        # 상품 동기화의 수정일 비교 (테이블 대신 인덱스만 읽음)
+        'CREATE INDEX IF NOT EXISTS idx_products_modified_date ON products (channel_product_no, modified_date)',
+        # 발송 대기열 (status = 'pending' AND next_attempt_at <= ?)
+        'CREATE INDEX IF NOT EXISTS idx_shipping_outbox_status_due ON shipping_outbox (status, next_attempt_at)'
+    ]),
+    (6, '주문/상품주문 테이블 분리', [
+        # 주문(결제) 단위 정보 - 한 주문에 여러 상품주문
+        '''
+        CREATE TABLE IF NOT EXISTS order_headers (
+            order_id TEXT PRIMARY KEY,
+            order_date TEXT,
+            orderer_name TEXT,
+            orderer_tel TEXT,
+            payment_means TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        # 상품주문 단위 정보 (order_date는 기간 조회 인덱스용으로 order_headers와 같은 값을 함께 저장)
+        '''
+        CREATE TABLE IF NOT EXISTS product_orders (
+            product_order_id TEXT PRIMARY KEY,
+            order_id TEXT NOT NULL REFERENCES order_headers (order_id),
+            order_date TEXT,
+            status TEXT,
+            claim_type TEXT,
+            claim_status TEXT,
+            product_name TEXT,
+            product_option TEXT,
+            seller_product_code TEXT,
+            quantity INTEGER DEFAULT 1,
+            unit_price INTEGER DEFAULT 0,
+            discount_amount INTEGER DEFAULT 0,
+            total_amount INTEGER DEFAULT 0,
+            base_address TEXT,
+            detailed_address TEXT,
+            shipping_due_date TEXT,
+            shipping_memo TEXT,
+            delivery_company TEXT,
+            tracking_number TEXT,
+            last_changed_date TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_product_orders_status_order_date ON product_orders (status, order_date)',
+        'CREATE INDEX IF NOT EXISTS idx_product_orders_claim_status_order_date ON product_orders (claim_status, order_date)',
+        'CREATE INDEX IF NOT EXISTS idx_product_orders_order_date ON product_orders (order_date)',
+        'CREATE INDEX IF NOT EXISTS idx_product_orders_order_id ON product_orders (order_id)',
+        'CREATE INDEX IF NOT EXISTS idx_product_orders_shipping_due_date ON product_orders (shipping_due_date)',
+        'CREATE INDEX IF NOT EXISTS idx_product_orders_last_changed_date ON product_orders (last_changed_date)',
+        # 기존 orders 데이터 이전 (상품주문 ID가 없는 이전 행은 주문 ID를 상품주문 ID로 사용)
+        '''
+        INSERT OR IGNORE INTO order_headers (order_id, order_date, orderer_name, orderer_tel, created_at, updated_at)
+        SELECT order_id, order_date, customer_name, customer_phone, created_at, updated_at FROM orders
+        ''',
+        '''
+        INSERT OR IGNORE INTO product_orders (
+            product_order_id, order_id, order_date, status, product_name, product_option, quantity,
+            total_amount, shipping_due_date, shipping_memo, delivery_company, tracking_number, created_at, updated_at
+        )
+        SELECT COALESCE(NULLIF(product_order_id, ''), order_id), order_id, order_date, status, product_name,
+               product_option, COALESCE(quantity, 1), COALESCE(price, 0), NULLIF(shipping_due_date, ''), memo,
+               shipping_company, tracking_number, created_at, updated_at
+        FROM orders
+        '''
+    ]),
+    (7, '상품주문 원본 응답 압축 보관', [
+        # payload: 코덱(codec)으로 압축한 JSON, content_hash: 압축 전 JSON의 sha1 (변경 없는 문서는 다시 쓰지 않음)
+        '''
+        CREATE TABLE IF NOT EXISTS order_documents (
+            product_order_id TEXT PRIMARY KEY,
+            order_id TEXT,
+            last_changed_date TEXT,
+            codec TEXT NOT NULL,
+            raw_size INTEGER DEFAULT 0,
+            content_hash TEXT,
+            payload BLOB NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_order_documents_order_id ON order_documents (order_id)',
+        'CREATE INDEX IF NOT EXISTS idx_order_documents_last_changed_date ON order_documents (last_changed_date)'
+    ]),
+    (8, '클레임 상태 인덱스에 상품주문 상태 포함', [
+        # 상태별 건수에서 두 상태가 같은 상품주문 수를 인덱스만 읽어서 계산
+        'CREATE INDEX IF NOT EXISTS idx_product_orders_claim_status_order_date_status '
+        'ON product_orders (claim_status, order_date, status)',
+        'DROP INDEX IF EXISTS idx_product_orders_claim_status_order_date'
+    ]),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """DB에 기록된 스키마 버전 (PRAGMA user_version)"""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """현재 버전 이후의 마이그레이션을 하나씩 각각의 트랜잭션으로 적용 - 적용한 개수 반환
+
+    이미 최신이면 PRAGMA 조회 한 번으로 끝난다.
+    다른 프로세스가 동시에 마이그레이션해도 BEGIN IMMEDIATE 후 버전을 다시 확인하므로 중복 적용되지 않는다.
+    """
+    if get_schema_version(conn) >= SCHEMA_VERSION:
+        return 0
+
+    if conn.in_transaction:
+        conn.commit()
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None  # BEGIN/COMMIT을 직접 관리
+    applied = 0
+    try:
+        for version, description, steps in MIGRATIONS:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                if get_schema_version(conn) >= version:
+                    conn.execute('COMMIT')
+                    continue
+                for step in steps:
+                    if callable(step):
+                        step(conn)
+                    else:
+                        conn.execute(step)
+                conn.execute(f'PRAGMA user_version = {int(version)}')
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            applied += 1
+            print(f"스키마 마이그레이션 {version} 적용: {description}")
+    finally:
+        conn.isolation_level = isolation_level
+    return applied
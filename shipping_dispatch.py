@@ -0,0 +1,218 @@
+"""
+발송 처리 일괄 전송 모듈 (검증 → 대기열(outbox) 저장 → 배치 병렬 전송 → 실패 건만 재시도)
+"""
+import re
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from naver_api_base import DISPATCH_BATCH_SIZE
+
+TRACKING_NUMBER_PATTERN = re.compile(r'^[0-9A-Za-z]{6,30}$')
+
+
+def normalize_shipment(row: Dict) -> Dict:
+    """입력 행({'productOrderId'/'product_order_id', 택배사, 송장번호})을 대기열 형식으로 정리"""
+    product_order_id = row.get('product_order_id') or row.get('productOrderId') or row.get('상품주문ID') or ''
+    delivery_company = row.get('delivery_company') or row.get('deliveryCompanyCode') or row.get('택배사') or ''
+    tracking_number = row.get('tracking_number') or row.get('trackingNumber') or row.get('송장번호') or ''
+    return {
+        'product_order_id': str(product_order_id).strip(),
+        'delivery_company': str(delivery_company).strip().upper(),
+        # 송장번호의 공백/하이픈 제거
+        'tracking_number': re.sub(r'[\s-]', '', str(tracking_number))
+    }
+
+
+class ShippingDispatcher:
+    """발송 처리 파이프라인
+
+    1. validate()로 입력 행 검증 (필수값, 송장번호 형식, 택배사 코드, 중복 상품주문)
+    2. 유효한 행을 shipping_outbox 테이블에 저장 (처리 도중 종료되어도 다음 실행에서 이어서 발송)
+    3. 대기 건을 DISPATCH_BATCH_SIZE 단위로 나눠 병렬 전송 (요청 속도는 공유 속도 제한기가 제어)
+    4. 응답의 실패 건만 지수 백오프 후 재시도, max_attempts회 실패하면 failed로 남김
+       - 서킷 브레이커 차단/요청 제한으로 보내지 못한 배치는 시도 횟수를 늘리지 않고 복구 시각까지 보류
+    """
+
+    def __init__(self, naver_api, db_manager, batch_size: int = DISPATCH_BATCH_SIZE, max_workers: int = None,
+                 max_attempts: int = 3, retry_delay: float = 2.0):
+        self.naver_api = naver_api
+        self.db_manager = db_manager
+        self.batch_size = max(1, min(int(batch_size), DISPATCH_BATCH_SIZE))
+        self.max_workers = max(1, int(max_workers or getattr(naver_api, 'window_workers', 4)))
+        self.max_attempts = max(1, int(max_attempts))
+        self.retry_delay = retry_delay  # 첫 재시도 대기 시간 (초), 이후 2배씩 증가
+        self._run_lock = threading.Lock()
+        self._known_companies = None
+        self.last_stats = {}
+
+    def known_delivery_companies(self) -> Optional[set]:
+        """택배사 코드 목록 (조회 실패 시 None - 택배사 코드 검증 생략)"""
+        if self._known_companies is None:
+            try:
+                response = self.naver_api.get_delivery_companies()
+                data = response.get('data') if response and response.get('success') else None
+                companies = data.get('data') if isinstance(data, dict) else data
+                if isinstance(companies, list):
+                    self._known_companies = {str(company.get('code') or company.get('deliveryCompanyCode')).upper()
+                                             for company in companies if isinstance(company, dict)}
+            except Exception as e:
+                print(f"택배사 목록 조회 오류: {e}")
+        return self._known_companies or None
+
+    def validate(self, rows: Iterable[Dict]) -> tuple:
+        """입력 행 검증 - (유효한 행 목록, [(입력 행, 오류 사유), ...])
+
+        같은 상품주문 ID가 여러 번 있으면 마지막 행을 사용한다.
+        """
+        known_companies = self.known_delivery_companies()
+        valid = {}
+        invalid = []
+        for row in rows:
+            shipment = normalize_shipment(row)
+            if not shipment['product_order_id']:
+                invalid.append((row, '상품주문 ID 없음'))
+            elif not shipment['delivery_company']:
+                invalid.append((row, '택배사 없음'))
+            elif known_companies and shipment['delivery_company'] not in known_companies:
+                invalid.append((row, f"알 수 없는 택배사 코드: {shipment['delivery_company']}"))
+            elif not TRACKING_NUMBER_PATTERN.match(shipment['tracking_number']):
+                invalid.append((row, f"송장번호 형식 오류: {shipment['tracking_number'] or '(없음)'}"))
+            else:
+                valid.pop(shipment['product_order_id'], None)
+                valid[shipment['product_order_id']] = shipment
+        return list(valid.values()), invalid
+
+    def enqueue(self, rows: Iterable[Dict]) -> Dict:
+        """검증 후 대기열에 저장 - {'queued', 'invalid': [(입력 행, 사유), ...]}"""
+        shipments, invalid = self.validate(rows)
+        queued = self.db_manager.enqueue_shipments(shipments)
+        if invalid:
+            print(f"발송 입력 검증: 유효 {len(shipments)}건, 오류 {len(invalid)}건")
+        return {'queued': queued, 'invalid': invalid}
+
+    def dispatch(self, rows: Iterable[Dict], on_progress=None) -> Dict:
+        """입력 행을 대기열에 저장하고 바로 발송"""
+        enqueued = self.enqueue(rows)
+        result = self.run(on_progress=on_progress)
+        result['invalid'] = enqueued['invalid']
+        return result
+
+    def run(self, on_progress=None, wait_for_retries: bool = True) -> Dict:
+        """대기열의 발송 건을 모두 처리 (이전 실행에서 중단된 건 포함)
+
+        wait_for_retries가 False이면 재시도 대기 중인 건은 다음 실행으로 넘긴다.
+        on_progress(stats)는 배치 묶음을 처리할 때마다 호출된다.
+        """
+        with self._run_lock:
+            started = time.time()
+            resumed = self.db_manager.reset_inflight_shipments()
+            if resumed:
+                print(f"발송 대기열: 이전 실행에서 중단된 {resumed}건 재개")
+
+            stats = {'sent': 0, 'retried': 0, 'deferred': 0, 'failed': 0, 'requests': 0, 'resumed': resumed}
+            while True:
+                due = self.db_manager.claim_due_shipments(time.time())
+                if not due:
+                    next_due = self.db_manager.get_next_shipment_due()
+                    if next_due is None or not wait_for_retries:
+                        break
+                    time.sleep(max(0.0, min(next_due - time.time(), self.retry_delay * 2 ** self.max_attempts)))
+                    continue
+
+                self._dispatch_rows(due, stats)
+                if on_progress:
+                    try:
+                        on_progress(dict(stats))
+                    except Exception as e:
+                        print(f"발송 진행 이벤트 처리 오류: {e}")
+
+            stats['pending'] = self.db_manager.get_shipping_outbox_counts().get('pending', 0)
+            stats['elapsed'] = round(time.time() - started, 3)
+            self.last_stats = stats
+            print(f"발송 처리 완료: 성공 {stats['sent']}건, 실패 {stats['failed']}건, 재시도 {stats['retried']}건, 보류 {stats['deferred']}건 "
+                  f"({stats['requests']}회 요청, {stats['elapsed']:.2f}초)")
+            return dict(stats, success=stats['failed'] == 0 and stats['pending'] == 0)
+
+    def _dispatch_rows(self, rows: List[Dict], stats: Dict):
+        """대기 건을 배치로 나눠 병렬 전송하고 결과 반영"""
+        batches = [rows[offset:offset + self.batch_size] for offset in range(0, len(rows), self.batch_size)]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+            results = list(executor.map(self._send_batch, batches))
+
+        succeeded = []
+        failures = []
+        now = time.time()
+        for batch, (success_ids, errors, retry_in) in zip(batches, results):
+            stats['requests'] += 1
+            if retry_in is not None:
+                # 요청이 거부된 배치는 시도로 세지 않고 차단이 풀릴 시각에 다시 보냄
+                error = next(iter(errors.values()), '')
+                self.db_manager.defer_shipments([row['product_order_id'] for row in batch], error, now + retry_in)
+                stats['deferred'] += len(batch)
+                continue
+            succeeded.extend(success_ids)
+            for row in batch:
+                error = errors.get(row['product_order_id'])
+                if error is None:
+                    continue
+                attempts = row['attempts'] + 1
+                if attempts >= self.max_attempts:
+                    failures.append((row['product_order_id'], error, None))
+                    stats['failed'] += 1
+                else:
+                    failures.append((row['product_order_id'], error, now + self.retry_delay * 2 ** (attempts - 1)))
+                    stats['retried'] += 1
+
+        if succeeded:
+            self.db_manager.complete_shipments(succeeded)
+            stats['sent'] += len(succeeded)
+        if failures:
+            self.db_manager.fail_shipments(failures)
+
+    def _send_batch(self, batch: List[Dict]) -> tuple:
+        """한 배치 전송 - (성공한 상품주문 ID 목록, {실패한 상품주문 ID: 사유}, 보류 시간)
+
+        서킷 브레이커 차단이나 요청 제한으로 거부되면 보류 시간(초)을, 그 외에는 None을 반환한다.
+        """
+        ids = [row['product_order_id'] for row in batch]
+        try:
+            response = self.naver_api.dispatch_product_orders([
+                {
+                    'productOrderId': row['product_order_id'],
+                    'deliveryCompanyCode': row['delivery_company'],
+                    'trackingNumber': row['tracking_number']
+                }
+                for row in batch
+            ])
+        except Exception as e:
+            return [], {product_order_id: str(e) for product_order_id in ids}, None
+
+        if not response or not response.get('success'):
+            error = (response.get('error') or response.get('message')) if response else '응답 없음'
+            retry_in = self._rejected_retry_in(response) if response else None
+            return [], {product_order_id: str(error) for product_order_id in ids}, retry_in
+
+        # 네이버 응답은 {'data': {'successProductOrderIds': [...], 'failProductOrderInfos': [...]}} 구조
+        data = response.get('data') or {}
+        if isinstance(data.get('data'), dict):
+            data = data['data']
+        errors = {str(info.get('productOrderId')): f"{info.get('code', '')} {info.get('message', '')}".strip()
+                  for info in data.get('failProductOrderInfos') or [] if isinstance(info, dict)}
+        success_ids = [str(i) for i in data.get('successProductOrderIds') or [] if str(i) not in errors]
+        if 'successProductOrderIds' not in data:
+            # 성공 목록이 없는 응답은 실패 목록에 없는 건을 모두 성공으로 처리
+            success_ids = [product_order_id for product_order_id in ids if product_order_id not in errors]
+        # 응답에 없는 건은 다시 보냄
+        reported = set(success_ids) | set(errors)
+        errors.update({product_order_id: '응답에 결과 없음' for product_order_id in ids if product_order_id not in reported})
+        return success_ids, errors, None
+
+    def _rejected_retry_in(self, response: Dict) -> Optional[float]:
+        """서킷 브레이커 차단/요청 제한 응답이면 다시 보낼 때까지 기다릴 시간 (초), 그 외 실패는 None"""
+        if not response.get('circuit_open') and not response.get('throttled'):
+            return None
+        circuit_breaker = getattr(self.naver_api, 'circuit_breaker', None)
+        retry_in = circuit_breaker.retry_in() if circuit_breaker is not None else 0.0
+        return retry_in or self.retry_delay
@@ -0,0 +1,96 @@
+"""
+동일한 동시 요청 병합 모듈 (single-flight)
+"""
+import copy
+import json
+import inspect
+import functools
+import threading
+from typing import Any, Callable, Dict
+
+
+class _Call:
+    """진행 중인 호출 1건 (완료 시 결과/예외를 대기자에게 전달)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출은 한 번만 실행하고 결과를 공유"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: str, func: Callable, *args, **kwargs) -> Any:
+        """key로 진행 중인 호출이 있으면 그 결과를 기다려 반환, 없으면 직접 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # 호출자마다 결과를 수정해도 서로 영향이 없도록 복사본 전달
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def get_stats(self) -> Dict:
+        """병합 통계 (실행된 호출 수, 다른 호출 결과를 공유한 호출 수)"""
+        with self._lock:
+            calls = self._executed + self._shared
+            return {
+                'calls': calls,
+                'executed': self._executed,
+                'deduplicated': self._shared,
+                'in_flight': len(self._calls),
+                'dedup_ratio': round(self._shared / calls, 3) if calls else 0.0
+            }
+
+
+def coalesce(method: Callable) -> Callable:
+    """인스턴스의 single_flight 그룹으로 같은 인자의 동시 호출을 하나로 병합하는 데코레이터
+
+    키는 메서드 이름 + 기본값을 채운 인자(정렬된 JSON)로 만들며,
+    인스턴스에 single_flight 속성이 없거나 None이면 그대로 실행한다.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        group = getattr(self, 'single_flight', None)
+        if group is None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = {name: value for name, value in bound.arguments.items() if name != 'self'}
+        key = f"{method.__name__}|{json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)}"
+        return group.do(key, method, self, *args, **kwargs)
+
+    return wrapper
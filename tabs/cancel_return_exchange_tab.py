@@ -7,6 +7,7 @@ from tkcalendar import DateEntry
 from datetime import datetime, timedelta
 import json
 
+from product_order import format_datetime
 from ui_utils import BaseTab, run_in_thread, enable_context_menu
 
 
@@ -20,6 +21,7 @@ class CancelReturnExchangeTab(BaseTab):
         self.is_first_load = True  # 첫 로드 여부
         self.create_tab()
         self.setup_copy_paste_bindings()
+        self.bind_order_detail(self.tree)
         self.update_order_status_display()
 
         # 탭 생성 후 저장된 주문 데이터 우선 로드
@@ -199,117 +201,19 @@ class CancelReturnExchangeTab(BaseTab):
             print(f"[DEBUG] 취소/반품/교환 탭 조회 기간: {start_date_str} ~ {end_date_str}")
             print(f"[DEBUG] 취소/반품/교환 탭 조회 상태: {order_status}")
 
-            # 전체 조회인 경우 다중 상태를 한 번에 조회
-            if order_status == "ALL_CRE":
-                # 다중 상태를 리스트로 전달하여 한 번에 조회
-                response = self.app.naver_api.get_orders(
-                    start_date=start_date_str,
-                    end_date=end_date_str,
-                    order_status=["CANCELED", "RETURNED", "EXCHANGED"],
-                    limit=100
-                )
-
-                if response and isinstance(response, dict):
-                    print(f"[DEBUG] 다중 상태 API 응답 구조: {list(response.keys()) if response else 'None'}")
-                    if 'data' in response:
-                        print(f"[DEBUG] response['data'] 구조: {list(response['data'].keys()) if isinstance(response['data'], dict) else type(response['data'])}")
-
-                    # 응답에서 실제 주문 데이터 추출
-                    if 'data' in response and 'data' in response['data']:
-                        orders = response['data']['data']
-                        print(f"[DEBUG] 다중 상태 - response['data']['data']에서 {len(orders)}건 추출")
-                    elif 'data' in response and 'orders' in response['data']:
-                        orders = response['data']['orders']
-                        print(f"[DEBUG] 다중 상태 - response['data']['orders']에서 {len(orders)}건 추출")
-                    elif 'orders' in response:
-                        orders = response['orders']
-                        print(f"[DEBUG] 다중 상태 - response['orders']에서 {len(orders)}건 추출")
-                    elif isinstance(response, list):
-                        orders = response
-                        print(f"[DEBUG] 다중 상태 - 직접 리스트에서 {len(orders)}건 추출")
-                    else:
-                        orders = []
-                        print(f"[DEBUG] 다중 상태 - 주문 데이터 찾을 수 없음")
-                else:
-                    orders = []
-            else:
-                # API 호출 (주문관리 탭과 동일한 방식)
-                response = self.app.naver_api.get_orders(
-                    start_date=start_date_str,
-                    end_date=end_date_str,
-                    order_status=order_status,
-                    limit=100
-                )
-
-                if response and isinstance(response, dict):
-                    print(f"[DEBUG] 단일 상태 API 응답 구조: {list(response.keys()) if response else 'None'}")
-                    if 'data' in response:
-                        print(f"[DEBUG] response['data'] 구조: {list(response['data'].keys()) if isinstance(response['data'], dict) else type(response['data'])}")
-
-                    # 응답에서 실제 주문 데이터 추출
-                    if 'data' in response and 'data' in response['data']:
-                        orders = response['data']['data']
-                        print(f"[DEBUG] 단일 상태 - response['data']['data']에서 {len(orders)}건 추출")
-                    elif 'data' in response and 'orders' in response['data']:
-                        orders = response['data']['orders']
-                        print(f"[DEBUG] 단일 상태 - response['data']['orders']에서 {len(orders)}건 추출")
-                    elif 'orders' in response:
-                        orders = response['orders']
-                        print(f"[DEBUG] 단일 상태 - response['orders']에서 {len(orders)}건 추출")
-                    elif isinstance(response, list):
-                        orders = response
-                        print(f"[DEBUG] 단일 상태 - 직접 리스트에서 {len(orders)}건 추출")
-                    else:
-                        orders = []
-                        print(f"[DEBUG] 단일 상태 - 주문 데이터 찾을 수 없음")
-                else:
-                    orders = []
-
-            # 주문관리 탭과 동일한 데이터 처리 방식
+            # 기간 내 전체 주문을 한 번 조회해 상태별로 분류한 결과 사용 (전체 조회는 세 상태를 함께 가져옴)
+            statuses = ["CANCELED", "RETURNED", "EXCHANGED"] if order_status == "ALL_CRE" else [order_status]
+            response = self.app.naver_api.get_orders_by_status(
+                start_date=start_date_str,
+                end_date=end_date_str,
+                statuses=statuses
+            )
+
+            # 상태별 분류 결과(ProductOrder)를 그대로 사용
             processed_orders = []
-            if orders and isinstance(orders, list):
-                for item in orders:
-                    if isinstance(item, dict) and 'content' in item:
-                        content = item['content']
-                        if 'order' in content and 'productOrder' in content:
-                            order_info = content['order']
-                            product_order = content['productOrder']
-
-                            # 배송예정일 포맷팅
-                            shipping_due_date = product_order.get('shippingDueDate', 'N/A')
-                            if shipping_due_date != 'N/A':
-                                try:
-                                    if 'T' in str(shipping_due_date):
-                                        dt = datetime.fromisoformat(str(shipping_due_date).replace('Z', '+00:00'))
-                                        shipping_due_date = dt.strftime('%Y-%m-%d')
-                                except:
-                                    pass
-
-                            # 배송지 주소 조합
-                            shipping_address = product_order.get('shippingAddress', {})
-                            base_address = shipping_address.get('baseAddress', '')
-                            detailed_address = shipping_address.get('detailedAddress', '')
-                            full_address = f"{base_address} {detailed_address}".strip()
-
-                            # 완전한 주문 데이터 객체 생성 (주문관리 탭과 동일)
-                            order_data = {
-                                'orderId': order_info.get('orderId'),
-                                'productOrderId': item.get('productOrderId'),
-                                'ordererName': order_info.get('ordererName'),
-                                'orderDate': order_info.get('orderDate'),
-                                'productName': product_order.get('productName'),
-                                'productOption': product_order.get('productOption', ''),
-                                'sellerProductCode': product_order.get('sellerProductCode', ''),
-                                'quantity': product_order.get('quantity'),
-                                'unitPrice': product_order.get('unitPrice'),
-                                'productDiscountAmount': product_order.get('productDiscountAmount'),
-                                'totalPaymentAmount': product_order.get('totalPaymentAmount'),
-                                'paymentMeans': order_info.get('paymentMeans', ''),
-                                'shippingAddress': full_address,
-                                'shippingDueDate': shipping_due_date,
-                                'productOrderStatus': product_order.get('productOrderStatus')
-                            }
-                            processed_orders.append(order_data)
+            if response and response.get('success'):
+                processed_orders = response['data']['data']
+            print(f"[DEBUG] 취소/반품/교환 탭 - {statuses} 상태 {len(processed_orders)}건 조회")
 
             if processed_orders:
                 self.last_api_orders = processed_orders
@@ -331,62 +235,50 @@ class CancelReturnExchangeTab(BaseTab):
         # 기존 데이터 클리어
         self.clear_tree()
 
-        for i, order in enumerate(orders):
-            print(f"[DEBUG] 주문 {i+1}: {order.keys() if isinstance(order, dict) else type(order)}")
+        self.tree_orders = {}
+        for order in orders:
             # 주문 데이터를 표시 컬럼에 맞게 변환
             row_data = self.convert_order_to_row(order)
-            print(f"[DEBUG] 변환된 행 데이터: {row_data[:3]}...")  # 처음 3개 컬럼만 출력
-            self.tree.insert("", "end", values=row_data)
+            item_id = self.tree.insert("", "end", values=row_data)
+            self.tree_orders[item_id] = order
 
         print(f"[DEBUG] 트리에 삽입 완료: 총 {len(self.tree.get_children())}개 행")
         self.last_orders_data = orders
 
     def convert_order_to_row(self, order):
-        """주문 데이터를 행 데이터로 변환 (이미 처리된 데이터 사용)"""
+        """주문(ProductOrder)을 행 데이터로 변환"""
         row_data = []
         for col in self.display_columns:
             if col == "주문ID":
-                row_data.append(order.get('orderId', ''))
+                row_data.append(order.order_id)
             elif col == "상품주문ID":
-                row_data.append(order.get('productOrderId', ''))
+                row_data.append(order.product_order_id)
             elif col == "주문자":
-                row_data.append(order.get('ordererName', ''))
+                row_data.append(order.orderer_name)
             elif col == "상품명":
-                row_data.append(order.get('productName', ''))
+                row_data.append(order.product_name)
             elif col == "옵션정보":
-                row_data.append(order.get('productOption', ''))
+                row_data.append(order.product_option)
             elif col == "판매자상품코드":
-                row_data.append(order.get('sellerProductCode', ''))
+                row_data.append(order.seller_product_code)
             elif col == "수량":
-                quantity = order.get('quantity', '')
-                row_data.append(str(quantity) if quantity else '')
+                row_data.append(str(order.quantity))
             elif col == "단가":
-                unit_price = order.get('unitPrice', 0)
-                row_data.append(f"{unit_price:,}" if unit_price else '')
+                row_data.append(f"{order.unit_price:,}")
             elif col == "할인금액":
-                discount = order.get('productDiscountAmount', 0)
-                row_data.append(f"{discount:,}" if discount else '')
+                row_data.append(f"{order.discount_amount:,}")
             elif col == "금액":
-                total = order.get('totalPaymentAmount', 0)
-                row_data.append(f"{total:,}" if total else '')
+                row_data.append(f"{order.total_amount:,}")
             elif col == "결제방법":
-                row_data.append(order.get('paymentMeans', ''))
+                row_data.append(order.payment_means)
             elif col == "배송지주소":
-                row_data.append(order.get('shippingAddress', ''))
+                row_data.append(order.shipping_address)
             elif col == "배송예정일":
-                row_data.append(order.get('shippingDueDate', ''))
+                row_data.append(format_datetime(order.shipping_due_date, '%Y-%m-%d'))
             elif col == "주문일시":
-                order_date = order.get('orderDate', '')
-                if order_date:
-                    try:
-                        dt = datetime.fromisoformat(order_date.replace('Z', '+00:00'))
-                        row_data.append(dt.strftime('%Y-%m-%d %H:%M'))
-                    except:
-                        row_data.append(order_date)
-                else:
-                    row_data.append('')
+                row_data.append(format_datetime(order.order_date))
             elif col == "상태":
-                row_data.append(order.get('productOrderStatus', ''))
+                row_data.append(order.status)
             else:
                 row_data.append('')
 
@@ -483,17 +375,14 @@ class CancelReturnExchangeTab(BaseTab):
         try:
             print("취소/반품/교환 탭 - 캐시된 주문 로드 시도")
             # 데이터베이스에서 취소/반품/교환 주문만 로드
-            if hasattr(self.app.db_manager, 'get_orders'):
-                cached_orders = self.app.db_manager.get_orders()
-                # CANCELED, RETURNED, EXCHANGED 상태만 필터링
-                cre_orders = [order for order in cached_orders
-                             if order.get('productOrderStatus') in ['CANCELED', 'RETURNED', 'EXCHANGED']]
-                if cre_orders:
-                    print(f"취소/반품/교환 탭 - 캐시된 주문 {len(cre_orders)}건 표시")
-                    self.display_orders(cre_orders)
-                    self.order_status_label.config(text=f"저장된 취소/반품/교환 주문 {len(cre_orders)}건")
-                else:
-                    print("취소/반품/교환 탭 - 캐시된 주문 없음")
+            # CANCELED, RETURNED, EXCHANGED 상태만 필터링
+            cre_orders = self.app.db_manager.get_product_orders(statuses=['CANCELED', 'RETURNED', 'EXCHANGED'])
+            if cre_orders:
+                print(f"취소/반품/교환 탭 - 캐시된 주문 {len(cre_orders)}건 표시")
+                self.display_orders(cre_orders)
+                self.order_status_label.config(text=f"저장된 취소/반품/교환 주문 {len(cre_orders)}건")
+            else:
+                print("취소/반품/교환 탭 - 캐시된 주문 없음")
         except Exception as e:
             print(f"취소/반품/교환 탭 - 캐시된 주문 로드 오류: {e}")
 
@@ -191,149 +191,10 @@ class HomeTab(BaseTab):
             
             print(f"조회할 주문 상태: {status_list}")
             
-            # 각 상태별 주문 수 집계
-            order_counts = {}
-            for status in status_list:
-                order_counts[status] = 0
-            
-            all_orders = []
-            total_chunks = 0
-            
-            # 다중 상태 조회 시도 (주문관리탭과 동일한 방식)
-            print(f"다중 상태 조회 시도: {status_list}")
-            try:
-                response = self.app.naver_api.get_orders(
-                    start_date=start_date_str,
-                    end_date=end_date_str,
-                    order_status=status_list,  # 리스트 전체 전달
-                    limit=1000
-                )
-                
-                multi_query_success = False
-                if response.get('success'):
-                    data = response.get('data', {})
-                    print(f"홈탭 대시보드 - API 응답 데이터 구조: {list(data.keys()) if isinstance(data, dict) else type(data)}")
-                    
-                    # 주문관리탭과 동일한 구조로 처리
-                    orders_list = []
-                    if isinstance(data, list):
-                        # 데이터가 직접 리스트인 경우
-                        orders_list = data
-                    elif isinstance(data, dict) and 'data' in data:
-                        # 'data' 키 안에 리스트가 있는 경우
-                        orders_list = data.get('data', [])
-                    elif isinstance(data, dict) and 'contents' in data:
-                        # 'contents' 키 안에 리스트가 있는 경우
-                        orders_list = data.get('contents', [])
-                    
-                    print(f"홈탭 대시보드 - 처리할 주문 수: {len(orders_list)}")
-                    
-                    if isinstance(orders_list, list) and len(orders_list) > 0:
-                        print(f"다중 상태 조회 성공: 총 {len(orders_list)}건")
-                        multi_query_success = True
-                        
-                        # 상태별로 분류 (주문관리탭과 동일한 로직)
-                        for i, order in enumerate(orders_list):
-                            print(f"홈탭 대시보드 - 주문 {i+1} 구조: {list(order.keys()) if isinstance(order, dict) else type(order)}")
-                            
-                            order_status = None
-                            
-                            if isinstance(order, dict):
-                                # 네이버 API의 다양한 응답 구조 처리
-                                if 'content' in order:
-                                    content = order['content']
-                                    print(f"홈탭 대시보드 - 주문 {i+1} content 키들: {list(content.keys()) if isinstance(content, dict) else type(content)}")
-                                    
-                                    # content 내부 구조 상세 분석 (주문관리탭과 동일한 방식)
-                                    if isinstance(content, dict):
-                                        # 주문관리탭과 동일한 방식: content.get('productOrder', {})
-                                        product_order = content.get('productOrder', {})
-                                        print(f"홈탭 대시보드 - 주문 {i+1} productOrder 키들: {list(product_order.keys()) if isinstance(product_order, dict) else type(product_order)}")
-                                        
-                                        if isinstance(product_order, dict):
-                                            order_status = product_order.get('productOrderStatus')
-                                            print(f"홈탭 대시보드 - 주문 {i+1} productOrder.productOrderStatus: {order_status}")
-                                        else:
-                                            # productOrder가 없거나 dict가 아닌 경우, 직접 찾기
-                                            order_status = content.get('productOrderStatus')
-                                            print(f"홈탭 대시보드 - 주문 {i+1} content.productOrderStatus: {order_status}")
-                                        
-                                        # content 안의 모든 키-값 구조 확인 (첫 번째 주문만)
-                                        if i == 0:
-                                            print(f"홈탭 대시보드 - 첫 번째 주문 content 전체 구조:")
-                                            for k, v in content.items():
-                                                if isinstance(v, dict):
-                                                    print(f"  {k}: dict with keys {list(v.keys())}")
-                                                else:
-                                                    print(f"  {k}: {type(v)} = {v}")
-                                    
-                                    print(f"홈탭 대시보드 - 주문 {i+1} 최종 추출된 상태: {order_status}")
-                                elif 'orderStatus' in order:
-                                    order_status = order.get('orderStatus')
-                                    print(f"홈탭 대시보드 - 주문 {i+1} 직접 상태: {order_status}")
-                                elif 'productOrderStatus' in order:
-                                    order_status = order.get('productOrderStatus')
-                                    print(f"홈탭 대시보드 - 주문 {i+1} productOrderStatus: {order_status}")
-                                
-                                # 상태별 카운트 증가
-                                if order_status and order_status in order_counts:
-                                    order_counts[order_status] += 1
-                                    print(f"홈탭 대시보드 - 상태 '{order_status}' 카운트 증가: {order_counts[order_status]}")
-                                else:
-                                    print(f"홈탭 대시보드 - 주문 {i+1} 상태 인식 실패 또는 미지원 상태: {order_status}")
-                        
-                        print(f"다중 조회 결과: {order_counts}")
-                    else:
-                        print("다중 상태 조회: 주문 데이터 없음")
-                        multi_query_success = True  # 빈 결과도 성공으로 처리
-                else:
-                    error_msg = response.get('error', '알 수 없는 오류')
-                    print(f"다중 상태 조회 실패: {error_msg}")
-                
-                # 다중 조회가 실패한 경우에만 개별 조회로 fallback
-                if not multi_query_success:
-                    print("다중 상태 조회 실패 → 개별 상태 조회로 fallback")
-                    # 각 상태별로 개별 조회
-                    for status in status_list:
-                        try:
-                            print(f"개별 주문 상태 '{status}' 조회 중...")
-                            response = self.app.naver_api.get_orders(
-                                start_date=start_date_str,
-                                end_date=end_date_str,
-                                order_status=status,
-                                limit=1000
-                            )
-                            
-                            if response.get('success'):
-                                data = response.get('data', {})
-                                
-                                # 주문 수 계산
-                                if isinstance(data, dict) and 'total' in data:
-                                    count = data.get('total', 0)
-                                    order_counts[status] = count
-                                    print(f"개별 조회 - 주문 상태 '{status}': {count}건")
-                                elif isinstance(data, dict) and 'data' in data:
-                                    orders_list = data.get('data', [])
-                                    count = len(orders_list) if isinstance(orders_list, list) else 0
-                                    order_counts[status] = count
-                                    print(f"개별 조회 - 주문 상태 '{status}': {count}건")
-                                else:
-                                    order_counts[status] = 0
-                                    print(f"개별 조회 - 주문 상태 '{status}': 데이터 구조 인식 실패")
-                            else:
-                                order_counts[status] = 0
-                                error_msg = response.get('error', '알 수 없는 오류')
-                                print(f"개별 조회 - 주문 상태 '{status}' 조회 실패: {error_msg}")
-                                
-                        except Exception as e:
-                            order_counts[status] = 0
-                            print(f"개별 조회 - 주문 상태 '{status}' 조회 오류: {e}")
-                            
-            except Exception as e:
-                print(f"다중 상태 조회 오류: {e}")
-                # 예외 발생 시에도 개별 조회로 fallback
-                for status in status_list:
-                    order_counts[status] = 0
+            # 증분 동기화로 변경분만 반영한 뒤 DB에서 집계 (실패 시 기간 전체 API 조회)
+            order_counts = self._load_order_counts_incrementally(start_date, dashboard_days, status_list)
+            if order_counts is None:
+                order_counts = self._fetch_order_counts_from_api(start_date_str, end_date_str, status_list)
             
             print(f"대시보드 새로고침 결과: {order_counts}")
             
@@ -388,6 +249,47 @@ class HomeTab(BaseTab):
             print(f"대시보드 새로고침 오류: {e}")
             self.app.root.after(0, lambda: messagebox.showerror("오류", f"대시보드 새로고침 실패: {str(e)}"))
     
+    def _load_order_counts_incrementally(self, start_date, dashboard_days, status_list):
+        """증분 동기화 후 DB에서 상태별 주문 수 집계 - 동기화할 수 없으면 None 반환"""
+        order_sync = getattr(self.app, 'order_sync', None)
+        if not order_sync:
+            return None
+        
+        try:
+            # 동기화된 범위보다 이전 기간을 선택했으면 빠진 구간을 먼저 채운 뒤 집계
+            result = order_sync.sync(initial_lookback_days=dashboard_days, since=start_date)
+            if not result.get('success'):
+                print("증분 동기화 실패 → 기간 전체 조회로 대체")
+                return None
+            
+            order_counts = self.app.db_manager.get_product_order_counts(
+                status_list, since=start_date.isoformat(timespec='milliseconds'))
+            print(f"증분 동기화 집계 (API 요청 {result.get('requests', 0)}회): {order_counts}")
+            return order_counts
+        except Exception as e:
+            print(f"증분 동기화 오류: {e}")
+            return None
+    
+    def _fetch_order_counts_from_api(self, start_date_str, end_date_str, status_list):
+        """조회 기간 전체를 API로 조회하여 상태별 주문 수 집계"""
+        # 각 상태별 주문 수 집계
+        order_counts = {}
+        for status in status_list:
+            order_counts[status] = 0
+        
+        # 상태 조건 없이 한 번 조회하여 로컬에서 상태별 집계 (상태 수와 관계없이 구간당 한 번 조회)
+        try:
+            partition = self.app.naver_api.get_order_partition(start_date_str, end_date_str)
+            order_counts.update(partition.counts(status_list))
+            if partition.complete:
+                print(f"상태별 집계 결과: {order_counts}")
+            else:
+                print(f"상태별 집계 결과 (일부 페이지 조회 실패): {order_counts}")
+        except Exception as e:
+            print(f"상태별 주문 집계 오류: {e}")
+        
+        return order_counts
+    
     def on_period_changed(self, event=None):
         """대시보드 기간 변경 이벤트"""
         try:
@@ -559,11 +461,10 @@ class HomeTab(BaseTab):
             
             self.app.root.after(0, lambda: self.home_status_var.set("신규주문 조회 중..."))
             
-            response = self.app.naver_api.get_orders(
+            response = self.app.naver_api.get_orders_by_status(
                 start_date=start_date_str,
                 end_date=end_date_str,
-                order_status='PAYED',
-                limit=100
+                statuses=['PAYED']
             )
             
             print(f"홈탭 응답 수신: {response is not None}")
@@ -576,92 +477,9 @@ class HomeTab(BaseTab):
                 print(f"홈탭 API 데이터 타입: {type(api_data)}")
                 print(f"홈탭 API 데이터 키들: {list(api_data.keys()) if isinstance(api_data, dict) else 'Not a dict'}")
                 
-                # get_orders 함수의 반환 구조에 맞는 데이터 처리
-                orders = []
-                
-                # get_orders 함수는 API contents 구조를 그대로 'data' 키로 반환
-                if isinstance(api_data, dict) and 'data' in api_data:
-                    raw_orders = api_data['data']
-                    print(f"홈탭 get_orders 반환 주문 수: {len(raw_orders) if isinstance(raw_orders, list) else 'Not a list'}")
-                    
-                    # 첫 번째 항목의 구조 분석
-                    if isinstance(raw_orders, list) and len(raw_orders) > 0:
-                        first_item = raw_orders[0]
-                        print(f"홈탭 첫 번째 주문 타입: {type(first_item)}")
-                        if isinstance(first_item, dict):
-                            print(f"홈탭 첫 번째 주문 키들: {list(first_item.keys())}")
-                    
-                    # get_orders는 API의 contents 배열을 그대로 반환하므로 contents 구조로 처리
-                    for i, item in enumerate(raw_orders):
-                        if isinstance(item, dict):
-                            print(f"홈탭 주문 {i+1} 처리 중: 키들 = {list(item.keys())}")
-                            
-                            # contents 구조인 경우 (productOrderId + content)
-                            if 'content' in item and 'productOrderId' in item:
-                                content = item['content']
-                                print(f"홈탭 주문 {i+1} content 키들: {list(content.keys()) if isinstance(content, dict) else 'Not a dict'}")
-                                
-                                if isinstance(content, dict) and 'order' in content:
-                                    order_info = content['order']
-                                    product_info = content.get('product', {})
-                                    
-                                    order_data = {
-                                        'orderId': order_info.get('orderId'),
-                                        'productOrderId': item.get('productOrderId'),
-                                        'ordererName': order_info.get('ordererName'),
-                                        'orderDate': order_info.get('orderDate'),
-                                        'orderStatus': content.get('productOrderStatus', 'PAYED'),
-                                        'productName': product_info.get('name', 'N/A') if isinstance(product_info, dict) else 'N/A'
-                                    }
-                                    orders.append(order_data)
-                                    print(f"홈탭 주문 {i+1} 추출 성공: {order_data['orderId']}")
-                                else:
-                                    print(f"홈탭 주문 {i+1} content 구조 오류: order 키가 없음")
-                            
-                            # 이미 가공된 주문 데이터인 경우
-                            elif 'orderId' in item:
-                                orders.append(item)
-                                print(f"홈탭 주문 {i+1} 직접 추출: {item.get('orderId')}")
-                            
-                            else:
-                                print(f"홈탭 주문 {i+1} 알 수 없는 구조: {list(item.keys())}")
-                                # 예상치 못한 구조 대응
-                                if len(list(item.keys())) > 0:
-                                    print(f"홈탭 주문 {i+1} 첫 번째 값 샘플: {list(item.values())[0] if item.values() else 'No values'}")
-                
-                # get_orders가 contents 구조로 직접 API 데이터를 반환하는 경우 대비
-                elif isinstance(api_data, dict) and 'contents' in api_data:
-                    contents = api_data['contents']
-                    print(f"홈탭 contents 길이: {len(contents) if isinstance(contents, list) else 'Not a list'}")
-                    
-                    for item in contents:
-                        if isinstance(item, dict) and 'content' in item:
-                            content = item['content']
-                            if 'order' in content:
-                                order_info = content['order']
-                                order_data = {
-                                    'orderId': order_info.get('orderId'),
-                                    'productOrderId': item.get('productOrderId'),
-                                    'ordererName': order_info.get('ordererName'),
-                                    'orderDate': order_info.get('orderDate'),
-                                    'orderStatus': content.get('productOrderStatus', 'PAYED'),
-                                    'productName': content.get('product', {}).get('name', 'N/A')
-                                }
-                                orders.append(order_data)
-                
-                print(f"홈탭 추출된 주문 수: {len(orders)}")
-                
-                # 중복 제거 - orderId 기준
-                unique_orders = []
-                seen_order_ids = set()
-                
-                for order in orders:
-                    order_id = order.get('orderId')
-                    if order_id and order_id not in seen_order_ids:
-                        seen_order_ids.add(order_id)
-                        unique_orders.append(order)
-                
-                print(f"홈탭 중복 제거: {len(orders)}건 → {len(unique_orders)}건")
+                # 상태별 분류 결과(ProductOrder) 사용 - 분류 시 상품주문ID 기준으로 중복 제거됨
+                unique_orders = api_data.get('data', []) if isinstance(api_data, dict) else []
+                print(f"홈탭 신규주문 수: {len(unique_orders)}건")
                 
                 # UI 업데이트
                 self.app.root.after(0, lambda: self._update_orders_tree(unique_orders))
@@ -702,56 +520,17 @@ class HomeTab(BaseTab):
             
             self.app.root.after(0, lambda: self.products_status_var.set("상품 목록 조회 중..."))
             
-            # 상품 목록 조회
-            response = self.app.naver_api.get_products()
+            # 전체 상품 동기화 (모든 페이지 조회, 수정일이 같은 상품은 저장 생략)
+            from env_config import config
+            response = self.app.product_sync.sync(enrich=config.get_bool('PRODUCT_SYNC_ENRICH', False))
             
-            if response and response.get('success'):
-                data = response.get('data', {})
-                products = data.get('contents', [])
+            if response and (response.get('success') or response.get('products')):
+                products = response.get('products', [])
+                stats = response.get('stats', {})
                 
-                print(f"홈탭 상품 조회 결과: {len(products)}개")
-                
-                # 상품 데이터를 데이터베이스에 저장
-                for product in products:
-                    if isinstance(product, dict):
-                        # 상품 데이터 구조 변환
-                        origin_product_no = product.get('originProductNo')
-                        channel_products = product.get('channelProducts', [])
-                        
-                        if channel_products and len(channel_products) > 0:
-                            channel_product = channel_products[0]
-                            
-                            # 데이터베이스 저장을 위한 플랫 구조로 변환
-                            product_data = {
-                                'origin_product_no': origin_product_no,
-                                'channel_product_no': channel_product.get('channelProductNo'),
-                                'product_name': channel_product.get('name'),
-                                'status_type': channel_product.get('statusType'),
-                                'sale_price': channel_product.get('salePrice', 0),
-                                'discounted_price': channel_product.get('discountedPrice', 0),
-                                'stock_quantity': channel_product.get('stockQuantity', 0),
-                                'category_id': channel_product.get('categoryId'),
-                                'category_name': channel_product.get('wholeCategoryName', '').split('>')[-1] if channel_product.get('wholeCategoryName') else '',
-                                'brand_name': channel_product.get('brandName'),
-                                'manufacturer_name': channel_product.get('manufacturerName'),
-                                'model_name': channel_product.get('modelName'),
-                                'seller_management_code': channel_product.get('sellerManagementCode'),
-                                'reg_date': channel_product.get('regDate'),
-                                'modified_date': channel_product.get('modifiedDate'),
-                                'representative_image_url': channel_product.get('representativeImage', {}).get('url'),
-                                'whole_category_name': channel_product.get('wholeCategoryName'),
-                                'whole_category_id': channel_product.get('wholeCategoryId'),
-                                'delivery_fee': channel_product.get('deliveryFee', 0),
-                                'return_fee': channel_product.get('returnFee', 0),
-                                'exchange_fee': channel_product.get('exchangeFee', 0),
-                                'discount_method': '',
-                                'customer_benefit': ''
-                            }
-                            
-                            self.app.db_manager.save_product(product_data)
+                print(f"홈탭 상품 조회 결과: {len(products)}개 ({stats.get('pages', 0)}페이지, 저장 {stats.get('saved', 0)}개, 변경 없음 {stats.get('skipped', 0)}개)")
                 
                 # 상품 상태별 필터링
-                from env_config import config
                 saved_statuses = config.get('PRODUCT_STATUS_TYPES', 'SALE')
                 status_list = [s.strip() for s in saved_statuses.split(',')]
                 print(f"홈탭 조회 필터링 상태: {status_list}")
@@ -775,7 +554,11 @@ class HomeTab(BaseTab):
             else:
                 error_msg = f"상품 조회 실패: {response.get('error', '응답 없음') if response else '네트워크 오류'}"
                 print(error_msg)
-                self.app.root.after(0, lambda: self.products_status_var.set("상품 조회 실패"))
+                if self.app.naver_api.circuit_breaker.is_open:
+                    # API 차단 중(서킷 브레이커)이면 저장된 상품으로 표시
+                    self.app.root.after(0, self.load_saved_products)
+                else:
+                    self.app.root.after(0, lambda: self.products_status_var.set("상품 조회 실패"))
                 
         except Exception as e:
             print(f"홈탭 상품 조회 오류: {e}")
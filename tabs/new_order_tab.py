@@ -7,6 +7,7 @@ from tkcalendar import DateEntry
 from datetime import datetime, timedelta
 import json
 
+from product_order import format_datetime
 from ui_utils import BaseTab, run_in_thread, enable_context_menu
 
 
@@ -20,6 +21,7 @@ class NewOrderTab(BaseTab):
         self.is_first_load = True  # 첫 로드 여부
         self.create_tab()
         self.setup_copy_paste_bindings()
+        self.bind_order_detail(self.tree)
         self.update_order_status_display()
 
         # 탭 생성 후 저장된 주문 데이터 우선 로드
@@ -193,12 +195,11 @@ class NewOrderTab(BaseTab):
 
             print(f"신규주문 탭 - API 조회 시작: {start_date_str} ~ {end_date_str}, 상태: {order_status}")
 
-            # API 호출 (주문관리 탭과 동일한 방식)
-            response = self.app.naver_api.get_orders(
+            # 기간 내 전체 주문을 한 번 조회해 상태별로 분류한 결과 사용 (다른 탭과 조회 결과 공유)
+            response = self.app.naver_api.get_orders_by_status(
                 start_date=start_date_str,
                 end_date=end_date_str,
-                order_status=order_status,
-                limit=100
+                statuses=[order_status]
             )
 
             if response and response.get('success'):
@@ -213,48 +214,8 @@ class NewOrderTab(BaseTab):
                 print(f"신규주문 탭 - 처리할 주문 수: {len(raw_orders)}")
 
                 if raw_orders:
-                    # 주문관리 탭과 동일한 방식으로 데이터 변환
-                    processed_orders = []
-
-                    for i, item in enumerate(raw_orders):
-                        print(f"신규주문 탭 - 주문 {i+1} 구조: {list(item.keys()) if isinstance(item, dict) else type(item)}")
-
-                        if isinstance(item, dict) and 'content' in item:
-                            content = item['content']
-                            print(f"신규주문 탭 - 주문 {i+1} content 키들: {list(content.keys()) if isinstance(content, dict) else type(content)}")
-
-                            if 'order' in content and 'productOrder' in content:
-                                order_info = content['order']
-                                product_order = content['productOrder']
-
-                                # 상품 주문 상태 확인
-                                product_order_status = product_order.get('productOrderStatus')
-                                print(f"신규주문 탭 - 주문 {i+1} 상태 확인: {product_order_status}")
-
-                                # PAYED 상태만 필터링
-                                if product_order_status == 'PAYED':
-                                    # 주문관리 탭과 동일한 데이터 구조로 변환
-                                    order_data = {
-                                        'orderId': order_info.get('orderId'),
-                                        'productOrderId': item.get('productOrderId'),
-                                        'ordererName': order_info.get('ordererName'),
-                                        'productName': product_order.get('productName'),
-                                        'productOption': product_order.get('productOption'),
-                                        'sellerProductCode': product_order.get('sellerProductCode'),
-                                        'quantity': product_order.get('quantity'),
-                                        'unitPrice': product_order.get('unitPrice'),
-                                        'productDiscountAmount': product_order.get('productDiscountAmount', 0),
-                                        'totalPaymentAmount': product_order.get('totalPaymentAmount'),
-                                        'paymentMeans': order_info.get('paymentMeans'),
-                                        'shippingAddress': product_order.get('shippingAddress'),
-                                        'shippingDueDate': product_order.get('shippingDueDate'),
-                                        'orderDate': order_info.get('orderDate'),
-                                        'orderStatus': product_order_status
-                                    }
-                                    processed_orders.append(order_data)
-                                    print(f"신규주문 탭 - 주문 {i+1} PAYED 상태 확인, 변환 완료: {order_data.get('productName', 'N/A')}")
-                                else:
-                                    print(f"신규주문 탭 - 주문 {i+1} {product_order_status} 상태로 필터링 제외")
+                    # 상태별 분류 결과(ProductOrder)를 그대로 사용 - PAYED 상태만 필터링
+                    processed_orders = [order for order in raw_orders if order.status == 'PAYED']
 
                     print(f"신규주문 탭 - 최종 처리된 주문 수: {len(processed_orders)}")
 
@@ -283,65 +244,49 @@ class NewOrderTab(BaseTab):
         # 기존 데이터 클리어
         self.clear_tree()
 
+        self.tree_orders = {}
         for order in orders:
             # 주문 데이터를 표시 컬럼에 맞게 변환
             row_data = self.convert_order_to_row(order)
-            self.tree.insert("", "end", values=row_data)
+            item_id = self.tree.insert("", "end", values=row_data)
+            self.tree_orders[item_id] = order
 
         self.last_orders_data = orders
 
     def convert_order_to_row(self, order):
-        """주문 데이터를 행 데이터로 변환"""
+        """주문(ProductOrder)을 행 데이터로 변환"""
         row_data = []
         for col in self.display_columns:
             if col == "주문ID":
-                row_data.append(order.get('orderId', ''))
+                row_data.append(order.order_id)
             elif col == "상품주문ID":
-                row_data.append(order.get('productOrderId', ''))
+                row_data.append(order.product_order_id)
             elif col == "주문자":
-                row_data.append(order.get('ordererName', ''))
+                row_data.append(order.orderer_name)
             elif col == "상품명":
-                row_data.append(order.get('productName', ''))
+                row_data.append(order.product_name)
             elif col == "옵션정보":
-                row_data.append(order.get('productOption', ''))
+                row_data.append(order.product_option)
             elif col == "판매자상품코드":
-                row_data.append(order.get('sellerProductCode', ''))
+                row_data.append(order.seller_product_code)
             elif col == "수량":
-                row_data.append(str(order.get('quantity', '')))
+                row_data.append(str(order.quantity))
             elif col == "단가":
-                row_data.append(f"{order.get('unitPrice', 0):,}")
+                row_data.append(f"{order.unit_price:,}")
             elif col == "할인금액":
-                row_data.append(f"{order.get('productDiscountAmount', 0):,}")
+                row_data.append(f"{order.discount_amount:,}")
             elif col == "금액":
-                row_data.append(f"{order.get('totalPaymentAmount', 0):,}")
+                row_data.append(f"{order.total_amount:,}")
             elif col == "결제방법":
-                row_data.append(order.get('paymentMeans', ''))
+                row_data.append(order.payment_means)
             elif col == "배송지주소":
-                shipping_addr = order.get('shippingAddress', {})
-                addr = f"{shipping_addr.get('baseAddress', '')} {shipping_addr.get('detailAddress', '')}"
-                row_data.append(addr.strip())
+                row_data.append(order.shipping_address)
             elif col == "배송예정일":
-                shipping_due = order.get('shippingDueDate', '')
-                if shipping_due:
-                    try:
-                        dt = datetime.fromisoformat(shipping_due.replace('Z', '+00:00'))
-                        row_data.append(dt.strftime('%Y-%m-%d'))
-                    except:
-                        row_data.append(shipping_due)
-                else:
-                    row_data.append('')
+                row_data.append(format_datetime(order.shipping_due_date, '%Y-%m-%d'))
             elif col == "주문일시":
-                order_date = order.get('orderDate', '')
-                if order_date:
-                    try:
-                        dt = datetime.fromisoformat(order_date.replace('Z', '+00:00'))
-                        row_data.append(dt.strftime('%Y-%m-%d %H:%M'))
-                    except:
-                        row_data.append(order_date)
-                else:
-                    row_data.append('')
+                row_data.append(format_datetime(order.order_date))
             elif col == "상태":
-                row_data.append(order.get('productOrderStatus', ''))
+                row_data.append(order.status)
             else:
                 row_data.append('')
 
@@ -438,16 +383,14 @@ class NewOrderTab(BaseTab):
         try:
             print("신규주문 탭 - 캐시된 주문 로드 시도")
             # 데이터베이스에서 신규주문만 로드
-            if hasattr(self.app.db_manager, 'get_orders'):
-                cached_orders = self.app.db_manager.get_orders()
-                # PAYED 상태만 필터링
-                new_orders = [order for order in cached_orders if order.get('productOrderStatus') == 'PAYED']
-                if new_orders:
-                    print(f"신규주문 탭 - 캐시된 신규주문 {len(new_orders)}건 표시")
-                    self.display_orders(new_orders)
-                    self.order_status_label.config(text=f"저장된 신규주문 {len(new_orders)}건")
-                else:
-                    print("신규주문 탭 - 캐시된 신규주문 없음")
+            # PAYED 상태만 필터링
+            new_orders = self.app.db_manager.get_product_orders(statuses=['PAYED'])
+            if new_orders:
+                print(f"신규주문 탭 - 캐시된 신규주문 {len(new_orders)}건 표시")
+                self.display_orders(new_orders)
+                self.order_status_label.config(text=f"저장된 신규주문 {len(new_orders)}건")
+            else:
+                print("신규주문 탭 - 캐시된 신규주문 없음")
         except Exception as e:
             print(f"신규주문 탭 - 캐시된 주문 로드 오류: {e}")
 
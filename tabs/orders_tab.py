@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 import json
 
 from ui_utils import BaseTab, run_in_thread, enable_context_menu
+from product_order import format_datetime
 
 
 class OrdersTab(BaseTab):
@@ -165,6 +166,9 @@ class OrdersTab(BaseTab):
         # 컬럼 너비 변경 감지 이벤트 바인딩
         self.orders_tree.bind('<ButtonRelease-1>', self.on_column_resize, add='+')  # 기존 이벤트에 추가
         
+        # 행 더블클릭 시 저장된 원본 응답으로 주문 상세 표시
+        self.bind_order_detail(self.orders_tree)
+        
         # 상태 표시
         self.orders_status_var = tk.StringVar()
         self.orders_status_var.set("대기 중...")
@@ -272,6 +276,12 @@ class OrdersTab(BaseTab):
                 self.app.root.after(0, show_api_error)
                 return
             
+            if self.app.naver_api.circuit_breaker.is_open:
+                # API 차단 중(서킷 브레이커)이면 요청 없이 저장된 주문 표시
+                print("API 차단 중 - 저장된 주문으로 조회")
+                self.app.root.after(0, self.query_orders_from_db)
+                return
+            
             start_date = self.start_date_entry.get_date()
             end_date = self.end_date_entry.get_date()
             
@@ -286,187 +296,27 @@ class OrdersTab(BaseTab):
             order_statuses = config.get('ORDER_STATUS_TYPES', 'PAYMENT_WAITING,PAYED,DELIVERING,DELIVERED,PURCHASE_DECIDED,EXCHANGED,CANCELED,RETURNED,CANCELED_BY_NOPAYMENT')
             status_list = [status.strip() for status in order_statuses.split(',')]
             
-            print(f"주문 상태 다중 조회 시도: {status_list}")
-            self.app.root.after(0, lambda: self.orders_status_var.set(f"API에서 주문 조회 중... (다중 상태: {len(status_list)}개)"))
-            
-            # 먼저 다중 상태 조회 시도
-            response = self.app.naver_api.get_orders(
-                start_date=start_date_str,
-                end_date=end_date_str,
-                order_status=status_list,  # 리스트로 전달
-                limit=100
-            )
-            
-            all_processed_orders = []
-            
-            if response and response.get('success'):
-                # 다중 상태 조회가 성공한 경우
-                print("다중 상태 조회 성공!")
-                data = response.get('data', {})
-                raw_orders = data.get('data', [])
-                print(f"다중 상태 조회 결과: {len(raw_orders) if isinstance(raw_orders, list) else 'Not a list'}건")
-                
-                if isinstance(raw_orders, list):
-                    for j, item in enumerate(raw_orders):
-                        if isinstance(item, dict):
-                            # 주문 데이터 처리 로직 (기존과 동일)
-                            if 'content' in item:
-                                content = item['content']
-                                if 'order' in content:
-                                    order_info = content['order']
-                                    product_order = content.get('productOrder', {})
-                                    
-                                    # 배송예정일 포맷팅
-                                    shipping_due_date = product_order.get('shippingDueDate', 'N/A')
-                                    if shipping_due_date != 'N/A':
-                                        try:
-                                            if 'T' in str(shipping_due_date):
-                                                dt = datetime.fromisoformat(str(shipping_due_date).replace('Z', '+00:00'))
-                                                shipping_due_date = dt.strftime('%m-%d')
-                                        except:
-                                            pass
-                                    
-                                    # 배송지 주소 조합
-                                    shipping_address = product_order.get('shippingAddress', {})
-                                    base_address = shipping_address.get('baseAddress', '')
-                                    detailed_address = shipping_address.get('detailedAddress', '')
-                                    full_address = f"{base_address} {detailed_address}".strip()
-                                    if not full_address:
-                                        full_address = 'N/A'
-                                    
-                                    # 상품 주문 상태 확인
-                                    product_order_status = product_order.get('productOrderStatus', 'UNKNOWN')
-
-                                    # 설정된 상태 필터와 일치하는지 확인
-                                    if product_order_status in status_list:
-                                        order_data = {
-                                            'orderId': order_info.get('orderId'),
-                                            'productOrderId': item.get('productOrderId'),
-                                            'ordererName': order_info.get('ordererName'),
-                                            'orderDate': order_info.get('orderDate'),
-                                            'orderStatus': product_order_status,
-                                            'productName': product_order.get('productName', 'N/A'),
-                                            'totalAmount': product_order.get('totalPaymentAmount', 0),
-                                            'productOption': product_order.get('productOption', 'N/A'),
-                                            'sellerProductCode': product_order.get('sellerProductCode', 'N/A'),
-                                            'quantity': product_order.get('quantity', 1),
-                                            'unitPrice': product_order.get('unitPrice', 0),
-                                            'discountAmount': product_order.get('productDiscountAmount', 0),
-                                            'paymentMeans': order_info.get('paymentMeans', 'N/A'),
-                                            'shippingAddress': full_address,
-                                            'shippingDueDate': shipping_due_date
-                                        }
-                                        all_processed_orders.append(order_data)
-                                        print(f"주문관리 탭 - {product_order_status} 상태 주문 포함: {order_data.get('productName', 'N/A')}")
-                                    else:
-                                        print(f"주문관리 탭 - {product_order_status} 상태 주문 필터링 제외 (허용 상태: {status_list})")
-                            elif 'orderId' in item:
-                                all_processed_orders.append(item)
-            else:
-                # 다중 상태 조회가 실패한 경우 기존 방식으로 폴백
-                print("다중 상태 조회 실패, 개별 상태 조회로 폴백")
-                self.app.root.after(0, lambda: self.orders_status_var.set("다중 상태 조회 실패, 개별 조회 중..."))
-                
-                # 개별 상태별 조회 (기존 로직)
-                for i, order_status in enumerate(status_list):
-                    print(f"주문 상태 {order_status} 조회 중... ({i+1}/{len(status_list)})")
-                    self.app.root.after(0, lambda status=order_status, curr=i+1, total=len(status_list): 
-                                      self.orders_status_var.set(f"API에서 주문 조회 중... ({curr}/{total}) - {status}"))
-                    
-                    response = self.app.naver_api.get_orders(
-                        start_date=start_date_str,
-                        end_date=end_date_str,
-                        order_status=order_status,
-                        limit=100
-                    )
-                
-                if response and response.get('success'):
-                    data = response.get('data', {})
-                    raw_orders = data.get('data', [])  # 실제 주문 리스트
-                    
-                    print(f"주문상태 {order_status} - raw_orders 길이: {len(raw_orders) if isinstance(raw_orders, list) else 'Not a list'}")
-                    
-                    # raw_orders는 이미 contents에서 추출된 주문 데이터 배열
-                    if isinstance(raw_orders, list):
-                        for j, item in enumerate(raw_orders):
-                            if isinstance(item, dict):
-                                # get_orders에서 반환하는 주문 데이터는 이미 contents 구조
-                                if 'content' in item:
-                                    content = item['content']
-                                    if 'order' in content:
-                                        order_info = content['order']
-                                        # 주문 정보를 표준 형식으로 변환
-                                        product_order = content.get('productOrder', {})
-                                        
-                                        # 배송예정일 포맷팅
-                                        shipping_due_date = product_order.get('shippingDueDate', 'N/A')
-                                        if shipping_due_date != 'N/A':
-                                            try:
-                                                if 'T' in str(shipping_due_date):
-                                                    dt = datetime.fromisoformat(str(shipping_due_date).replace('Z', '+00:00'))
-                                                    shipping_due_date = dt.strftime('%m-%d')
-                                            except:
-                                                pass
-                                        
-                                        # 배송지 주소 조합
-                                        shipping_address = product_order.get('shippingAddress', {})
-                                        base_address = shipping_address.get('baseAddress', '')
-                                        detailed_address = shipping_address.get('detailedAddress', '')
-                                        full_address = f"{base_address} {detailed_address}".strip()
-                                        if not full_address:
-                                            full_address = 'N/A'
-                                        
-                                        order_data = {
-                                            'orderId': order_info.get('orderId'),
-                                            'productOrderId': item.get('productOrderId'),
-                                            'ordererName': order_info.get('ordererName'),
-                                            'orderDate': order_info.get('orderDate'),
-                                            'orderStatus': product_order.get('productOrderStatus', order_status),
-                                            'productName': product_order.get('productName', 'N/A'),
-                                            'totalAmount': product_order.get('totalPaymentAmount', 0),
-                                            'productOption': product_order.get('productOption', 'N/A'),
-                                            'sellerProductCode': product_order.get('sellerProductCode', 'N/A'),
-                                            'quantity': product_order.get('quantity', 1),
-                                            'unitPrice': product_order.get('unitPrice', 0),
-                                            'discountAmount': product_order.get('productDiscountAmount', 0),
-                                            'paymentMeans': order_info.get('paymentMeans', 'N/A'),
-                                            'shippingAddress': full_address,
-                                            'shippingDueDate': shipping_due_date
-                                        }
-                                        all_processed_orders.append(order_data)
-                                # 직접 orderId가 있는 경우 (다른 형식)
-                                elif 'orderId' in item:
-                                    all_processed_orders.append(item)
-                else:
-                    print(f"주문상태 {order_status} 조회 실패")
-            
-            print(f"전체 주문상태 조회 완료 - 총 변환된 주문 수: {len(all_processed_orders)}")
-            
-            # 중복 제거
-            unique_orders = self.app.remove_duplicate_orders(all_processed_orders)
-            
-            # 데이터베이스에 저장
-            saved_count = 0
-            for order in unique_orders:
-                if isinstance(order, dict):
-                    # API 데이터를 DB 스키마에 맞게 변환
-                    order_data = self._convert_api_order_to_db_format(order)
-                    if self.app.db_manager.save_order(order_data):
-                        saved_count += 1
-                        print(f"주문 저장 성공: {order_data.get('order_id', 'Unknown ID')}")
-                    else:
-                        print(f"주문 저장 실패: {order_data.get('order_id', 'Unknown ID')}")
+            print(f"주문 상태 스트리밍 조회: {status_list}")
             
-            print(f"총 {len(unique_orders)}건 중 {saved_count}건 데이터베이스에 저장 완료")
+            # 페이지가 도착할 때마다 트리뷰에 추가 (전체 기간 조회 완료를 기다리지 않음)
+            unique_orders = self._stream_orders_into_tree(start_date_str, end_date_str, status_list)
+            
+            if unique_orders is None:
+                if self.app.naver_api.circuit_breaker.is_open:
+                    # 조회 중 API가 차단되면 저장된 주문 표시
+                    self.app.root.after(0, self.query_orders_from_db)
+                    return
+                # 상태 조건 없이 한 번에 조회하므로 상태별 재조회 없이 실패로 처리
+                print("주문 조회 실패: 모든 페이지 조회 실패")
+                self.app.root.after(0, lambda: self.orders_status_var.set("API 주문 조회 실패 - 잠시 후 다시 시도해주세요."))
+                return
             
             # 마지막 API 조회 결과 저장
             self.last_api_orders = unique_orders
             self.is_first_load = False
             
             # UI 업데이트
-            self.app.root.after(0, self._update_orders_tree, unique_orders)
             self.app.root.after(0, lambda: self.update_refresh_status_message(len(unique_orders), is_from_api=True))
-
             if not unique_orders:
                 self.app.root.after(0, lambda: self.orders_status_var.set("해당 기간과 상태 조건에 맞는 주문이 없습니다."))
                 
@@ -475,6 +325,57 @@ class OrdersTab(BaseTab):
             print(f"API 주문 조회 오류: {e}")
             self.app.root.after(0, lambda msg=error_msg: self.orders_status_var.set(msg))
     
+    def _stream_orders_into_tree(self, start_date_str, end_date_str, status_list):
+        """API 주문을 페이지 단위로 받아 트리뷰에 바로 추가하고 DB에 저장
+        
+        중복 제거된 주문 목록을 반환하며, 모든 요청이 실패해 주문이 없으면 None을 반환한다.
+        """
+        self.app.root.after(0, self._clear_orders_tree)
+        unique_orders = []
+        seen_order_ids = set()
+        pending = []
+        failed_pages = []
+        
+        def flush():
+            # 지금까지 받은 주문을 DB에 저장하고 UI 스레드에서 행 추가
+            if not pending:
+                return
+            batch = list(pending)
+            pending.clear()
+            self._save_api_orders(batch)
+            self.app.root.after(0, self._append_orders_tree, batch)
+        
+        def on_progress(event):
+            flush()
+            if event['type'] == 'page':
+                self.app.root.after(0, lambda e=event: self.orders_status_var.set(
+                    f"API에서 주문 조회 중... ({e['window']}/{e['windows']}일, {e['orders']}건)"))
+            elif event['type'] == 'done':
+                failed_pages.extend(event['failed_pages'])
+        
+        for order in self.app.naver_api.iter_orders(start_date_str, end_date_str, statuses=status_list,
+                                                    limit=100, on_progress=on_progress):
+            # 중복 제거 (상품주문ID 기준 - 한 주문의 여러 상품주문은 각각 표시)
+            order_key = order.product_order_id or order.order_id
+            if not order_key or order_key in seen_order_ids:
+                continue
+            seen_order_ids.add(order_key)
+            unique_orders.append(order)
+            pending.append(order)
+        flush()
+        
+        print(f"스트리밍 조회 완료 - 총 {len(unique_orders)}건 (실패 페이지 {len(failed_pages)}개)")
+        if not unique_orders and failed_pages:
+            return None
+        return unique_orders
+    
+    def _save_api_orders(self, orders) -> int:
+        """API 주문(ProductOrder) 목록을 DB에 저장 - 저장 건수 반환"""
+        result = self.app.db_manager.upsert_product_orders(orders)
+        if result['failed']:
+            print(f"주문 저장 실패: {result['failed']}건")
+        return result['inserted'] + result['updated'] + result['unchanged']
+    
     def query_orders_from_db(self):
         """데이터베이스에서 주문 조회"""
         try:
@@ -489,7 +390,7 @@ class OrdersTab(BaseTab):
             end_date_str = end_date.strftime('%Y-%m-%d')
             print(f"DB 조회 기간: {start_date_str} ~ {end_date_str}")
 
-            orders = self.app.db_manager.get_orders_by_date_range(start_date_str, end_date_str)
+            orders = self.app.db_manager.get_product_orders(start_date=start_date_str, end_date=end_date_str)
             print(f"DB에서 조회된 주문 수: {len(orders)}")
 
             # 설정에서 선택된 주문 상태들 가져오기 (강제 새로고침)
@@ -502,24 +403,15 @@ class OrdersTab(BaseTab):
             if orders:
                 # 조회된 주문 정보 출력
                 for i, order in enumerate(orders[:3]):  # 처음 3건만 출력
-                    print(f"DB 주문 {i+1}: ID={order.get('order_id')}, 상태={order.get('status')}, 고객={order.get('customer_name')}")
+                    print(f"DB 주문 {i+1}: ID={order.order_id}, 상태={order.status}, 고객={order.orderer_name}")
 
                 # 상태 필터링 적용
-                filtered_orders = []
-                for order in orders:
-                    order_status = order.get('status', 'UNKNOWN')
-                    if order_status in status_list:
-                        filtered_orders.append(order)
-                        print(f"DB 조회 - {order_status} 상태 주문 포함: {order.get('customer_name', 'N/A')}")
-                    else:
-                        print(f"DB 조회 - {order_status} 상태 주문 필터링 제외 (허용 상태: {status_list})")
+                filtered_orders = [order for order in orders if order.status in status_list]
 
                 print(f"DB 조회 - 필터링 후 주문 수: {len(filtered_orders)}")
 
                 if filtered_orders:
-                    # DB 데이터를 API 형식으로 변환하여 UI에 표시
-                    api_format_orders = self._convert_db_orders_to_api_format(filtered_orders)
-                    self._update_orders_tree(api_format_orders)
+                    self._update_orders_tree(filtered_orders)
                     self.update_refresh_status_message(len(filtered_orders), is_from_api=False)
                 else:
                     print("필터링 후 해당 상태의 주문이 없습니다.")
@@ -549,117 +441,30 @@ class OrdersTab(BaseTab):
     
     def _update_orders_tree(self, orders):
         """주문 트리뷰 업데이트 (상세 정보 포함)"""
-        # 마지막 주문 데이터 저장
-        self.last_orders_data = orders
-        
-        # 기존 데이터 삭제
+        self._clear_orders_tree()
+        self._append_orders_tree(orders)
+    
+    def _clear_orders_tree(self):
+        """주문 트리뷰 비우기"""
+        self.last_orders_data = []
+        self.tree_orders = {}
         for item in self.orders_tree.get_children():
             self.orders_tree.delete(item)
+    
+    def _append_orders_tree(self, orders):
+        """주문 트리뷰에 행 추가 (스트리밍 조회 시 페이지 단위로 호출)"""
+        # 마지막 주문 데이터 저장
+        self.last_orders_data.extend(orders)
         
         # 새 데이터 추가
-        for i, order in enumerate(orders):
-            if isinstance(order, dict):
-                print(f"트리뷰 업데이트 - 주문 {i+1}: {json.dumps(order, ensure_ascii=False, indent=2)}")
-                
-                order_id = order.get('orderId', 'N/A')
-                orderer_name = order.get('ordererName', 'N/A')
-                product_name = order.get('productName', 'N/A')
-                order_date = order.get('orderDate', 'N/A')
-                status = order.get('orderStatus', 'N/A')
-                amount = order.get('totalAmount', 0)
-                product_order_id = order.get('productOrderId', 'N/A')
-                product_option = order.get('productOption', 'N/A')
-                seller_product_code = order.get('sellerProductCode', 'N/A')
-                quantity = order.get('quantity', 1)
-                unit_price = order.get('unitPrice', 0)
-                discount_amount = order.get('discountAmount', 0)
-                payment_means = order.get('paymentMeans', 'N/A')
-                shipping_address = order.get('shippingAddress', 'N/A')
-                shipping_due_date = order.get('shippingDueDate', 'N/A')
-                
-                print(f"트리뷰 - 추출된 정보: orderId={order_id}, ordererName={orderer_name}, productName={product_name}, productOption={product_option}")
-                
-                # 주문일시 포맷 변경 (보기 쉽게)
-                if order_date != 'N/A':
-                    try:
-                        # ISO 형식을 파싱하여 보기 좋은 형식으로 변환
-                        if 'T' in str(order_date):
-                            dt = datetime.fromisoformat(str(order_date).replace('Z', '+00:00'))
-                            order_date = dt.strftime('%Y-%m-%d %H:%M')
-                    except:
-                        pass  # 포맷 변경 실패 시 원본 그대로 사용
-                
-                print(f"트리뷰 - 최종 삽입 데이터: orderId={order_id}, productOrderId={product_order_id}, ordererName={orderer_name}, productName={product_name}, productOption={product_option}")
-                
-                # 동적 컬럼에 맞는 값들 추출
-                current_columns = self.orders_tree['columns']
-                order_data = {
-                    'orderId': order_id,
-                    'productOrderId': product_order_id,
-                    'ordererName': orderer_name,
-                    'productName': product_name,
-                    'optionInfo': product_option,
-                    'sellerProductCode': seller_product_code,
-                    'quantity': quantity,
-                    'unitPrice': unit_price,
-                    'discountAmount': discount_amount,
-                    'price': amount,
-                    'payType': payment_means,
-                    'shippingAddress': shipping_address,
-                    'expectedDeliveryDate': shipping_due_date,
-                    'shippingDueDate': shipping_due_date,  # 두 필드 모두 설정
-                    'orderDate': order_date,
-                    'claimStatus': status
-                }
-                
-                values = self.get_order_values_for_columns(order_data, current_columns)
-                item_id = self.orders_tree.insert('', 'end', values=values)
-                
-                # 배송예정일에 따른 색상 설정 (order_data에서 실제 배송예정일 값을 가져옴)
-                actual_delivery_date = order_data.get('expectedDeliveryDate', '') or order_data.get('shippingDueDate', '')
-                self.apply_delivery_date_color(item_id, actual_delivery_date, current_columns)
-    
-    def _convert_api_order_to_db_format(self, api_order: dict) -> dict:
-        """API 주문 데이터를 DB 스키마에 맞게 변환"""
-        return {
-            'order_id': api_order.get('orderId', ''),
-            'order_date': api_order.get('orderDate', ''),
-            'customer_name': api_order.get('ordererName', ''),
-            'customer_phone': api_order.get('ordererPhone', ''),
-            'product_name': api_order.get('productName', ''),
-            'quantity': api_order.get('quantity', 1),
-            'price': api_order.get('totalAmount', 0),
-            'status': api_order.get('orderStatus', '신규주문'),
-            'shipping_company': api_order.get('shippingCompany', ''),
-            'tracking_number': api_order.get('trackingNumber', ''),
-            'memo': api_order.get('memo', ''),
-            'product_order_id': api_order.get('productOrderId', ''),
-            'shipping_due_date': api_order.get('shippingDueDate', ''),
-            'product_option': api_order.get('productOption', '')
-        }
-    
-    def _convert_db_orders_to_api_format(self, db_orders: list) -> list:
-        """DB 주문 데이터를 API 형식으로 변환"""
-        api_orders = []
-        for db_order in db_orders:
-            api_order = {
-                'orderId': db_order.get('order_id', ''),
-                'orderDate': db_order.get('order_date', ''),
-                'ordererName': db_order.get('customer_name', ''),
-                'ordererPhone': db_order.get('customer_phone', ''),
-                'productName': db_order.get('product_name', ''),
-                'quantity': db_order.get('quantity', 1),
-                'totalAmount': db_order.get('price', 0),
-                'orderStatus': db_order.get('status', '신규주문'),
-                'shippingCompany': db_order.get('shipping_company', ''),
-                'trackingNumber': db_order.get('tracking_number', ''),
-                'memo': db_order.get('memo', ''),
-                'productOrderId': db_order.get('product_order_id', ''),
-                'shippingDueDate': db_order.get('shipping_due_date', ''),
-                'productOption': db_order.get('product_option', '')
-            }
-            api_orders.append(api_order)
-        return api_orders
+        current_columns = self.orders_tree['columns']
+        for order in orders:
+            values = self.get_order_values_for_columns(order, current_columns)
+            item_id = self.orders_tree.insert('', 'end', values=values)
+            self.tree_orders[item_id] = order
+            
+            # 배송예정일에 따른 색상 설정
+            self.apply_delivery_date_color(item_id, order.shipping_due_date, current_columns)
     
     
     def on_column_drag_start(self, event):
@@ -1036,6 +841,7 @@ class OrdersTab(BaseTab):
             self.orders_tree.bind('<ButtonRelease-1>', self.on_column_drop)
             self.orders_tree.bind('<Button-3>', self.show_column_context_menu)
             self.orders_tree.bind('<ButtonRelease-1>', self.on_column_resize, add='+')
+            self.bind_order_detail(self.orders_tree)
             
             # 백업된 데이터가 있다면 다시 로드
             if current_data:
@@ -1048,42 +854,40 @@ class OrdersTab(BaseTab):
             print(f"컬럼 표시 업데이트 오류: {e}")
     
     def get_order_values_for_columns(self, order, columns):
-        """주문 데이터에서 지정된 컬럼에 해당하는 값들 추출"""
+        """주문(ProductOrder)에서 지정된 컬럼에 해당하는 값들 추출"""
         try:
             values = []
             for col in columns:
                 if col == '주문ID':
-                    values.append(order.get('orderId', ''))
+                    values.append(order.order_id)
                 elif col == '상품주문ID':
-                    values.append(order.get('productOrderId', ''))
+                    values.append(order.product_order_id)
                 elif col == '주문자':
-                    values.append(order.get('ordererName', ''))
+                    values.append(order.orderer_name)
                 elif col == '상품명':
-                    values.append(order.get('productName', ''))
+                    values.append(order.product_name)
                 elif col == '옵션정보':
-                    values.append(order.get('optionInfo', ''))
+                    values.append(order.product_option)
                 elif col == '판매자상품코드':
-                    values.append(order.get('sellerProductCode', ''))
+                    values.append(order.seller_product_code)
                 elif col == '수량':
-                    values.append(str(order.get('quantity', 0)))
+                    values.append(str(order.quantity))
                 elif col == '단가':
-                    values.append(f"{order.get('unitPrice', 0):,}")
+                    values.append(f"{order.unit_price:,}")
                 elif col == '할인금액':
-                    values.append(f"{order.get('discountAmount', 0):,}")
+                    values.append(f"{order.discount_amount:,}")
                 elif col == '금액':
-                    values.append(f"{order.get('price', 0):,}")
+                    values.append(f"{order.total_amount:,}")
                 elif col == '결제방법':
-                    values.append(order.get('payType', ''))
+                    values.append(order.payment_means)
                 elif col == '배송지주소':
-                    values.append(order.get('shippingAddress', ''))
+                    values.append(order.shipping_address)
                 elif col == '배송예정일':
-                    # shippingDueDate와 expectedDeliveryDate 둘 다 확인
-                    delivery_date = order.get('expectedDeliveryDate', '') or order.get('shippingDueDate', '')
-                    values.append(delivery_date)
+                    values.append(format_datetime(order.shipping_due_date, '%m-%d'))
                 elif col == '주문일시':
-                    values.append(order.get('orderDate', ''))
+                    values.append(format_datetime(order.order_date))
                 elif col == '상태':
-                    values.append(order.get('claimStatus', ''))
+                    values.append(order.status)
                 else:
                     values.append('')
             
@@ -1237,8 +1041,8 @@ class OrdersTab(BaseTab):
         """초기화 시 캐시된 주문 데이터 로드"""
         try:
             # 데이터베이스에서 저장된 주문 조회
-            orders = self.app.db_manager.get_orders()
-            
+            orders = self.app.db_manager.get_product_orders()
+
             if orders and len(orders) > 0:
                 print(f"주문관리 탭 - 캐시된 주문 데이터 {len(orders)}건 로드")
                 
@@ -113,54 +113,17 @@ class ProductsTab(BaseTab):
             
             self.app.root.after(0, lambda: self.products_status_var.set("상품 목록 조회 중..."))
             
-            # 상품 목록 조회
-            response = self.app.naver_api.get_products()
+            # 전체 상품 동기화 (모든 페이지 조회, 수정일이 같은 상품은 저장 생략)
+            from env_config import config
+            response = self.app.product_sync.sync(enrich=config.get_bool('PRODUCT_SYNC_ENRICH', False))
             
-            if response and response.get('success'):
-                data = response.get('data', {})
-                products = data.get('contents', [])
+            if response and (response.get('success') or response.get('products')):
+                products = response.get('products', [])
+                stats = response.get('stats', {})
                 
-                # 상품 데이터를 데이터베이스에 저장
-                for product in products:
-                    if isinstance(product, dict):
-                        # 상품 데이터 구조 변환
-                        origin_product_no = product.get('originProductNo')
-                        channel_products = product.get('channelProducts', [])
-                        
-                        if channel_products and len(channel_products) > 0:
-                            channel_product = channel_products[0]
-                            
-                            # 데이터베이스 저장을 위한 플랫 구조로 변환
-                            product_data = {
-                                'origin_product_no': origin_product_no,
-                                'channel_product_no': channel_product.get('channelProductNo'),
-                                'product_name': channel_product.get('name'),
-                                'status_type': channel_product.get('statusType'),
-                                'sale_price': channel_product.get('salePrice', 0),
-                                'discounted_price': channel_product.get('discountedPrice', 0),
-                                'stock_quantity': channel_product.get('stockQuantity', 0),
-                                'category_id': channel_product.get('categoryId'),
-                                'category_name': channel_product.get('wholeCategoryName', '').split('>')[-1] if channel_product.get('wholeCategoryName') else '',
-                                'brand_name': channel_product.get('brandName'),
-                                'manufacturer_name': channel_product.get('manufacturerName'),
-                                'model_name': channel_product.get('modelName'),
-                                'seller_management_code': channel_product.get('sellerManagementCode'),
-                                'reg_date': channel_product.get('regDate'),
-                                'modified_date': channel_product.get('modifiedDate'),
-                                'representative_image_url': channel_product.get('representativeImage', {}).get('url'),
-                                'whole_category_name': channel_product.get('wholeCategoryName'),
-                                'whole_category_id': channel_product.get('wholeCategoryId'),
-                                'delivery_fee': channel_product.get('deliveryFee', 0),
-                                'return_fee': channel_product.get('returnFee', 0),
-                                'exchange_fee': channel_product.get('exchangeFee', 0),
-                                'discount_method': '',
-                                'customer_benefit': ''
-                            }
-                            
-                            self.app.db_manager.save_product(product_data)
+                print(f"상품 조회 결과: {len(products)}개 ({stats.get('pages', 0)}페이지, 저장 {stats.get('saved', 0)}개, 변경 없음 {stats.get('skipped', 0)}개)")
                 
                 # 상품 상태별 필터링
-                from env_config import config
                 saved_statuses = config.get('PRODUCT_STATUS_TYPES', 'SALE')
                 status_list = [s.strip() for s in saved_statuses.split(',')]
                 print(f"조회 필터링 상태: {status_list}")
@@ -182,9 +145,12 @@ class ProductsTab(BaseTab):
                 self.app.root.after(0, lambda: self.update_refresh_status_message(len(filtered_products), is_from_api=True))
                 
                 # 서버 응답 표시
-                response_text = f"상품 목록 조회 성공!\n조회된 상품 수: {len(products)}개\n\n응답 데이터:\n{json.dumps(response, indent=2, ensure_ascii=False)}"
+                response_text = f"상품 목록 조회 성공!\n조회된 상품 수: {len(products)}개\n\n동기화 결과:\n{json.dumps(stats, indent=2, ensure_ascii=False)}"
                 self.app.root.after(0, lambda: self.server_response_text.delete(1.0, tk.END))
                 self.app.root.after(0, lambda: self.server_response_text.insert(1.0, response_text))
+            elif self.app.naver_api.circuit_breaker.is_open:
+                # API 차단 중(서킷 브레이커)이면 저장된 상품으로 표시
+                self.app.root.after(0, self.load_saved_products)
             else:
                 self.app.root.after(0, lambda: self.products_status_var.set("상품 목록 조회 실패"))
                 
@@ -7,6 +7,7 @@ from tkcalendar import DateEntry
 from datetime import datetime, timedelta
 import json
 
+from product_order import format_datetime
 from ui_utils import BaseTab, run_in_thread, enable_context_menu
 
 
@@ -20,6 +21,7 @@ class ShippingPendingTab(BaseTab):
         self.is_first_load = True  # 첫 로드 여부
         self.create_tab()
         self.setup_copy_paste_bindings()
+        self.bind_order_detail(self.tree)
         self.update_order_status_display()
 
         # 탭 생성 후 저장된 주문 데이터 우선 로드
@@ -100,6 +102,8 @@ class ShippingPendingTab(BaseTab):
                   command=self.collect_orders).pack(side="left", padx=5)
         ttk.Button(button_frame, text="엑셀 저장",
                   command=self.save_to_excel).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="송장 일괄 발송",
+                  command=self.dispatch_from_file).pack(side="left", padx=5)
 
         self.order_status_label = ttk.Label(button_frame, text="")
         self.order_status_label.pack(side="right", padx=5)
@@ -200,12 +204,11 @@ class ShippingPendingTab(BaseTab):
 
             print(f"발송대기 탭 - API 조회 시작: {start_date_str} ~ {end_date_str}, 상태: {order_status}")
 
-            # API 호출 (주문관리 탭과 동일한 방식)
-            response = self.app.naver_api.get_orders(
+            # 기간 내 전체 주문을 한 번 조회해 상태별로 분류한 결과 사용 (다른 탭과 조회 결과 공유)
+            response = self.app.naver_api.get_orders_by_status(
                 start_date=start_date_str,
                 end_date=end_date_str,
-                order_status=order_status,
-                limit=100
+                statuses=[order_status]
             )
 
             if response and response.get('success'):
@@ -220,48 +223,8 @@ class ShippingPendingTab(BaseTab):
                 print(f"발송대기 탭 - 처리할 주문 수: {len(raw_orders)}")
 
                 if raw_orders:
-                    # 주문관리 탭과 동일한 방식으로 데이터 변환
-                    processed_orders = []
-
-                    for i, item in enumerate(raw_orders):
-                        print(f"발송대기 탭 - 주문 {i+1} 구조: {list(item.keys()) if isinstance(item, dict) else type(item)}")
-
-                        if isinstance(item, dict) and 'content' in item:
-                            content = item['content']
-                            print(f"발송대기 탭 - 주문 {i+1} content 키들: {list(content.keys()) if isinstance(content, dict) else type(content)}")
-
-                            if 'order' in content and 'productOrder' in content:
-                                order_info = content['order']
-                                product_order = content['productOrder']
-
-                                # 상품 주문 상태 확인
-                                product_order_status = product_order.get('productOrderStatus')
-                                print(f"발송대기 탭 - 주문 {i+1} 상태 확인: {product_order_status}")
-
-                                # PAYED 상태만 필터링
-                                if product_order_status == 'PAYED':
-                                    # 주문관리 탭과 동일한 데이터 구조로 변환
-                                    order_data = {
-                                        'orderId': order_info.get('orderId'),
-                                        'productOrderId': item.get('productOrderId'),
-                                        'ordererName': order_info.get('ordererName'),
-                                        'productName': product_order.get('productName'),
-                                        'productOption': product_order.get('productOption'),
-                                        'sellerProductCode': product_order.get('sellerProductCode'),
-                                        'quantity': product_order.get('quantity'),
-                                        'unitPrice': product_order.get('unitPrice'),
-                                        'productDiscountAmount': product_order.get('productDiscountAmount', 0),
-                                        'totalPaymentAmount': product_order.get('totalPaymentAmount'),
-                                        'paymentMeans': order_info.get('paymentMeans'),
-                                        'shippingAddress': product_order.get('shippingAddress'),
-                                        'shippingDueDate': product_order.get('shippingDueDate'),
-                                        'orderDate': order_info.get('orderDate'),
-                                        'orderStatus': product_order_status
-                                    }
-                                    processed_orders.append(order_data)
-                                    print(f"발송대기 탭 - 주문 {i+1} PAYED 상태 확인, 변환 완료: {order_data.get('productName', 'N/A')}")
-                                else:
-                                    print(f"발송대기 탭 - 주문 {i+1} {product_order_status} 상태로 필터링 제외")
+                    # 상태별 분류 결과(ProductOrder)를 그대로 사용 - PAYED 상태만 필터링
+                    processed_orders = [order for order in raw_orders if order.status == 'PAYED']
 
                     print(f"발송대기 탭 - 최종 처리된 주문 수: {len(processed_orders)}")
 
@@ -290,65 +253,49 @@ class ShippingPendingTab(BaseTab):
         # 기존 데이터 클리어
         self.clear_tree()
 
+        self.tree_orders = {}
         for order in orders:
             # 주문 데이터를 표시 컬럼에 맞게 변환
             row_data = self.convert_order_to_row(order)
-            self.tree.insert("", "end", values=row_data)
+            item_id = self.tree.insert("", "end", values=row_data)
+            self.tree_orders[item_id] = order
 
         self.last_orders_data = orders
 
     def convert_order_to_row(self, order):
-        """주문 데이터를 행 데이터로 변환"""
+        """주문(ProductOrder)을 행 데이터로 변환"""
         row_data = []
         for col in self.display_columns:
             if col == "주문ID":
-                row_data.append(order.get('orderId', ''))
+                row_data.append(order.order_id)
             elif col == "상품주문ID":
-                row_data.append(order.get('productOrderId', ''))
+                row_data.append(order.product_order_id)
             elif col == "주문자":
-                row_data.append(order.get('ordererName', ''))
+                row_data.append(order.orderer_name)
             elif col == "상품명":
-                row_data.append(order.get('productName', ''))
+                row_data.append(order.product_name)
             elif col == "옵션정보":
-                row_data.append(order.get('productOption', ''))
+                row_data.append(order.product_option)
             elif col == "판매자상품코드":
-                row_data.append(order.get('sellerProductCode', ''))
+                row_data.append(order.seller_product_code)
             elif col == "수량":
-                row_data.append(str(order.get('quantity', '')))
+                row_data.append(str(order.quantity))
             elif col == "단가":
-                row_data.append(f"{order.get('unitPrice', 0):,}")
+                row_data.append(f"{order.unit_price:,}")
             elif col == "할인금액":
-                row_data.append(f"{order.get('productDiscountAmount', 0):,}")
+                row_data.append(f"{order.discount_amount:,}")
             elif col == "금액":
-                row_data.append(f"{order.get('totalPaymentAmount', 0):,}")
+                row_data.append(f"{order.total_amount:,}")
             elif col == "결제방법":
-                row_data.append(order.get('paymentMeans', ''))
+                row_data.append(order.payment_means)
             elif col == "배송지주소":
-                shipping_addr = order.get('shippingAddress', {})
-                addr = f"{shipping_addr.get('baseAddress', '')} {shipping_addr.get('detailAddress', '')}"
-                row_data.append(addr.strip())
+                row_data.append(order.shipping_address)
             elif col == "배송예정일":
-                shipping_due = order.get('shippingDueDate', '')
-                if shipping_due:
-                    try:
-                        dt = datetime.fromisoformat(shipping_due.replace('Z', '+00:00'))
-                        row_data.append(dt.strftime('%Y-%m-%d'))
-                    except:
-                        row_data.append(shipping_due)
-                else:
-                    row_data.append('')
+                row_data.append(format_datetime(order.shipping_due_date, '%Y-%m-%d'))
             elif col == "주문일시":
-                order_date = order.get('orderDate', '')
-                if order_date:
-                    try:
-                        dt = datetime.fromisoformat(order_date.replace('Z', '+00:00'))
-                        row_data.append(dt.strftime('%Y-%m-%d %H:%M'))
-                    except:
-                        row_data.append(order_date)
-                else:
-                    row_data.append('')
+                row_data.append(format_datetime(order.order_date))
             elif col == "상태":
-                row_data.append(order.get('productOrderStatus', ''))
+                row_data.append(order.status)
             else:
                 row_data.append('')
 
@@ -410,6 +357,65 @@ class ShippingPendingTab(BaseTab):
         except Exception as e:
             messagebox.showerror("오류", f"엑셀 저장 중 오류가 발생했습니다: {str(e)}")
 
+    def dispatch_from_file(self):
+        """엑셀/CSV 파일(상품주문ID, 택배사, 송장번호)로 발송 처리"""
+        if not self.app.naver_api or not getattr(self.app, 'shipping_dispatcher', None):
+            messagebox.showwarning("경고", "API가 설정되지 않았습니다. 설정 탭에서 API 정보를 입력해주세요.")
+            return
+
+        from tkinter import filedialog
+        file_path = filedialog.askopenfilename(
+            filetypes=[("Excel/CSV files", "*.xlsx *.xls *.csv"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+
+        try:
+            import pandas as pd
+
+            if file_path.lower().endswith('.csv'):
+                df = pd.read_csv(file_path, dtype=str, keep_default_na=False)
+            else:
+                df = pd.read_excel(file_path, dtype=str, keep_default_na=False)
+            rows = df.to_dict('records')
+        except Exception as e:
+            messagebox.showerror("오류", f"파일 읽기 중 오류가 발생했습니다: {str(e)}")
+            return
+
+        if not messagebox.askyesno("확인", f"{len(rows)}건을 발송 처리하시겠습니까?"):
+            return
+        run_in_thread(self._dispatch_thread, rows)
+
+    def _dispatch_thread(self, rows):
+        """발송 처리 스레드"""
+        try:
+            self.app.root.after(0, lambda: self.order_status_label.config(text=f"발송 처리 중... (0/{len(rows)})"))
+
+            def on_progress(stats):
+                text = f"발송 처리 중... 성공 {stats['sent']}건, 재시도 대기 {stats['retried']}건, 실패 {stats['failed']}건"
+                self.app.root.after(0, lambda: self.order_status_label.config(text=text))
+
+            result = self.app.shipping_dispatcher.dispatch(rows, on_progress=on_progress)
+
+            summary = (f"발송 처리 완료: 성공 {result['sent']}건, 실패 {result['failed']}건"
+                       f", 입력 오류 {len(result['invalid'])}건")
+            self.app.root.after(0, lambda: self.order_status_label.config(text=summary))
+
+            if result['invalid'] or result['failed']:
+                lines = [f"{row.get('상품주문ID') or row.get('productOrderId') or '-'}: {reason}"
+                         for row, reason in result['invalid'][:20]]
+                detail = '\n'.join(lines)
+                self.app.root.after(0, lambda: messagebox.showwarning("발송 처리 결과", f"{summary}\n\n{detail}".rstrip()))
+
+            # 발송된 주문은 발송대기 목록에서 빠지므로 다시 조회
+            if result['sent']:
+                self.app.root.after(0, self.collect_orders)
+
+        except Exception as e:
+            error_msg = f"발송 처리 오류: {str(e)}"
+            print(error_msg)
+            self.app.root.after(0, lambda: self.order_status_label.config(text=error_msg))
+
     def setup_copy_paste_bindings(self):
         """복사/붙여넣기 단축키 설정"""
         self.tree.bind('<Control-c>', self.copy_selection)
@@ -445,16 +451,14 @@ class ShippingPendingTab(BaseTab):
         try:
             print("발송대기 탭 - 캐시된 주문 로드 시도")
             # 데이터베이스에서 발송대기 주문만 로드
-            if hasattr(self.app.db_manager, 'get_orders'):
-                cached_orders = self.app.db_manager.get_orders()
-                # PAYED 상태만 필터링
-                pending_orders = [order for order in cached_orders if order.get('productOrderStatus') == 'PAYED']
-                if pending_orders:
-                    print(f"발송대기 탭 - 캐시된 발송대기 주문 {len(pending_orders)}건 표시")
-                    self.display_orders(pending_orders)
-                    self.order_status_label.config(text=f"저장된 발송대기 주문 {len(pending_orders)}건")
-                else:
-                    print("발송대기 탭 - 캐시된 발송대기 주문 없음")
+            # PAYED 상태만 필터링
+            pending_orders = self.app.db_manager.get_product_orders(statuses=['PAYED'])
+            if pending_orders:
+                print(f"발송대기 탭 - 캐시된 발송대기 주문 {len(pending_orders)}건 표시")
+                self.display_orders(pending_orders)
+                self.order_status_label.config(text=f"저장된 발송대기 주문 {len(pending_orders)}건")
+            else:
+                print("발송대기 탭 - 캐시된 발송대기 주문 없음")
         except Exception as e:
             print(f"발송대기 탭 - 캐시된 주문 로드 오류: {e}")
 
@@ -6,8 +6,12 @@ from tkinter import ttk, messagebox, simpledialog
 from datetime import datetime, timedelta
 import json
 
+from product_order import ProductOrder, format_datetime
 from ui_utils import BaseTab, run_in_thread
 
+# 배송 상태 화면 이름 → 상품주문 상태
+SHIPPING_STATUSES = {'발송대기': 'PAYED', '배송중': 'DELIVERING', '배송완료': 'DELIVERED'}
+
 
 class ShippingTab(BaseTab):
     """배송 탭 클래스"""
@@ -63,6 +67,7 @@ class ShippingTab(BaseTab):
         self.shipping_tree.configure(yscrollcommand=scrollbar.set)
         
         self.shipping_tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        self.bind_order_detail(self.shipping_tree)
         scrollbar.pack(side="right", fill="y", pady=5)
         
         # 배송 관리 버튼
@@ -84,8 +89,8 @@ class ShippingTab(BaseTab):
         try:
             status = self.shipping_status_var.get()
             
-            # 데이터베이스에서 해당 상태의 주문 조회
-            orders = self.app.db_manager.get_orders_by_status(status)
+            # 데이터베이스에서 해당 상태의 상품주문 조회 (화면 상태명 → 상품주문 상태)
+            orders = self.app.db_manager.get_product_orders(statuses=[SHIPPING_STATUSES.get(status, status)])
             
             if orders:
                 self._update_shipping_tree(orders)
@@ -102,10 +107,17 @@ class ShippingTab(BaseTab):
         # 기존 데이터 삭제
         for item in self.shipping_tree.get_children():
             self.shipping_tree.delete(item)
+        self.tree_orders = {}
         
         # 새 데이터 추가
         for order in orders:
-            if isinstance(order, dict):
+            if isinstance(order, ProductOrder):
+                item_id = self.shipping_tree.insert('', 'end', values=(
+                    order.order_id, order.orderer_name, order.product_name, format_datetime(order.order_date),
+                    order.claim_status or order.status, order.delivery_company, order.tracking_number
+                ))
+                self.tree_orders[item_id] = order
+            elif isinstance(order, dict):
                 order_id = order.get('orderId', 'N/A')
                 orderer_name = order.get('ordererName', 'N/A')
                 product_name = order.get('productName', 'N/A')
@@ -133,7 +145,7 @@ class ShippingTab(BaseTab):
                 order_id = values[0]
                 
                 # 데이터베이스에서 주문 상태 업데이트
-                self.app.db_manager.update_order_status(order_id, '배송중')
+                self.app.db_manager.update_order_status(order_id, SHIPPING_STATUSES['배송중'])
             
             messagebox.showinfo("성공", f"{len(selected_items)}건의 주문 발송 처리가 완료되었습니다.")
             
@@ -157,7 +169,7 @@ class ShippingTab(BaseTab):
                 order_id = values[0]
                 
                 # 데이터베이스에서 주문 상태 업데이트
-                self.app.db_manager.update_order_status(order_id, '배송완료')
+                self.app.db_manager.update_order_status(order_id, SHIPPING_STATUSES['배송완료'])
             
             messagebox.showinfo("성공", f"{len(selected_items)}건의 주문 배송 완료 처리가 완료되었습니다.")
             
@@ -201,7 +213,7 @@ class ShippingTab(BaseTab):
     def load_cached_shipping_on_init(self):
         """초기화 시 캐시된 배송 데이터 로드"""
         try:
-            orders = self.app.db_manager.get_orders()
+            orders = self.app.db_manager.get_product_orders()
             if orders and len(orders) > 0:
                 print(f"배송관리 탭 - 캐시된 주문 데이터 {len(orders)}건 로드")
                 self._update_shipping_tree(orders)
@@ -0,0 +1,172 @@
+"""
+네이버 커머스 API 액세스 토큰 관리 모듈
+"""
+import os
+import json
+import time
+import hmac
+import base64
+import hashlib
+import threading
+from typing import Callable, Optional, Tuple
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # 선택 의존성 - 없으면 소유자만 읽을 수 있는(0600) 평문 JSON으로 저장
+    Fernet = None
+    InvalidToken = ValueError
+
+
+def _cache_key(client_id: str, client_secret: str) -> bytes:
+    """클라이언트 인증 정보로부터 토큰 캐시 암호화 키(Fernet) 생성"""
+    digest = hmac.new(client_secret.encode('utf-8'), f"withus-token-cache|{client_id}".encode('utf-8'), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest)
+
+
+class TokenManager:
+    """스레드 안전한 액세스 토큰 관리 (만료 추적, 단일 갱신, 디스크 캐시)
+
+    디스크 캐시는 cryptography 패키지가 있으면 Fernet으로 암호화하고, 없으면 평문으로 저장한다.
+    두 경우 모두 파일 권한은 소유자 전용(0600)이다.
+    """
+
+    def __init__(self, client_id: str, client_secret: str,
+                 issue_func: Callable[[], Optional[Tuple[str, int]]],
+                 cache_path: str = None, refresh_margin: int = 300):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.issue_func = issue_func  # (access_token, expires_in) 또는 None 반환
+        self.cache_path = cache_path
+        self.refresh_margin = refresh_margin
+
+        self._cond = threading.Condition()
+        self._token = None
+        self._expires_at = 0.0
+        self._refreshing = False
+        self._generation = 0  # 갱신 시도 횟수 (대기 중인 스레드가 결과를 확인하는 용도)
+
+        self._fernet = Fernet(_cache_key(client_id, client_secret)) if Fernet is not None else None
+        self._load_from_disk()
+
+    @property
+    def token(self) -> Optional[str]:
+        """현재 보유 중인 토큰 (만료 여부와 무관)"""
+        return self._token
+
+    @property
+    def expires_in(self) -> float:
+        """토큰 만료까지 남은 시간 (초)"""
+        return max(0.0, self._expires_at - time.time())
+
+    def get_token(self, force: bool = False) -> Optional[str]:
+        """유효한 토큰 반환 - 만료 임박 시 한 스레드만 갱신하고 나머지는 대기"""
+        with self._cond:
+            now = time.time()
+            if not force and self._token and now < self._expires_at - self.refresh_margin:
+                return self._token
+
+            if self._refreshing:
+                # 아직 만료되지 않았다면 갱신을 기다리지 않고 기존 토큰 사용
+                if not force and self._token and now < self._expires_at:
+                    return self._token
+                generation = self._generation
+                while self._refreshing and self._generation == generation:
+                    self._cond.wait()
+                return self._token
+
+            self._refreshing = True
+
+        token = None
+        expires_in = 0
+        try:
+            result = self.issue_func()
+            if result:
+                token, expires_in = result
+        except Exception as e:
+            print(f"토큰 갱신 오류: {e}")
+        finally:
+            with self._cond:
+                if token:
+                    self._token = token
+                    self._expires_at = time.time() + (expires_in or 0)
+                self._refreshing = False
+                self._generation += 1
+                self._cond.notify_all()
+
+        if token:
+            print(f"액세스 토큰 갱신 완료 (유효시간: {expires_in}초)")
+            self._save_to_disk()
+            return token
+        return None
+
+    def invalidate(self, token: str = None):
+        """토큰 무효화 - 실패한 토큰이 현재 토큰과 같을 때만 (동시 401 중복 갱신 방지)"""
+        with self._cond:
+            if token is None or token == self._token:
+                self._token = None
+                self._expires_at = 0.0
+
+    def prefetch(self) -> threading.Thread:
+        """백그라운드에서 토큰 미리 발급 (UI 스레드 블로킹 방지)"""
+        thread = threading.Thread(target=self.get_token, daemon=True)
+        thread.start()
+        return thread
+
+    def _save_to_disk(self):
+        """토큰을 디스크에 저장 (Fernet 암호화 또는 평문, 소유자 전용 권한)"""
+        if not self.cache_path:
+            return
+        try:
+            with self._cond:
+                payload = json.dumps({
+                    'access_token': self._token,
+                    'expires_at': self._expires_at
+                }).encode('utf-8')
+            blob = self._fernet.encrypt(payload) if self._fernet is not None else payload
+
+            tmp_path = f"{self.cache_path}.tmp"
+            # 처음부터 0600으로 생성 (쓰는 도중에도 다른 사용자가 읽을 수 없도록)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(blob)
+            try:
+                os.chmod(tmp_path, 0o600)
+            except OSError:
+                pass
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"토큰 캐시 저장 오류: {e}")
+
+    def _load_from_disk(self):
+        """디스크에 저장된 토큰 로드 (만료되었거나 복호화에 실패하면 무시)"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'rb') as f:
+                blob = f.read().strip()
+            plaintext = blob.startswith(b'{')
+            if not plaintext:
+                if self._fernet is None:
+                    print("암호화되었거나 이전 형식인 토큰 캐시 - 무시 (암호화 캐시는 cryptography 패키지 필요)")
+                    return
+                try:
+                    blob = self._fernet.decrypt(blob)
+                except InvalidToken:
+                    print("토큰 캐시 복호화 실패 (인증 정보 변경 또는 이전 형식) - 무시")
+                    return
+
+            data = json.loads(blob.decode('utf-8'))
+            if data.get('access_token') and data.get('expires_at', 0) > time.time() + self.refresh_margin:
+                self._token = data['access_token']
+                self._expires_at = float(data['expires_at'])
+                print(f"저장된 액세스 토큰 로드 (남은 시간: {int(self.expires_in)}초)")
+            if plaintext and self._fernet is not None:
+                # 이전 버전의 평문 캐시는 한 번만 읽고 바로 암호화해서 다시 저장 (유효한 토큰이 없으면 삭제)
+                if self._token:
+                    self._save_to_disk()
+                    print("평문 토큰 캐시를 암호화 형식으로 변환")
+                else:
+                    os.remove(self.cache_path)
+                    print("만료된 평문 토큰 캐시 삭제")
+        except Exception as e:
+            print(f"토큰 캐시 로드 오류: {e}")
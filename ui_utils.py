@@ -172,6 +172,94 @@ class BaseTab:
                 context_menu.grab_release()
         except Exception as e:
             print(f"컨텍스트 메뉴 오류: {e}")
+    
+    def bind_order_detail(self, tree):
+        """주문 목록 행 더블클릭 시 주문 상세 표시 (행 → 주문 레코드는 self.tree_orders에 기록)"""
+        self.tree_orders = {}
+
+        def on_double_click(event):
+            order = self.tree_orders.get(tree.identify_row(event.y))
+            if hasattr(order, 'product_order_id'):  # ProductOrder 행만
+                self.show_order_detail(order)
+
+        tree.bind('<Double-1>', on_double_click)
+
+    def show_order_detail(self, order):
+        """저장된 원본 응답(order_documents)으로 주문 상세 표시 - API 요청 없이 오프라인에서도 동작"""
+        try:
+            document = None
+            if order.product_order_id:
+                document = self.app.db_manager.get_order_documents([order.product_order_id]).get(str(order.product_order_id))
+
+            lines = [f"현재 상태: {order.status}"
+                     f"{' / 클레임 ' + order.claim_status if order.claim_status else ''}"
+                     f"{' / 송장 ' + order.delivery_company + ' ' + order.tracking_number if order.tracking_number else ''}",
+                     '']
+            if document is not None:
+                lines.extend(format_order_document(document.payload))
+                lines.append(f"\n(저장된 원본 응답 - 마지막 변경 {document.last_changed_date or '알 수 없음'})")
+            else:
+                lines.extend([f"주문ID: {order.order_id}", f"상품주문ID: {order.product_order_id}",
+                              f"상품명: {order.product_name}", f"옵션: {order.product_option}",
+                              f"배송지: {order.shipping_address}", f"배송 메모: {order.shipping_memo}",
+                              '', "(저장된 원본 응답 없음 - 목록 정보만 표시)"])
+
+            window = tk.Toplevel(self.frame)
+            window.title(f"주문 상세 - {order.product_order_id or order.order_id}")
+            text = tk.Text(window, wrap='word', width=80, height=32)
+            text.insert('1.0', '\n'.join(lines))
+            text.config(state='disabled')
+            text.pack(fill='both', expand=True, padx=5, pady=5)
+            ttk.Button(window, text="닫기", command=window.destroy).pack(pady=5)
+        except Exception as e:
+            print(f"주문 상세 표시 오류: {e}")
+            messagebox.showerror("오류", f"주문 상세를 표시할 수 없습니다: {str(e)}")
+
+
+# 주문 상세 화면 구성 - (섹션 제목, 원본 응답 키, [(항목명, 필드 경로), ...])
+ORDER_DETAIL_SECTIONS = (
+    ('주문', 'order', [('주문ID', 'orderId'), ('주문일시', 'orderDate'), ('주문자', 'ordererName'),
+                      ('주문자 연락처', 'ordererTel'), ('결제일시', 'paymentDate'), ('결제방법', 'paymentMeans'),
+                      ('결제 위치', 'payLocationType')]),
+    ('상품주문', 'productOrder', [('상품주문ID', 'productOrderId'), ('상태', 'productOrderStatus'),
+                                ('상품명', 'productName'), ('옵션', 'productOption'), ('판매자상품코드', 'sellerProductCode'),
+                                ('수량', 'quantity'), ('단가', 'unitPrice'), ('할인금액', 'productDiscountAmount'),
+                                ('결제금액', 'totalPaymentAmount'), ('배송비', 'deliveryFeeAmount'),
+                                ('발송기한', 'shippingDueDate'), ('배송 메모', 'shippingMemo'),
+                                ('클레임 유형', 'claimType'), ('클레임 상태', 'claimStatus')]),
+    ('배송지', 'productOrder', [('수령인', 'shippingAddress.name'), ('연락처', 'shippingAddress.tel1'),
+                              ('우편번호', 'shippingAddress.zipCode'), ('주소', 'shippingAddress.baseAddress'),
+                              ('상세주소', 'shippingAddress.detailedAddress')]),
+    ('배송', 'delivery', [('택배사', 'deliveryCompany'), ('송장번호', 'trackingNumber'), ('배송 상태', 'deliveryStatus'),
+                         ('발송일시', 'sendDate'), ('배송완료일시', 'deliveredDate')]),
+)
+CLAIM_SECTIONS = (('취소', 'cancel'), ('반품', 'return'), ('교환', 'exchange'))
+
+
+def format_order_document(payload):
+    """상품주문 원본 응답({'order', 'productOrder', 'delivery', ...})을 상세 화면 줄 목록으로 변환"""
+    if isinstance(payload.get('content'), dict):
+        payload = payload['content']
+    lines = []
+    for title, key, fields in ORDER_DETAIL_SECTIONS:
+        section = payload.get(key) or {}
+        values = []
+        for label, path in fields:
+            value = section
+            for part in path.split('.'):
+                value = value.get(part) if isinstance(value, dict) else None
+            if value not in (None, ''):
+                values.append(f"  {label}: {value}")
+        if values:
+            lines.extend([f"[{title}]"] + values + [''])
+    # 클레임 상세는 유형마다 항목이 달라 받은 그대로 표시
+    for title, key in CLAIM_SECTIONS:
+        claim = payload.get(key)
+        if isinstance(claim, dict) and claim:
+            lines.append(f"[{title}]")
+            lines.extend(f"  {field}: {value}" for field, value in claim.items() if value not in (None, ''))
+            lines.append('')
+    return lines
 
 
 def run_in_thread(func, *args, **kwargs):